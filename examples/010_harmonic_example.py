@@ -260,3 +260,23 @@ critical_mode = mode_at_critical_phase_and_time_f.get_entity_data_by_id(max_elem
 print(f"The critical ply is {critical_ply_name}.")
 print(f"The maximum IRF is {max_over_freq_and_phases_f.max().data[0]}.")
 print(f"The critical failure mode is {FailureModeEnum(int(critical_mode)).name}.")
+
+# %%
+# Evaluate all phases at once
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# The :meth:`.CompositeModel.evaluate_harmonic_failure` method reads the real and
+# imaginary parts of the stresses and strains only once. It forms the stresses and
+# strains of all phase angles on the server and evaluates them in a single call of
+# the failure operator per frequency. The critical phase angle of each element is
+# refined between the sampled phase angles.
+#
+harmonic_results = composite_model.evaluate_harmonic_failure(combined_fc, number_of_phases=36)
+critical_index = harmonic_results.failure_values.argmax()
+print(f"The element with highest IRF is {harmonic_results.element_ids[critical_index]}.")
+print(f"The maximum IRF is {harmonic_results.failure_values[critical_index]}.")
+print(f"The critical frequency is {harmonic_results.critical_frequencies[critical_index]} 1/s.")
+print(f"The critical phase is {harmonic_results.critical_phases[critical_index]:.1f}°.")
+print(
+    "The critical failure mode is "
+    f"{FailureModeEnum(int(harmonic_results.failure_modes[critical_index])).name}."
+)
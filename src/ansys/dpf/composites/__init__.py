@@ -29,32 +29,77 @@ except ModuleNotFoundError:
 
 __version__ = importlib_metadata.version(__name__.replace(".", "-"))
 
-from . import (
-    composite_model,
-    composite_scope,
-    constants,
-    data_sources,
-    failure_criteria,
-    layup_info,
-    ply_wise_data,
-    result_definition,
-    sampling_point,
-    select_indices,
-    server_helpers,
-    solid_stack_results,
-)
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:  # pragma: no cover
+    from . import (
+        composite_model,
+        composite_scope,
+        constants,
+        critical_elements,
+        data_sources,
+        design_point_study,
+        element_chunks,
+        failure_criteria,
+        failure_export,
+        failure_statistics,
+        harmonic_failure,
+        layered_reduction,
+        layup_info,
+        load_combinations,
+        memory_usage,
+        ply_wise_data,
+        ply_wise_failure,
+        result_cache,
+        result_definition,
+        result_partitions,
+        result_store,
+        sampling_point,
+        select_indices,
+        server_helpers,
+        solid_stack_results,
+        tracing,
+    )
 
 __all__ = (
     "composite_model",
     "composite_scope",
     "constants",
+    "critical_elements",
     "data_sources",
+    "design_point_study",
+    "element_chunks",
     "failure_criteria",
+    "failure_export",
+    "failure_statistics",
+    "harmonic_failure",
+    "layered_reduction",
     "layup_info",
+    "load_combinations",
+    "memory_usage",
     "ply_wise_data",
+    "ply_wise_failure",
+    "result_cache",
     "result_definition",
+    "result_partitions",
+    "result_store",
     "sampling_point",
     "server_helpers",
     "select_indices",
     "solid_stack_results",
+    "tracing",
 )
+
+
+def __getattr__(name: str) -> Any:
+    # The submodules are imported on first access. Importing them all eagerly
+    # loads the DPF operators and Matplotlib, which slows down scripts and
+    # worker processes which use only a few of the submodules.
+    if name in __all__:
+        return importlib.import_module(f".{name}", __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *__all__])
@@ -0,0 +1,68 @@
+# Copyright (C) 2022 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Helpers to call blocking DPF functions from asyncio code."""
+
+import asyncio
+from collections.abc import Callable
+import contextvars
+import threading
+from typing import TypeVar
+
+_T = TypeVar("_T")
+
+
+def _run_with_lock(
+    function: Callable[[threading.Event], _T], lock: threading.Lock, cancel_event: threading.Event
+) -> _T:
+    with lock:
+        if cancel_event.is_set():
+            raise asyncio.CancelledError()
+        return function(cancel_event)
+
+
+async def _run_in_executor(
+    function: Callable[[threading.Event], _T], lock: "threading.Lock | None" = None
+) -> _T:
+    """Run a blocking function in the default executor of the running event loop.
+
+    The function receives an event which is set if the awaiting task is cancelled.
+    Long-running functions check the event between chunks and stop early.
+    The function runs in a copy of the caller's context, so that, for example,
+    :func:`.record_timings` records its stages.
+
+    If a lock is given, the function runs while the executor thread holds the
+    lock. Functions which share a lock therefore run one after the other. A
+    function which is cancelled while it waits for the lock is not run.
+    """
+    cancel_event = threading.Event()
+    loop = asyncio.get_running_loop()
+    context = contextvars.copy_context()
+    try:
+        if lock is None:
+            return await loop.run_in_executor(None, context.run, function, cancel_event)
+        return await loop.run_in_executor(
+            None, context.run, _run_with_lock, function, lock, cancel_event
+        )
+    except asyncio.CancelledError:
+        cancel_event.set()
+        raise
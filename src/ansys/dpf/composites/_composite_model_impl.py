@@ -22,31 +22,78 @@
 
 """Composite Model Interface."""
 # New interface after 2023 R2
-from collections.abc import Collection, Sequence
-from typing import cast
+from collections.abc import Collection, Iterable, Iterator, Sequence
+from dataclasses import dataclass, replace
+from enum import IntEnum
+import itertools
+import os
+import threading
+from typing import Any, cast
 from warnings import warn
 
 import ansys.dpf.core as dpf
-from ansys.dpf.core import FieldsContainer, MeshedRegion, Operator, UnitSystem
+from ansys.dpf.core import DataSources, Field, FieldsContainer, MeshedRegion, Operator, UnitSystem
 from ansys.dpf.core.server_types import BaseServer
 import numpy as np
-from numpy.typing import NDArray
+from numpy.typing import ArrayLike, NDArray
 
-from ._composite_model_impl_helpers import _deprecated_composite_definition_label, _merge_containers
+from ._composite_model_impl_helpers import (
+    _deprecated_composite_definition_label,
+    _get_fields_by_failure_output,
+    _merge_containers,
+)
+from ._indexer import _get_field_data_as_csr, _get_values_by_element, _select_csr_rows
 from .composite_scope import CompositeScope
-from .constants import D3PLOT_KEY_AND_FILENAME, REF_SURFACE_NAME, SolverType
+from .constants import (
+    D3PLOT_KEY_AND_FILENAME,
+    REF_SURFACE_NAME,
+    TIME_LABEL,
+    FailureOutput,
+    ResultType,
+    SolverType,
+)
+from .critical_elements import CriticalElements, _get_top_k_indices
 from .data_sources import (
     CompositeDataSources,
     ContinuousFiberCompositesFiles,
     get_composites_data_sources,
 )
+from .element_chunks import ElementChunk, _prefetch
 from .failure_criteria import CombinedFailureCriterion
+from .failure_export import ExportFormat, FailureExportResult, FailureTableWriter
+from .failure_statistics import (
+    FailureStatistics,
+    StreamingHistogram,
+    _update_grouped_histograms,
+    get_default_bin_edges,
+)
+from .harmonic_failure import (
+    HarmonicFailureResults,
+    _create_phase_container,
+    _get_phase_factors,
+    _get_phases,
+    _refine_critical_phases,
+)
+from .layered_reduction import (
+    GroupingKey,
+    LayeredReductionResult,
+    ReductionOperation,
+    reduce_layered_data,
+    reduce_layered_field,
+)
 from .layup_info import (
+    AnalysisPlyIncidence,
     ElementInfo,
+    ElementInfoColumns,
+    ElementInfoProvider,
+    ElementInfoProviderLSDyna,
+    LayeredElementData,
     LayerProperty,
     LayupModelContextType,
     LayupPropertiesProvider,
     add_layup_info_to_mesh,
+    get_analysis_ply_index_to_name_map,
+    get_element_info_columns,
     get_element_info_provider,
     get_material_names_to_dpf_material_index,
 )
@@ -62,7 +109,24 @@ from .layup_info.material_properties import (
     get_constant_property_dict,
     get_material_metadata,
 )
+from .load_combinations import (
+    LoadCombinationEnvelope,
+    _combine_load_steps,
+    _create_combined_container,
+    _validate_combination_matrix,
+)
+from .memory_usage import MemoryReport, ModelCache, _estimate_dict_nbytes, _get_nbytes
+from .ply_wise_failure import PlyWiseFailureResults
+from .result_cache import ResultCache, ResultCacheKey
 from .result_definition import FailureMeasureEnum
+from .result_partitions import (
+    ResultPartition,
+    _get_default_max_workers,
+    _map_in_parallel,
+    get_partition_chunks,
+    get_result_partitions,
+)
+from .result_store import ResultStore, ResultStoreWriter
 from .sampling_point import SamplingPointNew
 from .sampling_point_solid_stack import SamplingPointSolidStack
 from .sampling_point_types import SamplingPoint
@@ -71,9 +135,37 @@ from .server_helpers import (
     version_equal_or_later,
     version_older_than,
 )
+from .tracing import _is_tracing, _span
 from .unit_system import get_unit_system
 
 
+@dataclass(frozen=True)
+class _FailureChunkContainers:
+    """Fields containers of the failure evaluation of a chunk of elements."""
+
+    #: Minimum per element
+    min_container: FieldsContainer
+    #: Maximum per element
+    max_container: FieldsContainer
+    #: Failure values and modes of all layers, spots, and nodes of the elements
+    layered_container: FieldsContainer
+
+
+def _convert_failure_measure(
+    fields_container: FieldsContainer, measure: FailureMeasureEnum
+) -> None:
+    """Convert the inverse reserve factors of a fields container in place."""
+    converter_op = dpf.Operator("composite::failure_measure_converter")
+    converter_op.inputs.measure_type(measure.value)
+    converter_op.inputs.fields_container(fields_container)
+    converter_op.run()
+
+
+#: Key of the cached ply-wise failure results: criterion definition, time,
+#: element scope, and named selections. The ply scope is not part of the key.
+_PlyWiseFailureCacheKey = tuple[str, float | None, tuple[int, ...] | None, tuple[str, ...] | None]
+
+
 class CompositeModelImpl:
     """Provides access to the basic composite postprocessing functionality.
 
@@ -152,10 +244,14 @@ class CompositeModelImpl:
             self._reference_surface_and_mapping_field = _get_reference_surface_and_mapping_field(
                 data_sources=self.data_sources.composite, unit_system=self._unit_system
             )
+            self._element_layer_indices_field = self.get_mesh().property_field(
+                "element_layer_indices"
+            )
 
-            self._map_to_reference_surface_operator = _get_map_to_reference_surface_operator(
-                reference_surface_and_mapping_field=self._reference_surface_and_mapping_field,
-                element_layer_indices_field=self.get_mesh().property_field("element_layer_indices"),
+        self._result_partitions: list[ResultPartition] = []
+        if self.solver_type == SolverType.MAPDL and len(self._composite_files.result_files) > 1:
+            self._result_partitions = get_result_partitions(
+                self._composite_files.result_files, server=server
             )
 
         self._element_info_provider = get_element_info_provider(
@@ -163,11 +259,23 @@ class CompositeModelImpl:
             stream_provider_or_data_source=self.get_rst_streams_provider(),
             material_provider=self.material_operators.material_provider,
             solver_type=self.solver_type,
+            result_partitions=self._result_partitions,
         )
 
         self._layup_properties_provider = LayupPropertiesProvider(
             layup_provider=self._layup_provider, mesh=self.get_mesh()
         )
+        self._analysis_ply_incidence: AnalysisPlyIncidence | None = None
+        self._result_cache: ResultCache | None = None
+        self._ply_wise_failure_cache: (
+            tuple[_PlyWiseFailureCacheKey, PlyWiseFailureResults] | None
+        ) = None
+        self._memory_budget: int | None = None
+        # The lookup structures do not change after the model is created, so
+        # they are measured once. The sizes of the caches are measured when
+        # they change and are reused by the checks of the memory budget.
+        self._indexer_nbytes: dict[str, int] | None = None
+        self._cache_nbytes: dict[ModelCache, int] = {}
 
     @property
     def composite_definition_labels(self) -> Sequence[str]:
@@ -269,6 +377,7 @@ class CompositeModelImpl:
         measure: FailureMeasureEnum = FailureMeasureEnum.INVERSE_RESERVE_FACTOR,
         write_data_for_full_element_scope: bool = True,
         max_chunk_size: int = 50000,
+        cancel_event: threading.Event | None = None,
     ) -> FieldsContainer:
         """Get a fields container with the evaluated failure criteria.
 
@@ -301,7 +410,1011 @@ class CompositeModelImpl:
 
                 For some special element types such as beams,
                 ``write_data_for_full_element_scope=True`` is not supported.
+        cancel_event:
+            Event which is checked before each chunk. The evaluation is stopped with
+            a ``RuntimeError`` if the event is set.
+
+        """
+        with _span("evaluate_failure_criteria"):
+            min_merger = dpf.Operator("merge::fields_container")
+            max_merger = dpf.Operator("merge::fields_container")
+
+            merge_index = 0
+            for containers in self._iterate_failure_containers(
+                combined_criterion,
+                composite_scope,
+                write_data_for_full_element_scope,
+                max_chunk_size,
+                cancel_event,
+            ):
+                min_merger.connect(merge_index, containers.min_container)
+                max_merger.connect(merge_index, containers.max_container)
+                merge_index = merge_index + 1
+                last_max_container = containers.max_container
+
+            if self._supports_reference_surface_operators():
+                with _span("merge"):
+                    overall_max_container = max_merger.outputs.merged_fields_container()
+                    overall_min_container = min_merger.outputs.merged_fields_container()
+                with _span("map_to_reference_surface"):
+                    ref_surface_max_container = self._map_to_reference_surface(
+                        overall_min_container, overall_max_container
+                    )
+                with _span("convert_failure_measure"):
+                    _convert_failure_measure(overall_max_container, measure)
+                    self._convert_reference_surface_failure_measure(
+                        ref_surface_max_container, measure
+                    )
+                return _merge_containers(overall_max_container, ref_surface_max_container)
+            else:
+                with _span("merge"):
+                    overall_max_container = max_merger.outputs.merged_fields_container()
+                with _span("convert_failure_measure"):
+                    _convert_failure_measure(overall_max_container, measure)
+                return last_max_container
+
+    def export_failure_criteria(
+        self,
+        path: str | os.PathLike[str],
+        combined_criterion: CombinedFailureCriterion,
+        composite_scope: CompositeScope | None = None,
+        measure: FailureMeasureEnum = FailureMeasureEnum.INVERSE_RESERVE_FACTOR,
+        write_data_for_full_element_scope: bool = True,
+        max_chunk_size: int = 50000,
+        file_format: ExportFormat | None = None,
+    ) -> FailureExportResult:
+        """Evaluate the failure criteria and export the results to a columnar file.
+
+        The results of each chunk of elements are written as soon as they are
+        evaluated. The results mapped to the reference surface are written after
+        all chunks because they depend on the results of all elements of a stack.
+        See :class:`.FailureTableWriter` for the written tables and files.
+
+        Parameters
+        ----------
+        path:
+            Path of the exported file.
+        combined_criterion :
+            Combined failure criterion to evaluate.
+        composite_scope :
+            Composite scope on which to evaluate the failure criteria.
+        measure :
+            Failure measure to evaluate.
+        write_data_for_full_element_scope :
+            Whether each element in the element scope is to get a
+            (potentially zero) failure value.
+        max_chunk_size:
+            Maximum number of elements per chunk.
+        file_format:
+            Format of the exported file. If ``None``, the format is determined from the
+            suffix of ``path``.
+        """
+        time_values = self.get_result_times_or_frequencies()
+        supports_reference_surface = self._supports_reference_surface_operators()
+        min_merger = dpf.Operator("merge::fields_container")
+        max_merger = dpf.Operator("merge::fields_container")
+
+        with FailureTableWriter(
+            path, file_format, metadata={"failure_measure": measure.value}
+        ) as writer:
+            merge_index = 0
+            for containers in self._iterate_failure_containers(
+                combined_criterion,
+                composite_scope,
+                write_data_for_full_element_scope,
+                max_chunk_size,
+            ):
+                max_container = containers.max_container
+                if supports_reference_surface:
+                    # The measure is converted in place, but the reference surface
+                    # mapping requires the inverse reserve factors.
+                    min_merger.connect(merge_index, containers.min_container)
+                    max_merger.connect(merge_index, max_container.deep_copy(server=self._server))
+                    merge_index = merge_index + 1
+                _convert_failure_measure(max_container, measure)
+                writer.write_fields_container(max_container, time_values)
+
+            if supports_reference_surface:
+                ref_surface_max_container = self._map_to_reference_surface(
+                    min_merger.outputs.merged_fields_container(),
+                    max_merger.outputs.merged_fields_container(),
+                )
+                self._convert_reference_surface_failure_measure(ref_surface_max_container, measure)
+                writer.write_fields_container(ref_surface_max_container, time_values)
+
+        return writer.result
+
+    def get_most_critical(
+        self,
+        n: int,
+        combined_criterion: CombinedFailureCriterion,
+        composite_scope: CompositeScope | None = None,
+        measure: FailureMeasureEnum = FailureMeasureEnum.INVERSE_RESERVE_FACTOR,
+        max_chunk_size: int = 50000,
+    ) -> CriticalElements:
+        """Get the most critical elements of a failure evaluation.
+
+        Parameters
+        ----------
+        n:
+            Number of elements.
+        combined_criterion :
+            Combined failure criterion to evaluate.
+        composite_scope :
+            Composite scope on which to evaluate the failure criteria.
+        measure :
+            Failure measure to evaluate.
+        max_chunk_size:
+            Maximum number of elements per chunk.
+        """
+        if n < 1:
+            raise RuntimeError(f"The number of elements must be positive, got {n}.")
+        largest = measure == FailureMeasureEnum.INVERSE_RESERVE_FACTOR
+        time_values = self.get_result_times_or_frequencies()
+        columns: dict[FailureOutput | str, list[NDArray[Any]]] = {
+            "element_id": [],
+            "time": [],
+            FailureOutput.FAILURE_VALUE: [],
+            FailureOutput.FAILURE_MODE: [],
+            FailureOutput.MAX_LAYER_INDEX: [],
+        }
+
+        for containers in self._iterate_failure_containers(
+            combined_criterion, composite_scope, False, max_chunk_size
+        ):
+            max_container = containers.max_container
+            _convert_failure_measure(max_container, measure)
+            for time_id in max_container.get_available_ids_for_label(TIME_LABEL):
+                fields = _get_fields_by_failure_output(max_container, time_id)
+                value_field = fields[FailureOutput.FAILURE_VALUE]
+                element_ids = np.asarray(value_field.scoping.ids, dtype=np.int64)
+                values = np.asarray(value_field.data, dtype=np.double)
+                indices = _get_top_k_indices(values, element_ids, n, largest)
+                columns["element_id"].append(element_ids[indices])
+                columns["time"].append(np.full(len(indices), time_values[time_id - 1]))
+                columns[FailureOutput.FAILURE_VALUE].append(values[indices])
+                # The data of each field is transferred once and indexed by element ID
+                for output in (FailureOutput.FAILURE_MODE, FailureOutput.MAX_LAYER_INDEX):
+                    columns[output].append(
+                        _get_values_by_element(fields.get(output), element_ids[indices], -1).astype(
+                            np.int64
+                        )
+                    )
+
+            # Keep only the n most critical candidates of all chunks so far
+            merged = {key: np.concatenate(values) for key, values in columns.items()}
+            indices = _get_top_k_indices(
+                merged[FailureOutput.FAILURE_VALUE], merged["element_id"], n, largest
+            )
+            columns = {key: [values[indices]] for key, values in merged.items()}
+
+        result = {key: values[0] for key, values in columns.items()}
+        layer_offset = 1 if version_equal_or_later(self._server, "7.1") else 0
+        analysis_ply_names: list[str | None] = []
+        for element_id, layer_index in zip(
+            result["element_id"], result[FailureOutput.MAX_LAYER_INDEX]
+        ):
+            ply_names = (
+                self._layup_properties_provider.get_analysis_plies(int(element_id))
+                if self._has_analysis_plies()
+                else None
+            )
+            position = int(layer_index) - layer_offset
+            analysis_ply_names.append(
+                ply_names[position] if ply_names and 0 <= position < len(ply_names) else None
+            )
+
+        return CriticalElements(
+            element_ids=result["element_id"],
+            failure_values=result[FailureOutput.FAILURE_VALUE],
+            failure_modes=result[FailureOutput.FAILURE_MODE],
+            layer_indices=result[FailureOutput.MAX_LAYER_INDEX],
+            analysis_ply_names=analysis_ply_names,
+            times=result["time"],
+        )
+
+    def evaluate_load_combinations(
+        self,
+        combination_matrix: ArrayLike,
+        combined_criterion: CombinedFailureCriterion,
+        composite_scope: CompositeScope | None = None,
+        load_steps: Sequence[float] | None = None,
+        max_chunk_size: int = 10000,
+        max_combinations_per_batch: int = 16,
+    ) -> LoadCombinationEnvelope:
+        """Evaluate the failure criteria for superposed load cases.
+
+        Parameters
+        ----------
+        combination_matrix:
+            Factors of the load steps with one row per combination and one
+            column per load step.
+        combined_criterion :
+            Combined failure criterion to evaluate.
+        composite_scope :
+            Composite scope on which to evaluate the failure criteria. Only the
+            elements and named selections are supported.
+        load_steps :
+            Times or frequencies of the load steps. All times or frequencies in the
+            result file are used if ``None``.
+        max_chunk_size:
+            Maximum number of elements per chunk.
+        max_combinations_per_batch:
+            Maximum number of combinations which are evaluated at once.
+        """
+        if self.solver_type != SolverType.MAPDL:
+            raise RuntimeError("evaluate_load_combinations is implemented for MAPDL results only.")
+        if max_combinations_per_batch < 1:
+            raise RuntimeError(
+                "The number of combinations per batch must be positive, "
+                f"got {max_combinations_per_batch}."
+            )
+        if composite_scope is None:
+            composite_scope = CompositeScope()
+        if composite_scope.plies is not None or composite_scope.time is not None:
+            raise RuntimeError(
+                "The composite scope of a load combination supports only elements "
+                "and named selections."
+            )
+        if load_steps is None:
+            time_ids = list(range(1, len(self.get_result_times_or_frequencies()) + 1))
+        else:
+            time_ids = [self._get_time_id(load_step) for load_step in load_steps]
+        matrix = _validate_combination_matrix(combination_matrix, len(time_ids))
+
+        result_types = [ResultType.STRESS, ResultType.ELASTIC_STRAIN]
+        columns: dict[str, list[NDArray[Any]]] = {
+            "element_id": [],
+            "value": [],
+            "mode": [],
+            "layer": [],
+            "combination": [],
+        }
+        combination_failure_values = np.zeros(len(matrix), dtype=np.double)
+        for chunk_index, fields_containers in self._read_load_step_chunks(
+            result_types,
+            time_ids,
+            [] if composite_scope.elements is None else composite_scope.elements,
+            [] if composite_scope.named_selections is None else composite_scope.named_selections,
+            max_chunk_size,
+        ):
+            chunk_element_ids, indptr, data_by_result, units = self._transfer_load_step_data(
+                fields_containers,
+                [{TIME_LABEL: time_id} for time_id in time_ids],
+                "load_combination_chunk",
+                chunk_index,
+            )
+            # The combinations are evaluated in batches, so the memory of the
+            # combined data is bounded independently of the number of combinations
+            best_values = np.full(len(chunk_element_ids), -np.inf)
+            best_modes = np.full(len(chunk_element_ids), -1, dtype=np.int64)
+            best_layers = np.full(len(chunk_element_ids), -1, dtype=np.int64)
+            best_combinations = np.zeros(len(chunk_element_ids), dtype=np.int64)
+            rows = np.arange(len(chunk_element_ids))
+            for batch_start in range(0, len(matrix), max_combinations_per_batch):
+                batch_matrix = matrix[batch_start : batch_start + max_combinations_per_batch]
+                with _span(
+                    "load_combination_chunk.combine",
+                    chunk_index=chunk_index,
+                    number_of_combinations=len(batch_matrix),
+                ):
+                    combined_containers = [
+                        _create_combined_container(
+                            chunk_element_ids,
+                            indptr,
+                            _combine_load_steps(data_by_load_step, batch_matrix),
+                            unit,
+                            self._server,
+                        )
+                        for data_by_load_step, unit in zip(data_by_result, units)
+                    ]
+                values, modes, layers = self._evaluate_combined_failure(
+                    combined_criterion,
+                    combined_containers,
+                    chunk_element_ids,
+                    len(batch_matrix),
+                    "load_combination_chunk",
+                    chunk_index,
+                )
+
+                critical = np.argmax(values, axis=1)
+                batch_values = values[rows, critical]
+                # Ties are resolved in favor of the first combination, as by argmax
+                is_critical = batch_values > best_values
+                best_values[is_critical] = batch_values[is_critical]
+                best_modes[is_critical] = modes[rows, critical][is_critical]
+                best_layers[is_critical] = layers[rows, critical][is_critical]
+                best_combinations[is_critical] = batch_start + critical[is_critical]
+                if len(values) > 0:
+                    batch_failure_values = combination_failure_values[
+                        batch_start : batch_start + len(batch_matrix)
+                    ]
+                    np.maximum(batch_failure_values, values.max(axis=0), out=batch_failure_values)
+
+            columns["element_id"].append(chunk_element_ids)
+            columns["value"].append(best_values)
+            columns["mode"].append(best_modes)
+            columns["layer"].append(best_layers)
+            columns["combination"].append(best_combinations)
+
+        if len(columns["element_id"]) == 0:
+            raise RuntimeError("No elements are selected.")
+        return LoadCombinationEnvelope(
+            element_ids=np.concatenate(columns["element_id"]),
+            failure_values=np.concatenate(columns["value"]),
+            failure_modes=np.concatenate(columns["mode"]),
+            layer_indices=np.concatenate(columns["layer"]),
+            critical_combinations=np.concatenate(columns["combination"]),
+            combination_failure_values=combination_failure_values,
+        )
+
+    def evaluate_harmonic_failure(
+        self,
+        combined_criterion: CombinedFailureCriterion,
+        composite_scope: CompositeScope | None = None,
+        frequencies: Sequence[float] | None = None,
+        number_of_phases: int = 36,
+        refine_phases: bool = True,
+        max_chunk_size: int = 10000,
+    ) -> HarmonicFailureResults:
+        """Evaluate the maximum failure values of a harmonic analysis over the phase angle.
+
+        Parameters
+        ----------
+        combined_criterion :
+            Combined failure criterion to evaluate.
+        composite_scope :
+            Composite scope on which to evaluate the failure criteria. Only the
+            elements and named selections are supported.
+        frequencies :
+            Frequencies to evaluate. All frequencies in the result file are used
+            if ``None``.
+        number_of_phases :
+            Number of equally spaced phase angles in the range [-180, 180).
+        refine_phases :
+            Whether to evaluate the failure criteria once more at the estimated
+            critical phase angle of each element.
+        max_chunk_size:
+            Maximum number of elements per chunk.
+        """
+        if self.solver_type != SolverType.MAPDL:
+            raise RuntimeError("evaluate_harmonic_failure is implemented for MAPDL results only.")
+        if composite_scope is None:
+            composite_scope = CompositeScope()
+        if composite_scope.plies is not None or composite_scope.time is not None:
+            raise RuntimeError(
+                "The composite scope of a harmonic failure evaluation supports only "
+                "elements and named selections."
+            )
+        all_frequencies = self.get_result_times_or_frequencies()
+        if frequencies is None:
+            frequency_ids = list(range(1, len(all_frequencies) + 1))
+        else:
+            frequency_ids = [self._get_time_id(frequency) for frequency in frequencies]
+        if len(frequency_ids) == 0:
+            raise RuntimeError("At least one frequency is required.")
+        phases = _get_phases(number_of_phases)
+
+        columns: dict[str, list[NDArray[Any]]] = {
+            "element_id": [],
+            "value": [],
+            "mode": [],
+            "layer": [],
+            "frequency": [],
+            "phase": [],
+        }
+        for chunk_index, fields_containers in self._read_load_step_chunks(
+            [ResultType.STRESS, ResultType.ELASTIC_STRAIN],
+            frequency_ids,
+            [] if composite_scope.elements is None else composite_scope.elements,
+            [] if composite_scope.named_selections is None else composite_scope.named_selections,
+            max_chunk_size,
+        ):
+            if any("complex" not in container.labels for container in fields_containers):
+                raise RuntimeError(
+                    "evaluate_harmonic_failure requires the complex results of a "
+                    "harmonic analysis."
+                )
+            if refine_phases:
+                # Each element is refined at its own phase angle, which is done on
+                # the client. The real and imaginary part of all frequencies are
+                # transferred at once.
+                chunk_element_ids, indptr, data_by_result, units = self._transfer_load_step_data(
+                    fields_containers,
+                    [
+                        {TIME_LABEL: frequency_id, "complex": complex_id}
+                        for frequency_id in frequency_ids
+                        for complex_id in (0, 1)
+                    ],
+                    "harmonic_failure_chunk",
+                    chunk_index,
+                )
+            else:
+                chunk_element_ids = np.asarray(
+                    fields_containers[0]
+                    .get_field({TIME_LABEL: frequency_ids[0], "complex": 0})
+                    .scoping.ids,
+                    dtype=np.int64,
+                )
+                # The client data is only used for the refinement
+                indptr, data_by_result, units = np.zeros(1, dtype=np.int64), [], []
+            rows = np.arange(len(chunk_element_ids))
+            best_values = np.full(len(chunk_element_ids), -np.inf)
+            best_modes = np.full(len(chunk_element_ids), -1, dtype=np.int64)
+            best_layers = np.full(len(chunk_element_ids), -1, dtype=np.int64)
+            best_frequencies = np.zeros(len(chunk_element_ids), dtype=np.double)
+            best_phases = np.zeros(len(chunk_element_ids), dtype=np.double)
+
+            for frequency_index, frequency_id in enumerate(frequency_ids):
+                with _span(
+                    "harmonic_failure_chunk.sweep_phases",
+                    chunk_index=chunk_index,
+                    number_of_phases=number_of_phases,
+                ):
+                    phase_containers = [
+                        _create_phase_container(
+                            fields_container.get_field({TIME_LABEL: frequency_id, "complex": 0}),
+                            fields_container.get_field({TIME_LABEL: frequency_id, "complex": 1}),
+                            phases,
+                            self._server,
+                        )
+                        for fields_container in fields_containers
+                    ]
+                values, modes, layers = self._evaluate_combined_failure(
+                    combined_criterion,
+                    phase_containers,
+                    chunk_element_ids,
+                    number_of_phases,
+                    "harmonic_failure_chunk",
+                    chunk_index,
+                )
+                critical = np.argmax(values, axis=1)
+                frequency_values = values[rows, critical]
+                frequency_modes = modes[rows, critical]
+                frequency_layers = layers[rows, critical]
+                frequency_phases = phases[critical]
+
+                if refine_phases and len(chunk_element_ids) > 0:
+                    complex_data = [
+                        data[2 * frequency_index : 2 * frequency_index + 2]
+                        for data in data_by_result
+                    ]
+                    refined_phases = _refine_critical_phases(values, phases)
+                    # Each element is evaluated at its own phase angle
+                    row_factors = np.repeat(
+                        _get_phase_factors(refined_phases), np.diff(indptr), axis=0
+                    )
+                    with _span("harmonic_failure_chunk.refine_phases", chunk_index=chunk_index):
+                        refined_containers = [
+                            _create_combined_container(
+                                chunk_element_ids,
+                                indptr,
+                                np.einsum("vc,cv...->v...", row_factors, data)[np.newaxis],
+                                unit,
+                                self._server,
+                            )
+                            for data, unit in zip(complex_data, units)
+                        ]
+                    refined_values, refined_modes, refined_layers = self._evaluate_combined_failure(
+                        combined_criterion,
+                        refined_containers,
+                        chunk_element_ids,
+                        1,
+                        "harmonic_failure_chunk",
+                        chunk_index,
+                    )
+                    is_refined = refined_values[:, 0] > frequency_values
+                    frequency_values[is_refined] = refined_values[is_refined, 0]
+                    frequency_modes[is_refined] = refined_modes[is_refined, 0]
+                    frequency_layers[is_refined] = refined_layers[is_refined, 0]
+                    frequency_phases[is_refined] = refined_phases[is_refined]
+
+                is_critical = frequency_values > best_values
+                best_values[is_critical] = frequency_values[is_critical]
+                best_modes[is_critical] = frequency_modes[is_critical]
+                best_layers[is_critical] = frequency_layers[is_critical]
+                best_frequencies[is_critical] = all_frequencies[frequency_id - 1]
+                best_phases[is_critical] = frequency_phases[is_critical]
+
+            columns["element_id"].append(chunk_element_ids)
+            columns["value"].append(best_values)
+            columns["mode"].append(best_modes)
+            columns["layer"].append(best_layers)
+            columns["frequency"].append(best_frequencies)
+            columns["phase"].append(best_phases)
+
+        if len(columns["element_id"]) == 0:
+            raise RuntimeError("No elements are selected.")
+        return HarmonicFailureResults(
+            element_ids=np.concatenate(columns["element_id"]),
+            failure_values=np.concatenate(columns["value"]),
+            failure_modes=np.concatenate(columns["mode"]),
+            layer_indices=np.concatenate(columns["layer"]),
+            critical_frequencies=np.concatenate(columns["frequency"]),
+            critical_phases=np.concatenate(columns["phase"]),
+        )
+
+    def _transfer_load_step_data(
+        self,
+        fields_containers: list[FieldsContainer],
+        label_spaces: list[dict[str, int]],
+        span_prefix: str,
+        chunk_index: int,
+    ) -> tuple[NDArray[np.int64], NDArray[np.int64], list[NDArray[np.double]], list[str]]:
+        """Transfer the fields of several label spaces of a chunk to the client.
+
+        Returns the element IDs and the row pointer of the chunk, the data of each
+        fields container with the shape (label spaces, values, components), and
+        the units of the fields containers. The first field defines the element order.
+        The real part of complex results is selected if the label space does not
+        specify the ``complex`` label.
+        """
+        with _span(f"{span_prefix}.transfer", chunk_index=chunk_index) as span:
+            fields_data = [
+                [
+                    _get_field_data_as_csr(
+                        fields_container.get_field(
+                            {"complex": 0, **label_space}
+                            if "complex" in fields_container.labels
+                            else label_space
+                        )
+                    )
+                    for label_space in label_spaces
+                ]
+                for fields_container in fields_containers
+            ]
+            span["bytes"] = sum(
+                array.nbytes
+                for result_data in fields_data
+                for field_data in result_data
+                for array in field_data
+            )
+
+        chunk_element_ids, indptr, _ = fields_data[0][0]
+        data_by_result = [
+            np.stack(
+                [
+                    _select_csr_rows(field_ids, field_indptr, data, chunk_element_ids)[1]
+                    for field_ids, field_indptr, data in result_data
+                ]
+            )
+            for result_data in fields_data
+        ]
+        units = [fields_container[0].unit for fields_container in fields_containers]
+        return chunk_element_ids, indptr, data_by_result, units
+
+    def _evaluate_combined_failure(
+        self,
+        combined_criterion: CombinedFailureCriterion,
+        combined_containers: list[FieldsContainer],
+        element_ids: NDArray[np.int64],
+        number_of_combinations: int,
+        span_prefix: str,
+        chunk_index: int,
+    ) -> tuple[NDArray[np.double], NDArray[np.int64], NDArray[np.int64]]:
+        """Evaluate the failure criteria for combined stresses and strains.
+
+        The combination ``i`` has the time ID ``i + 1`` in the stress and strain
+        containers. Returns the failure values, modes, and critical layers with
+        the shape (elements, combinations).
+        """
+        failure_evaluator = dpf.Operator(
+            "composite::multiple_failure_criteria_operator", server=self._server
+        )
+        failure_evaluator.inputs.configuration(combined_criterion.to_json())
+        failure_evaluator.inputs.materials_container(self.material_operators.material_provider)
+        failure_evaluator.inputs.stresses_container(combined_containers[0])
+        failure_evaluator.inputs.strains_container(combined_containers[1])
+        failure_evaluator.inputs.section_data_container(
+            self._layup_provider.outputs.section_data_container
+        )
+        failure_evaluator.inputs.mesh_properties_container(
+            self._layup_provider.outputs.mesh_properties_container
+        )
+        failure_evaluator.inputs.layup_model_context_type(self.layup_model_type.value)
+        failure_evaluator.inputs.mesh(self.get_mesh())
+        with _span(f"{span_prefix}.evaluate", chunk_index=chunk_index):
+            layered_container = failure_evaluator.outputs.fields_container()
+
+        minmax_el_op = dpf.Operator("composite::minmax_per_element_operator", server=self._server)
+        minmax_el_op.inputs.fields_container(layered_container)
+        minmax_el_op.inputs.mesh(self.get_mesh())
+        minmax_el_op.inputs.material_support(
+            self.material_operators.material_support_provider.outputs
+        )
+        with _span(f"{span_prefix}.min_max_reduction", chunk_index=chunk_index):
+            max_container = minmax_el_op.outputs.field_max()
+
+        values = np.empty((len(element_ids), number_of_combinations), dtype=np.double)
+        modes = np.empty_like(values)
+        layers = np.empty_like(values)
+        for combination_index in range(number_of_combinations):
+            fields = _get_fields_by_failure_output(max_container, combination_index + 1)
+            values[:, combination_index] = _get_values_by_element(
+                fields.get(FailureOutput.FAILURE_VALUE), element_ids, 0.0
+            )
+            modes[:, combination_index] = _get_values_by_element(
+                fields.get(FailureOutput.FAILURE_MODE), element_ids, -1
+            )
+            layers[:, combination_index] = _get_values_by_element(
+                fields.get(FailureOutput.MAX_LAYER_INDEX), element_ids, -1
+            )
+        return values, modes.astype(np.int64), layers.astype(np.int64)
+
+    def get_failure_statistics(
+        self,
+        combined_criterion: CombinedFailureCriterion,
+        composite_scope: CompositeScope | None = None,
+        bin_edges: Sequence[float] | NDArray[np.double] | None = None,
+        max_chunk_size: int = 50000,
+    ) -> FailureStatistics:
+        """Get streaming statistics of the failure values.
+
+        Parameters
+        ----------
+        combined_criterion :
+            Combined failure criterion to evaluate.
+        composite_scope :
+            Composite scope on which to evaluate the failure criteria.
+        bin_edges:
+            Edges of the histogram bins. :func:`.get_default_bin_edges` is used if ``None``.
+        max_chunk_size:
+            Maximum number of elements per chunk.
+        """
+        bin_edges = np.asarray(
+            get_default_bin_edges() if bin_edges is None else bin_edges, dtype=np.double
+        )
+        statistics = FailureStatistics(
+            elements=StreamingHistogram(bin_edges),
+            analysis_plies={},
+            materials={},
+            failure_mode_counts={},
+        )
+        analysis_ply_names = (
+            get_analysis_ply_index_to_name_map(self.get_mesh())
+            if self._has_analysis_plies()
+            else None
+        )
+
+        for containers in self._iterate_failure_containers(
+            combined_criterion, composite_scope, False, max_chunk_size
+        ):
+            for time_id in containers.max_container.get_available_ids_for_label(TIME_LABEL):
+                max_fields = _get_fields_by_failure_output(containers.max_container, time_id)
+                statistics.elements.update(max_fields[FailureOutput.FAILURE_VALUE].data)
+                modes, counts = np.unique(
+                    np.rint(max_fields[FailureOutput.FAILURE_MODE].data).astype(np.int64),
+                    return_counts=True,
+                )
+                for mode, count in zip(modes, counts):
+                    statistics.failure_mode_counts[int(mode)] = statistics.failure_mode_counts.get(
+                        int(mode), 0
+                    ) + int(count)
+
+                layered_fields = _get_fields_by_failure_output(
+                    containers.layered_container, time_id
+                )
+                self._update_layered_failure_statistics(
+                    statistics,
+                    layered_fields[FailureOutput.FAILURE_VALUE],
+                    bin_edges,
+                    analysis_ply_names,
+                )
+        return statistics
+
+    def evaluate_ply_wise_failure_criteria(
+        self,
+        combined_criterion: CombinedFailureCriterion,
+        composite_scope: CompositeScope | None = None,
+        max_chunk_size: int = 50000,
+    ) -> PlyWiseFailureResults:
+        """Get the maximum failure value of each element in each analysis ply.
+
+        Parameters
+        ----------
+        combined_criterion :
+            Combined failure criterion to evaluate.
+        composite_scope :
+            Composite scope on which to evaluate the failure criteria.
+        max_chunk_size:
+            Maximum number of elements per chunk.
+        """
+        if composite_scope is None:
+            composite_scope = CompositeScope()
+        key = (
+            combined_criterion.to_json(),
+            composite_scope.time,
+            None if composite_scope.elements is None else tuple(sorted(composite_scope.elements)),
+            (
+                None
+                if composite_scope.named_selections is None
+                else tuple(composite_scope.named_selections)
+            ),
+        )
+        cached = self._ply_wise_failure_cache
+        if cached is not None and cached[0] == key:
+            results = cached[1]
+        else:
+            results = self._evaluate_ply_wise_failure_criteria(
+                combined_criterion, replace(composite_scope, plies=None), max_chunk_size
+            )
+            self._ply_wise_failure_cache = (key, results)
+            self._enforce_memory_budget([ModelCache.PLY_WISE_FAILURE])
+
+        if composite_scope.plies is None:
+            return results
+        # Raises for plies without results, for example misspelled ply names
+        return results.select_plies(composite_scope.plies)
+
+    def clear_ply_wise_failure_cache(self) -> None:
+        """Release the cached ply-wise failure results."""
+        self._ply_wise_failure_cache = None
+        self._cache_nbytes.pop(ModelCache.PLY_WISE_FAILURE, None)
+
+    def _get_element_info_cache(self) -> dict[int, ElementInfo | None]:
+        if isinstance(
+            self._element_info_provider, (ElementInfoProvider, ElementInfoProviderLSDyna)
+        ):
+            # pylint: disable=protected-access
+            return self._element_info_provider._element_info_cache
+        return {}
+
+    def _get_cache_nbytes(self, cache: ModelCache) -> int:
+        if cache == ModelCache.ELEMENT_INFO:
+            return _estimate_dict_nbytes(self._get_element_info_cache())
+        if cache == ModelCache.ANALYSIS_PLY_INCIDENCE:
+            return _get_nbytes(self._analysis_ply_incidence)
+        if cache == ModelCache.PLY_WISE_FAILURE:
+            return _get_nbytes(self._ply_wise_failure_cache)
+        if cache == ModelCache.RESULT:
+            return _get_nbytes(self._result_cache)
+        raise RuntimeError(f"Unknown cache: {cache}.")
+
+    def _get_indexer_nbytes(self) -> dict[str, int]:
+        if self._indexer_nbytes is None:
+            self._indexer_nbytes = {
+                "element_info_provider": _get_nbytes(
+                    self._element_info_provider,
+                    visited={id(self._get_element_info_cache())},
+                ),
+                "layup_properties_provider": _get_nbytes(self._layup_properties_provider),
+            }
+        return self._indexer_nbytes
+
+    def memory_report(self) -> MemoryReport:
+        """Get the estimated client memory of the caches and lookup structures."""
+        self._cache_nbytes = {cache: self._get_cache_nbytes(cache) for cache in ModelCache}
+        return MemoryReport(
+            cache_bytes=dict(self._cache_nbytes), indexer_bytes=dict(self._get_indexer_nbytes())
+        )
+
+    def clear_caches(self, caches: Collection[ModelCache] | None = None) -> None:
+        """Release cached data.
+
+        Parameters
+        ----------
+        caches:
+            Caches to release. All caches are released if ``None``.
+        """
+        for cache in ModelCache if caches is None else caches:
+            self._cache_nbytes.pop(cache, None)
+            if cache == ModelCache.ELEMENT_INFO:
+                if isinstance(
+                    self._element_info_provider, (ElementInfoProvider, ElementInfoProviderLSDyna)
+                ):
+                    self._element_info_provider.clear_cache()
+            elif cache == ModelCache.ANALYSIS_PLY_INCIDENCE:
+                self._analysis_ply_incidence = None
+            elif cache == ModelCache.PLY_WISE_FAILURE:
+                self.clear_ply_wise_failure_cache()
+            elif cache == ModelCache.RESULT:
+                if self._result_cache is not None:
+                    self._result_cache.clear()
+            else:
+                raise RuntimeError(f"Unknown cache: {cache}.")
+
+    @property
+    def memory_budget(self) -> int | None:
+        """Maximum client memory of the caches and lookup structures in bytes."""
+        return self._memory_budget
+
+    def set_memory_budget(self, max_bytes: int | None) -> None:
+        """Set the memory budget and release caches until it is met.
+
+        Parameters
+        ----------
+        max_bytes:
+            Maximum client memory in bytes. The budget is disabled if ``None``.
+        """
+        if max_bytes is not None and max_bytes < 0:
+            raise RuntimeError(f"The memory budget must not be negative, got {max_bytes}.")
+        self._memory_budget = max_bytes
+        self._enforce_memory_budget(list(ModelCache))
+
+    def _enforce_memory_budget(self, changed_caches: Iterable[ModelCache]) -> None:
+        """Release the largest caches until the memory budget is met.
+
+        Only the changed caches and the caches which have not been measured
+        yet are measured. The lay-up information is also cached by
+        :meth:`get_element_info`, which does not check the budget, so it is
+        always estimated. The estimate only measures a sample of the entries.
+        """
+        if self._memory_budget is None:
+            return
+        for cache in {*changed_caches, ModelCache.ELEMENT_INFO}:
+            self._cache_nbytes[cache] = self._get_cache_nbytes(cache)
+        for cache in ModelCache:
+            if cache not in self._cache_nbytes:
+                self._cache_nbytes[cache] = self._get_cache_nbytes(cache)
+
+        excess = (
+            sum(self._cache_nbytes.values())
+            + sum(self._get_indexer_nbytes().values())
+            - self._memory_budget
+        )
+        for cache, size in sorted(self._cache_nbytes.items(), key=lambda item: -item[1]):
+            if excess <= 0 or size == 0:
+                return
+            self.clear_caches([cache])
+            excess -= size
+
+    def _evaluate_ply_wise_failure_criteria(
+        self,
+        combined_criterion: CombinedFailureCriterion,
+        composite_scope: CompositeScope,
+        max_chunk_size: int,
+    ) -> PlyWiseFailureResults:
+        if not self._has_analysis_plies():
+            raise RuntimeError("Ply-wise failure results require a lay-up with analysis plies.")
+
+        time_values = self.get_result_times_or_frequencies()
+        entries: dict[str, list[NDArray[Any]]] = {
+            "element_ids": [],
+            "analysis_ply_indices": [],
+            "failure_values": [],
+            "failure_modes": [],
+        }
+        time_ids: set[int] = set()
+        for containers in self._iterate_failure_containers(
+            combined_criterion, composite_scope, False, max_chunk_size
+        ):
+            for time_id in containers.layered_container.get_available_ids_for_label(TIME_LABEL):
+                time_ids.add(time_id)
+                layered_fields = _get_fields_by_failure_output(
+                    containers.layered_container, time_id
+                )
+                if layered_fields[FailureOutput.FAILURE_VALUE].scoping.size == 0:
+                    continue
+                element_ids, indptr, data, columns = self._get_layered_failure_data(
+                    layered_fields[FailureOutput.FAILURE_VALUE]
+                )
+                columns, analysis_ply_indices = self._get_analysis_ply_columns(element_ids, columns)
+                argmax_result = reduce_layered_data(
+                    data,
+                    indptr,
+                    columns,
+                    GroupingKey.ANALYSIS_PLY,
+                    ReductionOperation.ARGMAX,
+                    analysis_ply_indices=analysis_ply_indices,
+                )
+                # The element IDs of the field are not necessarily sorted
+                sorter = np.argsort(element_ids)
+                positions = sorter[
+                    np.searchsorted(
+                        element_ids, argmax_result.element_group_element_ids, sorter=sorter
+                    )
+                ]
+                data_indices = indptr[positions] + argmax_result.element_group_values
+                _, _, mode_data = _get_field_data_as_csr(layered_fields[FailureOutput.FAILURE_MODE])
+                entries["element_ids"].append(argmax_result.element_group_element_ids)
+                entries["analysis_ply_indices"].append(argmax_result.element_group_ids)
+                entries["failure_values"].append(data[data_indices])
+                entries["failure_modes"].append(
+                    np.rint(np.ravel(mode_data)[data_indices]).astype(np.int64)
+                )
+        if len(time_ids) > 1:
+            raise RuntimeError("Ply-wise failure results are only supported for a single time.")
+        if len(entries["element_ids"]) == 0:
+            raise RuntimeError("No elements are selected.")
+
+        merged = {name: np.concatenate(values) for name, values in entries.items()}
+        order = np.lexsort((merged["element_ids"], merged["analysis_ply_indices"]))
+        merged = {name: values[order] for name, values in merged.items()}
+        ply_indices, counts = np.unique(merged["analysis_ply_indices"], return_counts=True)
+        ply_indptr = np.zeros(len(ply_indices) + 1, dtype=np.int64)
+        np.cumsum(counts, out=ply_indptr[1:])
+        analysis_ply_names = get_analysis_ply_index_to_name_map(self.get_mesh())
+        return PlyWiseFailureResults(
+            analysis_ply_names=[analysis_ply_names[int(index)] for index in ply_indices],
+            analysis_ply_indices=ply_indices.astype(np.int64),
+            indptr=ply_indptr,
+            element_ids=merged["element_ids"].astype(np.int64),
+            failure_values=merged["failure_values"].astype(np.double),
+            failure_modes=merged["failure_modes"],
+            time=float(time_values[next(iter(time_ids)) - 1]),
+        )
+
+    def _update_layered_failure_statistics(
+        self,
+        statistics: FailureStatistics,
+        failure_value_field: Field,
+        bin_edges: NDArray[np.double],
+        analysis_ply_names: dict[int, str] | None,
+    ) -> None:
+        element_ids, indptr, data, columns = self._get_layered_failure_data(failure_value_field)
+        material_result = reduce_layered_data(data, indptr, columns, GroupingKey.MATERIAL)
+        _update_grouped_histograms(
+            statistics.materials,
+            material_result.element_group_ids,
+            material_result.element_group_values,
+            bin_edges,
+        )
+        if analysis_ply_names is None:
+            return
+
+        columns, analysis_ply_indices = self._get_analysis_ply_columns(element_ids, columns)
+        ply_result = reduce_layered_data(
+            data,
+            indptr,
+            columns,
+            GroupingKey.ANALYSIS_PLY,
+            analysis_ply_indices=analysis_ply_indices,
+        )
+        _update_grouped_histograms(
+            statistics.analysis_plies,
+            ply_result.element_group_ids,
+            ply_result.element_group_values,
+            bin_edges,
+            analysis_ply_names,
+        )
+
+    def _get_layered_failure_data(
+        self, failure_field: Field
+    ) -> tuple[NDArray[np.int64], NDArray[np.int64], NDArray[Any], ElementInfoColumns]:
+        """Get the data of a layered failure field and the lay-up of its elements.
+
+        Elements whose failure values do not cover all layers are marked as
+        non-layered, so they are ignored by :func:`.reduce_layered_data`.
+        """
+        element_ids, indptr, data = _get_field_data_as_csr(failure_field)
+        if data.ndim > 1:
+            data = data[:, 0]
+        columns = get_element_info_columns(self._element_info_provider, element_ids)
+        columns = replace(
+            columns,
+            is_layered=columns.is_layered & (np.diff(indptr) == columns.number_of_elementary_data),
+        )
+        return element_ids, indptr, data, columns
+
+    def _get_analysis_ply_columns(
+        self, element_ids: NDArray[np.int64], columns: ElementInfoColumns
+    ) -> tuple[ElementInfoColumns, LayeredElementData]:
+        """Get the analysis ply indices of elements.
+
+        Elements without analysis ply for each layer are marked as non-layered.
+        """
+        analysis_ply_indices = self.get_analysis_ply_indices_for_elements(
+            cast(Sequence[int], element_ids)
+        )
+        columns = replace(
+            columns,
+            is_layered=columns.is_layered
+            & (analysis_ply_indices.number_of_layers == columns.n_layers),
+        )
+        return columns, analysis_ply_indices
 
+    def _iterate_failure_containers(
+        self,
+        combined_criterion: CombinedFailureCriterion,
+        composite_scope: CompositeScope | None,
+        write_data_for_full_element_scope: bool,
+        max_chunk_size: int,
+        cancel_event: threading.Event | None = None,
+    ) -> Iterator[_FailureChunkContainers]:
+        """Evaluate the failure criteria chunk by chunk.
+
+        Yields the fields containers of each chunk. The failure measure is
+        the inverse reserve factor.
         """
         if self.solver_type != SolverType.MAPDL:
             raise RuntimeError("evaluate_failure_criteria is implemented for MAPDL results only.")
@@ -335,30 +1448,17 @@ class CompositeModelImpl:
                 selected_plies_op.connect(value[0], value[1])
             scope_config_reader_op.inputs.ply_ids(selected_plies_op.outputs.strings)
 
-        # configure operator to chunk the scope
-        chunking_data_tree = dpf.DataTree({"max_chunk_size": max_chunk_size})
-        if ns_in:
-            chunking_data_tree.add({"named_selections": ns_in})
-
-        chunking_generator = dpf.Operator("composite::scope_generator")
-        chunking_generator.inputs.stream_provider(self.get_rst_streams_provider())
-        chunking_generator.inputs.data_tree(chunking_data_tree)
-        if self.data_sources.composite:
-            chunking_generator.inputs.data_sources(self.data_sources.composite)
-
-        if element_scope_in:
-            element_scope = dpf.Scoping(location="elemental")
-            element_scope.ids = element_scope_in
-            chunking_generator.inputs.element_scoping(element_scope)
-
-        min_merger = dpf.Operator("merge::fields_container")
-        max_merger = dpf.Operator("merge::fields_container")
+        chunking_generator = self._get_chunking_generator(max_chunk_size, element_scope_in, ns_in)
 
         merge_index = 0
 
         while True:
-            chunking_generator.inputs.generator_counter(merge_index)
-            finished = chunking_generator.outputs.is_finished()
+            if cancel_event is not None and cancel_event.is_set():
+                raise RuntimeError("The evaluation of the failure criteria was cancelled.")
+
+            with _span("failure_chunk.generate_scope", chunk_index=merge_index):
+                chunking_generator.inputs.generator_counter(merge_index)
+                finished = chunking_generator.outputs.is_finished()
             if finished:
                 break
 
@@ -406,90 +1506,94 @@ class CompositeModelImpl:
             # Ensure that sandwich criteria are evaluated
             evaluate_failure_criterion_per_scope_op.inputs.request_sandwich_results(True)
 
+            # The failure container is evaluated first, so the evaluation and the
+            # min/max reduction can be timed separately.
+            with _span("failure_chunk.evaluate", chunk_index=merge_index):
+                layered_container = (
+                    evaluate_failure_criterion_per_scope_op.outputs.failure_container()
+                )
+
             # Note: the min/max layer indices are 1-based starting with
             # Workbench 2024 R1 (DPF server 7.1)
             minmax_el_op = dpf.Operator("composite::minmax_per_element_operator")
-            minmax_el_op.inputs.fields_container(
-                evaluate_failure_criterion_per_scope_op.outputs.failure_container
-            )
+            minmax_el_op.inputs.fields_container(layered_container)
 
             minmax_el_op.inputs.mesh(self.get_mesh())
             minmax_el_op.inputs.material_support(
                 self.material_operators.material_support_provider.outputs
             )
 
+            # It is important to evaluate the field here, otherwise the merge operator detects
+            # the workflow as changed if upstream operator inputs change
+            with _span("failure_chunk.min_max_reduction", chunk_index=merge_index) as span:
+                min_container = minmax_el_op.outputs.field_min()
+                max_container = minmax_el_op.outputs.field_max()
+                if _is_tracing() and len(max_container) > 0:
+                    span["number_of_elements"] = max_container[0].scoping.size
+
             if (
                 self.layup_model_type != LayupModelContextType.NOT_AVAILABLE
                 and write_data_for_full_element_scope
             ):
-                add_default_data_op = dpf.Operator("composite::add_default_data")
-                add_default_data_op.inputs.requested_element_scoping(chunking_generator.outputs)
-                add_default_data_op.inputs.time_id(
-                    evaluate_failure_criterion_per_scope_op.outputs.time_id
-                )
-
-                add_default_data_op.inputs.mesh(self.get_mesh())
-
-                add_default_data_op.inputs.fields_container(minmax_el_op.outputs.field_min)
-                add_default_data_op.run()
-
-                add_default_data_op.inputs.fields_container(minmax_el_op.outputs.field_max)
-                add_default_data_op.run()
-
-            # It is important to evaluate the field here, otherwise the merge operator detects
-            # the workflow as changed if upstream operator inputs change
-            min_container = minmax_el_op.outputs.field_min()
-            max_container = minmax_el_op.outputs.field_max()
-
-            min_merger.connect(merge_index, min_container)
-            max_merger.connect(merge_index, max_container)
+                with _span("failure_chunk.add_default_data", chunk_index=merge_index):
+                    add_default_data_op = dpf.Operator("composite::add_default_data")
+                    add_default_data_op.inputs.requested_element_scoping(chunking_generator.outputs)
+                    add_default_data_op.inputs.time_id(
+                        evaluate_failure_criterion_per_scope_op.outputs.time_id
+                    )
+
+                    add_default_data_op.inputs.mesh(self.get_mesh())
+
+                    # The containers are extended in place
+                    add_default_data_op.inputs.fields_container(min_container)
+                    add_default_data_op.run()
+
+                    add_default_data_op.inputs.fields_container(max_container)
+                    add_default_data_op.run()
+
+            yield _FailureChunkContainers(
+                min_container=min_container,
+                max_container=max_container,
+                layered_container=layered_container,
+            )
             merge_index = merge_index + 1
 
         if merge_index == 0:
             raise RuntimeError("No output is generated! Check the scope (element and ply IDs).")
 
-        if self._supports_reference_surface_operators():
-            overall_max_container = max_merger.outputs.merged_fields_container()
-
-            self._map_to_reference_surface_operator.inputs.min_container(
-                min_merger.outputs.merged_fields_container()
-            )
-            self._map_to_reference_surface_operator.inputs.max_container(overall_max_container)
-
-            ref_surface_max_container = (
-                self._map_to_reference_surface_operator.outputs.max_container()
-            )
-
-            converter_op = dpf.Operator("composite::failure_measure_converter")
-            converter_op.inputs.measure_type(measure.value)
-            converter_op.inputs.fields_container(overall_max_container)
-            converter_op.run()
-            converter_op.inputs.fields_container(ref_surface_max_container)
-            converter_op.run()
-
-            if version_older_than(self._server, "8.2"):
-                # For versions before 8.2, the Reference Surface suffix
-                # is not correctly preserved by the failure_measure_converter
-                # We add the suffix manually here.
-                for field in ref_surface_max_container:
-                    if (
-                        field.name.startswith("IRF")
-                        or field.name.startswith("SF")
-                        or field.name.startswith("SM")
-                    ):
-                        assert not field.name.endswith(REF_SURFACE_NAME)
-                        # Set name in field definition, because setting
-                        # the name directly is not supported for older dpf versions
-                        field_definition = field.field_definition
-                        field_definition.name = field_definition.name + " " + REF_SURFACE_NAME
-
-            return _merge_containers(overall_max_container, ref_surface_max_container)
-        else:
-            converter_op = dpf.Operator("composite::failure_measure_converter")
-            converter_op.inputs.measure_type(measure.value)
-            converter_op.inputs.fields_container(max_merger.outputs.merged_fields_container())
-            converter_op.run()
-            return max_container
+    def _map_to_reference_surface(
+        self, min_container: FieldsContainer, max_container: FieldsContainer
+    ) -> FieldsContainer:
+        # Each call creates its own operator so that concurrent calls
+        # do not change the inputs of a shared operator.
+        map_to_reference_surface_operator = _get_map_to_reference_surface_operator(
+            reference_surface_and_mapping_field=self._reference_surface_and_mapping_field,
+            element_layer_indices_field=self._element_layer_indices_field,
+        )
+        map_to_reference_surface_operator.inputs.min_container(min_container)
+        map_to_reference_surface_operator.inputs.max_container(max_container)
+        return cast(FieldsContainer, map_to_reference_surface_operator.outputs.max_container())
+
+    def _convert_reference_surface_failure_measure(
+        self, ref_surface_max_container: FieldsContainer, measure: FailureMeasureEnum
+    ) -> None:
+        _convert_failure_measure(ref_surface_max_container, measure)
+
+        if version_older_than(self._server, "8.2"):
+            # For versions before 8.2, the Reference Surface suffix
+            # is not correctly preserved by the failure_measure_converter
+            # We add the suffix manually here.
+            for field in ref_surface_max_container:
+                if (
+                    field.name.startswith("IRF")
+                    or field.name.startswith("SF")
+                    or field.name.startswith("SM")
+                ):
+                    assert not field.name.endswith(REF_SURFACE_NAME)
+                    # Set name in field definition, because setting
+                    # the name directly is not supported for older dpf versions
+                    field_definition = field.field_definition
+                    field_definition.name = field_definition.name + " " + REF_SURFACE_NAME
 
     @_deprecated_composite_definition_label
     def get_sampling_point(
@@ -644,6 +1748,132 @@ class CompositeModelImpl:
         """
         return self._layup_properties_provider.get_element_laminate_offset(element_id)
 
+    def get_property_for_elements(
+        self,
+        layup_property: LayerProperty,
+        element_ids: Sequence[int] | None = None,
+    ) -> LayeredElementData:
+        """Get a layer property for multiple elements.
+
+        Parameters
+        ----------
+        layup_property:
+            Lay-up property.
+        element_ids:
+            Element IDs or labels. All layered elements are selected if ``None``.
+        """
+        if layup_property == LayerProperty.ANGLES:
+            return self._layup_properties_provider.get_layer_angles_for_elements(element_ids)
+        if layup_property == LayerProperty.THICKNESSES:
+            return self._layup_properties_provider.get_layer_thicknesses_for_elements(element_ids)
+        if layup_property == LayerProperty.SHEAR_ANGLES:
+            return self._layup_properties_provider.get_layer_shear_angles_for_elements(element_ids)
+        raise RuntimeError(f"Invalid property {layup_property}")
+
+    def get_analysis_ply_indices_for_elements(
+        self, element_ids: Sequence[int] | None = None
+    ) -> LayeredElementData:
+        """Get the analysis ply indices of all layers of multiple elements.
+
+        Parameters
+        ----------
+        element_ids:
+            Element IDs or labels. All layered elements are selected if ``None``.
+        """
+        return self._layup_properties_provider.get_analysis_ply_indices_for_elements(element_ids)
+
+    def get_element_laminate_offsets(
+        self, element_ids: Sequence[int] | None = None
+    ) -> NDArray[np.double]:
+        """Get the laminate offsets of multiple elements.
+
+        Parameters
+        ----------
+        element_ids:
+            Element IDs or labels. All layered elements are selected if ``None``.
+        """
+        return self._layup_properties_provider.get_element_laminate_offsets(element_ids)
+
+    def get_laminate_thicknesses(
+        self, element_ids: Sequence[int] | None = None
+    ) -> NDArray[np.double]:
+        """Get the total laminate thicknesses of multiple elements.
+
+        Parameters
+        ----------
+        element_ids:
+            Element IDs or labels. All layered elements are selected if ``None``.
+        """
+        return self._layup_properties_provider.get_laminate_thicknesses(element_ids)
+
+    def get_number_of_layers(self, element_ids: Sequence[int] | None = None) -> NDArray[np.int64]:
+        """Get the number of layers of multiple elements.
+
+        Parameters
+        ----------
+        element_ids:
+            Element IDs or labels. All layered elements are selected if ``None``.
+        """
+        return self._layup_properties_provider.get_number_of_layers(element_ids)
+
+    def get_analysis_ply_incidence(self) -> AnalysisPlyIncidence:
+        """Get the sparse incidence matrix of layered elements and analysis plies.
+
+        The matrix is built on the first call and reused afterwards.
+        """
+        if self._analysis_ply_incidence is None:
+            analysis_ply_incidence = self._layup_properties_provider.get_analysis_ply_incidence()
+            self._analysis_ply_incidence = analysis_ply_incidence
+            self._enforce_memory_budget([ModelCache.ANALYSIS_PLY_INCIDENCE])
+            # The budget can release the cache, so the local reference is returned
+            return analysis_ply_incidence
+        return self._analysis_ply_incidence
+
+    def get_element_info_columns(self, element_ids: Sequence[int]) -> ElementInfoColumns:
+        """Get the lay-up information of multiple elements as arrays.
+
+        Parameters
+        ----------
+        element_ids:
+            Element IDs or labels.
+        """
+        element_info_columns = get_element_info_columns(self._element_info_provider, element_ids)
+        self._enforce_memory_budget([ModelCache.ELEMENT_INFO])
+        return element_info_columns
+
+    def reduce_layered_field(
+        self,
+        field: Field,
+        grouping_key: GroupingKey,
+        reduction: ReductionOperation = ReductionOperation.MAX,
+        component: IntEnum | int = 0,
+        selected_groups: Collection[int] | None = None,
+    ) -> LayeredReductionResult:
+        """Reduce the elementary data of a layered field grouped by a key.
+
+        Parameters
+        ----------
+        field:
+            Elemental nodal field of layered data.
+        grouping_key:
+            Key by which the data is grouped.
+        reduction:
+            Reduction applied to each group.
+        component:
+            Component of the field to reduce.
+        selected_groups:
+            Groups to consider. All groups are considered by default.
+        """
+        return reduce_layered_field(
+            field,
+            self._element_info_provider,
+            grouping_key,
+            reduction,
+            component=component,
+            layup_properties_provider=self._layup_properties_provider,
+            selected_groups=selected_groups,
+        )
+
     @_deprecated_composite_definition_label
     def get_constant_property_dict(
         self,
@@ -685,6 +1915,470 @@ class CompositeModelImpl:
             NDArray[np.double], self._core_model.metadata.time_freq_support.time_frequencies.data
         )
 
+    @property
+    def result_cache(self) -> ResultCache | None:
+        """Result cache or ``None`` if the cache is disabled."""
+        return self._result_cache
+
+    def enable_result_cache(self, max_size: int = 8) -> None:
+        """Enable the cache for results read with :meth:`get_result`.
+
+        An existing cache is replaced by an empty one.
+
+        Parameters
+        ----------
+        max_size:
+            Maximum number of cached fields containers.
+        """
+        self._result_cache = ResultCache(max_size)
+        self._cache_nbytes.pop(ModelCache.RESULT, None)
+
+    def disable_result_cache(self) -> None:
+        """Disable the result cache and release all cached results."""
+        self._result_cache = None
+        self._cache_nbytes.pop(ModelCache.RESULT, None)
+
+    def invalidate_result_cache(
+        self, result_type: ResultType | None = None, time: float | None = None
+    ) -> int:
+        """Remove the cached results of a result type and time.
+
+        Returns the number of removed entries.
+
+        Parameters
+        ----------
+        result_type:
+            Result type. All result types are removed if ``None``.
+        time:
+            Time or frequency. All times are removed if ``None``.
+        """
+        if self._result_cache is None:
+            return 0
+        time_id = None if time is None else self._get_time_id(time)
+        self._cache_nbytes.pop(ModelCache.RESULT, None)
+        return self._result_cache.invalidate(result_type, time_id)
+
+    def get_result(
+        self,
+        result_type: ResultType,
+        time: float | None = None,
+        element_ids: Sequence[int] | None = None,
+    ) -> FieldsContainer:
+        """Read a result in the layer coordinate system.
+
+        The result is taken from the result cache if it is enabled.
+
+        Parameters
+        ----------
+        result_type:
+            Type of the result.
+        time:
+            Time or frequency. The last time or frequency is used if ``None``.
+        element_ids:
+            Element scope. The result is read for all elements if ``None``.
+        """
+        key: ResultCacheKey = (
+            result_type,
+            self._get_time_id(time),
+            None if element_ids is None else tuple(int(element_id) for element_id in element_ids),
+        )
+        if self._result_cache is not None:
+            cached_result = self._result_cache.get(key)
+            if cached_result is not None:
+                return cast(FieldsContainer, cached_result)
+
+        result = self._read_result(*key)
+        if self._result_cache is not None:
+            self._result_cache.put(key, result)
+            self._enforce_memory_budget([ModelCache.RESULT])
+        return result
+
+    def _get_time_id(self, time: float | None) -> int:
+        """Get the set ID of a time or frequency (the last set if ``None``)."""
+        times = self.get_result_times_or_frequencies()
+        if time is None:
+            return len(times)
+        matches = np.flatnonzero(np.isclose(times, time))
+        if len(matches) == 0:
+            raise RuntimeError(
+                f"Time or frequency {time} is not in the result file. "
+                f"Available times or frequencies: {times}."
+            )
+        return int(matches[0]) + 1
+
+    def _get_result_operator(
+        self,
+        result_type: ResultType,
+        time_id: int | Sequence[int],
+        data_sources: DataSources | None = None,
+    ) -> Operator:
+        """Get an operator which reads a result in the layer coordinate system.
+
+        Several time IDs are read at once if ``time_id`` is a sequence. The result
+        is read from ``data_sources`` if set, for example from a single partition
+        of a distributed result file.
+        """
+        if result_type == ResultType.STRESS:
+            result_operator = dpf.operators.result.stress(server=self._server)
+        elif result_type == ResultType.ELASTIC_STRAIN:
+            result_operator = dpf.operators.result.elastic_strain(server=self._server)
+        else:
+            raise RuntimeError(f"Unsupported result type {result_type}.")
+
+        if data_sources is None:
+            result_operator.inputs.streams_container.connect(self.get_rst_streams_provider())
+        else:
+            result_operator.inputs.data_sources.connect(data_sources)
+        result_operator.inputs.bool_rotate_to_global(False)
+        result_operator.inputs.time_scoping.connect(
+            [time_id] if isinstance(time_id, int) else list(time_id)
+        )
+        return result_operator
+
+    def _read_result(
+        self, result_type: ResultType, time_id: int, element_ids: tuple[int, ...] | None
+    ) -> FieldsContainer:
+        result_operator = self._get_result_operator(result_type, time_id)
+        if element_ids is not None:
+            result_operator.inputs.mesh_scoping.connect(
+                dpf.Scoping(
+                    ids=list(element_ids), location=dpf.locations.elemental, server=self._server
+                )
+            )
+        return result_operator.outputs.fields_container()
+
+    def iterate_element_chunks(
+        self,
+        result_types: Sequence[ResultType] = (ResultType.STRESS, ResultType.ELASTIC_STRAIN),
+        time: float | None = None,
+        element_ids: Sequence[int] | None = None,
+        named_selections: Sequence[str] | None = None,
+        max_chunk_size: int = 50000,
+        prefetch: bool = True,
+    ) -> Iterator[ElementChunk]:
+        """Iterate over chunks of elements and their results.
+
+        Parameters
+        ----------
+        result_types:
+            Results to read for each chunk.
+        time:
+            Time or frequency. The last time or frequency is used if ``None``.
+        element_ids:
+            Element scope. All elements are selected if ``None``.
+        named_selections:
+            Named selections which define the element scope.
+        max_chunk_size:
+            Maximum number of elements per chunk.
+        prefetch:
+            Whether to read the next chunk in a background thread while the
+            current chunk is processed.
+        """
+        if len(result_types) == 0:
+            raise RuntimeError("At least one result type is required.")
+        if self._result_partitions:
+            return self._read_partition_element_chunks(
+                list(result_types),
+                self._get_time_id(time),
+                [] if element_ids is None else element_ids,
+                [] if named_selections is None else named_selections,
+                max_chunk_size,
+                prefetch,
+            )
+        chunks = self._read_element_chunks(
+            list(result_types),
+            self._get_time_id(time),
+            [] if element_ids is None else element_ids,
+            [] if named_selections is None else named_selections,
+            max_chunk_size,
+        )
+        if prefetch:
+            return _prefetch(chunks)
+        return chunks
+
+    def write_result_store(
+        self,
+        path: str | os.PathLike[str],
+        result_types: Sequence[ResultType] = (ResultType.STRESS, ResultType.ELASTIC_STRAIN),
+        time: float | None = None,
+        element_ids: Sequence[int] | None = None,
+        named_selections: Sequence[str] | None = None,
+        max_chunk_size: int = 50000,
+    ) -> ResultStore:
+        """Write results to a local result store and open it.
+
+        Parameters
+        ----------
+        path:
+            Directory of the store.
+        result_types:
+            Results to store. The result names of the store are the enum values.
+        time:
+            Time or frequency. The last time or frequency is used if ``None``.
+        element_ids:
+            Element scope. All elements are selected if ``None``.
+        named_selections:
+            Named selections which define the element scope.
+        max_chunk_size:
+            Maximum number of elements per chunk.
+        """
+        time_id = self._get_time_id(time)
+        has_analysis_plies = self._has_analysis_plies()
+        chunks = self.iterate_element_chunks(
+            result_types, time, element_ids, named_selections, max_chunk_size
+        )
+        first_chunk = next(chunks, None)
+        if first_chunk is None:
+            raise RuntimeError("No elements are selected.")
+
+        with ResultStoreWriter(
+            path,
+            number_of_components={
+                result_type.value: values.shape[1] if values.ndim > 1 else 1
+                for result_type, values in first_chunk.results.items()
+            },
+            analysis_ply_names=(
+                get_analysis_ply_index_to_name_map(self.get_mesh()) if has_analysis_plies else {}
+            ),
+            material_names=self.material_names,
+            metadata={"time": float(self.get_result_times_or_frequencies()[time_id - 1])},
+        ) as writer:
+            for chunk in itertools.chain([first_chunk], chunks):
+                writer.append(
+                    chunk.element_info_columns,
+                    chunk.indptr,
+                    {result_type.value: values for result_type, values in chunk.results.items()},
+                    (
+                        self.get_analysis_ply_indices_for_elements(
+                            cast(Sequence[int], chunk.element_ids)
+                        )
+                        if has_analysis_plies
+                        else None
+                    ),
+                )
+        return ResultStore(path)
+
+    def _read_element_chunks(
+        self,
+        result_types: list[ResultType],
+        time_id: int,
+        element_ids: Sequence[int],
+        named_selections: Sequence[str],
+        max_chunk_size: int,
+    ) -> Iterator[ElementChunk]:
+        chunking_generator = self._get_chunking_generator(
+            max_chunk_size, element_ids, named_selections
+        )
+        result_operators = [
+            self._get_result_operator(result_type, time_id) for result_type in result_types
+        ]
+        for result_operator in result_operators:
+            result_operator.inputs.mesh_scoping.connect(chunking_generator.outputs)
+
+        chunk_index = 0
+        while True:
+            with _span("element_chunk.generate_scope", chunk_index=chunk_index):
+                chunking_generator.inputs.generator_counter(chunk_index)
+                finished = chunking_generator.outputs.is_finished()
+            if finished:
+                return
+
+            with _span("element_chunk.read", chunk_index=chunk_index):
+                fields_containers = [
+                    result_operator.outputs.fields_container()
+                    for result_operator in result_operators
+                ]
+            yield self._create_element_chunk(chunk_index, result_types, time_id, fields_containers)
+            chunk_index += 1
+
+    def _read_partition_element_chunks(
+        self,
+        result_types: list[ResultType],
+        time_id: int,
+        element_ids: Sequence[int],
+        named_selections: Sequence[str],
+        max_chunk_size: int,
+        prefetch: bool,
+    ) -> Iterator[ElementChunk]:
+        """Read the element chunks of a distributed result file.
+
+        Each chunk is part of a single partition and is read from the result file
+        of this partition only. The chunks are read in parallel if ``prefetch``
+        is set.
+        """
+        chunks = get_partition_chunks(
+            self._result_partitions,
+            self._get_element_scope(element_ids, named_selections),
+            max_chunk_size,
+        )
+
+        def read_chunk(
+            indexed_chunk: tuple[int, tuple[ResultPartition, NDArray[np.int64]]],
+        ) -> ElementChunk:
+            chunk_index, (partition, chunk_element_ids) = indexed_chunk
+            chunk_scoping = dpf.Scoping(
+                ids=chunk_element_ids.tolist(),
+                location=dpf.locations.elemental,
+                server=self._server,
+            )
+            fields_containers = []
+            with _span(
+                "element_chunk.read", chunk_index=chunk_index, partition_index=partition.index
+            ):
+                for result_type in result_types:
+                    result_operator = self._get_result_operator(
+                        result_type, time_id, partition.data_sources
+                    )
+                    result_operator.inputs.mesh_scoping.connect(chunk_scoping)
+                    fields_containers.append(result_operator.outputs.fields_container())
+            return self._create_element_chunk(chunk_index, result_types, time_id, fields_containers)
+
+        max_workers = _get_default_max_workers(len(self._result_partitions)) if prefetch else 1
+        return _map_in_parallel(read_chunk, enumerate(chunks), max_workers)
+
+    def _read_load_step_chunks(
+        self,
+        result_types: list[ResultType],
+        time_ids: Sequence[int],
+        element_ids: Sequence[int],
+        named_selections: Sequence[str],
+        max_chunk_size: int,
+    ) -> Iterator[tuple[int, list[FieldsContainer]]]:
+        """Read the results of several load steps chunk by chunk.
+
+        Yields the chunk index and the fields containers of the results. The
+        load steps of a chunk are read at once.
+        """
+        if self._result_partitions:
+            for chunk_index, (partition, chunk_element_ids) in enumerate(
+                get_partition_chunks(
+                    self._result_partitions,
+                    self._get_element_scope(element_ids, named_selections),
+                    max_chunk_size,
+                )
+            ):
+                chunk_scoping = dpf.Scoping(
+                    ids=chunk_element_ids.tolist(),
+                    location=dpf.locations.elemental,
+                    server=self._server,
+                )
+                fields_containers = []
+                with _span(
+                    "load_combination_chunk.read",
+                    chunk_index=chunk_index,
+                    partition_index=partition.index,
+                ):
+                    for result_type in result_types:
+                        result_operator = self._get_result_operator(
+                            result_type, time_ids, partition.data_sources
+                        )
+                        result_operator.inputs.mesh_scoping.connect(chunk_scoping)
+                        fields_containers.append(result_operator.outputs.fields_container())
+                yield chunk_index, fields_containers
+            return
+
+        chunking_generator = self._get_chunking_generator(
+            max_chunk_size, element_ids, named_selections
+        )
+        result_operators = [
+            self._get_result_operator(result_type, time_ids) for result_type in result_types
+        ]
+        for result_operator in result_operators:
+            result_operator.inputs.mesh_scoping.connect(chunking_generator.outputs)
+
+        chunk_index = 0
+        while True:
+            with _span("load_combination_chunk.generate_scope", chunk_index=chunk_index):
+                chunking_generator.inputs.generator_counter(chunk_index)
+                finished = chunking_generator.outputs.is_finished()
+            if finished:
+                return
+
+            with _span("load_combination_chunk.read", chunk_index=chunk_index):
+                fields_containers = [
+                    result_operator.outputs.fields_container()
+                    for result_operator in result_operators
+                ]
+            yield chunk_index, fields_containers
+            chunk_index += 1
+
+    def _get_element_scope(
+        self, element_ids: Sequence[int], named_selections: Sequence[str]
+    ) -> NDArray[np.int64]:
+        """Get the element IDs of an element scope and named selections."""
+        mesh = self.get_mesh()
+        if named_selections:
+            scope = np.unique(
+                np.concatenate([mesh.named_selection(name).ids for name in named_selections])
+            )
+            if element_ids:
+                scope = np.intersect1d(scope, element_ids)
+        elif element_ids:
+            scope = np.asarray(element_ids)
+        else:
+            scope = np.asarray(mesh.elements.scoping.ids)
+        return scope.astype(np.int64)
+
+    def _create_element_chunk(
+        self,
+        chunk_index: int,
+        result_types: list[ResultType],
+        time_id: int,
+        fields_containers: list[FieldsContainer],
+    ) -> ElementChunk:
+        fields_data = []
+        with _span("element_chunk.transfer", chunk_index=chunk_index) as span:
+            for fields_container in fields_containers:
+                label_space = {TIME_LABEL: time_id}
+                if "complex" in fields_container.labels:
+                    label_space["complex"] = 0
+                fields_data.append(_get_field_data_as_csr(fields_container.get_field(label_space)))
+            span["bytes"] = sum(array.nbytes for field_data in fields_data for array in field_data)
+
+        # The first result defines the element order of the chunk
+        chunk_element_ids, indptr, _ = fields_data[0]
+        results: dict[ResultType, NDArray[np.double]] = {}
+        for result_type, (field_ids, field_indptr, data) in zip(result_types, fields_data):
+            _, data = _select_csr_rows(field_ids, field_indptr, data, chunk_element_ids)
+            results[result_type] = data.reshape(len(data), -1)
+
+        with _span(
+            "element_chunk.element_info",
+            chunk_index=chunk_index,
+            number_of_elements=len(chunk_element_ids),
+        ):
+            element_info_columns = get_element_info_columns(
+                self._element_info_provider, chunk_element_ids
+            )
+        self._enforce_memory_budget([ModelCache.ELEMENT_INFO])
+        return ElementChunk(
+            index=chunk_index,
+            element_ids=chunk_element_ids,
+            element_info_columns=element_info_columns,
+            indptr=indptr,
+            results=results,
+        )
+
+    def _get_chunking_generator(
+        self, max_chunk_size: int, element_ids: Sequence[int], named_selections: Sequence[str]
+    ) -> Operator:
+        """Get the operator which splits the element scope into chunks."""
+        chunking_data_tree = dpf.DataTree({"max_chunk_size": max_chunk_size})
+        if named_selections:
+            chunking_data_tree.add({"named_selections": named_selections})
+
+        chunking_generator = dpf.Operator("composite::scope_generator")
+        chunking_generator.inputs.stream_provider(self.get_rst_streams_provider())
+        chunking_generator.inputs.data_tree(chunking_data_tree)
+        if self.data_sources.composite:
+            chunking_generator.inputs.data_sources(self.data_sources.composite)
+
+        if element_ids:
+            element_scope = dpf.Scoping(location="elemental")
+            element_scope.ids = element_ids
+            chunking_generator.inputs.element_scoping(element_scope)
+        return chunking_generator
+
     @_deprecated_composite_definition_label
     def add_interlaminar_normal_stresses(
         self,
@@ -718,6 +2412,11 @@ class CompositeModelImpl:
                 "add_interlaminar_normal_stresses is implemented for MAPDL results only."
             )
 
+        if self._result_cache is not None:
+            # The stresses are modified in place, so later calls of get_result
+            # must not get them from the cache.
+            self._result_cache.remove(stresses)
+
         ins_operator = dpf.Operator("composite::interlaminar_normal_stress_operator")
         ins_operator.inputs.materials_container(self._material_operators.material_provider)
         ins_operator.inputs.mesh(self.get_mesh())
@@ -758,6 +2457,11 @@ class CompositeModelImpl:
         )
         return self.get_all_layered_element_ids()
 
+    @property
+    def result_partitions(self) -> Sequence[ResultPartition]:
+        """Partitions of a distributed result file, or an empty list."""
+        return self._result_partitions
+
     def get_rst_streams_provider(self) -> Operator:
         """Get the streams provider of the loaded result file."""
         return self._core_model.metadata.streams_provider
@@ -771,6 +2475,9 @@ class CompositeModelImpl:
                 f"Specify a key explicitly."
             )
 
+    def _has_analysis_plies(self) -> bool:
+        return self.layup_model_type in (LayupModelContextType.ACP, LayupModelContextType.MIXED)
+
     # Whether the reference surface operators are available or supported by the server
     def _supports_reference_surface_operators(self) -> bool:
         if not version_equal_or_later(self._server, "8.0"):
@@ -27,7 +27,7 @@ from typing import Any
 from warnings import warn
 
 import ansys.dpf.core as dpf
-from ansys.dpf.core import FieldsContainer
+from ansys.dpf.core import Field, FieldsContainer
 
 from .constants import FAILURE_LABEL, REF_SURFACE_NAME, TIME_LABEL, FailureOutput
 
@@ -108,3 +108,20 @@ def _get_failure_enum_from_name(name: str) -> FailureOutput:
         return FailureOutput.MAX_SOLID_ELEMENT_ID
 
     raise RuntimeError("Could not determine failure output from name: " + name)
+
+
+def _get_fields_by_failure_output(
+    fields_container: FieldsContainer, time_id: int
+) -> dict[FailureOutput, Field]:
+    """Get the fields of a time by failure output.
+
+    The failure output is determined from the field name. Fields with other
+    names are ignored.
+    """
+    fields_by_output = {}
+    for field in fields_container.get_fields({TIME_LABEL: time_id}):
+        try:
+            fields_by_output[_get_failure_enum_from_name(field.name)] = field
+        except RuntimeError:
+            continue
+    return fields_by_output
@@ -22,7 +22,7 @@
 
 """Indexer helper classes."""
 from dataclasses import dataclass
-from typing import Protocol, cast
+from typing import Any, Protocol, cast
 
 from ansys.dpf.core import Field, PropertyField, Scoping
 import numpy as np
@@ -52,6 +52,137 @@ def setup_index_by_id(scoping: Scoping) -> IndexToId:
     return IndexToId(mapping=indices, max_id=len(indices) - 1)
 
 
+def _get_indices_by_ids(
+    indices: NDArray[np.int64], entity_ids: NDArray[np.int64], bounds_check: bool = True
+) -> NDArray[np.int64]:
+    """Get the indices of multiple entities.
+
+    The index is -1 for entities which are not present. Without bounds check,
+    only IDs above the maximum ID are treated as missing, like in ``by_id``
+    of the indexers without bounds check. Negative IDs are not checked.
+    """
+    if not bounds_check:
+        is_in_range = entity_ids < len(indices)
+        if np.all(is_in_range):
+            return indices[entity_ids]
+        result_in_range: NDArray[np.int64] = np.full(len(entity_ids), -1, dtype=np.int64)
+        result_in_range[is_in_range] = indices[entity_ids[is_in_range]]
+        return result_in_range
+
+    result: NDArray[np.int64] = np.full(len(entity_ids), -1, dtype=np.int64)
+    is_valid = (entity_ids >= 0) & (entity_ids < len(indices))
+    result[is_valid] = indices[entity_ids[is_valid]]
+    return result
+
+
+def _gather_rows(
+    data: NDArray[Any], starts: NDArray[np.int64], ends: NDArray[np.int64]
+) -> tuple[NDArray[np.int64], NDArray[Any]]:
+    """Gather the rows ``[starts[i], ends[i])`` of ``data`` into a CSR layout.
+
+    Returns the row pointer (with a trailing end entry) and the gathered rows.
+    """
+    lengths = ends - starts
+    indptr: NDArray[np.int64] = np.zeros(len(lengths) + 1, dtype=np.int64)
+    np.cumsum(lengths, out=indptr[1:])
+    positions = np.repeat(starts - indptr[:-1], lengths) + np.arange(indptr[-1], dtype=np.int64)
+    return indptr, data[positions]
+
+
+def _gather_rows_by_indices(
+    data: NDArray[Any],
+    data_pointer: NDArray[np.int64],
+    n_components: int,
+    indices: NDArray[np.int64],
+) -> tuple[NDArray[np.int64], NDArray[Any]]:
+    """Gather the data of entities with the given indices (-1 for missing entities)."""
+    is_valid = indices >= 0
+    valid_indices = indices[is_valid]
+    starts = np.zeros(len(indices), dtype=np.int64)
+    ends = np.zeros(len(indices), dtype=np.int64)
+    starts[is_valid] = data_pointer[valid_indices] // n_components
+    ends[is_valid] = data_pointer[valid_indices + 1] // n_components
+    return _gather_rows(data, starts, ends)
+
+
+def _gather_single_values_by_indices(
+    data: NDArray[Any], indices: NDArray[np.int64]
+) -> tuple[NDArray[np.int64], NDArray[Any]]:
+    """Gather the data of entities with one value each (-1 for missing entities)."""
+    starts = np.where(indices >= 0, indices, 0)
+    ends = np.where(indices >= 0, indices + 1, 0)
+    return _gather_rows(data, starts, ends)
+
+
+def _get_field_data_as_csr(
+    field: Field,
+) -> tuple[NDArray[np.int64], NDArray[np.int64], NDArray[Any]]:
+    """Get the entity IDs, the row pointer, and the data of a field.
+
+    The rows ``indptr[i]:indptr[i + 1]`` of the data belong to the entity ``ids[i]``.
+    """
+    entity_ids = np.asarray(field.scoping.ids, dtype=np.int64)
+    data = np.asarray(field.data)
+    if len(entity_ids) == 1:
+        indptr = np.array([0, len(data)], dtype=np.int64)
+    elif _has_data_pointer(field):
+        indptr = np.append(
+            np.asarray(field._data_pointer, dtype=np.int64)  # pylint: disable=protected-access
+            // field.component_count,
+            len(data),
+        )
+    else:
+        indptr = np.arange(len(entity_ids) + 1, dtype=np.int64)
+    return entity_ids, indptr, data
+
+
+def _get_values_by_element(
+    field: Field | None, element_ids: NDArray[np.int64], default: float
+) -> NDArray[np.double]:
+    """Get the first value of each element of an elemental field.
+
+    Elements without data get the default value.
+    """
+    values = np.full(len(element_ids), default, dtype=np.double)
+    if field is None:
+        return values
+    field_ids = np.asarray(field.scoping.ids, dtype=np.int64)
+    if len(field_ids) == 0:
+        return values
+    field_values = np.asarray(field.data, dtype=np.double).reshape(len(field_ids), -1)[:, 0]
+    sorter = np.argsort(field_ids)
+    positions = np.minimum(
+        np.searchsorted(field_ids, element_ids, sorter=sorter), len(field_ids) - 1
+    )
+    is_present = field_ids[sorter[positions]] == element_ids
+    values[is_present] = field_values[sorter[positions[is_present]]]
+    return values
+
+
+def _select_csr_rows(
+    entity_ids: NDArray[np.int64],
+    indptr: NDArray[np.int64],
+    data: NDArray[Any],
+    requested_ids: NDArray[np.int64],
+) -> tuple[NDArray[np.int64], NDArray[Any]]:
+    """Get the rows of the requested entities in the requested order.
+
+    Returns the new row pointer and data.
+    """
+    if np.array_equal(entity_ids, requested_ids):
+        return indptr, data
+    if len(entity_ids) == 0 and len(requested_ids) > 0:
+        raise RuntimeError(f"No data for entity with id {requested_ids[0]}.")
+    sorter = np.argsort(entity_ids)
+    positions = sorter[
+        np.minimum(np.searchsorted(entity_ids, requested_ids, sorter=sorter), len(sorter) - 1)
+    ]
+    is_missing = entity_ids[positions] != requested_ids
+    if np.any(is_missing):
+        raise RuntimeError(f"No data for entity with id {requested_ids[is_missing][0]}.")
+    return _gather_rows(data, indptr[positions], indptr[positions + 1])
+
+
 class PropertyFieldIndexerProtocol(Protocol):
     """Protocol for single value property field indexer."""
 
@@ -65,6 +196,15 @@ class PropertyFieldIndexerProtocol(Protocol):
     def by_id_as_array(self, entity_id: int) -> NDArray[np.int64] | None:
         """Get indices by id."""
 
+    def by_ids_as_csr(
+        self, entity_ids: NDArray[np.int64]
+    ) -> tuple[NDArray[np.int64], NDArray[np.int64]]:
+        """Get the values of multiple entities in a CSR layout.
+
+        Returns the row pointer and the values. Entities which are
+        not present have no values.
+        """
+
 
 def _has_data_pointer(field: PropertyField | Field) -> bool:
     if (
@@ -103,6 +243,15 @@ class FieldIndexexProtocol(Protocol):
     def by_id_as_array(self, entity_id: int) -> NDArray[np.double] | None:
         """Get values by id."""
 
+    def by_ids_as_csr(
+        self, entity_ids: NDArray[np.int64]
+    ) -> tuple[NDArray[np.int64], NDArray[np.double]]:
+        """Get the values of multiple entities in a CSR layout.
+
+        Returns the row pointer and the values. Entities which are
+        not present have no values.
+        """
+
 
 # General comment for all Indexer:
 # The .data call accesses the actual data. This sends the data over grpc which takes some time
@@ -156,6 +305,18 @@ class PropertyFieldIndexerNoDataPointer:
             return None
         return np.array([value], dtype=np.int64)
 
+    def by_ids_as_csr(
+        self, entity_ids: NDArray[np.int64]
+    ) -> tuple[NDArray[np.int64], NDArray[np.int64]]:
+        """Get the values of multiple entities in a CSR layout.
+
+        Parameters
+        ----------
+        entity_ids
+        """
+        indices = _get_indices_by_ids(self._indices, np.asarray(entity_ids, dtype=np.int64))
+        return _gather_single_values_by_indices(self._data, indices)
+
 
 class PropertyFieldIndexerNoDataPointerNoBoundsCheck:
     """Indexer for a property field with no data pointer and no bounds checks."""
@@ -196,6 +357,20 @@ class PropertyFieldIndexerNoDataPointerNoBoundsCheck:
             return None
         return np.array([value], dtype=np.int64)
 
+    def by_ids_as_csr(
+        self, entity_ids: NDArray[np.int64]
+    ) -> tuple[NDArray[np.int64], NDArray[np.int64]]:
+        """Get the values of multiple entities in a CSR layout.
+
+        Parameters
+        ----------
+        entity_ids
+        """
+        indices = _get_indices_by_ids(
+            self._indices, np.asarray(entity_ids, dtype=np.int64), bounds_check=False
+        )
+        return _gather_single_values_by_indices(self._data, indices)
+
 
 class PropertyFieldIndexerWithDataPointer:
     """Indexer for a property field with data pointer."""
@@ -248,6 +423,18 @@ class PropertyFieldIndexerWithDataPointer:
             // self._n_components
         ]
 
+    def by_ids_as_csr(
+        self, entity_ids: NDArray[np.int64]
+    ) -> tuple[NDArray[np.int64], NDArray[np.int64]]:
+        """Get the values of multiple entities in a CSR layout.
+
+        Parameters
+        ----------
+        entity_ids
+        """
+        indices = _get_indices_by_ids(self._indices, np.asarray(entity_ids, dtype=np.int64))
+        return _gather_rows_by_indices(self._data, self._data_pointer, self._n_components, indices)
+
 
 class PropertyFieldIndexerWithDataPointerNoBoundsCheck:
     """Indexer for a property field with data pointer and no bounds checks."""
@@ -297,6 +484,20 @@ class PropertyFieldIndexerWithDataPointerNoBoundsCheck:
             // self._n_components
         ]
 
+    def by_ids_as_csr(
+        self, entity_ids: NDArray[np.int64]
+    ) -> tuple[NDArray[np.int64], NDArray[np.int64]]:
+        """Get the values of multiple entities in a CSR layout.
+
+        Parameters
+        ----------
+        entity_ids
+        """
+        indices = _get_indices_by_ids(
+            self._indices, np.asarray(entity_ids, dtype=np.int64), bounds_check=False
+        )
+        return _gather_rows_by_indices(self._data, self._data_pointer, self._n_components, indices)
+
 
 # DPF does not set the data pointers if a field has just
 # one value per entity. Therefore, it is unknown if
@@ -355,6 +556,18 @@ class FieldIndexerNoDataPointer:
             return None
         return np.array([value], dtype=np.double)
 
+    def by_ids_as_csr(
+        self, entity_ids: NDArray[np.int64]
+    ) -> tuple[NDArray[np.int64], NDArray[np.double]]:
+        """Get the values of multiple entities in a CSR layout.
+
+        Parameters
+        ----------
+        entity_ids
+        """
+        indices = _get_indices_by_ids(self._indices, np.asarray(entity_ids, dtype=np.int64))
+        return _gather_single_values_by_indices(self._data, indices)
+
 
 class FieldIndexerWithDataPointer:
     """Indexer for a dpf field with data pointer."""
@@ -423,3 +636,15 @@ class FieldIndexerWithDataPointer:
             // self._n_components : self._data_pointer[idx + 1]
             // self._n_components
         ]
+
+    def by_ids_as_csr(
+        self, entity_ids: NDArray[np.int64]
+    ) -> tuple[NDArray[np.int64], NDArray[np.double]]:
+        """Get the values of multiple entities in a CSR layout.
+
+        Parameters
+        ----------
+        entity_ids
+        """
+        indices = _get_indices_by_ids(self._indices, np.asarray(entity_ids, dtype=np.int64))
+        return _gather_rows_by_indices(self._data, self._data_pointer, self._n_components, indices)
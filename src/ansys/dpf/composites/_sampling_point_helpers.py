@@ -24,8 +24,6 @@
 from collections.abc import Collection, Sequence
 from typing import Any, cast
 
-from matplotlib.patches import Rectangle
-import matplotlib.pyplot as plt
 import numpy as np
 import numpy.typing as npt
 
@@ -180,6 +178,9 @@ def get_polar_plot_from_sp(
     sampling_point: SamplingPoint, components: Sequence[str] = ("E1", "E2", "G12")
 ) -> SamplingPointFigure:
     """Create a standard polar plot to visualize the polar properties of the laminate."""
+    # Matplotlib is imported on first use because it slows down the import of the package
+    import matplotlib.pyplot as plt
+
     if not sampling_point.is_uptodate or not sampling_point.results:
         raise RuntimeError(f"Sampling point {sampling_point.name} is out-of-date.")
 
@@ -204,6 +205,8 @@ def add_ply_sequence_to_sampling_point_plot(
     sampling_point: SamplingPoint, axes: Any, core_scale_factor: float = 1.0
 ) -> None:
     """Add the stacking (ply and text) to an axis or plot."""
+    from matplotlib.patches import Rectangle
+
     offsets = sampling_point.get_offsets_by_spots(
         spots=[Spot.BOTTOM, Spot.TOP], core_scale_factor=core_scale_factor
     )
@@ -292,6 +295,8 @@ def get_result_plots_from_sp(
     spots: Collection[Spot] = (Spot.BOTTOM, Spot.MIDDLE, Spot.TOP),
 ) -> SamplingPointFigure:
     """Generate a figure with a grid of axes (plot) for each selected result entity."""
+    import matplotlib.pyplot as plt
+
     num_active_plots = int(create_laminate_plot)
     num_active_plots += 1 if len(strain_components) > 0 else 0
     num_active_plots += 1 if len(stress_components) > 0 else 0
@@ -421,6 +426,8 @@ def add_element_boxes_to_axes(
     alpha :
         Transparency of the element boxes.
     """
+    from matplotlib.patches import Rectangle
+
     plY_offsets = sampling_point.get_offsets_by_spots(
         spots=[Spot.BOTTOM, Spot.TOP], core_scale_factor=core_scale_factor
     )
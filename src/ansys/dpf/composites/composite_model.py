@@ -21,27 +21,48 @@
 # SOFTWARE.
 
 """Composite Model."""
-from collections.abc import Collection, Sequence
+from collections.abc import Collection, Iterator, Sequence
+from enum import IntEnum
+import os
+import threading
 
 import ansys.dpf.core as dpf
-from ansys.dpf.core import FieldsContainer, MeshedRegion, Operator, UnitSystem
+from ansys.dpf.core import Field, FieldsContainer, MeshedRegion, Operator, UnitSystem
 from ansys.dpf.core.server_types import BaseServer
 import numpy as np
-from numpy.typing import NDArray
+from numpy.typing import ArrayLike, NDArray
 
+from ._async_helpers import _run_in_executor
 from ._composite_model_factory import _composite_model_factory
+from ._composite_model_impl import CompositeModelImpl
 from .composite_scope import CompositeScope
+from .constants import ResultType
+from .critical_elements import CriticalElements
 from .data_sources import CompositeDataSources, ContinuousFiberCompositesFiles
+from .element_chunks import ElementChunk
 from .failure_criteria import CombinedFailureCriterion
+from .failure_export import ExportFormat, FailureExportResult
+from .failure_statistics import FailureStatistics
+from .harmonic_failure import HarmonicFailureResults
+from .layered_reduction import GroupingKey, LayeredReductionResult, ReductionOperation
 from .layup_info import (
+    AnalysisPlyIncidence,
     ElementInfo,
+    ElementInfoColumns,
     ElementInfoProviderProtocol,
+    LayeredElementData,
     LayerProperty,
     LayupModelContextType,
 )
 from .layup_info.material_operators import MaterialOperators
 from .layup_info.material_properties import MaterialMetadata, MaterialProperty
+from .load_combinations import LoadCombinationEnvelope
+from .memory_usage import MemoryReport, ModelCache
+from .ply_wise_failure import PlyWiseFailureResults
+from .result_cache import ResultCacheStatistics
 from .result_definition import FailureMeasureEnum
+from .result_partitions import ResultPartition
+from .result_store import ResultStore
 from .sampling_point_types import SamplingPoint
 
 
@@ -59,6 +80,18 @@ class CompositeModel:
         lay-up information is added to the DPF meshed regions. Depending on the use
         case, it can be more efficient to create the providers separately.
 
+        With DPF Server 7.0 (2024 R1) or later, the client-side caches of a
+        ``CompositeModel`` instance can be used by multiple threads: the element
+        information of the element info provider and the entries of the result
+        cache. All other calls, including failure evaluations, sampling points
+        and element chunk iterators, connect to the result streams provider, the
+        lay-up provider, and the material operators of the model. These operators
+        are not locked by the client, so a ``CompositeModel`` instance must not
+        be used by multiple threads. Use a separate ``CompositeModel`` instance
+        per thread, for example with a :class:`.ServerPool`. The asynchronous
+        methods, such as :meth:`.CompositeModel.aevaluate_failure_criteria`,
+        run the calls of one instance one after the other.
+
         The handling of models with multiple composite definition files (assemblies)
         differ depending on the version of the DPF server. The handling is simplified
         with DPF Server 7.0 (2024 R1) or later and the full assembly can be post-processed
@@ -104,6 +137,8 @@ class CompositeModel:
         self._implementation = _composite_model_factory(server)(
             composite_files, server, default_unit_system
         )
+        # Serializes the asynchronous calls, which run in the threads of an executor
+        self._async_lock = threading.Lock()
 
     @property
     def composite_definition_labels(self) -> Sequence[str]:
@@ -174,6 +209,16 @@ class CompositeModel:
         """Get the streams provider of the loaded result file."""
         return self._implementation.get_rst_streams_provider()
 
+    @property
+    def result_partitions(self) -> Sequence[ResultPartition]:
+        """Partitions of a distributed result file.
+
+        The list is empty if the result file is not distributed. The element
+        properties of all partitions are merged into the lay-up information of
+        :meth:`get_element_info`.
+        """
+        return self._get_implementation("result_partitions").result_partitions
+
     def get_layup_operator(self, composite_definition_label: str | None = None) -> Operator:
         """Get the lay-up operator.
 
@@ -222,6 +267,11 @@ class CompositeModel:
         if the measure is :attr:`.FailureMeasureEnum.MARGIN_OF_SAFETY` or
         :attr:`.FailureMeasureEnum.RESERVE_FACTOR`.
 
+        Each call evaluates the failure criteria, also if only the plies of the
+        composite scope differ from the previous call. To compare several groups
+        of plies, use :meth:`evaluate_ply_wise_failure_criteria` instead, which
+        evaluates the failure criteria once for all plies.
+
         Parameters
         ----------
         combined_criterion :
@@ -255,6 +305,395 @@ class CompositeModel:
             max_chunk_size,
         )
 
+    def export_failure_criteria(
+        self,
+        path: str | os.PathLike[str],
+        combined_criterion: CombinedFailureCriterion,
+        composite_scope: CompositeScope | None = None,
+        measure: FailureMeasureEnum = FailureMeasureEnum.INVERSE_RESERVE_FACTOR,
+        write_data_for_full_element_scope: bool = True,
+        max_chunk_size: int = 50000,
+        file_format: ExportFormat | None = None,
+    ) -> FailureExportResult:
+        """Evaluate the failure criteria and export the results to a columnar file.
+
+        The failure results are evaluated in chunks like in
+        :meth:`evaluate_failure_criteria` and the rows of each chunk are written
+        as soon as they are evaluated. The exported tables contain the element
+        IDs, the time, and all :class:`.FailureOutput` entries. The results mapped
+        to the reference surface are written to a separate table. See
+        :class:`.FailureTableWriter` for the file layout.
+
+        Parameters
+        ----------
+        path:
+            Path of the exported file. The suffixes ``.parquet``, ``.arrow``,
+            ``.feather``, ``.h5``, and ``.hdf5`` are supported.
+        combined_criterion :
+            Combined failure criterion to evaluate.
+        composite_scope :
+            Composite scope on which to evaluate the failure criteria. If empty, the criteria
+            is evaluated on the full model. If the time is not set, the last time or
+            frequency in the result file is used.
+        measure :
+            Failure measure to evaluate.
+        write_data_for_full_element_scope :
+            Whether each element in the element scope is to get a
+            (potentially zero) failure value, even elements that are not
+            part of ``composite_scope.plies``.
+        max_chunk_size:
+            Maximum number of elements per chunk. A higher value results in more
+            memory consumption, but faster evaluation.
+        file_format:
+            Format of the exported file. If ``None``, the format is determined from
+            the suffix of ``path``.
+        """
+        return self._get_implementation("export_failure_criteria").export_failure_criteria(
+            path,
+            combined_criterion,
+            composite_scope,
+            measure,
+            write_data_for_full_element_scope,
+            max_chunk_size,
+            file_format,
+        )
+
+    def get_most_critical(
+        self,
+        n: int,
+        combined_criterion: CombinedFailureCriterion,
+        composite_scope: CompositeScope | None = None,
+        measure: FailureMeasureEnum = FailureMeasureEnum.INVERSE_RESERVE_FACTOR,
+        max_chunk_size: int = 50000,
+    ) -> CriticalElements:
+        """Get the ``n`` most critical elements of a failure evaluation.
+
+        The failure criteria are evaluated in chunks like in
+        :meth:`evaluate_failure_criteria`. Instead of merging the results of all
+        chunks, only the ``n`` most critical candidates are kept after each chunk.
+        Failure modes and critical layers are only transferred for these candidates.
+        The most critical elements have the highest inverse reserve factor or the
+        lowest reserve factor or margin of safety. Ties are ordered by element ID.
+
+        This method requires DPF Server 7.0 (2024 R1) or later.
+
+        Parameters
+        ----------
+        n:
+            Number of elements.
+        combined_criterion :
+            Combined failure criterion to evaluate.
+        composite_scope :
+            Composite scope on which to evaluate the failure criteria. If empty, the criteria
+            is evaluated on the full model. If the time is not set, the last time or
+            frequency in the result file is used.
+        measure :
+            Failure measure to evaluate.
+        max_chunk_size:
+            Maximum number of elements per chunk.
+        """
+        return self._get_implementation("get_most_critical").get_most_critical(
+            n, combined_criterion, composite_scope, measure, max_chunk_size
+        )
+
+    def evaluate_load_combinations(
+        self,
+        combination_matrix: ArrayLike,
+        combined_criterion: CombinedFailureCriterion,
+        composite_scope: CompositeScope | None = None,
+        load_steps: Sequence[float] | None = None,
+        max_chunk_size: int = 10000,
+        max_combinations_per_batch: int = 16,
+    ) -> LoadCombinationEnvelope:
+        """Evaluate the failure criteria for linear combinations of load steps.
+
+        The stresses and strains of each chunk of elements are read once for all
+        load steps. The combined stresses and strains are formed on the client
+        for a batch of combinations at a time and evaluated in a single call of
+        the failure operator per batch. The envelope keeps the maximum inverse
+        reserve factor of all combinations per element and the combination which
+        causes it.
+
+        Superposition is only valid for linear analyses. The memory of the
+        combined data is proportional to ``max_chunk_size`` times
+        ``max_combinations_per_batch``, independently of the total number of
+        combinations.
+
+        This method requires DPF Server 7.0 (2024 R1) or later.
+
+        Parameters
+        ----------
+        combination_matrix:
+            Factors of the load steps with one row per combination and one
+            column per load step.
+        combined_criterion :
+            Combined failure criterion to evaluate.
+        composite_scope :
+            Composite scope on which to evaluate the failure criteria. Only the
+            elements and named selections are supported. If empty, the criteria are
+            evaluated on the full model.
+        load_steps :
+            Times or frequencies of the load steps in the order of the columns of the
+            combination matrix. All times or frequencies in the result file are used
+            if ``None``.
+        max_chunk_size:
+            Maximum number of elements per chunk.
+        max_combinations_per_batch:
+            Maximum number of combinations which are evaluated at once. Larger
+            batches need fewer calls of the failure operator, but more memory.
+
+        Examples
+        --------
+        >>> envelope = composite_model.evaluate_load_combinations(
+        ...     [[1.35, 1.5], [1.0, 1.5], [1.35, 0.0]], combined_criterion
+        ... )
+        >>> envelope.critical_combinations
+        """
+        return self._get_implementation("evaluate_load_combinations").evaluate_load_combinations(
+            combination_matrix,
+            combined_criterion,
+            composite_scope,
+            load_steps,
+            max_chunk_size,
+            max_combinations_per_batch,
+        )
+
+    def evaluate_harmonic_failure(
+        self,
+        combined_criterion: CombinedFailureCriterion,
+        composite_scope: CompositeScope | None = None,
+        frequencies: Sequence[float] | None = None,
+        number_of_phases: int = 36,
+        refine_phases: bool = True,
+        max_chunk_size: int = 10000,
+    ) -> HarmonicFailureResults:
+        """Evaluate the maximum failure values of a harmonic analysis over the phase angle.
+
+        The real and imaginary parts of the stresses and strains of each chunk of
+        elements are read once for all frequencies. The stresses and strains at
+        the phase angle ``phi`` are ``real * cos(phi) - imaginary * sin(phi)``, like
+        in the ``sweeping_phase`` operator of DPF. They are formed on the server with
+        this operator for ``number_of_phases`` equally spaced phase angles and
+        evaluated in a single call of the failure operator per chunk and frequency.
+
+        Because the failure criteria are not linear in the stresses, the critical
+        phase angle can be between the sampled ones. If ``refine_phases`` is set,
+        a parabola is fitted through the maximum of each element and its
+        neighbours, and each element is evaluated once more at the vertex of the
+        parabola. The refined value is kept if it is higher than the sampled one.
+        The stresses and strains at the refined phase angles are formed on the
+        client, so the real and imaginary parts of each chunk are transferred
+        once for all frequencies.
+
+        This method requires DPF Server 7.0 (2024 R1) or later.
+
+        Parameters
+        ----------
+        combined_criterion :
+            Combined failure criterion to evaluate.
+        composite_scope :
+            Composite scope on which to evaluate the failure criteria. Only the
+            elements and named selections are supported. If empty, the criteria are
+            evaluated on the full model.
+        frequencies :
+            Frequencies to evaluate. All frequencies in the result file are used
+            if ``None``.
+        number_of_phases :
+            Number of equally spaced phase angles in the range [-180, 180).
+        refine_phases :
+            Whether to evaluate the failure criteria once more at the estimated
+            critical phase angle of each element.
+        max_chunk_size:
+            Maximum number of elements per chunk. The server memory per chunk grows
+            with the number of phase angles.
+
+        Examples
+        --------
+        >>> harmonic_results = composite_model.evaluate_harmonic_failure(combined_criterion)
+        >>> index = np.argmax(harmonic_results.failure_values)
+        >>> harmonic_results.critical_frequencies[index], harmonic_results.critical_phases[index]
+        """
+        return self._get_implementation("evaluate_harmonic_failure").evaluate_harmonic_failure(
+            combined_criterion,
+            composite_scope,
+            frequencies,
+            number_of_phases,
+            refine_phases,
+            max_chunk_size,
+        )
+
+    def get_failure_statistics(
+        self,
+        combined_criterion: CombinedFailureCriterion,
+        composite_scope: CompositeScope | None = None,
+        bin_edges: Sequence[float] | NDArray[np.double] | None = None,
+        max_chunk_size: int = 50000,
+    ) -> FailureStatistics:
+        """Get statistics of the failure values per element, analysis ply, and material.
+
+        The failure criteria are evaluated in chunks like in
+        :meth:`evaluate_failure_criteria`. The statistics are accumulated chunk by
+        chunk in fixed-bin histograms (:class:`.StreamingHistogram`), so the memory
+        consumption does not depend on the size of the model. The histograms provide
+        counts, minimum, maximum, mean, and approximate quantiles. The failure values
+        are inverse reserve factors. The analysis ply and material statistics use the
+        maximum failure value of each element in the ply or material.
+
+        This method requires DPF Server 7.0 (2024 R1) or later.
+
+        Parameters
+        ----------
+        combined_criterion :
+            Combined failure criterion to evaluate.
+        composite_scope :
+            Composite scope on which to evaluate the failure criteria. If empty, the criteria
+            is evaluated on the full model. If the time is not set, the last time or
+            frequency in the result file is used.
+        bin_edges:
+            Edges of the histogram bins. :func:`.get_default_bin_edges` is used if ``None``.
+        max_chunk_size:
+            Maximum number of elements per chunk.
+
+        Examples
+        --------
+        >>> statistics = composite_model.get_failure_statistics(combined_criterion)
+        >>> statistics.analysis_plies["P1L1__ModelingPly.1"].quantile(0.95)
+        """
+        return self._get_implementation("get_failure_statistics").get_failure_statistics(
+            combined_criterion, composite_scope, bin_edges, max_chunk_size
+        )
+
+    def evaluate_ply_wise_failure_criteria(
+        self,
+        combined_criterion: CombinedFailureCriterion,
+        composite_scope: CompositeScope | None = None,
+        max_chunk_size: int = 50000,
+    ) -> PlyWiseFailureResults:
+        """Get the maximum failure value and mode of each element in each analysis ply.
+
+        The failure criteria are evaluated once in chunks like in
+        :meth:`evaluate_failure_criteria`. The layer-wise failure values of each
+        chunk are reduced per element and analysis ply, so the results of all
+        analysis plies are obtained without evaluating the failure criteria for
+        each ply separately. The results are stored sparsely and contain only the
+        (element, analysis ply) pairs of the lay-up. The failure values are inverse
+        reserve factors.
+
+        This method requires DPF Server 7.0 (2024 R1) or later and a lay-up
+        with analysis plies.
+
+        Parameters
+        ----------
+        combined_criterion :
+            Combined failure criterion to evaluate.
+        composite_scope :
+            Composite scope on which to evaluate the failure criteria. If empty, the criteria
+            is evaluated on the full model. If the time is not set, the last time or
+            frequency in the result file is used. A ``RuntimeError`` is raised if a
+            ply of the scope has no results.
+        max_chunk_size:
+            Maximum number of elements per chunk.
+
+        Notes
+        -----
+        The results of the last evaluation are cached, keyed by the failure criterion,
+        time, element scope, and named selections. If only the plies of the composite
+        scope change, the cached results are filtered instead of evaluating the failure
+        criteria again. Use :meth:`clear_ply_wise_failure_cache` to release them, for
+        example after the result file has changed.
+
+        To fill the cache, the failure criteria are evaluated for all plies, also if
+        the composite scope contains only some of them. The first call with a ply
+        scope therefore takes longer than an evaluation restricted to these plies.
+
+        The cache is only used by this method. :meth:`evaluate_failure_criteria`
+        evaluates the failure criteria on each call, because its output also
+        contains the critical layers and the results of the reference surface,
+        which are not cached.
+
+        Examples
+        --------
+        >>> ply_results = composite_model.evaluate_ply_wise_failure_criteria(combined_criterion)
+        >>> irf_field = ply_results.get_ply_field("P1L1__ModelingPly.1")
+        >>> composite_model.get_mesh().plot(irf_field)
+
+        Get the critical ply of each element for a group of plies. The failure criteria
+        are not evaluated again.
+
+        >>> critical_plies = composite_model.evaluate_ply_wise_failure_criteria(
+        ...     combined_criterion,
+        ...     CompositeScope(plies=["P1L1__ModelingPly.1", "P1L1__ModelingPly.2"]),
+        ... ).get_critical_plies()
+        """
+        return self._get_implementation(
+            "evaluate_ply_wise_failure_criteria"
+        ).evaluate_ply_wise_failure_criteria(combined_criterion, composite_scope, max_chunk_size)
+
+    def clear_ply_wise_failure_cache(self) -> None:
+        """Release the cached results of :meth:`evaluate_ply_wise_failure_criteria`."""
+        self._get_implementation("clear_ply_wise_failure_cache").clear_ply_wise_failure_cache()
+
+    def memory_report(self) -> MemoryReport:
+        """Get the estimated client memory of the caches and lookup structures.
+
+        The report lists the bytes of each cache, such as the :class:`.ElementInfo`
+        objects of the element info provider, and of the indexers of the lay-up
+        properties. Data held by the DPF server is not included. The size of
+        large caches is estimated from a sample of their entries.
+
+        This method requires DPF Server 7.0 (2024 R1) or later.
+
+        Examples
+        --------
+        >>> print(composite_model.memory_report())
+        """
+        return self._get_implementation("memory_report").memory_report()
+
+    def clear_caches(self, caches: Collection[ModelCache] | None = None) -> None:
+        """Release cached data to reduce the client memory.
+
+        The caches are filled again when the data is needed.
+
+        This method requires DPF Server 7.0 (2024 R1) or later.
+
+        Parameters
+        ----------
+        caches:
+            Caches to release. All caches are released if ``None``.
+        """
+        self._get_implementation("clear_caches").clear_caches(caches)
+
+    @property
+    def memory_budget(self) -> int | None:
+        """Maximum client memory of the caches and lookup structures in bytes.
+
+        ``None`` if no budget is set. Use :meth:`set_memory_budget` to set it.
+        """
+        return self._get_implementation("memory_budget").memory_budget
+
+    def set_memory_budget(self, max_bytes: int | None) -> None:
+        """Limit the client memory of the caches and lookup structures.
+
+        After operations which fill a cache in bulk, such as reading element
+        chunks, the largest caches are released until the total memory of the
+        :meth:`memory_report` is within the budget. The lookup structures are
+        never released, so a budget below their size releases all caches.
+        Lay-up information requested for single elements with
+        :meth:`get_element_info` is cached without checking the budget.
+
+        This method requires DPF Server 7.0 (2024 R1) or later.
+
+        Parameters
+        ----------
+        max_bytes:
+            Maximum client memory in bytes. The budget is disabled if ``None``.
+
+        Examples
+        --------
+        >>> composite_model.set_memory_budget(2 * 1024**3)
+        """
+        self._get_implementation("set_memory_budget").set_memory_budget(max_bytes)
+
     def get_sampling_point(
         self,
         combined_criterion: CombinedFailureCriterion,
@@ -283,6 +722,80 @@ class CompositeModel:
             combined_criterion, element_id, time, composite_definition_label
         )
 
+    async def aevaluate_failure_criteria(
+        self,
+        combined_criterion: CombinedFailureCriterion,
+        composite_scope: CompositeScope | None = None,
+        measure: FailureMeasureEnum = FailureMeasureEnum.INVERSE_RESERVE_FACTOR,
+        write_data_for_full_element_scope: bool = True,
+        max_chunk_size: int = 50000,
+    ) -> FieldsContainer:
+        """Asynchronous version of :meth:`evaluate_failure_criteria`.
+
+        The evaluation runs in the default executor of the running event loop,
+        so that the event loop is not blocked. If the awaiting task is cancelled,
+        the evaluation stops before the next chunk. The asynchronous calls of a
+        model run one after the other because the operators of the model must
+        not be used by multiple threads. Synchronous methods of the model must
+        not be called while an asynchronous call is in flight. Use separate
+        models to evaluate in parallel.
+
+        See :meth:`evaluate_failure_criteria` for the description of the parameters.
+
+        Examples
+        --------
+        >>> irf_field = await composite_model.aevaluate_failure_criteria(combined_criterion)
+        """
+        implementation = self._implementation
+        if isinstance(implementation, CompositeModelImpl):
+            return await _run_in_executor(
+                lambda cancel_event: implementation.evaluate_failure_criteria(
+                    combined_criterion,
+                    composite_scope,
+                    measure,
+                    write_data_for_full_element_scope,
+                    max_chunk_size,
+                    cancel_event=cancel_event,
+                ),
+                self._async_lock,
+            )
+        return await _run_in_executor(
+            lambda _: self.evaluate_failure_criteria(
+                combined_criterion,
+                composite_scope,
+                measure,
+                write_data_for_full_element_scope,
+                max_chunk_size,
+            ),
+            self._async_lock,
+        )
+
+    async def aget_sampling_point(
+        self,
+        combined_criterion: CombinedFailureCriterion,
+        element_id: int,
+        time: float | None = None,
+        composite_definition_label: str | None = None,
+    ) -> SamplingPoint:
+        """Asynchronous version of :meth:`get_sampling_point`.
+
+        In contrast to :meth:`get_sampling_point`, the sampling point is
+        evaluated before it is returned. The evaluation runs in the
+        default executor of the running event loop.
+
+        See :meth:`get_sampling_point` for the description of the parameters.
+        """
+
+        def get_evaluated_sampling_point(_: threading.Event) -> SamplingPoint:
+            sampling_point = self.get_sampling_point(
+                combined_criterion, element_id, time, composite_definition_label
+            )
+            # Accessing the results runs the sampling point
+            _ = sampling_point.results
+            return sampling_point
+
+        return await _run_in_executor(get_evaluated_sampling_point, self._async_lock)
+
     def get_element_info(
         self, element_id: int, composite_definition_label: str | None = None
     ) -> ElementInfo | None:
@@ -373,6 +886,169 @@ class CompositeModel:
             element_id, composite_definition_label
         )
 
+    def get_property_for_elements(
+        self,
+        layup_property: LayerProperty,
+        element_ids: Sequence[int] | None = None,
+    ) -> LayeredElementData:
+        """Get a layer property for multiple elements.
+
+        The values of all elements are returned in a CSR layout. The values of
+        each element are ordered from bottom to top. Non-layered elements have
+        no values.
+
+        Parameters
+        ----------
+        layup_property:
+            Lay-up property.
+        element_ids:
+            Element IDs or labels. All layered elements are selected if ``None``.
+        """
+        return self._get_implementation("get_property_for_elements").get_property_for_elements(
+            layup_property, element_ids
+        )
+
+    def get_analysis_ply_indices_for_elements(
+        self, element_ids: Sequence[int] | None = None
+    ) -> LayeredElementData:
+        """Get the analysis ply indices of all layers of multiple elements.
+
+        The indices of all elements are returned in a CSR layout. Use
+        :func:`.get_analysis_ply_index_to_name_map` to map the indices
+        to analysis ply names.
+
+        Parameters
+        ----------
+        element_ids:
+            Element IDs or labels. All layered elements are selected if ``None``.
+        """
+        return self._get_implementation(
+            "get_analysis_ply_indices_for_elements"
+        ).get_analysis_ply_indices_for_elements(element_ids)
+
+    def get_element_laminate_offsets(
+        self, element_ids: Sequence[int] | None = None
+    ) -> NDArray[np.double]:
+        """Get the laminate offsets of multiple elements.
+
+        The offset is ``NaN`` for non-layered elements.
+
+        Parameters
+        ----------
+        element_ids:
+            Element IDs or labels. All layered elements are selected if ``None``.
+        """
+        return self._get_implementation(
+            "get_element_laminate_offsets"
+        ).get_element_laminate_offsets(element_ids)
+
+    def get_laminate_thicknesses(
+        self, element_ids: Sequence[int] | None = None
+    ) -> NDArray[np.double]:
+        """Get the total laminate thicknesses of multiple elements.
+
+        The thickness is ``0`` for non-layered elements.
+
+        Parameters
+        ----------
+        element_ids:
+            Element IDs or labels. All layered elements are selected if ``None``.
+        """
+        return self._get_implementation("get_laminate_thicknesses").get_laminate_thicknesses(
+            element_ids
+        )
+
+    def get_number_of_layers(self, element_ids: Sequence[int] | None = None) -> NDArray[np.int64]:
+        """Get the number of layers of multiple elements.
+
+        The number of layers is ``0`` for non-layered elements.
+
+        Parameters
+        ----------
+        element_ids:
+            Element IDs or labels. All layered elements are selected if ``None``.
+        """
+        return self._get_implementation("get_number_of_layers").get_number_of_layers(element_ids)
+
+    def get_analysis_ply_incidence(self) -> AnalysisPlyIncidence:
+        """Get the sparse incidence matrix of layered elements and analysis plies.
+
+        The rows of the matrix are the layered elements and the columns the
+        analysis plies. The value of an entry is the local layer index of the
+        analysis ply in the element plus one, or zero if the element does
+        not contain the analysis ply. The matrix is built once and
+        reused for subsequent calls.
+
+        This method requires SciPy.
+
+        Examples
+        --------
+        >>> incidence = composite_model.get_analysis_ply_incidence()
+        >>> element_ids = incidence.get_element_ids(["P1L1__ud", "P1L1__ud.2"])
+        """
+        return self._get_implementation("get_analysis_ply_incidence").get_analysis_ply_incidence()
+
+    def get_element_info_columns(self, element_ids: Sequence[int]) -> ElementInfoColumns:
+        """Get the lay-up information of multiple elements as arrays.
+
+        This method is the vectorized counterpart of :meth:`get_element_info`.
+
+        Parameters
+        ----------
+        element_ids:
+            Element IDs or labels.
+        """
+        return self._get_implementation("get_element_info_columns").get_element_info_columns(
+            element_ids
+        )
+
+    def reduce_layered_field(
+        self,
+        field: Field,
+        grouping_key: GroupingKey,
+        reduction: ReductionOperation = ReductionOperation.MAX,
+        component: IntEnum | int = 0,
+        selected_groups: Collection[int] | None = None,
+    ) -> LayeredReductionResult:
+        """Reduce the elementary data of a layered field grouped by a key.
+
+        The data of all layered elements is grouped by layer, analysis ply,
+        material, or spot and reduced at once. This replaces loops over
+        the elements with :func:`.get_selected_indices`.
+        See :func:`.reduce_layered_field` for details.
+
+        Parameters
+        ----------
+        field:
+            Elemental nodal field of layered data, for example stresses or
+            failure values.
+        grouping_key:
+            Key by which the data is grouped.
+        reduction:
+            Reduction applied to each group. The default is ``MAX``.
+        component:
+            Component of the field to reduce. The default is ``0``.
+        selected_groups:
+            Groups to consider. For example, the spots or material IDs.
+            All groups are considered by default.
+
+        Examples
+        --------
+        >>> from ansys.dpf.composites.constants import Spot, Sym3x3TensorComponent
+        >>> from ansys.dpf.composites.layered_reduction import GroupingKey, ReductionOperation
+        >>> result = composite_model.reduce_layered_field(
+        ...     stress_field,
+        ...     GroupingKey.SPOT,
+        ...     ReductionOperation.MAX,
+        ...     component=Sym3x3TensorComponent.TENSOR11,
+        ...     selected_groups=[Spot.TOP],
+        ... )
+        >>> element_ids, max_s11_at_top = result.get_group_values(Spot.TOP)
+        """
+        return self._get_implementation("reduce_layered_field").reduce_layered_field(
+            field, grouping_key, reduction, component, selected_groups
+        )
+
     def get_constant_property_dict(
         self,
         material_properties: Collection[MaterialProperty],
@@ -404,10 +1080,203 @@ class CompositeModel:
             material_properties, composite_definition_label
         )
 
+    async def aget_constant_property_dict(
+        self,
+        material_properties: Collection[MaterialProperty],
+        composite_definition_label: str | None = None,
+    ) -> dict[np.int64, dict[MaterialProperty, float]]:
+        """Asynchronous version of :meth:`get_constant_property_dict`.
+
+        The evaluation runs in the default executor of the running event loop.
+
+        See :meth:`get_constant_property_dict` for the description of the parameters.
+        """
+        return await _run_in_executor(
+            lambda _: self.get_constant_property_dict(
+                material_properties, composite_definition_label
+            ),
+            self._async_lock,
+        )
+
     def get_result_times_or_frequencies(self) -> NDArray[np.double]:
         """Get the times or frequencies in the result file."""
         return self._implementation.get_result_times_or_frequencies()
 
+    def enable_result_cache(self, max_size: int = 8) -> None:
+        """Enable the least recently used (LRU) cache for results.
+
+        Results read with :meth:`get_result` are cached, keyed by result type,
+        time, and element scope. Repeated requests of the same result do not
+        read the result file again. If the cache is full, the least recently
+        used result is released. An existing cache is replaced by an empty one.
+
+        The cache is disabled by default.
+
+        Parameters
+        ----------
+        max_size:
+            Maximum number of cached fields containers. The default is ``8``.
+        """
+        self._get_implementation("enable_result_cache").enable_result_cache(max_size)
+
+    def disable_result_cache(self) -> None:
+        """Disable the result cache and release all cached results."""
+        self._get_implementation("disable_result_cache").disable_result_cache()
+
+    @property
+    def result_cache_statistics(self) -> ResultCacheStatistics | None:
+        """Hit and miss statistics of the result cache, or ``None`` if it is disabled."""
+        result_cache = self._get_implementation("result_cache_statistics").result_cache
+        return None if result_cache is None else result_cache.statistics
+
+    def invalidate_result_cache(
+        self, result_type: ResultType | None = None, time: float | None = None
+    ) -> int:
+        """Remove cached results, for example after the result file has changed.
+
+        Returns the number of removed results.
+
+        Parameters
+        ----------
+        result_type:
+            Result type to remove. All result types are removed if ``None``.
+        time:
+            Time or frequency to remove. All times are removed if ``None``.
+        """
+        return self._get_implementation("invalidate_result_cache").invalidate_result_cache(
+            result_type, time
+        )
+
+    def get_result(
+        self,
+        result_type: ResultType,
+        time: float | None = None,
+        element_ids: Sequence[int] | None = None,
+    ) -> FieldsContainer:
+        """Read stresses or strains in the layer coordinate system.
+
+        The result is read with ``bool_rotate_to_global=False``. If the result cache
+        is enabled (see :meth:`enable_result_cache`), the result is taken from the
+        cache if available. Cached fields containers are shared between calls
+        and must not be modified. :meth:`add_interlaminar_normal_stresses`
+        modifies the stresses in place and therefore removes them from the cache.
+
+        Parameters
+        ----------
+        result_type:
+            Type of the result.
+        time:
+            Time or frequency. The last time or frequency is used if ``None``.
+        element_ids:
+            Element scope. The result is read for all elements if ``None``.
+
+        Examples
+        --------
+        >>> from ansys.dpf.composites.constants import ResultType
+        >>> composite_model.enable_result_cache(max_size=4)
+        >>> stresses = composite_model.get_result(ResultType.STRESS, time=1.0)
+        >>> stresses = composite_model.get_result(ResultType.STRESS, time=1.0)
+        >>> composite_model.result_cache_statistics.hits
+        1
+        """
+        return self._get_implementation("get_result").get_result(result_type, time, element_ids)
+
+    def iterate_element_chunks(
+        self,
+        result_types: Sequence[ResultType] = (ResultType.STRESS, ResultType.ELASTIC_STRAIN),
+        time: float | None = None,
+        element_ids: Sequence[int] | None = None,
+        named_selections: Sequence[str] | None = None,
+        max_chunk_size: int = 50000,
+        prefetch: bool = True,
+    ) -> Iterator[ElementChunk]:
+        """Iterate over chunks of elements with their lay-up information and results.
+
+        The element scope is split into chunks in the same way as in
+        :meth:`evaluate_failure_criteria`. Each chunk contains the element IDs,
+        the :class:`.ElementInfoColumns`, and the result data as NumPy arrays.
+        Only one or two chunks are held in memory at a time, which allows
+        processing models whose results do not fit in memory.
+
+        The results are read in the layer coordinate system. For complex
+        results, the real part is read.
+
+        For distributed result files, each chunk contains elements of a single
+        partition (see :attr:`result_partitions`) and is read from the result
+        file of this partition only. If ``prefetch`` is set, the chunks are read
+        in parallel.
+
+        Parameters
+        ----------
+        result_types:
+            Results to read for each chunk. The default is stresses and elastic strains.
+        time:
+            Time or frequency. The last time or frequency is used if ``None``.
+        element_ids:
+            Element scope. All elements are selected if ``None``.
+        named_selections:
+            Named selections which define the element scope.
+        max_chunk_size:
+            Maximum number of elements per chunk. The default is ``50000``.
+        prefetch:
+            Whether to read the next chunk in a background thread while the
+            current chunk is processed. The default is ``True``.
+
+        Examples
+        --------
+        >>> for chunk in composite_model.iterate_element_chunks(max_chunk_size=10000):
+        ...     max_s11 = np.maximum.reduceat(chunk.stresses[:, 0], chunk.indptr[:-1])
+        """
+        return self._get_implementation("iterate_element_chunks").iterate_element_chunks(
+            result_types, time, element_ids, named_selections, max_chunk_size, prefetch
+        )
+
+    def write_result_store(
+        self,
+        path: str | os.PathLike[str],
+        result_types: Sequence[ResultType] = (ResultType.STRESS, ResultType.ELASTIC_STRAIN),
+        time: float | None = None,
+        element_ids: Sequence[int] | None = None,
+        named_selections: Sequence[str] | None = None,
+        max_chunk_size: int = 50000,
+    ) -> ResultStore:
+        """Write results to a local result store and open it.
+
+        The results are read chunk by chunk with :meth:`iterate_element_chunks`
+        and appended to memory-mapped arrays together with the lay-up information,
+        analysis ply indices, and material IDs of the layers. The returned
+        :class:`.ResultStore` can be reopened later without a DPF server
+        by passing the same path to :class:`.ResultStore`.
+
+        This method requires DPF Server 7.0 (2024 R1) or later.
+
+        Parameters
+        ----------
+        path:
+            Directory of the store. Existing files of a store are overwritten.
+        result_types:
+            Results to store. The result names of the store are the enum values,
+            for example ``"stress"``.
+        time:
+            Time or frequency. The last time or frequency is used if ``None``.
+        element_ids:
+            Element scope. All elements are selected if ``None``.
+        named_selections:
+            Named selections which define the element scope.
+        max_chunk_size:
+            Maximum number of elements per chunk.
+
+        Examples
+        --------
+        >>> store = composite_model.write_result_store("stresses")
+        >>> # Later, without a DPF server
+        >>> store = ResultStore("stresses")
+        >>> selection = store.select("stress", analysis_ply_names=["P1L1__ModelingPly.1"])
+        """
+        return self._get_implementation("write_result_store").write_result_store(
+            path, result_types, time, element_ids, named_selections, max_chunk_size
+        )
+
     def add_interlaminar_normal_stresses(
         self,
         stresses: FieldsContainer,
@@ -422,6 +1291,9 @@ class CompositeModel:
         of a failure criterion depends on this stress component, for instance
         :class:`Puck 3D <.failure_criteria.PuckCriterion>` .
 
+        The stresses are modified in place. If they were read with :meth:`get_result`
+        from the result cache, they are removed from the cache.
+
         For a usage example, see
         :ref:`sphx_glr_examples_gallery_examples_007_interlaminar_normal_stress_example.py`.
 
@@ -462,3 +1334,12 @@ class CompositeModel:
         return self._implementation.get_all_layered_element_ids_for_composite_definition_label(
             composite_definition_label
         )
+
+    def _get_implementation(self, feature: str) -> CompositeModelImpl:
+        """Get the implementation for features which require DPF Server 7.0 or later."""
+        if not isinstance(self._implementation, CompositeModelImpl):
+            raise RuntimeError(
+                f"{feature} is not available for DPF servers older than 7.0 (2024 R1). "
+                "Please update the installation."
+            )
+        return self._implementation
@@ -30,6 +30,7 @@ __all__ = (
     "FailureOutput",
     "REF_SURFACE_NAME",
     "FAILURE_LABEL",
+    "ResultType",
     "SolverType",
     "TIME_LABEL",
     "component_index_from_name",
@@ -70,6 +71,13 @@ class SolverType(str, Enum):
     LSDYNA = "lsdyna"
 
 
+class ResultType(str, Enum):
+    """Enum to specify the type of a result read from the result file."""
+
+    STRESS = "stress"
+    ELASTIC_STRAIN = "elastic_strain"
+
+
 def _component_name(component: Sym3x3TensorComponent) -> str:
     if component == Sym3x3TensorComponent.TENSOR11:
         return "1"
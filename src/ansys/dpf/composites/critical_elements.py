@@ -0,0 +1,86 @@
+# Copyright (C) 2022 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Most critical elements of a failure evaluation."""
+
+from collections.abc import Sequence
+from dataclasses import dataclass
+
+import numpy as np
+from numpy.typing import NDArray
+
+__all__ = ("CriticalElements",)
+
+
+@dataclass(frozen=True)
+class CriticalElements:
+    """Provides the most critical elements of a failure evaluation.
+
+    Use :meth:`.CompositeModel.get_most_critical` to evaluate it. The entry
+    ``i`` of each array belongs to the ``i``-th most critical element.
+
+    Parameters
+    ----------
+    element_ids
+        Element IDs.
+    failure_values
+        Failure values in the requested failure measure.
+    failure_modes
+        Failure mode codes, as in the :attr:`.FailureOutput.FAILURE_MODE` field.
+    layer_indices
+        Critical layer indices, as in the :attr:`.FailureOutput.MAX_LAYER_INDEX` field.
+        The indices are 1-based starting with DPF server 7.1 (2024 R1).
+    analysis_ply_names
+        Name of the analysis ply of the critical layer or ``None`` if the element
+        has no analysis ply.
+    times
+        Time or frequency of the failure values.
+    """
+
+    element_ids: NDArray[np.int64]
+    failure_values: NDArray[np.double]
+    failure_modes: NDArray[np.int64]
+    layer_indices: NDArray[np.int64]
+    analysis_ply_names: Sequence[str | None]
+    times: NDArray[np.double]
+
+    def __len__(self) -> int:
+        """Get the number of elements."""
+        return len(self.element_ids)
+
+
+def _get_top_k_indices(
+    values: NDArray[np.double], element_ids: NDArray[np.int64], k: int, largest: bool
+) -> NDArray[np.int64]:
+    """Get the indices of the ``k`` most critical values in descending criticality.
+
+    Ties are ordered by element ID. Only the candidates selected by a partition
+    are sorted, so the cost is linear in the number of values.
+    """
+    keys = -values if largest else values
+    if len(keys) > k:
+        threshold = np.partition(keys, k - 1)[k - 1]
+        candidates = np.flatnonzero(keys <= threshold)
+    else:
+        candidates = np.arange(len(keys), dtype=np.int64)
+    order = np.lexsort((element_ids[candidates], keys[candidates]))
+    return candidates[order[:k]].astype(np.int64)
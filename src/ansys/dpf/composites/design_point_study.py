@@ -0,0 +1,313 @@
+# Copyright (C) 2022 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Evaluation of failure criteria for the design points of a Workbench project."""
+
+from collections.abc import Callable, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import AbstractContextManager, nullcontext
+import contextvars
+from dataclasses import dataclass
+from functools import partial
+import hashlib
+import pathlib
+import queue
+import re
+import threading
+from typing import Any
+
+from ansys.dpf.core.server_types import BaseServer
+import numpy as np
+from numpy.typing import NDArray
+
+from ._typing_helper import PATH as _PATH
+from .composite_model import CompositeModel
+from .composite_scope import CompositeScope
+from .critical_elements import CriticalElements
+from .data_sources import (
+    ContinuousFiberCompositesFiles,
+    get_composite_files_from_workbench_result_folder,
+)
+from .failure_criteria import CombinedFailureCriterion
+from .result_definition import FailureMeasureEnum
+from .server_helpers import (
+    ServerPool,
+    UploadCache,
+    upload_continuous_fiber_composite_files_to_server,
+)
+from .server_helpers._upload_files_to_server import _update_hash_with_file
+
+__all__ = (
+    "DesignPoint",
+    "DesignPointStudyResults",
+    "find_design_points",
+    "get_composite_input_hash",
+    "run_design_point_study",
+)
+
+_DESIGN_POINT_FOLDER_PATTERN = re.compile(r"^dp(\d+)$")
+
+
+@dataclass(frozen=True)
+class DesignPoint:
+    """Provides the input files of a design point.
+
+    Use :func:`find_design_points` to find the design points of a project.
+
+    Parameters
+    ----------
+    name
+        Name of the design point folder, for example ``"dp0"``.
+    composite_files
+        Input files of the design point.
+    input_hash
+        Hash of the composite definitions and the engineering data. Design points
+        with equal hashes share these input files.
+    """
+
+    name: str
+    composite_files: ContinuousFiberCompositesFiles
+    input_hash: str
+
+
+@dataclass(frozen=True)
+class DesignPointStudyResults:
+    """Provides the most critical element of each design point.
+
+    Use :func:`run_design_point_study` to evaluate it. Row ``i`` of each column
+    belongs to the ``i``-th design point.
+
+    Parameters
+    ----------
+    columns
+        Result columns by name. The columns are ``design_point``, ``element_id``,
+        ``failure_value``, ``failure_mode``, ``layer_index``,
+        ``analysis_ply_name``, and ``time``. See :class:`.CriticalElements` for
+        the meaning of the values.
+    """
+
+    columns: dict[str, NDArray[Any]]
+
+    def __len__(self) -> int:
+        """Get the number of design points."""
+        return len(self.columns["design_point"])
+
+
+def get_composite_input_hash(composite_files: ContinuousFiberCompositesFiles) -> str:
+    """Get the hash of the composite definitions and the engineering data.
+
+    The hash depends on the content of the files only, not on their paths.
+    The result files are not part of the hash.
+
+    Parameters
+    ----------
+    composite_files:
+        Local input files.
+    """
+    input_hash = hashlib.sha256()
+    for key in sorted(composite_files.composite):
+        definition_files = composite_files.composite[key]
+        input_hash.update(f"composite:{key}".encode())
+        _update_hash_with_file(input_hash, definition_files.definition)
+        if definition_files.mapping is not None:
+            input_hash.update(b"mapping")
+            _update_hash_with_file(input_hash, definition_files.mapping)
+    input_hash.update(b"engineering_data")
+    _update_hash_with_file(input_hash, composite_files.engineering_data)
+    return input_hash.hexdigest()
+
+
+def find_design_points(
+    project_folder: _PATH,
+    result_folder: _PATH = pathlib.Path("SYS", "MECH"),
+    ensure_composite_definitions_found: bool = True,
+) -> list[DesignPoint]:
+    """Find the design points of a Workbench project.
+
+    The design points are the ``dp0`` to ``dpN`` folders of the project folder
+    which contain a result folder. The input files of each design point are
+    determined with :func:`.get_composite_files_from_workbench_result_folder`.
+
+    Parameters
+    ----------
+    project_folder:
+        Folder which contains the design point folders, typically the
+        ``<project>_files`` folder.
+    result_folder:
+        Result folder of the solution relative to the design point folder.
+    ensure_composite_definitions_found:
+        Whether to check if at least one composite definition has been found
+        for each design point.
+    """
+    design_point_folders = []
+    for folder in pathlib.Path(project_folder).iterdir():
+        match = _DESIGN_POINT_FOLDER_PATTERN.match(folder.name)
+        if match is not None and (folder / result_folder).is_dir():
+            design_point_folders.append((int(match.group(1)), folder))
+    if len(design_point_folders) == 0:
+        raise RuntimeError(f"No design point folders with results found in {project_folder}.")
+
+    design_points = []
+    for _, folder in sorted(design_point_folders):
+        composite_files = get_composite_files_from_workbench_result_folder(
+            folder / result_folder, ensure_composite_definitions_found
+        )
+        design_points.append(
+            DesignPoint(
+                name=folder.name,
+                composite_files=composite_files,
+                input_hash=get_composite_input_hash(composite_files),
+            )
+        )
+    return design_points
+
+
+def run_design_point_study(
+    design_points: Sequence[DesignPoint],
+    combined_criterion: CombinedFailureCriterion,
+    servers: Sequence[BaseServer] | None = None,
+    number_of_servers: int = 1,
+    composite_scope: CompositeScope | None = None,
+    measure: FailureMeasureEnum = FailureMeasureEnum.INVERSE_RESERVE_FACTOR,
+    max_chunk_size: int = 50000,
+    server_pool: ServerPool | None = None,
+) -> DesignPointStudyResults:
+    """Evaluate the failure criteria for each design point.
+
+    The design points are distributed over several DPF servers. Each server
+    evaluates one design point at a time with
+    :meth:`.CompositeModel.get_most_critical`. With a :class:`.ServerPool`, a
+    server is borrowed from the pool for each design point, so the health check
+    and the recycling of the pool apply. Design points with the same input hash
+    are started one after the other. Files with identical content, such as the
+    composite definitions and engineering data, are uploaded only once per
+    server with an :class:`.UploadCache`.
+
+    Parameters
+    ----------
+    design_points:
+        Design points to evaluate.
+    combined_criterion:
+        Combined failure criterion to evaluate.
+    servers:
+        DPF servers with the DPF Composites plugin loaded. Each server is used
+        directly by one worker thread. If ``None``, the servers of
+        ``server_pool`` are used.
+    number_of_servers:
+        Number of local servers of the pool which is started if neither
+        ``servers`` nor ``server_pool`` is set. This pool is shut down after the
+        evaluation.
+    composite_scope:
+        Composite scope on which to evaluate the failure criteria.
+    measure:
+        Failure measure of the results.
+    max_chunk_size:
+        Maximum number of elements per chunk.
+    server_pool:
+        Pool of DPF servers. One worker thread per server of the pool borrows a
+        server for each design point.
+    """
+    if len(design_points) == 0:
+        raise RuntimeError("At least one design point is required.")
+
+    if servers is not None and server_pool is not None:
+        raise RuntimeError("Either servers or a server pool can be set, not both.")
+
+    owned_pool: ServerPool | None = None
+    get_servers: list[Callable[[], AbstractContextManager[BaseServer]]]
+    if servers is not None:
+        if len(servers) == 0:
+            raise RuntimeError("At least one server is required.")
+        get_servers = [partial(nullcontext, server) for server in servers]
+    else:
+        if server_pool is None:
+            owned_pool = server_pool = ServerPool(number_of_servers)
+        get_servers = [server_pool.server] * server_pool.size
+
+    pending_points: queue.Queue[int] = queue.Queue()
+    for index in sorted(
+        range(len(design_points)), key=lambda index: design_points[index].input_hash
+    ):
+        pending_points.put(index)
+    results: dict[int, CriticalElements] = {}
+    upload_cache = UploadCache()
+    failed = threading.Event()
+
+    def evaluate_design_points(
+        get_server: Callable[[], AbstractContextManager[BaseServer]],
+    ) -> None:
+        while not failed.is_set():
+            try:
+                index = pending_points.get_nowait()
+            except queue.Empty:
+                return
+            try:
+                with get_server() as server:
+                    composite_model = CompositeModel(
+                        upload_continuous_fiber_composite_files_to_server(
+                            design_points[index].composite_files,
+                            server,
+                            upload_cache=upload_cache,
+                        ),
+                        server=server,
+                    )
+                    results[index] = composite_model.get_most_critical(
+                        1, combined_criterion, composite_scope, measure, max_chunk_size
+                    )
+            except BaseException:
+                failed.set()
+                raise
+
+    try:
+        with ThreadPoolExecutor(max_workers=len(get_servers)) as executor:
+            futures = [
+                executor.submit(contextvars.copy_context().run, evaluate_design_points, get_server)
+                for get_server in get_servers
+            ]
+            for future in futures:
+                future.result()
+    finally:
+        if owned_pool is not None:
+            owned_pool.close()
+
+    ordered_results = [results[index] for index in range(len(design_points))]
+    return DesignPointStudyResults(
+        columns={
+            "design_point": np.array([design_point.name for design_point in design_points]),
+            "element_id": np.array(
+                [result.element_ids[0] for result in ordered_results], dtype=np.int64
+            ),
+            "failure_value": np.array(
+                [result.failure_values[0] for result in ordered_results], dtype=np.double
+            ),
+            "failure_mode": np.array(
+                [result.failure_modes[0] for result in ordered_results], dtype=np.int64
+            ),
+            "layer_index": np.array(
+                [result.layer_indices[0] for result in ordered_results], dtype=np.int64
+            ),
+            "analysis_ply_name": np.array(
+                [result.analysis_ply_names[0] for result in ordered_results], dtype=object
+            ),
+            "time": np.array([result.times[0] for result in ordered_results], dtype=np.double),
+        }
+    )
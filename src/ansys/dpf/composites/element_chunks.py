@@ -0,0 +1,114 @@
+# Copyright (C) 2022 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Element chunks of layered results."""
+
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+import contextvars
+from dataclasses import dataclass
+from typing import TypeVar
+
+import numpy as np
+from numpy.typing import NDArray
+
+from .constants import ResultType
+from .layup_info import ElementInfoColumns
+
+__all__ = ("ElementChunk",)
+
+
+@dataclass(frozen=True)
+class ElementChunk:
+    """Provides the results of a chunk of elements as arrays.
+
+    Use :meth:`.CompositeModel.iterate_element_chunks` to iterate over the
+    chunks of a model. The data of element ``element_ids[i]`` are the rows
+    ``indptr[i]:indptr[i + 1]`` of each result array. For layered elements,
+    these rows are the elementary data described in :ref:`select_indices`.
+
+    Parameters
+    ----------
+    index
+        0-based index of the chunk.
+    element_ids
+        IDs of the elements in the chunk.
+    element_info_columns
+        Lay-up information of the elements.
+    indptr
+        Row pointer of the result data of each element with a trailing end entry.
+    results
+        Result data with shape ``(indptr[-1], number_of_components)`` by result type.
+    """
+
+    index: int
+    element_ids: NDArray[np.int64]
+    element_info_columns: ElementInfoColumns
+    indptr: NDArray[np.int64]
+    results: dict[ResultType, NDArray[np.double]]
+
+    def __len__(self) -> int:
+        """Get the number of elements."""
+        return len(self.element_ids)
+
+    @property
+    def stresses(self) -> NDArray[np.double]:
+        """Stresses of the elements in the layer coordinate system."""
+        return self._get_result(ResultType.STRESS)
+
+    @property
+    def strains(self) -> NDArray[np.double]:
+        """Elastic strains of the elements in the layer coordinate system."""
+        return self._get_result(ResultType.ELASTIC_STRAIN)
+
+    def _get_result(self, result_type: ResultType) -> NDArray[np.double]:
+        if result_type not in self.results:
+            raise RuntimeError(f"The chunk does not contain the result {result_type.value}.")
+        return self.results[result_type]
+
+
+_T = TypeVar("_T")
+_END = object()
+
+
+def _prefetch(items: Iterable[_T]) -> Iterator[_T]:
+    """Iterate over items while the next item is evaluated in a background thread.
+
+    The items are always evaluated in the same background thread. Objects
+    which are used to evaluate the items, such as DPF operators, are therefore
+    not accessed concurrently. They are evaluated in a copy of the context of
+    the caller, so the timings of :func:`.record_timings` include them.
+    """
+    iterator = iter(items)
+    context = contextvars.copy_context()
+
+    def get_next() -> _T | object:
+        return next(iterator, _END)
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        next_item = executor.submit(context.run, get_next)
+        while True:
+            item = next_item.result()
+            if item is _END:
+                return
+            next_item = executor.submit(context.run, get_next)
+            yield item  # type: ignore[misc]
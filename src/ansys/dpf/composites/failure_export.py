@@ -0,0 +1,421 @@
+# Copyright (C) 2022 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Columnar export of failure results."""
+
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass
+from enum import Enum
+import os
+import pathlib
+from types import TracebackType
+from typing import Any, Protocol
+
+from ansys.dpf.core import FieldsContainer
+import numpy as np
+from numpy.typing import NDArray
+
+from ._composite_model_impl_helpers import _get_fields_by_failure_output
+from ._indexer import _select_csr_rows
+from .constants import TIME_LABEL, FailureOutput
+
+__all__ = (
+    "ELEMENT_TABLE_NAME",
+    "REFERENCE_SURFACE_TABLE_NAME",
+    "ExportFormat",
+    "FailureExportResult",
+    "FailureTableWriter",
+    "export_failure_fields_container",
+    "get_export_format",
+    "get_failure_columns",
+)
+
+#: Name of the table with the failure results of the elements.
+ELEMENT_TABLE_NAME = "elements"
+#: Name of the table with the failure results mapped to the reference surface.
+REFERENCE_SURFACE_TABLE_NAME = "reference_surface"
+
+# The first output of each table defines the elements of the rows.
+_TABLE_OUTPUTS = {
+    ELEMENT_TABLE_NAME: (
+        FailureOutput.FAILURE_VALUE,
+        FailureOutput.FAILURE_MODE,
+        FailureOutput.MAX_LAYER_INDEX,
+    ),
+    REFERENCE_SURFACE_TABLE_NAME: (
+        FailureOutput.FAILURE_VALUE_REF_SURFACE,
+        FailureOutput.FAILURE_MODE_REF_SURFACE,
+        FailureOutput.MAX_GLOBAL_LAYER_IN_STACK,
+        FailureOutput.MAX_LOCAL_LAYER_IN_ELEMENT,
+        FailureOutput.MAX_SOLID_ELEMENT_ID,
+    ),
+}
+_DOUBLE_OUTPUTS = (FailureOutput.FAILURE_VALUE, FailureOutput.FAILURE_VALUE_REF_SURFACE)
+
+
+class ExportFormat(str, Enum):
+    """Provides the file formats of the failure export."""
+
+    #: Apache Parquet file. Requires ``pyarrow``.
+    PARQUET = "parquet"
+    #: Apache Arrow IPC (Feather V2) file. Requires ``pyarrow``.
+    ARROW = "arrow"
+    #: HDF5 file with one group per table. Requires ``h5py``.
+    HDF5 = "hdf5"
+
+
+_FORMAT_BY_SUFFIX = {
+    ".parquet": ExportFormat.PARQUET,
+    ".pq": ExportFormat.PARQUET,
+    ".arrow": ExportFormat.ARROW,
+    ".feather": ExportFormat.ARROW,
+    ".ipc": ExportFormat.ARROW,
+    ".h5": ExportFormat.HDF5,
+    ".hdf5": ExportFormat.HDF5,
+}
+
+
+def get_export_format(path: str | os.PathLike[str]) -> ExportFormat:
+    """Get the export format from the suffix of a file path.
+
+    Parameters
+    ----------
+    path:
+        Path of the exported file.
+    """
+    suffix = pathlib.Path(path).suffix.lower()
+    if suffix not in _FORMAT_BY_SUFFIX:
+        raise RuntimeError(
+            f"Cannot determine the export format of {path}. "
+            f"Supported suffixes are {', '.join(_FORMAT_BY_SUFFIX)}."
+        )
+    return _FORMAT_BY_SUFFIX[suffix]
+
+
+@dataclass(frozen=True)
+class FailureExportResult:
+    """Provides the tables written by a :class:`FailureTableWriter`.
+
+    Parameters
+    ----------
+    table_paths
+        Path of the file of each table. For the HDF5 format, all tables are
+        groups of the same file.
+    number_of_rows
+        Number of rows of each table.
+    """
+
+    table_paths: dict[str, pathlib.Path]
+    number_of_rows: dict[str, int]
+
+
+def _get_values_by_ids(field: Any, element_ids: NDArray[np.int64]) -> NDArray[Any]:
+    field_ids = np.asarray(field.scoping.ids, dtype=np.int64)
+    data = np.asarray(field.data)
+    indptr = np.arange(len(field_ids) + 1, dtype=np.int64)
+    try:
+        _, values = _select_csr_rows(field_ids, indptr, data, element_ids)
+    except RuntimeError as exc:
+        raise RuntimeError(
+            f"The field {field.name} does not contain results for all elements."
+        ) from exc
+    return values
+
+
+def get_failure_columns(
+    fields_container: FieldsContainer, time_values: Sequence[float] | NDArray[np.double]
+) -> dict[str, dict[str, NDArray[Any]]]:
+    """Convert a fields container with failure results to columns.
+
+    Returns the columns of each table by table name. The tables are
+    :data:`ELEMENT_TABLE_NAME` and, if the fields container contains results
+    mapped to the reference surface, :data:`REFERENCE_SURFACE_TABLE_NAME`.
+    Each table contains the columns ``element_id``, ``time``, and one column
+    per :class:`.FailureOutput`, named after the lowercase enum name. Failure
+    modes, layer indices, and element IDs are stored as integers.
+
+    Parameters
+    ----------
+    fields_container:
+        Fields container returned by :meth:`.CompositeModel.evaluate_failure_criteria`.
+    time_values:
+        Times or frequencies of the result file, which are indexed by the time ID
+        minus one. Use :meth:`.CompositeModel.get_result_times_or_frequencies`
+        to get them.
+    """
+    columns_per_table: dict[str, list[dict[str, NDArray[Any]]]] = {}
+    for time_id in sorted(fields_container.get_available_ids_for_label(TIME_LABEL)):
+        fields_by_output = _get_fields_by_failure_output(fields_container, time_id)
+        for table_name, outputs in _TABLE_OUTPUTS.items():
+            if outputs[0] not in fields_by_output:
+                continue
+            element_ids = np.asarray(fields_by_output[outputs[0]].scoping.ids, dtype=np.int64)
+            columns = {
+                "element_id": element_ids,
+                "time": np.full(len(element_ids), time_values[time_id - 1], dtype=np.double),
+            }
+            for output in outputs:
+                if output not in fields_by_output:
+                    continue
+                values = _get_values_by_ids(fields_by_output[output], element_ids)
+                columns[output.name.lower()] = (
+                    values.astype(np.double)
+                    if output in _DOUBLE_OUTPUTS
+                    else np.rint(values).astype(np.int64)
+                )
+            columns_per_table.setdefault(table_name, []).append(columns)
+
+    return {
+        table_name: {
+            name: np.concatenate([columns[name] for columns in columns_list])
+            for name in columns_list[0]
+        }
+        for table_name, columns_list in columns_per_table.items()
+    }
+
+
+class _TableWriter(Protocol):
+    def write(self, columns: Mapping[str, NDArray[Any]]) -> None: ...
+
+    def close(self) -> None: ...
+
+
+def _import_pyarrow() -> Any:
+    try:
+        import pyarrow
+        import pyarrow.ipc
+        import pyarrow.parquet
+    except ImportError as exc:
+        raise ImportError(
+            "The Parquet and Arrow export requires PyArrow. Install it with "
+            "'pip install ansys-dpf-composites[export]'."
+        ) from exc
+    return pyarrow
+
+
+def _import_h5py() -> Any:
+    try:
+        import h5py
+    except ImportError as exc:
+        raise ImportError(
+            "The HDF5 export requires h5py. Install it with "
+            "'pip install ansys-dpf-composites[export]'."
+        ) from exc
+    return h5py
+
+
+class _ArrowTableWriter:
+    """Write record batches to a Parquet or Arrow IPC file.
+
+    The file is created with the schema of the first batch.
+    """
+
+    def __init__(self, path: pathlib.Path, file_format: ExportFormat, metadata: dict[str, str]):
+        self._pyarrow = _import_pyarrow()
+        self._path = path
+        self._file_format = file_format
+        self._metadata = metadata
+        self._writer: Any = None
+
+    def write(self, columns: Mapping[str, NDArray[Any]]) -> None:
+        table = self._pyarrow.table(dict(columns))
+        if self._writer is None:
+            schema = table.schema.with_metadata(self._metadata)
+            if self._file_format == ExportFormat.PARQUET:
+                self._writer = self._pyarrow.parquet.ParquetWriter(self._path, schema)
+            else:
+                self._writer = self._pyarrow.ipc.new_file(self._path, schema)
+        self._writer.write_table(table.replace_schema_metadata(self._metadata))
+
+    def close(self) -> None:
+        if self._writer is not None:
+            self._writer.close()
+
+
+class _Hdf5TableWriter:
+    """Append columns to resizable datasets of an HDF5 group."""
+
+    def __init__(self, group: Any):
+        self._group = group
+
+    def write(self, columns: Mapping[str, NDArray[Any]]) -> None:
+        for name, values in columns.items():
+            if name not in self._group:
+                self._group.create_dataset(
+                    name, data=values, maxshape=(None,), chunks=True, compression="gzip"
+                )
+            else:
+                dataset = self._group[name]
+                start = dataset.shape[0]
+                dataset.resize((start + len(values),))
+                dataset[start:] = values
+
+    def close(self) -> None:
+        pass
+
+
+class FailureTableWriter:
+    """Writes failure results to columnar files in chunks.
+
+    Each call of :meth:`write_fields_container` appends rows to the tables, so
+    results evaluated in chunks can be written without merging them first. Use
+    the writer as a context manager to close the files. For the Parquet and Arrow
+    formats, the table :data:`ELEMENT_TABLE_NAME` is written to ``path`` and each
+    other table to a file with the table name appended to the file name stem, for
+    example ``result.reference_surface.parquet``. For the HDF5 format, each table
+    is a group of the file at ``path``.
+
+    Parameters
+    ----------
+    path:
+        Path of the exported file. An existing file is overwritten.
+    file_format:
+        Format of the exported file. If ``None``, the format is determined from the
+        suffix of ``path``.
+    metadata:
+        Metadata added to each table, such as the failure measure.
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str],
+        file_format: ExportFormat | None = None,
+        metadata: Mapping[str, str] | None = None,
+    ):
+        """Create the writer. The files are created when the first rows are written."""
+        self._path = pathlib.Path(path)
+        self._file_format = get_export_format(path) if file_format is None else file_format
+        self._metadata = {} if metadata is None else dict(metadata)
+        self._writers: dict[str, _TableWriter] = {}
+        self._table_paths: dict[str, pathlib.Path] = {}
+        self._number_of_rows: dict[str, int] = {}
+        self._hdf5_file: Any = None
+        if self._file_format == ExportFormat.HDF5:
+            self._hdf5_file = _import_h5py().File(self._path, "w")
+            self._hdf5_file.attrs.update(self._metadata)
+        else:
+            _import_pyarrow()
+
+    def __enter__(self) -> "FailureTableWriter":
+        """Enter the context."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Close the files."""
+        self.close()
+
+    @property
+    def result(self) -> FailureExportResult:
+        """Tables written so far."""
+        return FailureExportResult(
+            table_paths=dict(self._table_paths), number_of_rows=dict(self._number_of_rows)
+        )
+
+    def write_columns(self, table_name: str, columns: Mapping[str, NDArray[Any]]) -> None:
+        """Append rows to a table.
+
+        Parameters
+        ----------
+        table_name:
+            Name of the table.
+        columns:
+            Values of the rows by column name. All calls for the same table must
+            provide the same columns.
+        """
+        if table_name not in self._writers:
+            self._writers[table_name] = self._create_writer(table_name)
+            self._number_of_rows[table_name] = 0
+        self._writers[table_name].write(columns)
+        self._number_of_rows[table_name] += len(next(iter(columns.values()), []))
+
+    def write_fields_container(
+        self, fields_container: FieldsContainer, time_values: Sequence[float] | NDArray[np.double]
+    ) -> None:
+        """Append the rows of a fields container with failure results.
+
+        Parameters
+        ----------
+        fields_container:
+            Fields container with failure results of a chunk of elements.
+        time_values:
+            Times or frequencies of the result file. See :func:`get_failure_columns`.
+        """
+        for table_name, columns in get_failure_columns(fields_container, time_values).items():
+            self.write_columns(table_name, columns)
+
+    def close(self) -> None:
+        """Close the files."""
+        for writer in self._writers.values():
+            writer.close()
+        self._writers.clear()
+        if self._hdf5_file is not None:
+            self._hdf5_file.close()
+            self._hdf5_file = None
+
+    def _create_writer(self, table_name: str) -> _TableWriter:
+        if self._file_format == ExportFormat.HDF5:
+            if self._hdf5_file is None:
+                raise RuntimeError("The writer is closed.")
+            self._table_paths[table_name] = self._path
+            return _Hdf5TableWriter(self._hdf5_file.create_group(table_name))
+
+        path = self._path
+        if table_name != ELEMENT_TABLE_NAME:
+            path = path.with_name(f"{path.stem}.{table_name}{path.suffix}")
+        self._table_paths[table_name] = path
+        return _ArrowTableWriter(path, self._file_format, self._metadata)
+
+
+def export_failure_fields_container(
+    fields_container: FieldsContainer,
+    path: str | os.PathLike[str],
+    time_values: Sequence[float] | NDArray[np.double],
+    file_format: ExportFormat | None = None,
+    metadata: Mapping[str, str] | None = None,
+) -> FailureExportResult:
+    """Export an evaluated fields container with failure results.
+
+    Use :meth:`.CompositeModel.export_failure_criteria` to export the failure
+    results while they are evaluated in chunks.
+
+    Parameters
+    ----------
+    fields_container:
+        Fields container returned by :meth:`.CompositeModel.evaluate_failure_criteria`.
+    path:
+        Path of the exported file. See :class:`FailureTableWriter`.
+    time_values:
+        Times or frequencies of the result file. See :func:`get_failure_columns`.
+    file_format:
+        Format of the exported file. If ``None``, the format is determined from the
+        suffix of ``path``.
+    metadata:
+        Metadata added to each table.
+    """
+    with FailureTableWriter(path, file_format, metadata) as writer:
+        writer.write_fields_container(fields_container, time_values)
+    return writer.result
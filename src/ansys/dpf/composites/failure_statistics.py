@@ -0,0 +1,226 @@
+# Copyright (C) 2022 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Streaming statistics of failure results."""
+
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass
+from typing import Any
+
+import numpy as np
+from numpy.typing import NDArray
+
+__all__ = ("FailureStatistics", "StreamingHistogram", "get_default_bin_edges")
+
+
+def get_default_bin_edges() -> NDArray[np.double]:
+    """Get the default bin edges of failure value histograms.
+
+    The 40 bins cover inverse reserve factors from 0 to 2.
+    """
+    return np.linspace(0.0, 2.0, 41)
+
+
+class StreamingHistogram:
+    """Accumulates a fixed-bin histogram and summary statistics of values.
+
+    The memory consumption does not depend on the number of values. Values
+    outside of the bins are counted as underflow or overflow. ``NaN`` values
+    are ignored.
+
+    Parameters
+    ----------
+    bin_edges:
+        Increasing edges of the bins. The last bin includes its upper edge.
+    """
+
+    def __init__(self, bin_edges: Sequence[float] | NDArray[np.double]):
+        """Create an empty histogram."""
+        self._bin_edges = np.asarray(bin_edges, dtype=np.double)
+        if len(self._bin_edges) < 2 or np.any(np.diff(self._bin_edges) <= 0):
+            raise RuntimeError("At least two strictly increasing bin edges are required.")
+        self._counts = np.zeros(len(self._bin_edges) - 1, dtype=np.int64)
+        self._underflow = 0
+        self._overflow = 0
+        self._sum = 0.0
+        self._minimum = np.inf
+        self._maximum = -np.inf
+
+    def update(self, values: Sequence[float] | NDArray[Any]) -> None:
+        """Add values.
+
+        Parameters
+        ----------
+        values:
+            Values to add.
+        """
+        values = np.ravel(np.asarray(values, dtype=np.double))
+        values = values[~np.isnan(values)]
+        if len(values) == 0:
+            return
+        bins = np.searchsorted(self._bin_edges, values, side="right") - 1
+        # The upper edge belongs to the last bin
+        bins[values == self._bin_edges[-1]] = len(self._counts) - 1
+        is_inside = (bins >= 0) & (bins < len(self._counts))
+        self._counts += np.bincount(bins[is_inside], minlength=len(self._counts))
+        self._underflow += int(np.count_nonzero(bins < 0))
+        self._overflow += int(np.count_nonzero(bins >= len(self._counts)))
+        self._sum += float(np.sum(values))
+        self._minimum = min(self._minimum, float(np.min(values)))
+        self._maximum = max(self._maximum, float(np.max(values)))
+
+    def merge(self, other: "StreamingHistogram") -> None:
+        """Add the values of another histogram with the same bin edges.
+
+        Parameters
+        ----------
+        other:
+            Histogram to add.
+        """
+        if not np.array_equal(self._bin_edges, other.bin_edges):
+            raise RuntimeError("Only histograms with the same bin edges can be merged.")
+        self._counts += other.counts
+        self._underflow += other.underflow
+        self._overflow += other.overflow
+        self._sum += other.mean * other.count if other.count else 0.0
+        self._minimum = min(self._minimum, other.minimum)
+        self._maximum = max(self._maximum, other.maximum)
+
+    @property
+    def bin_edges(self) -> NDArray[np.double]:
+        """Edges of the bins."""
+        return self._bin_edges.copy()
+
+    @property
+    def counts(self) -> NDArray[np.int64]:
+        """Number of values per bin."""
+        return self._counts.copy()
+
+    @property
+    def underflow(self) -> int:
+        """Number of values below the first bin edge."""
+        return self._underflow
+
+    @property
+    def overflow(self) -> int:
+        """Number of values above the last bin edge."""
+        return self._overflow
+
+    @property
+    def count(self) -> int:
+        """Number of values."""
+        return int(np.sum(self._counts)) + self._underflow + self._overflow
+
+    @property
+    def minimum(self) -> float:
+        """Minimum value. The value is ``inf`` if there are no values."""
+        return self._minimum
+
+    @property
+    def maximum(self) -> float:
+        """Maximum value. The value is ``-inf`` if there are no values."""
+        return self._maximum
+
+    @property
+    def mean(self) -> float:
+        """Mean value. The value is ``NaN`` if there are no values."""
+        return self._sum / self.count if self.count else np.nan
+
+    def quantile(self, q: float) -> float:
+        """Get an approximate quantile.
+
+        The values are assumed to be uniformly distributed within each bin.
+        Underflow and overflow values are assumed to be between the minimum
+        or maximum and the outer bin edges. The error is therefore bounded by
+        the width of the bin which contains the quantile. The value is ``NaN``
+        if there are no values.
+
+        Parameters
+        ----------
+        q:
+            Quantile between 0 and 1. For example, ``0.95`` for the 95th percentile.
+        """
+        if not 0.0 <= q <= 1.0:
+            raise RuntimeError(f"The quantile must be between 0 and 1, got {q}.")
+        if self.count == 0:
+            return float(np.nan)
+        edges = np.concatenate(
+            [
+                [min(self._minimum, self._bin_edges[0])],
+                self._bin_edges,
+                [max(self._maximum, self._bin_edges[-1])],
+            ]
+        )
+        counts = np.concatenate([[self._underflow], self._counts, [self._overflow]])
+        cumulative_counts = np.cumsum(counts)
+        target = q * self.count
+        index = min(int(np.searchsorted(cumulative_counts, target)), len(counts) - 1)
+        previous_count = cumulative_counts[index] - counts[index]
+        fraction = (target - previous_count) / counts[index] if counts[index] else 0.0
+        value = edges[index] + fraction * (edges[index + 1] - edges[index])
+        return float(np.clip(value, self._minimum, self._maximum))
+
+
+@dataclass(frozen=True)
+class FailureStatistics:
+    """Provides statistics of the failure values of a model.
+
+    Use :meth:`.CompositeModel.get_failure_statistics` to evaluate them.
+    The failure values are inverse reserve factors.
+
+    Parameters
+    ----------
+    elements
+        Statistics of the maximum failure value of each element.
+    analysis_plies
+        Statistics of the maximum failure value of each element in each
+        analysis ply by analysis ply name.
+    materials
+        Statistics of the maximum failure value of each element in each
+        material by DPF material ID.
+    failure_mode_counts
+        Number of elements by the failure mode code of the maximum failure value,
+        as in the :attr:`.FailureOutput.FAILURE_MODE` field.
+    """
+
+    elements: StreamingHistogram
+    analysis_plies: dict[str, StreamingHistogram]
+    materials: dict[int, StreamingHistogram]
+    failure_mode_counts: dict[int, int]
+
+
+def _update_grouped_histograms(
+    histograms: dict[Any, StreamingHistogram],
+    group_ids: NDArray[Any],
+    values: NDArray[np.double],
+    bin_edges: NDArray[np.double],
+    group_names: Mapping[int, Any] | None = None,
+) -> None:
+    """Add values to the histogram of their group. The histograms are created on demand."""
+    order = np.argsort(group_ids, kind="stable")
+    unique_ids, starts = np.unique(group_ids[order], return_index=True)
+    ends = np.append(starts[1:], len(order))
+    for group_id, start, end in zip(unique_ids, starts, ends):
+        key = int(group_id) if group_names is None else group_names[int(group_id)]
+        if key not in histograms:
+            histograms[key] = StreamingHistogram(bin_edges)
+        histograms[key].update(values[order[start:end]])
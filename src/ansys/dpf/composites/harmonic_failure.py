@@ -0,0 +1,153 @@
+# Copyright (C) 2022 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Failure evaluation of harmonic analyses over the phase angle."""
+
+from dataclasses import dataclass
+
+import ansys.dpf.core as dpf
+from ansys.dpf.core import Field, FieldsContainer
+from ansys.dpf.core.server_types import BaseServer
+import numpy as np
+from numpy.typing import NDArray
+
+from .constants import TIME_LABEL
+from .load_combinations import _create_time_freq_support
+
+__all__ = ("HarmonicFailureResults",)
+
+
+@dataclass(frozen=True)
+class HarmonicFailureResults:
+    """Provides the maximum failure values of a harmonic analysis over the phase angle.
+
+    Use :meth:`.CompositeModel.evaluate_harmonic_failure` to evaluate it. The
+    entry ``i`` of each array belongs to the element ``element_ids[i]``. The
+    failure measure is the inverse reserve factor.
+
+    Parameters
+    ----------
+    element_ids
+        Element IDs.
+    failure_values
+        Maximum failure value over all frequencies and phase angles.
+    failure_modes
+        Failure mode codes at the critical frequency and phase angle, as in the
+        :attr:`.FailureOutput.FAILURE_MODE` field.
+    layer_indices
+        Critical layer indices at the critical frequency and phase angle, as in the
+        :attr:`.FailureOutput.MAX_LAYER_INDEX` field. The indices are 1-based
+        starting with DPF server 7.1 (2024 R1).
+    critical_frequencies
+        Frequency with the maximum failure value.
+    critical_phases
+        Phase angle in degrees with the maximum failure value in the range
+        [-180, 180).
+    """
+
+    element_ids: NDArray[np.int64]
+    failure_values: NDArray[np.double]
+    failure_modes: NDArray[np.int64]
+    layer_indices: NDArray[np.int64]
+    critical_frequencies: NDArray[np.double]
+    critical_phases: NDArray[np.double]
+
+    def __len__(self) -> int:
+        """Get the number of elements."""
+        return len(self.element_ids)
+
+
+def _get_phases(number_of_phases: int) -> NDArray[np.double]:
+    """Get equally spaced phase angles in degrees in the range [-180, 180)."""
+    if number_of_phases < 3:
+        raise RuntimeError(f"At least 3 phase angles are required, got {number_of_phases}.")
+    return -180.0 + 360.0 * np.arange(number_of_phases, dtype=np.double) / number_of_phases
+
+
+def _get_phase_factors(phases: NDArray[np.double]) -> NDArray[np.double]:
+    """Get the factors of the real and imaginary part for phase angles in degrees.
+
+    The value at the phase angle ``phi`` is ``real * cos(phi) - imaginary * sin(phi)``,
+    like in the ``sweeping_phase`` operator of DPF. The result has the shape
+    (phases, 2) and can be used as combination matrix of the real and imaginary part.
+    """
+    radians = np.deg2rad(phases)
+    return np.stack([np.cos(radians), -np.sin(radians)], axis=-1)
+
+
+def _create_phase_container(
+    real_field: Field,
+    imaginary_field: Field,
+    phases: NDArray[np.double],
+    server: BaseServer | None,
+) -> FieldsContainer:
+    """Create a fields container with a complex field at several phase angles in degrees.
+
+    The fields are computed on the server with the ``sweeping_phase`` operator,
+    so the data is neither transferred to the client nor uploaded again. The
+    time ID of the field of phase ``i`` is ``i + 1``, so the failure operators
+    evaluate all phase angles at once.
+    """
+    container = dpf.FieldsContainer(server=server)
+    container.labels = [TIME_LABEL]
+    container.time_freq_support = _create_time_freq_support(len(phases), server)
+    for phase_index, phase in enumerate(phases):
+        sweeping_phase = dpf.operators.math.sweeping_phase(server=server)
+        sweeping_phase.inputs.real_field.connect(real_field)
+        sweeping_phase.inputs.imaginary_field.connect(imaginary_field)
+        sweeping_phase.inputs.angle.connect(float(phase))
+        sweeping_phase.inputs.unit_name.connect("deg")
+        container.add_field({TIME_LABEL: phase_index + 1}, sweeping_phase.outputs.field())
+    return container
+
+
+def _wrap_phases(phases: NDArray[np.double]) -> NDArray[np.double]:
+    """Wrap phase angles in degrees to the range [-180, 180)."""
+    return np.mod(phases + 180.0, 360.0) - 180.0
+
+
+def _refine_critical_phases(
+    values: NDArray[np.double], phases: NDArray[np.double]
+) -> NDArray[np.double]:
+    """Estimate the critical phase angle of each row between the sampled phase angles.
+
+    ``values`` has the shape (rows, phases) and is sampled at the equally spaced,
+    periodic ``phases``. A parabola is fitted through the maximum of each row
+    and its two neighbours. The vertex of the parabola is the estimate. It is
+    at most half a step away from the sampled maximum.
+    """
+    step = 360.0 / len(phases)
+    critical = np.argmax(values, axis=1)
+    rows = np.arange(len(values))
+    previous_values = values[rows, critical - 1]
+    critical_values = values[rows, critical]
+    next_values = values[rows, (critical + 1) % len(phases)]
+
+    curvature = previous_values - 2.0 * critical_values + next_values
+    offsets = np.zeros(len(values), dtype=np.double)
+    # Only a parabola which opens downwards has a maximum
+    is_concave = curvature < 0.0
+    offsets[is_concave] = (
+        0.5 * step * (previous_values[is_concave] - next_values[is_concave]) / curvature[is_concave]
+    )
+    offsets = np.clip(offsets, -0.5 * step, 0.5 * step)
+    return _wrap_phases(phases[critical] + offsets)
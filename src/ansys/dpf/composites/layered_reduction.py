@@ -0,0 +1,419 @@
+# Copyright (C) 2022 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Group-by reductions of layered result data.
+
+The functions in this module replace Python loops over elements and
+:func:`.get_selected_indices` calls. They reduce the elementary data of
+all layered elements at once, grouped by layer, analysis ply, material, or spot.
+"""
+
+from collections.abc import Collection, Sequence
+from dataclasses import dataclass
+from enum import Enum, IntEnum
+from typing import Any, cast
+
+from ansys.dpf.core import Field
+import numpy as np
+from numpy.typing import NDArray
+
+from ._indexer import _gather_rows, _get_field_data_as_csr
+from .constants import Spot
+from .layup_info import (
+    ElementInfoColumns,
+    ElementInfoProviderProtocol,
+    LayeredElementData,
+    LayupPropertiesProvider,
+    get_element_info_columns,
+)
+
+__all__ = (
+    "GroupingKey",
+    "ReductionOperation",
+    "LayeredReductionResult",
+    "reduce_layered_data",
+    "reduce_layered_field",
+)
+
+
+class GroupingKey(Enum):
+    """Provides the keys by which layered data can be grouped."""
+
+    #: 0-based layer index.
+    LAYER = "LAYER"
+    #: Analysis ply index. Use :func:`.get_analysis_ply_index_to_name_map` to get the names.
+    ANALYSIS_PLY = "ANALYSIS_PLY"
+    #: DPF material ID.
+    MATERIAL = "MATERIAL"
+    #: Spot, see :class:`.Spot`.
+    SPOT = "SPOT"
+
+
+class ReductionOperation(Enum):
+    """Provides the reductions which can be applied to the grouped data."""
+
+    MAX = "MAX"
+    MIN = "MIN"
+    MEAN = "MEAN"
+    #: Position of the maximum. See :class:`LayeredReductionResult` for details.
+    ARGMAX = "ARGMAX"
+
+
+# Spot of each spot index in the RST file. The order is always bottom, top, and middle.
+_SPOT_BY_RST_SPOT_INDEX = np.array([Spot.BOTTOM, Spot.TOP, Spot.MIDDLE], dtype=np.int64)
+
+
+@dataclass(frozen=True)
+class LayeredReductionResult:
+    """Provides the result of a group-by reduction of layered data.
+
+    The result contains three reductions of the same data: per element, per element
+    and group, and per group over all elements. Elements and groups without
+    selected data are not part of the result.
+
+    For the ``ARGMAX`` reduction, the values per element and per element and group
+    are the 0-based elementary indices of the maximum within the element's data.
+    These are the same indices as the ones returned by :func:`.get_selected_indices`.
+    The values per group are the IDs of the elements which contain the maximum.
+
+    Parameters
+    ----------
+    grouping_key
+        Key by which the data is grouped.
+    reduction
+        Applied reduction.
+    element_ids
+        IDs of the elements with selected data.
+    element_values
+        Reduced value of each element.
+    element_group_element_ids
+        Element ID of each combination of element and group.
+    element_group_ids
+        Group (for example the layer index) of each combination of element and group.
+    element_group_values
+        Reduced value of each combination of element and group.
+    group_ids
+        Sorted groups with selected data.
+    group_values
+        Reduced value of each group over all elements.
+    """
+
+    grouping_key: GroupingKey
+    reduction: ReductionOperation
+    element_ids: NDArray[np.int64]
+    element_values: NDArray[Any]
+    element_group_element_ids: NDArray[np.int64]
+    element_group_ids: NDArray[np.int64]
+    element_group_values: NDArray[Any]
+    group_ids: NDArray[np.int64]
+    group_values: NDArray[Any]
+
+    def get_group_values(self, group_id: int) -> tuple[NDArray[np.int64], NDArray[Any]]:
+        """Get the element IDs and the reduced values of one group.
+
+        Parameters
+        ----------
+        group_id:
+            Group, for example the layer index or the DPF material ID.
+        """
+        is_group = self.element_group_ids == group_id
+        return self.element_group_element_ids[is_group], self.element_group_values[is_group]
+
+
+def _get_segment_starts(*keys: NDArray[np.int64]) -> NDArray[np.int64]:
+    """Get the start of each run of equal keys in sorted keys."""
+    is_start = np.zeros(len(keys[0]), dtype=bool)
+    if len(is_start) > 0:
+        is_start[0] = True
+    for key in keys:
+        is_start[1:] |= key[1:] != key[:-1]
+    return np.flatnonzero(is_start)
+
+
+def _reduce_segments(
+    values: NDArray[Any], starts: NDArray[np.int64], reduction: ReductionOperation
+) -> NDArray[Any]:
+    """Reduce the segments of values which begin at the given starts.
+
+    NaN values are ignored unless all values of a segment are NaN.
+    For ``ARGMAX``, the position of the first maximum in ``values`` is returned.
+    """
+    if reduction == ReductionOperation.MAX:
+        return np.fmax.reduceat(values, starts)
+    if reduction == ReductionOperation.MIN:
+        return np.fmin.reduceat(values, starts)
+
+    if reduction == ReductionOperation.MEAN:
+        is_valid = ~np.isnan(values)
+        sums = np.add.reduceat(np.where(is_valid, values, 0.0), starts)
+        valid_counts = np.add.reduceat(is_valid.astype(np.int64), starts)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return sums / valid_counts
+    if reduction == ReductionOperation.ARGMAX:
+        maxima = np.fmax.reduceat(values, starts)
+        counts = np.diff(np.append(starts, len(values)))
+        positions = np.arange(len(values), dtype=np.int64)
+        candidates = np.where(values == np.repeat(maxima, counts), positions, len(values))
+        first_maximum = np.minimum.reduceat(candidates, starts)
+        # Segments which contain only NaN values
+        return np.where(first_maximum == len(values), starts, first_maximum)
+    raise RuntimeError(f"Unsupported reduction {reduction}.")
+
+
+def _get_row_values(
+    data: LayeredElementData,
+    element_info_columns: ElementInfoColumns,
+    rows: NDArray[np.int64],
+    layers: NDArray[np.int64],
+    name: str,
+) -> NDArray[np.int64]:
+    """Get the per-layer values of the layer of each elementary data point."""
+    if not np.array_equal(data.element_ids, element_info_columns.element_ids):
+        raise RuntimeError(f"The {name} do not match the element IDs of the data.")
+    number_of_values = np.diff(data.indptr)
+    is_invalid = number_of_values != element_info_columns.n_layers
+    is_invalid &= element_info_columns.is_layered
+    if np.any(is_invalid):
+        raise RuntimeError(
+            f"The number of {name} of element "
+            f"{element_info_columns.element_ids[is_invalid][0]} does not match "
+            "the number of layers."
+        )
+    return cast(NDArray[np.int64], data.values[data.indptr[rows] + layers])
+
+
+def reduce_layered_data(
+    data: NDArray[Any],
+    indptr: NDArray[np.int64],
+    element_info_columns: ElementInfoColumns,
+    grouping_key: GroupingKey,
+    reduction: ReductionOperation = ReductionOperation.MAX,
+    analysis_ply_indices: LayeredElementData | None = None,
+    selected_groups: Collection[int] | None = None,
+) -> LayeredReductionResult:
+    """Reduce the elementary data of layered elements grouped by a key.
+
+    The data of element ``element_info_columns.element_ids[i]`` is
+    ``data[indptr[i]:indptr[i + 1]]``. The order of the elementary data is the
+    one of the result files: layer, spot, and node. Non-layered elements and
+    elements without spots are ignored.
+
+    Parameters
+    ----------
+    data:
+        Elementary data of one component.
+    indptr:
+        Row pointer of the data of each element with a trailing end entry.
+    element_info_columns:
+        Lay-up information of the elements. Use :func:`.get_element_info_columns`
+        to create it.
+    grouping_key:
+        Key by which the data is grouped.
+    reduction:
+        Reduction applied to each group.
+    analysis_ply_indices:
+        Analysis ply indices of the layers of the elements. Required for
+        ``GroupingKey.ANALYSIS_PLY``. Use
+        :meth:`.LayupPropertiesProvider.get_analysis_ply_indices_for_elements`
+        to get them.
+    selected_groups:
+        Groups to consider. For example, the spots or material IDs.
+        All groups are considered by default.
+    """
+    values = np.asarray(data)
+    indptr = np.asarray(indptr, dtype=np.int64)
+    if len(indptr) != len(element_info_columns) + 1:
+        raise RuntimeError(
+            f"The row pointer has {len(indptr)} entries but {len(element_info_columns) + 1} "
+            "are expected."
+        )
+
+    n_elementary_data = element_info_columns.number_of_elementary_data
+    is_considered = element_info_columns.is_layered & (element_info_columns.n_spots > 0)
+    is_invalid = is_considered & (np.diff(indptr) != n_elementary_data)
+    if np.any(is_invalid):
+        raise RuntimeError(
+            "The number of data points of element "
+            f"{element_info_columns.element_ids[is_invalid][0]} "
+            f"({np.diff(indptr)[is_invalid][0]}) does not match the lay-up "
+            f"({n_elementary_data[is_invalid][0]})."
+        )
+
+    row_indptr, positions = _gather_rows(
+        np.arange(len(values), dtype=np.int64),
+        np.where(is_considered, indptr[:-1], 0),
+        np.where(is_considered, indptr[1:], 0),
+    )
+    rows = np.repeat(np.arange(len(element_info_columns), dtype=np.int64), np.diff(row_indptr))
+    local_indices = positions - indptr[rows]
+    nodes_per_spot_plane = element_info_columns.number_of_nodes_per_spot_plane[rows]
+    n_spots = element_info_columns.n_spots[rows]
+    layers = local_indices // (nodes_per_spot_plane * n_spots)
+
+    if grouping_key == GroupingKey.LAYER:
+        keys = layers
+    elif grouping_key == GroupingKey.SPOT:
+        keys = _SPOT_BY_RST_SPOT_INDEX[(local_indices // nodes_per_spot_plane) % n_spots]
+    elif grouping_key == GroupingKey.MATERIAL:
+        keys = _get_row_values(
+            element_info_columns.dpf_material_ids,
+            element_info_columns,
+            rows,
+            layers,
+            "material IDs",
+        )
+    elif grouping_key == GroupingKey.ANALYSIS_PLY:
+        if analysis_ply_indices is None:
+            raise RuntimeError("Analysis ply indices are required to group by analysis ply.")
+        keys = _get_row_values(
+            analysis_ply_indices, element_info_columns, rows, layers, "analysis ply indices"
+        )
+    else:
+        raise RuntimeError(f"Unsupported grouping key {grouping_key}.")
+
+    if selected_groups is not None:
+        is_selected = np.isin(keys, np.asarray(list(selected_groups), dtype=np.int64))
+        rows = rows[is_selected]
+        positions = positions[is_selected]
+        local_indices = local_indices[is_selected]
+        keys = keys[is_selected]
+
+    selected_values = values[positions]
+    element_ids = element_info_columns.element_ids
+    if len(selected_values) == 0:
+        empty_ids = np.zeros(0, dtype=np.int64)
+        empty_values = np.zeros(0, dtype=values.dtype)
+        return LayeredReductionResult(
+            grouping_key=grouping_key,
+            reduction=reduction,
+            element_ids=empty_ids,
+            element_values=empty_values,
+            element_group_element_ids=empty_ids,
+            element_group_ids=empty_ids,
+            element_group_values=empty_values,
+            group_ids=empty_ids,
+            group_values=empty_values,
+        )
+
+    # Per element: the data points are already sorted by element
+    element_starts = _get_segment_starts(rows)
+    element_values = _reduce_segments(selected_values, element_starts, reduction)
+    if reduction == ReductionOperation.ARGMAX:
+        element_values = local_indices[element_values]
+
+    # Per element and group
+    order = np.lexsort((keys, rows))
+    sorted_rows = rows[order]
+    sorted_keys = keys[order]
+    element_group_starts = _get_segment_starts(sorted_rows, sorted_keys)
+    element_group_values = _reduce_segments(selected_values[order], element_group_starts, reduction)
+    if reduction == ReductionOperation.ARGMAX:
+        element_group_values = local_indices[order][element_group_values]
+
+    # Per group over all elements
+    order = np.argsort(keys, kind="stable")
+    sorted_group_keys = keys[order]
+    group_starts = _get_segment_starts(sorted_group_keys)
+    group_values = _reduce_segments(selected_values[order], group_starts, reduction)
+    if reduction == ReductionOperation.ARGMAX:
+        group_values = element_ids[rows[order][group_values]]
+
+    return LayeredReductionResult(
+        grouping_key=grouping_key,
+        reduction=reduction,
+        element_ids=element_ids[rows[element_starts]],
+        element_values=element_values,
+        element_group_element_ids=element_ids[sorted_rows[element_group_starts]],
+        element_group_ids=sorted_keys[element_group_starts],
+        element_group_values=element_group_values,
+        group_ids=sorted_group_keys[group_starts],
+        group_values=group_values,
+    )
+
+
+def reduce_layered_field(
+    field: Field,
+    element_info_provider: ElementInfoProviderProtocol,
+    grouping_key: GroupingKey,
+    reduction: ReductionOperation = ReductionOperation.MAX,
+    component: IntEnum | int = 0,
+    layup_properties_provider: LayupPropertiesProvider | None = None,
+    selected_groups: Collection[int] | None = None,
+) -> LayeredReductionResult:
+    """Reduce the elementary data of a layered field grouped by a key.
+
+    This function is the vectorized equivalent of looping over all elements
+    of the field and reducing the data selected with :func:`.get_selected_indices`.
+
+    Parameters
+    ----------
+    field:
+        Elemental nodal field of layered data, for example stresses or
+        failure values.
+    element_info_provider:
+        Provider of the lay-up information of the elements.
+    grouping_key:
+        Key by which the data is grouped.
+    reduction:
+        Reduction applied to each group.
+    component:
+        Component of the field to reduce. The default is ``0``.
+    layup_properties_provider:
+        Provider of the analysis plies. Required for ``GroupingKey.ANALYSIS_PLY``.
+    selected_groups:
+        Groups to consider. For example, the spots or material IDs.
+        All groups are considered by default.
+
+    Examples
+    --------
+        >>> from ansys.dpf.composites.constants import Sym3x3TensorComponent
+        >>> from ansys.dpf.composites.layered_reduction import GroupingKey, ReductionOperation
+        >>> result = reduce_layered_field(
+        ...     stress_field,
+        ...     element_info_provider,
+        ...     GroupingKey.MATERIAL,
+        ...     ReductionOperation.MAX,
+        ...     component=Sym3x3TensorComponent.TENSOR11,
+        ... )
+        >>> element_ids, max_s11 = result.get_group_values(material_id)
+    """
+    component_int = component.value if isinstance(component, IntEnum) else component
+    element_ids, indptr, data = _get_field_data_as_csr(field)
+    if data.ndim > 1:
+        data = data[:, component_int]
+    element_info_columns = get_element_info_columns(element_info_provider, element_ids)
+    analysis_ply_indices = None
+    if grouping_key == GroupingKey.ANALYSIS_PLY:
+        if layup_properties_provider is None:
+            raise RuntimeError("A lay-up properties provider is required to group by analysis ply.")
+        analysis_ply_indices = layup_properties_provider.get_analysis_ply_indices_for_elements(
+            cast(Sequence[int], element_ids)
+        )
+    return reduce_layered_data(
+        data,
+        indptr,
+        element_info_columns,
+        grouping_key,
+        reduction,
+        analysis_ply_indices=analysis_ply_indices,
+        selected_groups=selected_groups,
+    )
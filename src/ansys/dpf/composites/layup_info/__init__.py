@@ -30,10 +30,13 @@ from ._element_info import (
     ElementInfoProviderLSDyna,
     ElementInfoProviderProtocol,
 )
+from ._element_info_columns import ElementInfoColumns, get_element_info_columns
 from ._enums import LayerProperty, LayupProperty
 from ._layup_info import (
+    AnalysisPlyIncidence,
     AnalysisPlyInfo,
     AnalysisPlyInfoProvider,
+    LayeredElementData,
     LayupModelContextType,
     LayupPropertiesProvider,
     get_all_analysis_ply_names,
@@ -47,13 +50,16 @@ from ._solid_stack_info import SolidStack, SolidStackProvider
 
 __all__ = (
     "add_layup_info_to_mesh",
+    "AnalysisPlyIncidence",
     "AnalysisPlyInfo",
     "AnalysisPlyInfoProvider",
     "ElementInfo",
+    "ElementInfoColumns",
     "ElementInfoProvider",
     "ElementInfoProviderLSDyna",
     "ElementInfoProviderProtocol",
     "LayerProperty",
+    "LayeredElementData",
     "LayupProperty",
     "LayupPropertiesProvider",
     "LayupModelContextType",
@@ -63,6 +69,7 @@ __all__ = (
     "get_analysis_ply_index_to_name_map",
     "get_dpf_material_id_by_analyis_ply_map",
     "get_dpf_material_id_by_analysis_ply_map",
+    "get_element_info_columns",
     "get_element_info_provider",
     "get_material_names_to_dpf_material_index",
     "material_properties",
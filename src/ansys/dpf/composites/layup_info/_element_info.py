@@ -22,7 +22,7 @@
 
 """Protocol of Element Info Provider class."""
 from dataclasses import dataclass
-from typing import Any, Protocol
+from typing import Any, Protocol, cast
 
 import ansys.dpf.core as dpf
 from ansys.dpf.core import MeshedRegion, PropertyField
@@ -31,6 +31,9 @@ from numpy.typing import NDArray
 
 from .._indexer import get_property_field_indexer
 
+# Marker for elements which are not in the element info cache
+_NOT_CACHED = object()
+
 # MAPDL element types that are supported by the ElementInfoProvider
 _supported_mapdl_element_types = [181, 281, 185, 186, 187, 190]
 
@@ -170,10 +173,12 @@ class ElementInfoProvider(ElementInfoProviderProtocol):
     Initialize the class before a loop and
     call :func:`~get_element_info` for each element.
 
-    Note that the :class:`~ElementInfoProvider` class is not fully supported for
-    distributed RST files. The :func:`~get_element_info` method will raise an
-    exception if the DPF server version does not support reading the required
-    information.
+    The provider can be shared by multiple threads.
+
+    For distributed RST files, create the provider with the ``result_partitions``
+    argument of :func:`~get_element_info_provider`. Otherwise, the
+    :func:`~get_element_info` method can raise an exception because the element
+    properties of some partitions are missing.
 
     Parameters
     ----------
@@ -237,6 +242,10 @@ class ElementInfoProvider(ElementInfoProviderProtocol):
 
         self._element_info_cache: dict[int, ElementInfo | None] = {}
 
+    def clear_cache(self) -> None:
+        """Release the cached :class:`~ElementInfo` objects."""
+        self._element_info_cache = {}
+
     def get_element_info(self, element_id: int) -> ElementInfo | None:
         """Get :class:`~ElementInfo` for a given element id.
 
@@ -250,8 +259,11 @@ class ElementInfoProvider(ElementInfoProviderProtocol):
         Optional[ElementInfo]:
             Returns None if element type is not supported
         """
-        if element_id in self._element_info_cache:
-            return self._element_info_cache[element_id]
+        # Single lookup without a lock: the cache is only extended, and
+        # concurrent misses compute and store the same element info.
+        cached_element_info = self._element_info_cache.get(element_id, _NOT_CACHED)
+        if cached_element_info is not _NOT_CACHED:
+            return cast(ElementInfo | None, cached_element_info)
 
         is_layered = False
         n_layers = 1
@@ -264,7 +276,8 @@ class ElementInfoProvider(ElementInfoProviderProtocol):
             raise RuntimeError(
                 "Could not determine element properties. Probably they were requested for an"
                 f" invalid element id. Element id: {element_id}\n"
-                "Note that creating ElementInfo is not fully supported for distributed RST files."
+                "For distributed RST files, pass the result partitions to"
+                " get_element_info_provider."
             )
 
         if int(solver_element_type) not in _supported_mapdl_element_types:
@@ -329,6 +342,8 @@ class ElementInfoProviderLSDyna(ElementInfoProviderProtocol):
     Initialize the class before a loop and
     call :func:`~get_element_info` for each element.
 
+    The provider can be shared by multiple threads.
+
     Parameters
     ----------
     mesh
@@ -379,6 +394,10 @@ class ElementInfoProviderLSDyna(ElementInfoProviderProtocol):
 
         self._element_info_cache: dict[int, ElementInfo | None] = {}
 
+    def clear_cache(self) -> None:
+        """Release the cached :class:`~ElementInfo` objects."""
+        self._element_info_cache = {}
+
     def get_element_info(self, element_id: int) -> ElementInfo | None:
         """Get :class:`~ElementInfo` for a given element id.
 
@@ -392,8 +411,11 @@ class ElementInfoProviderLSDyna(ElementInfoProviderProtocol):
         Optional[ElementInfo]:
             Returns None if element type is not supported
         """
-        if element_id in self._element_info_cache:
-            return self._element_info_cache[element_id]
+        # Single lookup without a lock: the cache is only extended, and
+        # concurrent misses compute and store the same element info.
+        cached_element_info = self._element_info_cache.get(element_id, _NOT_CACHED)
+        if cached_element_info is not _NOT_CACHED:
+            return cast(ElementInfo | None, cached_element_info)
 
         is_layered = False
         n_layers = 1
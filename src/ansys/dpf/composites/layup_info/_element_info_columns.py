@@ -0,0 +1,331 @@
+# Copyright (C) 2022 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Columnar element information for multiple elements."""
+from collections.abc import Sequence
+from dataclasses import dataclass
+
+import numpy as np
+from numpy.typing import NDArray
+
+from .._indexer import PropertyFieldIndexerProtocol, _gather_rows
+from ._element_info import (
+    ElementInfo,
+    ElementInfoProvider,
+    ElementInfoProviderProtocol,
+    _get_n_spots,
+    _supported_mapdl_element_types,
+)
+from ._layup_info import LayeredElementData
+
+_SHELL_ELEMENT_TYPES = [181, 281]
+
+
+@dataclass(frozen=True)
+class ElementInfoColumns:
+    """Provides the lay-up information of multiple elements as arrays.
+
+    This class is the columnar counterpart of :class:`~ElementInfo`. The entry ``i``
+    of each array belongs to the element ``element_ids[i]``. Use
+    :func:`~get_element_info_columns` to create it.
+
+    Elements with an unsupported element type have ``is_supported == False``,
+    zero layers, and no materials.
+
+    Parameters
+    ----------
+    element_ids
+        Element IDs or labels.
+    is_supported
+        Whether the element type is supported. :meth:`ElementInfoProvider.get_element_info`
+        returns ``None`` for unsupported elements.
+    n_layers
+        Number of layers. For non-layered elements, the value is ``1``.
+    n_corner_nodes
+        Number of corner nodes (without midside nodes).
+    n_spots
+        Number of spots (through-the-thickness integration points) per layer.
+    is_layered
+        Whether the element is layered.
+    element_type
+        Solver element type.
+    is_shell
+        Whether the element is a shell element.
+    number_of_nodes_per_spot_plane
+        Number of nodes per output plane. The value is ``-1`` for non-layered elements.
+    dpf_material_ids
+        DPF material IDs of all layers.
+    """
+
+    element_ids: NDArray[np.int64]
+    is_supported: NDArray[np.bool_]
+    n_layers: NDArray[np.int64]
+    n_corner_nodes: NDArray[np.int64]
+    n_spots: NDArray[np.int64]
+    is_layered: NDArray[np.bool_]
+    element_type: NDArray[np.int64]
+    is_shell: NDArray[np.bool_]
+    number_of_nodes_per_spot_plane: NDArray[np.int64]
+    dpf_material_ids: LayeredElementData
+
+    def __len__(self) -> int:
+        """Get the number of elements."""
+        return len(self.element_ids)
+
+    @property
+    def number_of_elementary_data(self) -> NDArray[np.int64]:
+        """Number of elementary data points of layered elements.
+
+        The value is ``n_layers * n_spots * number_of_nodes_per_spot_plane`` for layered
+        elements and ``0`` for all other elements.
+        """
+        return np.where(
+            self.is_layered,
+            self.n_layers * self.n_spots * self.number_of_nodes_per_spot_plane,
+            0,
+        )
+
+    def get_element_info(self, index: int) -> ElementInfo | None:
+        """Get the :class:`~ElementInfo` of the element at a given position.
+
+        Returns ``None`` if the element type is not supported.
+
+        Parameters
+        ----------
+        index:
+            Position of the element in ``element_ids``.
+        """
+        if not self.is_supported[index]:
+            return None
+        return ElementInfo(
+            id=int(self.element_ids[index]),
+            n_layers=int(self.n_layers[index]),
+            n_corner_nodes=int(self.n_corner_nodes[index]),
+            n_spots=int(self.n_spots[index]),
+            is_layered=bool(self.is_layered[index]),
+            element_type=int(self.element_type[index]),
+            dpf_material_ids=self.dpf_material_ids.get_values_by_index(index),
+            is_shell=bool(self.is_shell[index]),
+            number_of_nodes_per_spot_plane=int(self.number_of_nodes_per_spot_plane[index]),
+        )
+
+
+def _get_single_values(
+    indexer: PropertyFieldIndexerProtocol, element_ids: NDArray[np.int64]
+) -> tuple[NDArray[np.int64], NDArray[np.bool_]]:
+    """Get one value per element and whether the value exists."""
+    indptr, values = indexer.by_ids_as_csr(element_ids)
+    has_value = np.diff(indptr) > 0
+    result = np.full(len(element_ids), -1, dtype=np.int64)
+    result[has_value] = values.reshape(-1)[indptr[:-1][has_value]]
+    return result, has_value
+
+
+def _get_element_info_columns_mapdl(
+    element_info_provider: ElementInfoProvider, element_ids: NDArray[np.int64]
+) -> ElementInfoColumns:
+    """Vectorized implementation of :meth:`ElementInfoProvider.get_element_info`."""
+    keyopt_8, has_keyopt_8 = _get_single_values(element_info_provider.keyopt_8_values, element_ids)
+    keyopt_3, has_keyopt_3 = _get_single_values(element_info_provider.keyopt_3_values, element_ids)
+    solver_element_types, has_element_type = _get_single_values(
+        element_info_provider.solver_element_types, element_ids
+    )
+    is_valid = has_keyopt_8 & has_keyopt_3 & has_element_type
+    if not np.all(is_valid):
+        raise RuntimeError(
+            "Could not determine element properties. Probably they were requested for an"
+            f" invalid element id. Element id: {element_ids[~is_valid][0]}\n"
+            "For distributed RST files, pass the result partitions to"
+            " get_element_info_provider."
+        )
+
+    is_supported = np.isin(solver_element_types, _supported_mapdl_element_types)
+
+    n_spots = np.zeros(len(element_ids), dtype=np.int64)
+    spot_configurations = np.stack([solver_element_types, keyopt_8, keyopt_3], axis=1)
+    unique_configurations, configuration_indices = np.unique(
+        spot_configurations[is_supported], axis=0, return_inverse=True
+    )
+    n_spots_by_configuration = np.array(
+        [
+            _get_n_spots(element_type, keyopt_8_value, keyopt_3_value)
+            for element_type, keyopt_8_value, keyopt_3_value in unique_configurations
+        ],
+        dtype=np.int64,
+    )
+    n_spots[is_supported] = n_spots_by_configuration[configuration_indices.reshape(-1)]
+
+    dpf_element_types, has_dpf_element_type = _get_single_values(
+        element_info_provider.dpf_element_types, element_ids
+    )
+    if np.any(is_supported & ~has_dpf_element_type):
+        raise IndexError(
+            "No DPF element type for element with id "
+            f"{element_ids[is_supported & ~has_dpf_element_type][0]}."
+        )
+
+    layer_indptr, layer_values = element_info_provider.layer_indices.by_ids_as_csr(element_ids)
+    is_layered = (np.diff(layer_indptr) > 0) & is_supported
+    n_layers = np.where(is_supported, 1, 0).astype(np.int64)
+    n_layers[is_layered] = layer_values[layer_indptr[:-1][is_layered]]
+
+    material_indptr, material_values = element_info_provider.layer_materials.by_ids_as_csr(
+        element_ids
+    )
+    material_starts = np.where(is_layered, material_indptr[:-1], 0)
+    material_ends = np.where(is_layered, material_indptr[1:], 0)
+
+    homogeneous_material_ids = np.zeros(0, dtype=np.int64)
+    solver_material_to_dpf_id = element_info_provider.solver_material_to_dpf_id
+    is_homogeneous = is_supported & ~is_layered
+    if solver_material_to_dpf_id and np.any(is_homogeneous):
+        solver_material_ids, has_material = _get_single_values(
+            element_info_provider.apdl_material_indexer, element_ids[is_homogeneous]
+        )
+        known_solver_ids = np.array(sorted(solver_material_to_dpf_id), dtype=np.int64)
+        known_dpf_ids = np.array(
+            [solver_material_to_dpf_id[int(solver_id)] for solver_id in known_solver_ids],
+            dtype=np.int64,
+        )
+        is_valid_material = (
+            has_material
+            & (solver_material_ids != 0)
+            & np.isin(solver_material_ids, known_solver_ids)
+        )
+        if not np.all(is_valid_material):
+            raise RuntimeError(
+                "Could not evaluate material of element "
+                f"{element_ids[is_homogeneous][~is_valid_material][0]}."
+            )
+        homogeneous_material_ids = known_dpf_ids[
+            np.searchsorted(known_solver_ids, solver_material_ids)
+        ]
+        material_starts[is_homogeneous] = len(material_values) + np.arange(
+            len(homogeneous_material_ids)
+        )
+        material_ends[is_homogeneous] = material_starts[is_homogeneous] + 1
+
+    dpf_material_ids = LayeredElementData(
+        element_ids,
+        *_gather_rows(
+            np.concatenate([material_values.reshape(-1), homogeneous_material_ids]).astype(
+                np.int64
+            ),
+            material_starts,
+            material_ends,
+        ),
+    )
+
+    n_corner_nodes = np.zeros(len(element_ids), dtype=np.int64)
+    n_corner_nodes[is_supported] = element_info_provider.corner_nodes_by_element_type[
+        dpf_element_types[is_supported]
+    ]
+    if np.any(n_corner_nodes[is_supported] < 0):
+        invalid_types = dpf_element_types[is_supported][n_corner_nodes[is_supported] < 0]
+        raise ValueError(f"Invalid number of corner nodes for element with type {invalid_types[0]}")
+
+    is_shell = np.isin(solver_element_types, _SHELL_ELEMENT_TYPES)
+    number_of_nodes_per_spot_plane = np.where(
+        is_layered, np.where(is_shell, n_corner_nodes, n_corner_nodes // 2), -1
+    ).astype(np.int64)
+
+    return ElementInfoColumns(
+        element_ids=element_ids,
+        is_supported=is_supported,
+        n_layers=n_layers,
+        n_corner_nodes=n_corner_nodes,
+        n_spots=n_spots,
+        is_layered=is_layered,
+        element_type=solver_element_types,
+        is_shell=is_shell,
+        number_of_nodes_per_spot_plane=number_of_nodes_per_spot_plane,
+        dpf_material_ids=dpf_material_ids,
+    )
+
+
+def _get_element_info_columns_from_element_infos(
+    element_info_provider: ElementInfoProviderProtocol, element_ids: NDArray[np.int64]
+) -> ElementInfoColumns:
+    """Get the element information with one call per element."""
+    element_infos = [
+        element_info_provider.get_element_info(int(element_id)) for element_id in element_ids
+    ]
+
+    def column(attribute: str, default: int) -> NDArray[np.int64]:
+        return np.array(
+            [
+                getattr(element_info, attribute) if element_info else default
+                for element_info in element_infos
+            ],
+            dtype=np.int64,
+        )
+
+    material_ids = [
+        (
+            np.asarray(element_info.dpf_material_ids, dtype=np.int64)
+            if element_info
+            else np.zeros(0, dtype=np.int64)
+        )
+        for element_info in element_infos
+    ]
+    material_indptr = np.zeros(len(element_ids) + 1, dtype=np.int64)
+    np.cumsum([len(ids) for ids in material_ids], out=material_indptr[1:])
+
+    return ElementInfoColumns(
+        element_ids=element_ids,
+        is_supported=np.array([element_info is not None for element_info in element_infos]),
+        n_layers=column("n_layers", 0),
+        n_corner_nodes=column("n_corner_nodes", 0),
+        n_spots=column("n_spots", 0),
+        is_layered=column("is_layered", 0).astype(bool),
+        element_type=column("element_type", -1),
+        is_shell=column("is_shell", 0).astype(bool),
+        number_of_nodes_per_spot_plane=column("number_of_nodes_per_spot_plane", -1),
+        dpf_material_ids=LayeredElementData(
+            element_ids,
+            material_indptr,
+            np.concatenate(material_ids) if material_ids else np.zeros(0, dtype=np.int64),
+        ),
+    )
+
+
+def get_element_info_columns(
+    element_info_provider: ElementInfoProviderProtocol,
+    element_ids: Sequence[int] | NDArray[np.int64],
+) -> ElementInfoColumns:
+    """Get the lay-up information of multiple elements as arrays.
+
+    The evaluation is vectorized for :class:`~ElementInfoProvider` (MAPDL). For
+    all other providers, :meth:`get_element_info` is called for each element.
+
+    Parameters
+    ----------
+    element_info_provider:
+        Provider of the element information.
+        Use :func:`~get_element_info_provider` to create it.
+    element_ids:
+        Element IDs or labels.
+    """
+    ids = np.asarray(element_ids, dtype=np.int64)
+    if isinstance(element_info_provider, ElementInfoProvider):
+        return _get_element_info_columns_mapdl(element_info_provider, ids)
+    return _get_element_info_columns_from_element_infos(element_info_provider, ids)
@@ -25,7 +25,7 @@
 from collections.abc import Collection, Sequence
 from dataclasses import dataclass
 from enum import Enum
-from typing import cast
+from typing import Any, cast
 from warnings import warn
 
 import ansys.dpf.core as dpf
@@ -36,6 +36,7 @@ from numpy.typing import NDArray
 
 from .._indexer import get_field_indexer, get_property_field_indexer
 from ..constants import SolverType
+from ..result_partitions import ResultPartition, read_partition_property_field
 from ..server_helpers import version_equal_or_later, version_older_than
 from ._element_info import (
     ElementInfoProvider,
@@ -193,6 +194,129 @@ def _get_corner_nodes_by_element_type_array() -> NDArray[np.int64]:
     return corner_nodes_by_element_type
 
 
+@dataclass(frozen=True)
+class LayeredElementData:
+    """Provides layer-wise values of multiple elements in a CSR layout.
+
+    The values of the element at position ``i`` in ``element_ids`` are
+    ``values[indptr[i] : indptr[i + 1]]``, ordered from bottom to top.
+    Elements without lay-up have no values.
+
+    Parameters
+    ----------
+    element_ids
+        Element IDs or labels.
+    indptr
+        Row pointer with ``len(element_ids) + 1`` entries.
+    values
+        Concatenated layer values of all elements.
+    """
+
+    element_ids: NDArray[np.int64]
+    indptr: NDArray[np.int64]
+    values: NDArray[Any]
+
+    @property
+    def number_of_layers(self) -> NDArray[np.int64]:
+        """Number of layers per element. The value is ``0`` for non-layered elements."""
+        return cast(NDArray[np.int64], np.diff(self.indptr))
+
+    def get_values_by_index(self, index: int) -> NDArray[Any]:
+        """Get the layer values of the element at a given position.
+
+        Parameters
+        ----------
+        index:
+            Position of the element in ``element_ids``.
+        """
+        return self.values[self.indptr[index] : self.indptr[index + 1]]
+
+    def sum_per_element(self) -> NDArray[Any]:
+        """Get the sum of the layer values per element.
+
+        The sum is ``0`` for non-layered elements.
+        """
+        sums = np.zeros(len(self.element_ids), dtype=self.values.dtype)
+        has_layers = self.number_of_layers > 0
+        if np.any(has_layers):
+            sums[has_layers] = np.add.reduceat(self.values, self.indptr[:-1][has_layers])
+        return sums
+
+
+@dataclass(frozen=True)
+class AnalysisPlyIncidence:
+    """Provides the sparse incidence matrix of elements and analysis plies.
+
+    Row ``i`` of the matrix corresponds to the element ``element_ids[i]`` and
+    column ``j`` to the analysis ply ``analysis_ply_names[j]``. The value of an
+    entry is the local layer index of the analysis ply in the element plus one.
+    Entries of analysis plies which are not part of an element are zero.
+
+    The matrix is a :class:`scipy.sparse.csr_array`, so filter operations
+    on the whole model can be expressed as sparse matrix operations.
+
+    Parameters
+    ----------
+    matrix
+        Sparse matrix with the shape ``(len(element_ids), len(analysis_ply_names))``.
+    element_ids
+        Element IDs or labels of the rows.
+    analysis_ply_names
+        Analysis ply names of the columns.
+    analysis_ply_indices
+        Analysis ply indices of the columns, as stored in the
+        ``layer_to_analysis_ply`` property field of the mesh.
+    """
+
+    matrix: Any
+    element_ids: NDArray[np.int64]
+    analysis_ply_names: Sequence[str]
+    analysis_ply_indices: NDArray[np.int64]
+
+    def get_columns(self, analysis_ply_names: Collection[str]) -> NDArray[np.int64]:
+        """Get the column indices of analysis plies.
+
+        Parameters
+        ----------
+        analysis_ply_names:
+            Names of the analysis plies.
+        """
+        column_by_name = {name: index for index, name in enumerate(self.analysis_ply_names)}
+        missing = [name for name in analysis_ply_names if name not in column_by_name]
+        if missing:
+            raise RuntimeError(
+                f"Analysis plies are not available: {missing}. "
+                f"Available analysis plies: {list(self.analysis_ply_names)}"
+            )
+        return np.array([column_by_name[name] for name in analysis_ply_names], dtype=np.int64)
+
+    def get_element_ids(self, analysis_ply_names: Collection[str]) -> NDArray[np.int64]:
+        """Get the IDs of all elements which contain at least one of the analysis plies.
+
+        Parameters
+        ----------
+        analysis_ply_names:
+            Names of the analysis plies.
+        """
+        selected = self.matrix[:, self.get_columns(analysis_ply_names)].tocsr()
+        return cast(NDArray[np.int64], self.element_ids[np.diff(selected.indptr) > 0])
+
+    def get_layer_indices(
+        self, analysis_ply_name: str
+    ) -> tuple[NDArray[np.int64], NDArray[np.int64]]:
+        """Get the elements of an analysis ply and the local layer index of the ply.
+
+        Returns the element IDs and the 0-based layer indices.
+
+        Parameters
+        ----------
+        analysis_ply_name:
+            Name of the analysis ply.
+        """
+        column = self.matrix[:, self.get_columns([analysis_ply_name])].tocsc()
+        return self.element_ids[column.indices], column.data.astype(np.int64) - 1
+
+
 @dataclass(frozen=True)
 class AnalysisPlyInfo:
     """Data about an analysis ply."""
@@ -394,6 +518,7 @@ def get_element_info_provider(
     material_provider: Operator | None = None,
     no_bounds_checks: bool = False,
     solver_type: SolverType = SolverType.MAPDL,
+    result_partitions: Sequence[ResultPartition] | None = None,
 ) -> ElementInfoProviderProtocol:
     """Get :class:`~ElementInfoProvider` Object.
 
@@ -409,6 +534,10 @@ def get_element_info_provider(
         performance but can result in cryptic error messages
     solver_type
         Specify the type of solver (MAPDL or LSDyna).
+    result_partitions
+        Partitions of a distributed result file. If set, the element properties
+        which are not part of the mesh are read from each partition in parallel
+        and merged.
 
     Returns
     -------
@@ -459,6 +588,12 @@ def get_element_info_provider(
     else:
 
         def get_keyopt_property_field(keyopt: int) -> PropertyField:
+            if result_partitions:
+                return read_partition_property_field(
+                    result_partitions,
+                    f"keyopt_{keyopt}",
+                    server=mesh._server,  # pylint: disable=protected-access
+                )
             keyopt_provider = dpf.Operator("mesh_property_provider")
             if isinstance(stream_provider_or_data_source, Operator):
                 keyopt_provider.inputs.streams_container(stream_provider_or_data_source)
@@ -549,6 +684,9 @@ class LayupPropertiesProvider:
             {composite_label: LayupProperty.LAMINATE_OFFSET}
         )
         self._offset_indexer = get_field_indexer(offset_field)
+        self._layered_element_ids: NDArray[np.int64] = np.array(
+            thickness_field.scoping.ids, dtype=np.int64
+        )
 
         self._index_to_name_map = get_analysis_ply_index_to_name_map(mesh)
 
@@ -611,3 +749,162 @@ class LayupPropertiesProvider:
         if indices is None:
             return None
         return [self._index_to_name_map[index] for index in indices]
+
+    def _get_element_ids(self, element_ids: Sequence[int] | None) -> NDArray[np.int64]:
+        if element_ids is None:
+            return self._layered_element_ids
+        return np.asarray(element_ids, dtype=np.int64)
+
+    def get_layer_angles_for_elements(
+        self, element_ids: Sequence[int] | None = None
+    ) -> LayeredElementData:
+        """Get the angles of all layers of multiple elements.
+
+        Parameters
+        ----------
+        element_ids:
+            Element IDs/Labels. All layered elements are selected if ``None``.
+        """
+        selected_ids = self._get_element_ids(element_ids)
+        return LayeredElementData(selected_ids, *self._angle_indexer.by_ids_as_csr(selected_ids))
+
+    def get_layer_thicknesses_for_elements(
+        self, element_ids: Sequence[int] | None = None
+    ) -> LayeredElementData:
+        """Get the thicknesses of all layers of multiple elements.
+
+        Parameters
+        ----------
+        element_ids:
+            Element IDs/Labels. All layered elements are selected if ``None``.
+        """
+        selected_ids = self._get_element_ids(element_ids)
+        return LayeredElementData(
+            selected_ids, *self._thickness_indexer.by_ids_as_csr(selected_ids)
+        )
+
+    def get_layer_shear_angles_for_elements(
+        self, element_ids: Sequence[int] | None = None
+    ) -> LayeredElementData:
+        """Get the shear angles of all layers of multiple elements.
+
+        Parameters
+        ----------
+        element_ids:
+            Element IDs/Labels. All layered elements are selected if ``None``.
+        """
+        selected_ids = self._get_element_ids(element_ids)
+        return LayeredElementData(
+            selected_ids, *self._shear_angle_indexer.by_ids_as_csr(selected_ids)
+        )
+
+    def get_analysis_ply_indices_for_elements(
+        self, element_ids: Sequence[int] | None = None
+    ) -> LayeredElementData:
+        """Get the analysis ply indices of all layers of multiple elements.
+
+        Use :func:`~get_analysis_ply_index_to_name_map` to map the indices
+        to analysis ply names.
+
+        Parameters
+        ----------
+        element_ids:
+            Element IDs/Labels. All layered elements are selected if ``None``.
+        """
+        selected_ids = self._get_element_ids(element_ids)
+        return LayeredElementData(
+            selected_ids, *self._analysis_ply_indexer.by_ids_as_csr(selected_ids)
+        )
+
+    def get_element_laminate_offsets(
+        self, element_ids: Sequence[int] | None = None
+    ) -> NDArray[np.double]:
+        """Get the laminate offsets of multiple elements.
+
+        The offset is ``NaN`` for non-layered elements.
+
+        Parameters
+        ----------
+        element_ids:
+            Element IDs/Labels. All layered elements are selected if ``None``.
+        """
+        indptr, values = self._offset_indexer.by_ids_as_csr(self._get_element_ids(element_ids))
+        offsets = np.full(len(indptr) - 1, np.nan, dtype=np.double)
+        has_offset = np.diff(indptr) > 0
+        # Only the first value is relevant. See FieldIndexerWithDataPointer.by_id
+        offsets[has_offset] = values[indptr[:-1][has_offset]]
+        return offsets
+
+    def get_laminate_thicknesses(
+        self, element_ids: Sequence[int] | None = None
+    ) -> NDArray[np.double]:
+        """Get the total laminate thicknesses of multiple elements.
+
+        The thickness is ``0`` for non-layered elements.
+
+        Parameters
+        ----------
+        element_ids:
+            Element IDs/Labels. All layered elements are selected if ``None``.
+        """
+        return cast(
+            NDArray[np.double],
+            self.get_layer_thicknesses_for_elements(element_ids).sum_per_element(),
+        )
+
+    def get_number_of_layers(self, element_ids: Sequence[int] | None = None) -> NDArray[np.int64]:
+        """Get the number of layers of multiple elements.
+
+        The number of layers is ``0`` for non-layered elements.
+
+        Parameters
+        ----------
+        element_ids:
+            Element IDs/Labels. All layered elements are selected if ``None``.
+        """
+        return self.get_layer_thicknesses_for_elements(element_ids).number_of_layers
+
+    def get_analysis_ply_incidence(self) -> AnalysisPlyIncidence:
+        """Get the sparse incidence matrix of all layered elements and analysis plies.
+
+        This method requires SciPy.
+        """
+        try:
+            from scipy.sparse import csr_array
+        except ImportError as exc:
+            raise ImportError(
+                "The analysis ply incidence matrix requires SciPy. "
+                "Install it with 'pip install scipy'."
+            ) from exc
+
+        ply_indices = self.get_analysis_ply_indices_for_elements()
+        number_of_layers = ply_indices.number_of_layers
+        analysis_ply_indices = np.array(sorted(self._index_to_name_map.keys()), dtype=np.int64)
+
+        max_ply_index = max(
+            np.max(ply_indices.values, initial=-1), np.max(analysis_ply_indices, initial=-1)
+        )
+        column_by_ply_index = np.full(max_ply_index + 1, -1, dtype=np.int64)
+        column_by_ply_index[analysis_ply_indices] = np.arange(len(analysis_ply_indices))
+
+        rows = np.repeat(np.arange(len(number_of_layers), dtype=np.int64), number_of_layers)
+        local_layer_indices = np.arange(len(ply_indices.values), dtype=np.int64) - np.repeat(
+            ply_indices.indptr[:-1], number_of_layers
+        )
+        columns = column_by_ply_index[ply_indices.values]
+        # Layers of analysis plies without a name (filler plies) are skipped
+        is_named = columns >= 0
+
+        matrix = csr_array(
+            (local_layer_indices[is_named] + 1, (rows[is_named], columns[is_named])),
+            shape=(len(number_of_layers), len(analysis_ply_indices)),
+            dtype=np.int64,
+        )
+        return AnalysisPlyIncidence(
+            matrix=matrix,
+            element_ids=ply_indices.element_ids,
+            analysis_ply_names=[
+                self._index_to_name_map[int(index)] for index in analysis_ply_indices
+            ],
+            analysis_ply_indices=analysis_ply_indices,
+        )
@@ -0,0 +1,154 @@
+# Copyright (C) 2022 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Superposition of load cases before the failure evaluation."""
+
+from dataclasses import dataclass
+
+import ansys.dpf.core as dpf
+from ansys.dpf.core import Field, FieldsContainer
+from ansys.dpf.core.server_types import BaseServer
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+
+from .constants import TIME_LABEL
+
+__all__ = ("LoadCombinationEnvelope",)
+
+
+@dataclass(frozen=True)
+class LoadCombinationEnvelope:
+    """Provides the envelope of the failure values of several load combinations.
+
+    Use :meth:`.CompositeModel.evaluate_load_combinations` to evaluate it. The
+    entry ``i`` of the element arrays belongs to the element ``element_ids[i]``.
+    The failure measure is the inverse reserve factor.
+
+    Parameters
+    ----------
+    element_ids
+        Element IDs.
+    failure_values
+        Maximum failure value of all combinations.
+    failure_modes
+        Failure mode codes of the critical combination, as in the
+        :attr:`.FailureOutput.FAILURE_MODE` field.
+    layer_indices
+        Critical layer indices of the critical combination, as in the
+        :attr:`.FailureOutput.MAX_LAYER_INDEX` field. The indices are 1-based
+        starting with DPF server 7.1 (2024 R1).
+    critical_combinations
+        0-based row of the combination matrix with the maximum failure value.
+    combination_failure_values
+        Maximum failure value of all elements for each combination.
+    """
+
+    element_ids: NDArray[np.int64]
+    failure_values: NDArray[np.double]
+    failure_modes: NDArray[np.int64]
+    layer_indices: NDArray[np.int64]
+    critical_combinations: NDArray[np.int64]
+    combination_failure_values: NDArray[np.double]
+
+    def __len__(self) -> int:
+        """Get the number of elements."""
+        return len(self.element_ids)
+
+
+def _validate_combination_matrix(
+    combination_matrix: ArrayLike, number_of_load_steps: int
+) -> NDArray[np.double]:
+    """Get the combination matrix as an array of shape (combinations, load steps)."""
+    matrix = np.asarray(combination_matrix, dtype=np.double)
+    if matrix.ndim != 2 or matrix.shape[0] == 0:
+        raise RuntimeError(
+            "The combination matrix must be a non-empty 2D array with one row per "
+            f"combination, got shape {matrix.shape}."
+        )
+    if matrix.shape[1] != number_of_load_steps:
+        raise RuntimeError(
+            f"The combination matrix has {matrix.shape[1]} columns, but "
+            f"{number_of_load_steps} load steps are selected."
+        )
+    if not np.all(np.isfinite(matrix)):
+        raise RuntimeError("The combination matrix must contain finite factors only.")
+    return matrix
+
+
+def _combine_load_steps(
+    data_by_load_step: NDArray[np.double], combination_matrix: NDArray[np.double]
+) -> NDArray[np.double]:
+    """Superpose the data of the load steps.
+
+    ``data_by_load_step`` has the shape (load steps, values, components). The
+    result has the shape (combinations, values, components).
+    """
+    return np.tensordot(combination_matrix, data_by_load_step, axes=(1, 0))
+
+
+def _create_time_freq_support(
+    number_of_fields: int, server: BaseServer | None
+) -> dpf.TimeFreqSupport:
+    """Create a time frequency support with the time IDs ``1`` to ``number_of_fields``."""
+    time_frequencies = dpf.fields_factory.create_scalar_field(
+        1, location=dpf.locations.time_freq, server=server
+    )
+    time_frequencies.append(np.arange(1, number_of_fields + 1, dtype=np.double).tolist(), 1)
+    time_freq_support = dpf.TimeFreqSupport(server=server)
+    time_freq_support.time_frequencies = time_frequencies
+    return time_freq_support
+
+
+def _create_combined_container(
+    element_ids: NDArray[np.int64],
+    indptr: NDArray[np.int64],
+    combined_data: NDArray[np.double],
+    unit: str,
+    server: BaseServer | None,
+) -> FieldsContainer:
+    """Create a fields container with one elemental nodal field per combination.
+
+    The time ID of the field of combination ``i`` is ``i + 1``, so the failure
+    operators evaluate all combinations at once.
+    """
+    number_of_combinations = combined_data.shape[0]
+    scoping = dpf.Scoping(ids=element_ids, location=dpf.locations.elemental, server=server)
+    number_of_components = combined_data.shape[2] if combined_data.ndim > 2 else 1
+    # The data pointer counts scalar values, not entities
+    data_pointer = (indptr[:-1] * number_of_components).astype(np.int32)
+
+    container = dpf.FieldsContainer(server=server)
+    container.labels = [TIME_LABEL]
+    container.time_freq_support = _create_time_freq_support(number_of_combinations, server)
+    for combination_index in range(number_of_combinations):
+        field = Field(
+            nentities=len(element_ids),
+            nature=dpf.natures.symmatrix,
+            location=dpf.locations.elemental_nodal,
+            server=server,
+        )
+        field.scoping = scoping
+        field.data = combined_data[combination_index]
+        field._data_pointer = data_pointer  # pylint: disable=protected-access
+        field.unit = unit
+        container.add_field({TIME_LABEL: combination_index + 1}, field)
+    return container
@@ -0,0 +1,150 @@
+# Copyright (C) 2022 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Client memory used by the caches and indexers of a composite model."""
+
+from collections.abc import Mapping
+from dataclasses import dataclass
+from enum import Enum
+import itertools
+import sys
+from typing import Any
+
+import numpy as np
+
+__all__ = ("MemoryReport", "ModelCache")
+
+# Number of entries of a large dictionary which are measured to estimate its size
+_SAMPLE_SIZE = 100
+
+
+class ModelCache(str, Enum):
+    """Enum to specify a cache of a composite model which can be cleared."""
+
+    #: Lay-up information per element (:class:`.ElementInfo`).
+    ELEMENT_INFO = "element_info"
+    #: Incidence matrix of elements and analysis plies.
+    ANALYSIS_PLY_INCIDENCE = "analysis_ply_incidence"
+    #: Results of the last ply-wise failure evaluation.
+    PLY_WISE_FAILURE = "ply_wise_failure"
+    #: Result cache enabled by :meth:`.CompositeModel.enable_result_cache`.
+    #: It holds DPF fields containers, which are not counted. Its size is
+    #: therefore about 0 bytes, even for an in-process server which keeps
+    #: the data in the memory of the client. Limit it with ``max_size``.
+    RESULT = "result"
+
+
+@dataclass(frozen=True)
+class MemoryReport:
+    """Provides the estimated client memory held by a composite model.
+
+    Data held by the DPF server, such as fields containers, is not included.
+    This is also the case for an in-process server, whose data is in the memory
+    of the client process. Use :meth:`.CompositeModel.memory_report` to get the report of a model.
+
+    Parameters
+    ----------
+    cache_bytes
+        Bytes per cache. The caches can be released with
+        :meth:`.CompositeModel.clear_caches`.
+    indexer_bytes
+        Bytes per lookup structure, such as the indexers of the lay-up
+        properties. They are built when the model is created and are kept
+        for its lifetime.
+    """
+
+    cache_bytes: Mapping[ModelCache, int]
+    indexer_bytes: Mapping[str, int]
+
+    @property
+    def total_bytes(self) -> int:
+        """Bytes of all caches and lookup structures."""
+        return sum(self.cache_bytes.values()) + sum(self.indexer_bytes.values())
+
+    def __str__(self) -> str:
+        """Get a table of the bytes per cache and lookup structure."""
+        rows = [(cache.value, size) for cache, size in self.cache_bytes.items()]
+        rows += list(self.indexer_bytes.items())
+        rows.append(("total", self.total_bytes))
+        name_width = max(len(name) for name, _ in rows)
+        return "\n".join(f"{name:<{name_width}} {size / 1e6:>12.3f} MB" for name, size in rows)
+
+
+def _is_dpf_object(obj: Any) -> bool:
+    """Check whether an object is a DPF object, which is not counted.
+
+    DPF objects are handles of data held by the server. The data of an
+    in-process server is held by the DPF library in the client process, but
+    it is not counted either. :attr:`ModelCache.RESULT` therefore reads about
+    0 bytes for gRPC and in-process servers.
+    """
+    return type(obj).__module__.startswith("ansys.dpf.core")
+
+
+def _get_nbytes(obj: Any, visited: set[int] | None = None) -> int:
+    """Get the memory of an object and the objects it references.
+
+    Objects which are referenced several times are counted once.
+    """
+    if visited is None:
+        visited = set()
+    if obj is None or id(obj) in visited or _is_dpf_object(obj):
+        return 0
+    visited.add(id(obj))
+
+    if isinstance(obj, np.ndarray):
+        # Views do not own their data, the base array is counted instead
+        size = sys.getsizeof(obj)
+        return size if obj.base is None else size + _get_nbytes(obj.base, visited)
+    if isinstance(obj, (str, bytes, int, float, bool)):
+        return sys.getsizeof(obj)
+
+    size = sys.getsizeof(obj)
+    if isinstance(obj, Mapping):
+        size += sum(
+            _get_nbytes(key, visited) + _get_nbytes(value, visited) for key, value in obj.items()
+        )
+    elif isinstance(obj, (list, tuple, set, frozenset)):
+        size += sum(_get_nbytes(item, visited) for item in obj)
+    if hasattr(obj, "__dict__"):
+        size += _get_nbytes(vars(obj), visited)
+    for slot in getattr(type(obj), "__slots__", ()):
+        if hasattr(obj, slot):
+            size += _get_nbytes(getattr(obj, slot), visited)
+    return size
+
+
+def _estimate_dict_nbytes(dictionary: dict[Any, Any]) -> int:
+    """Estimate the memory of a large dictionary from a sample of its entries.
+
+    Measuring all entries of a cache with millions of entries is too slow to
+    be done after every operation.
+    """
+    if len(dictionary) <= _SAMPLE_SIZE:
+        return _get_nbytes(dictionary)
+    try:
+        sample = dict(itertools.islice(dictionary.items(), _SAMPLE_SIZE))
+    except RuntimeError:
+        # The dictionary was changed by another thread. Copying it is atomic.
+        sample = dict(itertools.islice(dictionary.copy().items(), _SAMPLE_SIZE))
+    sample_nbytes = _get_nbytes(sample) - sys.getsizeof(sample)
+    return sys.getsizeof(dictionary) + sample_nbytes * len(dictionary) // _SAMPLE_SIZE
@@ -0,0 +1,205 @@
+# Copyright (C) 2022 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Ply-wise failure results of all analysis plies."""
+
+from collections.abc import Collection, Sequence
+from dataclasses import dataclass
+
+from ansys.dpf.core import Field, fields_factory
+from ansys.dpf.core.server_types import BaseServer
+import numpy as np
+from numpy.typing import NDArray
+
+try:
+    from ansys.dpf.core.common import locations
+except ImportError:
+    # support ansys.dpf.core < 0.13
+    from ansys.dpf.gate.common import locations
+
+__all__ = ("CriticalPlyResults", "PlyWiseFailureResults")
+
+
+@dataclass(frozen=True)
+class CriticalPlyResults:
+    """Provides the critical analysis ply of each element.
+
+    Use :meth:`PlyWiseFailureResults.get_critical_plies` to evaluate it.
+
+    Parameters
+    ----------
+    element_ids
+        Element IDs in ascending order.
+    failure_values
+        Maximum inverse reserve factor over the analysis plies of the element.
+    failure_modes
+        Failure mode code at the maximum.
+    analysis_ply_names
+        Name of the critical analysis ply.
+    """
+
+    element_ids: NDArray[np.int64]
+    failure_values: NDArray[np.double]
+    failure_modes: NDArray[np.int64]
+    analysis_ply_names: Sequence[str]
+
+
+@dataclass(frozen=True)
+class PlyWiseFailureResults:
+    """Provides the maximum failure value of each element in each analysis ply.
+
+    Use :meth:`.CompositeModel.evaluate_ply_wise_failure_criteria` to evaluate
+    the results of all analysis plies in one pass. Only the (element, analysis ply)
+    pairs that exist in the lay-up are stored. The entries of analysis ply
+    ``analysis_ply_names[j]`` are ``indptr[j]:indptr[j + 1]``, sorted by element ID.
+
+    Parameters
+    ----------
+    analysis_ply_names
+        Names of the analysis plies.
+    analysis_ply_indices
+        Analysis ply indices, as stored in the ``layer_to_analysis_ply``
+        property field of the mesh.
+    indptr
+        Pointer to the entries of each analysis ply with a trailing end entry.
+    element_ids
+        Element ID of each entry.
+    failure_values
+        Maximum inverse reserve factor of each entry.
+    failure_modes
+        Failure mode code at the maximum of each entry.
+    time
+        Time or frequency of the results.
+    """
+
+    analysis_ply_names: Sequence[str]
+    analysis_ply_indices: NDArray[np.int64]
+    indptr: NDArray[np.int64]
+    element_ids: NDArray[np.int64]
+    failure_values: NDArray[np.double]
+    failure_modes: NDArray[np.int64]
+    time: float
+
+    def _get_ply_slice(self, analysis_ply_name: str) -> slice:
+        if analysis_ply_name not in self.analysis_ply_names:
+            raise RuntimeError(
+                f"Analysis ply {analysis_ply_name} is not available. "
+                f"Available analysis plies: {list(self.analysis_ply_names)}"
+            )
+        position = list(self.analysis_ply_names).index(analysis_ply_name)
+        return slice(self.indptr[position], self.indptr[position + 1])
+
+    def get_ply_results(
+        self, analysis_ply_name: str
+    ) -> tuple[NDArray[np.int64], NDArray[np.double], NDArray[np.int64]]:
+        """Get the element IDs, failure values, and failure modes of an analysis ply.
+
+        Parameters
+        ----------
+        analysis_ply_name:
+            Name of the analysis ply.
+        """
+        entries = self._get_ply_slice(analysis_ply_name)
+        return (
+            self.element_ids[entries],
+            self.failure_values[entries],
+            self.failure_modes[entries],
+        )
+
+    def get_ply_field(self, analysis_ply_name: str, server: BaseServer | None = None) -> Field:
+        """Get the failure values of an analysis ply as an elemental field.
+
+        The field can be plotted with the mesh of the composite model.
+
+        Parameters
+        ----------
+        analysis_ply_name:
+            Name of the analysis ply.
+        server:
+            DPF server on which the field is created. The global server is used if ``None``.
+        """
+        element_ids, failure_values, _ = self.get_ply_results(analysis_ply_name)
+        field = fields_factory.create_scalar_field(
+            len(element_ids), location=locations.elemental, server=server
+        )
+        field.name = f"IRF {analysis_ply_name}"
+        field.scoping.ids = element_ids
+        field.data = failure_values
+        return field
+
+    def select_plies(self, analysis_ply_names: Collection[str]) -> "PlyWiseFailureResults":
+        """Get the results of a subset of the analysis plies.
+
+        Parameters
+        ----------
+        analysis_ply_names:
+            Names of the selected analysis plies.
+        """
+        slices = [self._get_ply_slice(name) for name in analysis_ply_names]
+        indptr = np.zeros(len(slices) + 1, dtype=np.int64)
+        np.cumsum([entries.stop - entries.start for entries in slices], out=indptr[1:])
+        entries = np.concatenate(
+            [np.arange(entries.start, entries.stop, dtype=np.int64) for entries in slices]
+            + [np.zeros(0, dtype=np.int64)]
+        )
+        positions = [list(self.analysis_ply_names).index(name) for name in analysis_ply_names]
+        return PlyWiseFailureResults(
+            analysis_ply_names=list(analysis_ply_names),
+            analysis_ply_indices=self.analysis_ply_indices[positions],
+            indptr=indptr,
+            element_ids=self.element_ids[entries],
+            failure_values=self.failure_values[entries],
+            failure_modes=self.failure_modes[entries],
+            time=self.time,
+        )
+
+    def get_critical_plies(self) -> CriticalPlyResults:
+        """Get the maximum failure value, failure mode, and analysis ply of each element.
+
+        The maximum is taken over the analysis plies of the results. Use
+        :meth:`select_plies` to restrict the analysis plies. For equal failure
+        values, the first analysis ply in ``analysis_ply_names`` is critical.
+        """
+        ply_positions = np.repeat(
+            np.arange(len(self.analysis_ply_names), dtype=np.int64), np.diff(self.indptr)
+        )
+        order = np.lexsort((ply_positions, -self.failure_values, self.element_ids))
+        sorted_element_ids = self.element_ids[order]
+        is_first = np.ones(len(order), dtype=bool)
+        is_first[1:] = sorted_element_ids[1:] != sorted_element_ids[:-1]
+        critical = order[is_first]
+        return CriticalPlyResults(
+            element_ids=self.element_ids[critical],
+            failure_values=self.failure_values[critical],
+            failure_modes=self.failure_modes[critical],
+            analysis_ply_names=[
+                self.analysis_ply_names[index] for index in ply_positions[critical]
+            ],
+        )
+
+    def get_max_per_element(self) -> tuple[NDArray[np.int64], NDArray[np.double]]:
+        """Get the maximum failure value of each element over all analysis plies."""
+        order = np.argsort(self.element_ids, kind="stable")
+        element_ids, starts = np.unique(self.element_ids[order], return_index=True)
+        if len(order) == 0:
+            return element_ids, np.zeros(0, dtype=np.double)
+        return element_ids, np.maximum.reduceat(self.failure_values[order], starts)
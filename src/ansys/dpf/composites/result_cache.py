@@ -0,0 +1,188 @@
+# Copyright (C) 2022 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Cache for result fields containers read from the result file."""
+
+from collections import OrderedDict
+from dataclasses import dataclass
+import threading
+from typing import Any
+
+from .constants import ResultType
+
+__all__ = ("ResultCache", "ResultCacheKey", "ResultCacheStatistics")
+
+#: Key of a cache entry: result type, time or frequency set ID, and element scope.
+#: The element scope is ``None`` if the result is read for all elements.
+ResultCacheKey = tuple[ResultType, int, tuple[int, ...] | None]
+
+
+@dataclass(frozen=True)
+class ResultCacheStatistics:
+    """Provides the statistics of a :class:`ResultCache`.
+
+    Parameters
+    ----------
+    hits
+        Number of lookups which found an entry.
+    misses
+        Number of lookups which did not find an entry.
+    evictions
+        Number of entries removed because the cache was full.
+    size
+        Current number of entries.
+    max_size
+        Maximum number of entries.
+    """
+
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+    max_size: int
+
+
+class ResultCache:
+    """Least recently used (LRU) cache for result fields containers.
+
+    The entries are keyed by :data:`ResultCacheKey`. If the cache is full,
+    the least recently used entry is removed when a new entry is added.
+    Use :meth:`.CompositeModel.enable_result_cache` to enable the cache of
+    a composite model. The cache can be used by multiple threads.
+
+    Parameters
+    ----------
+    max_size
+        Maximum number of entries.
+    """
+
+    def __init__(self, max_size: int = 8):
+        """Create an empty cache."""
+        if max_size < 1:
+            raise RuntimeError(f"The maximum size of the cache must be positive, got {max_size}.")
+        self._max_size = max_size
+        self._entries: OrderedDict[ResultCacheKey, Any] = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: ResultCacheKey) -> Any | None:
+        """Get an entry and mark it as most recently used.
+
+        Returns ``None`` if the cache does not contain the entry.
+
+        Parameters
+        ----------
+        key:
+            Key of the entry.
+        """
+        with self._lock:
+            if key not in self._entries:
+                self._misses += 1
+                return None
+            self._hits += 1
+            self._entries.move_to_end(key)
+            return self._entries[key]
+
+    def put(self, key: ResultCacheKey, value: Any) -> None:
+        """Add or replace an entry.
+
+        Parameters
+        ----------
+        key:
+            Key of the entry.
+        value:
+            Cached value, typically a fields container.
+        """
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def invalidate(self, result_type: ResultType | None = None, time_id: int | None = None) -> int:
+        """Remove all entries of a result type and time.
+
+        Returns the number of removed entries.
+
+        Parameters
+        ----------
+        result_type:
+            Result type of the removed entries. Entries of all result types are removed
+            if ``None``.
+        time_id:
+            Time or frequency set ID of the removed entries. Entries of all times are
+            removed if ``None``.
+        """
+        with self._lock:
+            keys = [
+                key
+                for key in self._entries
+                if (result_type is None or key[0] == result_type)
+                and (time_id is None or key[1] == time_id)
+            ]
+            for key in keys:
+                del self._entries[key]
+            return len(keys)
+
+    def remove(self, value: Any) -> int:
+        """Remove all entries which hold the given object.
+
+        Returns the number of removed entries. Use this method before a cached
+        value is modified in place.
+
+        Parameters
+        ----------
+        value:
+            Cached object. Entries are compared by identity.
+        """
+        with self._lock:
+            keys = [key for key, entry in self._entries.items() if entry is value]
+            for key in keys:
+                del self._entries[key]
+            return len(keys)
+
+    def clear(self) -> None:
+        """Remove all entries and reset the statistics."""
+        with self._lock:
+            self._entries.clear()
+            self._hits = 0
+            self._misses = 0
+            self._evictions = 0
+
+    def __len__(self) -> int:
+        """Get the number of entries."""
+        return len(self._entries)
+
+    @property
+    def statistics(self) -> ResultCacheStatistics:
+        """Statistics of the cache."""
+        with self._lock:
+            return ResultCacheStatistics(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                size=len(self._entries),
+                max_size=self._max_size,
+            )
@@ -0,0 +1,238 @@
+# Copyright (C) 2022 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Partitions of distributed result files."""
+
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
+import contextvars
+from dataclasses import dataclass
+import os
+from typing import TypeVar
+
+import ansys.dpf.core as dpf
+from ansys.dpf.core import DataSources, PropertyField
+from ansys.dpf.core.server_types import BaseServer
+import numpy as np
+from numpy.typing import NDArray
+
+from ._typing_helper import PATH as _PATH
+
+__all__ = (
+    "ResultPartition",
+    "get_partition_chunks",
+    "get_result_partitions",
+    "read_partition_property_field",
+)
+
+_T = TypeVar("_T")
+_R = TypeVar("_R")
+
+
+@dataclass(frozen=True)
+class ResultPartition:
+    """Provides a partition of a distributed result file.
+
+    A distributed solution writes the results of each partition (domain)
+    to a separate file (``file0.rst`` to ``fileN.rst``).
+
+    Parameters
+    ----------
+    index
+        0-based index of the partition.
+    data_sources
+        Data sources which contain only the result file of the partition.
+    element_ids
+        IDs of the elements of the partition in ascending order.
+    """
+
+    index: int
+    data_sources: DataSources
+    element_ids: NDArray[np.int64]
+
+    def __len__(self) -> int:
+        """Get the number of elements."""
+        return len(self.element_ids)
+
+
+def _get_default_max_workers(number_of_items: int) -> int:
+    return max(1, min(number_of_items, os.cpu_count() or 1))
+
+
+def _map_in_parallel(
+    function: Callable[[_T], _R], items: Iterable[_T], max_workers: int
+) -> Iterator[_R]:
+    """Apply a function to items in background threads and yield the results in order.
+
+    At most ``max_workers`` items are evaluated at the same time, so the number
+    of results held in memory is bounded. The function runs in a copy of the
+    context of the caller, so the timings of :func:`.record_timings` include it.
+    """
+    if max_workers < 1:
+        raise RuntimeError(f"The number of workers must be positive, got {max_workers}.")
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        pending: deque[Future[_R]] = deque()
+        for item in items:
+            pending.append(executor.submit(contextvars.copy_context().run, function, item))
+            if len(pending) >= max_workers:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def _read_property_field(
+    data_sources: DataSources, property_name: str, server: BaseServer | None
+) -> PropertyField:
+    property_provider = dpf.Operator("mesh_property_provider", server=server)
+    property_provider.inputs.data_sources(data_sources)
+    property_provider.inputs.property_name(property_name)
+    return property_provider.outputs.property_as_property_field()
+
+
+def get_result_partitions(
+    result_files: Sequence[_PATH],
+    server: BaseServer | None = None,
+    max_workers: int | None = None,
+) -> list[ResultPartition]:
+    """Get the partitions of a distributed result file.
+
+    The element IDs of the partitions are read in parallel.
+
+    Parameters
+    ----------
+    result_files:
+        Result files of the partitions (``file0.rst`` to ``fileN.rst``) in order.
+    server:
+        DPF server. The global server is used if ``None``.
+    max_workers:
+        Maximum number of partitions which are read at the same time.
+        The number of CPUs is used if ``None``.
+    """
+
+    def read_partition(index: int) -> ResultPartition:
+        data_sources = DataSources(server=server)
+        data_sources.set_result_file_path(result_files[index])
+        element_types = _read_property_field(data_sources, "apdl_element_type", server)
+        return ResultPartition(
+            index=index,
+            data_sources=data_sources,
+            element_ids=np.sort(np.asarray(element_types.scoping.ids, dtype=np.int64)),
+        )
+
+    if max_workers is None:
+        max_workers = _get_default_max_workers(len(result_files))
+    return list(_map_in_parallel(read_partition, range(len(result_files)), max_workers))
+
+
+def read_partition_property_field(
+    partitions: Sequence[ResultPartition],
+    property_name: str,
+    server: BaseServer | None = None,
+    max_workers: int | None = None,
+) -> PropertyField:
+    """Read an elemental mesh property of all partitions and merge them.
+
+    The property is read from each partition in parallel. Elements which are
+    part of several partitions take the value of the first partition. Use this
+    function for properties such as ``keyopt_3`` which are not available for
+    all elements if they are read from the distributed result file at once.
+
+    Parameters
+    ----------
+    partitions:
+        Partitions of the distributed result file.
+    property_name:
+        Name of the mesh property, for example ``"keyopt_8"``.
+    server:
+        DPF server. The global server is used if ``None``.
+    max_workers:
+        Maximum number of partitions which are read at the same time.
+        The number of CPUs is used if ``None``.
+    """
+    if len(partitions) == 0:
+        raise RuntimeError("At least one partition is required.")
+
+    def read_values(partition: ResultPartition) -> tuple[NDArray[np.int64], NDArray[np.int64]]:
+        property_field = _read_property_field(partition.data_sources, property_name, server)
+        ids = np.asarray(property_field.scoping.ids, dtype=np.int64)
+        return ids, np.asarray(property_field.data, dtype=np.int64).reshape(len(ids), -1)
+
+    if max_workers is None:
+        max_workers = _get_default_max_workers(len(partitions))
+    partition_values = list(_map_in_parallel(read_values, partitions, max_workers))
+    all_ids = np.concatenate([ids for ids, _ in partition_values])
+    all_values = np.concatenate([values for _, values in partition_values])
+    ids, first_positions = np.unique(all_ids, return_index=True)
+    values = all_values[first_positions]
+
+    merged_field = dpf.PropertyField(
+        nentities=len(ids),
+        nature=dpf.natures.scalar if values.shape[1] == 1 else dpf.natures.vector,
+        location=dpf.locations.elemental,
+        server=server,
+    )
+    merged_field.scoping = dpf.Scoping(
+        ids=ids.tolist(), location=dpf.locations.elemental, server=server
+    )
+    merged_field.data = values.reshape(-1)
+    return merged_field
+
+
+def get_partition_chunks(
+    partitions: Sequence[ResultPartition],
+    element_ids: NDArray[np.int64],
+    max_chunk_size: int,
+) -> list[tuple[ResultPartition, NDArray[np.int64]]]:
+    """Split an element scope into chunks which are part of a single partition.
+
+    The results of a chunk can therefore be read from the result file of its
+    partition only. The chunks of a partition are consecutive and the elements
+    of a chunk are in ascending order.
+
+    Parameters
+    ----------
+    partitions:
+        Partitions of the distributed result file.
+    element_ids:
+        Element scope.
+    max_chunk_size:
+        Maximum number of elements per chunk.
+    """
+    if max_chunk_size < 1:
+        raise RuntimeError(f"The maximum chunk size must be positive, got {max_chunk_size}.")
+
+    remaining_ids = np.unique(np.asarray(element_ids, dtype=np.int64))
+    chunks: list[tuple[ResultPartition, NDArray[np.int64]]] = []
+    for partition in partitions:
+        is_in_partition = np.isin(remaining_ids, partition.element_ids, assume_unique=True)
+        partition_ids = remaining_ids[is_in_partition]
+        remaining_ids = remaining_ids[~is_in_partition]
+        for start in range(0, len(partition_ids), max_chunk_size):
+            chunks.append((partition, partition_ids[start : start + max_chunk_size]))
+
+    if len(remaining_ids) > 0:
+        raise RuntimeError(
+            f"Elements {remaining_ids[:10].tolist()} are not part of any partition "
+            "of the result file."
+        )
+    return chunks
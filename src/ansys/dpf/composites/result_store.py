@@ -0,0 +1,576 @@
+# Copyright (C) 2022 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Memory-mapped local store of layered results."""
+
+from collections.abc import Collection, Mapping
+from dataclasses import dataclass
+import json
+import os
+import pathlib
+from types import TracebackType
+from typing import Any, BinaryIO, cast
+
+import numpy as np
+from numpy.typing import NDArray
+
+from .constants import Spot
+from .layup_info import ElementInfo, ElementInfoColumns, LayeredElementData
+from .select_indices import _get_rst_spot_index
+
+__all__ = ("ResultStore", "ResultStoreWriter", "StoredResultSelection")
+
+_FORMAT_VERSION = 1
+_METADATA_FILE_NAME = "metadata.json"
+
+# Columns with one value per element. They define the ElementInfoColumns.
+_ELEMENT_COLUMNS = {
+    "element_ids": np.int64,
+    "is_supported": np.bool_,
+    "n_layers": np.int64,
+    "n_corner_nodes": np.int64,
+    "n_spots": np.int64,
+    "is_layered": np.bool_,
+    "element_type": np.int64,
+    "is_shell": np.bool_,
+    "number_of_nodes_per_spot_plane": np.int64,
+}
+# Columns with one value per layer
+_LAYER_COLUMNS = {"dpf_material_ids": np.int64, "analysis_ply_indices": np.int64}
+# Columns with one value per layer which have an index table
+_INDEXED_LAYER_COLUMNS = ("dpf_material_ids", "analysis_ply_indices")
+
+
+def _get_result_array_name(result_name: str) -> str:
+    return f"results/{result_name}"
+
+
+@dataclass(frozen=True)
+class StoredResultSelection:
+    """Provides selected result values of a :class:`ResultStore`.
+
+    The values of element ``element_ids[i]`` are the rows
+    ``indptr[i]:indptr[i + 1]`` of ``values``. ``elementary_indices`` contains
+    the index of each row within the element, as returned by
+    :func:`.get_selected_indices`. The rows of an element are in storage order.
+
+    Parameters
+    ----------
+    element_ids
+        IDs of the elements with at least one selected value.
+    indptr
+        Row pointer with a trailing end entry.
+    elementary_indices
+        Index of each row within its element.
+    values
+        Selected values with shape ``(indptr[-1], number_of_components)``.
+    """
+
+    element_ids: NDArray[np.int64]
+    indptr: NDArray[np.int64]
+    elementary_indices: NDArray[np.int64]
+    values: NDArray[np.double]
+
+
+class ResultStoreWriter:
+    """Writes layered results to a local result store.
+
+    A result store is a directory with one binary file per array and a
+    ``metadata.json`` file. The elementary data of each element are stored in
+    the CSR layout described in :ref:`select_indices`, and the lay-up
+    information of each element is stored column-wise. The chunks of
+    :meth:`.CompositeModel.iterate_element_chunks` can be appended one after
+    the other. The metadata file and the index tables of the analysis plies and
+    materials are written when the writer is closed. Use
+    :meth:`.CompositeModel.write_result_store` to create a store from a
+    composite model and :class:`ResultStore` to read it.
+
+    Parameters
+    ----------
+    path:
+        Directory of the store. Existing files of a store are overwritten.
+    number_of_components:
+        Number of components of each result by result name.
+    analysis_ply_names:
+        Map from analysis ply index to analysis ply name.
+    material_names:
+        Map from material name to DPF material ID.
+    metadata:
+        Additional JSON-serializable metadata, such as the time.
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str],
+        number_of_components: Mapping[str, int],
+        analysis_ply_names: Mapping[int, str] | None = None,
+        material_names: Mapping[str, int] | None = None,
+        metadata: Mapping[str, Any] | None = None,
+    ):
+        """Create the directory and the array files."""
+        self._path = pathlib.Path(path)
+        (self._path / "results").mkdir(parents=True, exist_ok=True)
+        (self._path / _METADATA_FILE_NAME).unlink(missing_ok=True)
+        self._number_of_components = dict(number_of_components)
+        self._analysis_ply_names = {} if analysis_ply_names is None else dict(analysis_ply_names)
+        self._material_names = {} if material_names is None else dict(material_names)
+        self._metadata = {} if metadata is None else dict(metadata)
+
+        self._arrays: dict[str, dict[str, Any]] = {}
+        self._files: dict[str, BinaryIO] = {}
+        for name, dtype in {**_ELEMENT_COLUMNS, **_LAYER_COLUMNS}.items():
+            self._open_array(name, dtype)
+        self._open_array("indptr", np.int64)
+        self._open_array("layer_indptr", np.int64)
+        for result_name, components in self._number_of_components.items():
+            self._open_array(_get_result_array_name(result_name), np.double, components)
+        self._append_array("indptr", np.zeros(1, dtype=np.int64))
+        self._append_array("layer_indptr", np.zeros(1, dtype=np.int64))
+        self._number_of_rows = 0
+        self._number_of_layers = 0
+
+    def __enter__(self) -> "ResultStoreWriter":
+        """Enter the context."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Close the writer. The metadata is only written if no exception occurred."""
+        if exc_type is None:
+            self.close()
+        else:
+            self._close_files()
+
+    def append(
+        self,
+        element_info_columns: ElementInfoColumns,
+        indptr: NDArray[np.int64],
+        results: Mapping[str, NDArray[np.double]],
+        analysis_ply_indices: LayeredElementData | None = None,
+    ) -> None:
+        """Append the results of multiple elements.
+
+        Parameters
+        ----------
+        element_info_columns:
+            Lay-up information of the elements.
+        indptr:
+            Row pointer of the result data of each element with a trailing end entry.
+        results:
+            Result data with shape ``(indptr[-1], number_of_components)`` by result name.
+            All results of the store are required.
+        analysis_ply_indices:
+            Analysis ply indices of the layers of the elements. Layers without
+            analysis ply get the index ``-1``.
+        """
+        if len(indptr) != len(element_info_columns) + 1:
+            raise RuntimeError("The row pointer does not match the number of elements.")
+        if set(results) != set(self._number_of_components):
+            raise RuntimeError(
+                f"Results {sorted(self._number_of_components)} are required, "
+                f"got {sorted(results)}."
+            )
+        for result_name, values in results.items():
+            values = np.asarray(values, dtype=np.double).reshape(
+                len(values), self._number_of_components[result_name]
+            )
+            if len(values) != indptr[-1] - indptr[0]:
+                raise RuntimeError(f"The data of {result_name} does not match the row pointer.")
+            self._append_array(_get_result_array_name(result_name), values)
+
+        for name in _ELEMENT_COLUMNS:
+            self._append_array(name, getattr(element_info_columns, name))
+
+        material_ids = element_info_columns.dpf_material_ids
+        self._append_array("dpf_material_ids", material_ids.values)
+        self._append_array(
+            "analysis_ply_indices",
+            _get_analysis_ply_indices_per_layer(material_ids, analysis_ply_indices),
+        )
+
+        self._append_array("indptr", indptr[1:] - indptr[0] + self._number_of_rows)
+        self._append_array(
+            "layer_indptr",
+            material_ids.indptr[1:] - material_ids.indptr[0] + self._number_of_layers,
+        )
+        self._number_of_rows += int(indptr[-1] - indptr[0])
+        self._number_of_layers += len(material_ids.values)
+
+    def close(self) -> None:
+        """Write the index tables and the metadata and close the files."""
+        if not self._files:
+            return
+        self._close_files()
+
+        (self._path / "index").mkdir(exist_ok=True)
+        layer_indptr = np.fromfile(self._path / "layer_indptr.bin", dtype=np.int64)
+        layer_element_positions = np.repeat(
+            np.arange(len(layer_indptr) - 1, dtype=np.int64), np.diff(layer_indptr)
+        )
+        for name in _INDEXED_LAYER_COLUMNS:
+            keys = np.fromfile(self._path / f"{name}.bin", dtype=np.int64)
+            self._write_index_table(name, keys, layer_element_positions)
+
+        # The sorted element IDs are stored, so opening a store does not sort them
+        element_ids = np.fromfile(self._path / "element_ids.bin", dtype=np.int64)
+        element_order = np.argsort(element_ids, kind="stable")
+        self._write_index_array("index/element_order", element_order)
+        self._write_index_array("index/sorted_element_ids", element_ids[element_order])
+
+        metadata = {
+            "format_version": _FORMAT_VERSION,
+            "arrays": self._arrays,
+            "results": self._number_of_components,
+            "analysis_ply_names": {
+                str(index): name for index, name in self._analysis_ply_names.items()
+            },
+            "material_names": self._material_names,
+            "metadata": self._metadata,
+        }
+        with open(self._path / _METADATA_FILE_NAME, "w", encoding="utf-8") as file:
+            json.dump(metadata, file, indent=2)
+
+    def _open_array(self, name: str, dtype: Any, number_of_components: int | None = None) -> None:
+        self._arrays[name] = {
+            "dtype": np.dtype(dtype).str,
+            "shape": [0] if number_of_components is None else [0, number_of_components],
+        }
+        self._files[name] = open(  # pylint: disable=consider-using-with
+            self._path / f"{name}.bin", "wb"
+        )
+
+    def _append_array(self, name: str, values: NDArray[Any]) -> None:
+        array = self._arrays[name]
+        values = np.ascontiguousarray(values, dtype=np.dtype(array["dtype"]))
+        self._files[name].write(values.tobytes())
+        array["shape"][0] += len(values)
+
+    def _write_index_table(
+        self, name: str, keys: NDArray[np.int64], layer_element_positions: NDArray[np.int64]
+    ) -> None:
+        # Unique (key, element position) pairs sorted by key and element position
+        pairs = np.unique(np.stack([keys, layer_element_positions], axis=1), axis=0)
+        pairs = pairs[pairs[:, 0] >= 0]
+        key_ids, counts = np.unique(pairs[:, 0], return_counts=True)
+        indptr = np.zeros(len(key_ids) + 1, dtype=np.int64)
+        np.cumsum(counts, out=indptr[1:])
+        for suffix, values in (
+            ("ids", key_ids),
+            ("indptr", indptr),
+            ("element_positions", pairs[:, 1]),
+        ):
+            self._write_index_array(f"index/{name}_{suffix}", values)
+
+    def _write_index_array(self, array_name: str, values: NDArray[Any]) -> None:
+        values = values.astype(np.int64)
+        values.tofile(self._path / f"{array_name}.bin")
+        self._arrays[array_name] = {"dtype": values.dtype.str, "shape": [len(values)]}
+
+    def _close_files(self) -> None:
+        for file in self._files.values():
+            file.close()
+        self._files.clear()
+
+
+def _get_analysis_ply_indices_per_layer(
+    dpf_material_ids: LayeredElementData, analysis_ply_indices: LayeredElementData | None
+) -> NDArray[np.int64]:
+    """Get the analysis ply index of each layer with -1 for layers without analysis ply."""
+    result = np.full(len(dpf_material_ids.values), -1, dtype=np.int64)
+    if analysis_ply_indices is None:
+        return result
+    if not np.array_equal(analysis_ply_indices.element_ids, dpf_material_ids.element_ids):
+        raise RuntimeError("The analysis ply indices do not match the elements.")
+    number_of_layers = dpf_material_ids.number_of_layers
+    number_of_plies = analysis_ply_indices.number_of_layers
+    has_plies = number_of_plies == number_of_layers
+    result[np.repeat(has_plies, number_of_layers)] = analysis_ply_indices.values[
+        np.repeat(has_plies, number_of_plies)
+    ]
+    return result
+
+
+class ResultStore:
+    """Provides read access to a local result store.
+
+    The arrays of the store are memory-mapped, so opening a store is fast and
+    only the selected data is read from disk. No DPF server is required.
+    Use :class:`ResultStoreWriter` or :meth:`.CompositeModel.write_result_store`
+    to create a store.
+
+    Parameters
+    ----------
+    path:
+        Directory of the store.
+    """
+
+    def __init__(self, path: str | os.PathLike[str]):
+        """Open the store."""
+        self._path = pathlib.Path(path)
+        metadata_path = self._path / _METADATA_FILE_NAME
+        if not metadata_path.is_file():
+            raise RuntimeError(f"{self._path} is not a complete result store.")
+        with open(metadata_path, encoding="utf-8") as file:
+            metadata = json.load(file)
+        if metadata["format_version"] != _FORMAT_VERSION:
+            raise RuntimeError(
+                f"The result store format version {metadata['format_version']} " "is not supported."
+            )
+        self._arrays = {
+            name: self._open_array(name, spec) for name, spec in metadata["arrays"].items()
+        }
+        self._number_of_components: dict[str, int] = metadata["results"]
+        self._analysis_ply_names = {
+            int(index): name for index, name in metadata["analysis_ply_names"].items()
+        }
+        self._material_names: dict[str, int] = metadata["material_names"]
+        self._metadata: dict[str, Any] = metadata["metadata"]
+        if "index/element_order" in self._arrays:
+            self._element_order = self._arrays["index/element_order"]
+            self._sorted_element_ids = self._arrays["index/sorted_element_ids"]
+        else:
+            # Stores written by older versions have no sorted element index
+            self._element_order = np.argsort(self._arrays["element_ids"], kind="stable")
+            self._sorted_element_ids = self._arrays["element_ids"][self._element_order]
+
+    def __len__(self) -> int:
+        """Get the number of elements."""
+        return len(self.element_ids)
+
+    @property
+    def element_ids(self) -> NDArray[np.int64]:
+        """Element IDs in storage order."""
+        return self._arrays["element_ids"]
+
+    @property
+    def result_names(self) -> list[str]:
+        """Names of the stored results."""
+        return list(self._number_of_components)
+
+    @property
+    def analysis_ply_names(self) -> dict[int, str]:
+        """Map from analysis ply index to analysis ply name."""
+        return dict(self._analysis_ply_names)
+
+    @property
+    def material_names(self) -> dict[str, int]:
+        """Map from material name to DPF material ID."""
+        return dict(self._material_names)
+
+    @property
+    def metadata(self) -> dict[str, Any]:
+        """Additional metadata provided by the writer."""
+        return dict(self._metadata)
+
+    @property
+    def element_info_columns(self) -> ElementInfoColumns:
+        """Lay-up information of all elements."""
+        return ElementInfoColumns(
+            **{name: self._arrays[name] for name in _ELEMENT_COLUMNS},
+            dpf_material_ids=LayeredElementData(
+                self._arrays["element_ids"],
+                self._arrays["layer_indptr"],
+                self._arrays["dpf_material_ids"],
+            ),
+        )
+
+    def get_element_info(self, element_id: int) -> ElementInfo | None:
+        """Get the lay-up information of an element.
+
+        The element information can be used with the functions of
+        :mod:`.select_indices`. Returns ``None`` if the element type is
+        not supported.
+
+        Parameters
+        ----------
+        element_id:
+            Element ID or label.
+        """
+        return self.element_info_columns.get_element_info(
+            int(self._get_positions(np.array([element_id]))[0])
+        )
+
+    def get_element_data(self, result_name: str, element_id: int) -> NDArray[np.double]:
+        """Get the elementary data of an element.
+
+        Parameters
+        ----------
+        result_name:
+            Name of the result.
+        element_id:
+            Element ID or label.
+        """
+        position = int(self._get_positions(np.array([element_id]))[0])
+        indptr = self._arrays["indptr"]
+        return self._get_result(result_name)[indptr[position] : indptr[position + 1]]
+
+    def select(
+        self,
+        result_name: str,
+        element_ids: Collection[int] | None = None,
+        layers: Collection[int] | None = None,
+        nodes: Collection[int] | None = None,
+        spots: Collection[Spot] | None = None,
+        analysis_ply_names: Collection[str] | None = None,
+        dpf_material_ids: Collection[int] | None = None,
+    ) -> StoredResultSelection:
+        """Select result values by element, layer, node, spot, analysis ply, and material.
+
+        The filters have the same meaning as the arguments of
+        :func:`.get_selected_indices`, :func:`.get_selected_indices_by_analysis_ply`,
+        and :func:`.get_selected_indices_by_dpf_material_ids`, and all filters
+        must match. If any layer-wise filter is set, only layered elements are
+        selected. Elements without selected values are omitted.
+
+        Parameters
+        ----------
+        result_name:
+            Name of the result.
+        element_ids:
+            Selected elements. All elements are selected if ``None``.
+        layers:
+            Selected 0-based layer indices.
+        nodes:
+            Selected 0-based corner node indices.
+        spots:
+            Selected spots (:class:`.Spot`).
+        analysis_ply_names:
+            Names of the selected analysis plies.
+        dpf_material_ids:
+            Selected DPF material IDs.
+        """
+        values = self._get_result(result_name)
+        if element_ids is None:
+            positions = np.arange(len(self), dtype=np.int64)
+        else:
+            positions = self._get_positions(np.asarray(list(element_ids), dtype=np.int64))
+
+        layer_filters: dict[str, NDArray[np.int64]] = {}
+        if analysis_ply_names is not None:
+            index_by_name = {name: index for index, name in self._analysis_ply_names.items()}
+            missing = [name for name in analysis_ply_names if name not in index_by_name]
+            if missing:
+                raise RuntimeError(f"Analysis plies {missing} are not in the result store.")
+            layer_filters["analysis_ply_indices"] = np.array(
+                [index_by_name[name] for name in analysis_ply_names], dtype=np.int64
+            )
+        if dpf_material_ids is not None:
+            layer_filters["dpf_material_ids"] = np.asarray(list(dpf_material_ids), dtype=np.int64)
+        for name, keys in layer_filters.items():
+            positions = positions[np.isin(positions, self._get_indexed_positions(name, keys))]
+
+        has_layer_filter = bool(layer_filters) or any(
+            selection is not None for selection in (layers, nodes, spots)
+        )
+        if has_layer_filter:
+            positions = positions[
+                self._arrays["is_layered"][positions] & (self._arrays["n_spots"][positions] > 0)
+            ]
+
+        indptr = self._arrays["indptr"]
+        starts = indptr[positions]
+        lengths = indptr[positions + 1] - starts
+        row_elements = np.repeat(np.arange(len(positions), dtype=np.int64), lengths)
+        local_rows = np.arange(np.sum(lengths), dtype=np.int64) - np.repeat(
+            np.cumsum(lengths) - lengths, lengths
+        )
+
+        if has_layer_filter:
+            nodes_per_spot = np.repeat(
+                self._arrays["number_of_nodes_per_spot_plane"][positions], lengths
+            )
+            n_spots = np.repeat(self._arrays["n_spots"][positions], lengths)
+            layer_indices = local_rows // (nodes_per_spot * n_spots)
+            is_selected = np.ones(len(local_rows), dtype=bool)
+            if layers is not None:
+                is_selected &= np.isin(layer_indices, list(layers))
+            if nodes is not None:
+                is_selected &= np.isin(local_rows % nodes_per_spot, list(nodes))
+            if spots is not None:
+                is_selected &= np.isin(
+                    (local_rows // nodes_per_spot) % n_spots,
+                    [_get_rst_spot_index(spot) for spot in spots],
+                )
+            global_layers = (
+                np.repeat(self._arrays["layer_indptr"][positions], lengths) + layer_indices
+            )
+            for name, keys in layer_filters.items():
+                is_selected &= np.isin(self._arrays[name][global_layers], keys)
+            row_elements = row_elements[is_selected]
+            local_rows = local_rows[is_selected]
+
+        counts = np.bincount(row_elements, minlength=len(positions))
+        has_values = counts > 0
+        selected_indptr = np.zeros(np.count_nonzero(has_values) + 1, dtype=np.int64)
+        np.cumsum(counts[has_values], out=selected_indptr[1:])
+        return StoredResultSelection(
+            element_ids=np.asarray(self.element_ids[positions[has_values]], dtype=np.int64),
+            indptr=selected_indptr,
+            elementary_indices=local_rows,
+            values=np.asarray(values[starts[row_elements] + local_rows]),
+        )
+
+    def _open_array(self, name: str, spec: Mapping[str, Any]) -> NDArray[Any]:
+        dtype = np.dtype(spec["dtype"])
+        shape = tuple(spec["shape"])
+        if np.prod(shape) == 0:
+            # Empty files cannot be memory-mapped
+            return np.zeros(shape, dtype=dtype)
+        return np.memmap(self._path / f"{name}.bin", dtype=dtype, mode="r", shape=shape)
+
+    def _get_result(self, result_name: str) -> NDArray[np.double]:
+        if result_name not in self._number_of_components:
+            raise RuntimeError(
+                f"The result store does not contain the result {result_name}. "
+                f"Available results: {self.result_names}."
+            )
+        return self._arrays[_get_result_array_name(result_name)]
+
+    def _get_positions(self, element_ids: NDArray[np.int64]) -> NDArray[np.int64]:
+        if len(self) == 0:
+            positions = np.zeros(len(element_ids), dtype=np.int64)
+            is_missing = np.ones(len(element_ids), dtype=bool)
+        else:
+            sorted_ids = self._sorted_element_ids
+            indices = np.minimum(np.searchsorted(sorted_ids, element_ids), len(sorted_ids) - 1)
+            positions = self._element_order[indices]
+            is_missing = self.element_ids[positions] != element_ids
+        if np.any(is_missing):
+            raise RuntimeError(f"Element {element_ids[is_missing][0]} is not in the result store.")
+        return cast(NDArray[np.int64], positions)
+
+    def _get_indexed_positions(self, name: str, keys: NDArray[np.int64]) -> NDArray[np.int64]:
+        """Get the positions of the elements with a layer that has one of the keys."""
+        key_ids = self._arrays[f"index/{name}_ids"]
+        indptr = self._arrays[f"index/{name}_indptr"]
+        element_positions = self._arrays[f"index/{name}_element_positions"]
+        key_indices = np.flatnonzero(np.isin(key_ids, keys))
+        return np.unique(
+            np.concatenate(
+                [element_positions[indptr[index] : indptr[index + 1]] for index in key_indices]
+                + [np.zeros(0, dtype=np.int64)]
+            )
+        )
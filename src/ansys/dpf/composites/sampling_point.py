@@ -51,6 +51,7 @@ from .layup_info.material_operators import MaterialOperators
 from .result_definition import FailureMeasureEnum
 from .sampling_point_types import FailureResult, SamplingPoint, SamplingPointFigure
 from .server_helpers import version_equal_or_later
+from .tracing import _span
 from .unit_system import get_unit_system
 
 
@@ -460,10 +461,15 @@ class SamplingPointNew(SamplingPoint):
         sampling_point_to_json_converter = dpf.Operator("composite::convert_sampling_point_to_json")
         sampling_point_to_json_converter.connect(0, sampling_point_evaluator, 0)
 
+        with _span("sampling_point.evaluate", number_of_elements=1) as span:
+            results_json = sampling_point_to_json_converter.get_output(
+                pin=0, output_type=dpf.types.string
+            )
+            span["bytes"] = len(results_json)
+
         # update internal members
-        self._results = json.loads(
-            sampling_point_to_json_converter.get_output(pin=0, output_type=dpf.types.string)
-        )
+        with _span("sampling_point.parse"):
+            self._results = json.loads(results_json)
         if not self._results or len(self._results) == 0:
             raise RuntimeError(f"Sampling point {self.name} has no results.")
         if self._results and len(self._results) > 1:
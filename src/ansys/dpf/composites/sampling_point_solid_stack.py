@@ -69,6 +69,7 @@ from .solid_stack_results import (
     get_through_the_thickness_failure_results,
     get_through_the_thickness_results,
 )
+from .tracing import _span
 from .unit_system import get_unit_system
 
 
@@ -382,8 +383,9 @@ class SamplingPointSolidStack(SamplingPoint):
         elastic_strain_operator.inputs.streams_container.connect(self._rst_streams_provider)
         elastic_strain_operator.inputs.bool_rotate_to_global(False)
 
-        stress_container = stress_operator.outputs.fields_container()
-        elastic_strain_container = elastic_strain_operator.outputs.fields_container()
+        with _span("sampling_point.read", number_of_elements=len(element_scope.ids)):
+            stress_container = stress_operator.outputs.fields_container()
+            elastic_strain_container = elastic_strain_operator.outputs.fields_container()
         if not self._time:
             last_time_step = stress_container.get_available_ids_for_label("time")[-1]
             if (
@@ -409,7 +411,10 @@ class SamplingPointSolidStack(SamplingPoint):
         )
         failure_evaluator.inputs.mesh(self._meshed_region)
 
-        elemental_nodal_failure_container = failure_evaluator.outputs.fields_container.get_data()
+        with _span("sampling_point.evaluate", number_of_elements=len(element_scope.ids)):
+            elemental_nodal_failure_container = (
+                failure_evaluator.outputs.fields_container.get_data()
+            )
         irf_field = elemental_nodal_failure_container.get_field(
             {
                 "failure_label": FailureOutput.FAILURE_VALUE,
@@ -423,33 +428,34 @@ class SamplingPointSolidStack(SamplingPoint):
             }
         )
 
-        failure_results = get_through_the_thickness_failure_results(
-            self._solid_stack, self._element_info_provider, irf_field, failure_model_field
-        )
+        with _span("sampling_point.through_the_thickness"):
+            failure_results = get_through_the_thickness_failure_results(
+                self._solid_stack, self._element_info_provider, irf_field, failure_model_field
+            )
 
-        stress_field = stress_container.get_field(
-            {
-                "time": self._time,
-            }
-        )
-        elastic_strain_field = elastic_strain_container.get_field(
-            {
-                "time": self._time,
-            }
-        )
+            stress_field = stress_container.get_field(
+                {
+                    "time": self._time,
+                }
+            )
+            elastic_strain_field = elastic_strain_container.get_field(
+                {
+                    "time": self._time,
+                }
+            )
 
-        stress_results = get_through_the_thickness_results(
-            self._solid_stack,
-            self._element_info_provider,
-            stress_field,
-            tuple(stress_component_name(component) for component in Sym3x3TensorComponent),
-        )
-        strain_results = get_through_the_thickness_results(
-            self._solid_stack,
-            self._element_info_provider,
-            elastic_strain_field,
-            tuple([strain_component_name(component) for component in Sym3x3TensorComponent]),
-        )
+            stress_results = get_through_the_thickness_results(
+                self._solid_stack,
+                self._element_info_provider,
+                stress_field,
+                tuple(stress_component_name(component) for component in Sym3x3TensorComponent),
+            )
+            strain_results = get_through_the_thickness_results(
+                self._solid_stack,
+                self._element_info_provider,
+                elastic_strain_field,
+                tuple([strain_component_name(component) for component in Sym3x3TensorComponent]),
+            )
 
         analysis_plies = []
         offsets = []
@@ -28,7 +28,10 @@ the DPF Composites plugin.
 
 from ._connect_to_or_start_server import connect_to_or_start_server
 from ._load_plugin import load_composites_plugin
+from ._server_pool import ServerPool
 from ._upload_files_to_server import (
+    UploadCache,
+    UploadProgress,
     upload_continuous_fiber_composite_files_to_server,
     upload_file_to_unique_tmp_folder,
     upload_files_to_unique_tmp_folder,
@@ -39,7 +42,10 @@ from ._versions import version_equal_or_later, version_older_than
 __all__ = (
     "load_composites_plugin",
     "connect_to_or_start_server",
+    "ServerPool",
     "upload_short_fiber_composite_files_to_server",
+    "UploadCache",
+    "UploadProgress",
     "upload_file_to_unique_tmp_folder",
     "upload_files_to_unique_tmp_folder",
     "upload_continuous_fiber_composite_files_to_server",
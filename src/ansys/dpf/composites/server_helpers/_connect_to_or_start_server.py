@@ -33,20 +33,33 @@ from ansys.dpf.core.server_factory import AvailableServerConfigs
 from ansys.dpf.composites.server_helpers._load_plugin import load_composites_plugin
 
 
-def _try_until_timeout(fun: Callable[[], Any], error_message: str, timeout: int = 10) -> Any:
+def _try_until_timeout(
+    fun: Callable[[], Any],
+    error_message: str,
+    timeout: float = 10,
+    initial_delay: float = 0.001,
+    max_delay: float = 0.1,
+) -> Any:
     """Try to run a function until a timeout is reached.
 
     Before the timeout is reached, all exceptions are ignored and a retry happens.
+    The delay between the retries starts at ``initial_delay`` and is doubled after
+    each failed try up to ``max_delay``.
     """
     import time
 
-    tstart = time.time()
-    while (time.time() - tstart) < timeout:
-        time.sleep(0.001)
+    deadline = time.monotonic() + timeout
+    delay = initial_delay
+    while True:
         try:
             return fun()
         except Exception:  # pylint: disable=broad-except
             pass
+        remaining_time = deadline - time.monotonic()
+        if remaining_time <= 0:
+            break
+        time.sleep(min(delay, remaining_time))
+        delay = min(2 * delay, max_delay)
     raise TimeoutError(f"Timeout is reached: {error_message}")
 
 
@@ -63,7 +76,11 @@ def _wait_until_server_is_up(server: _dpf_server) -> Any:
 
 
 def connect_to_or_start_server(
-    port: int | None = None, ip: str | None = None, ansys_path: str | None = None, **kwargs: Any
+    port: int | None = None,
+    ip: str | None = None,
+    ansys_path: str | None = None,
+    load_plugin: bool = True,
+    **kwargs: Any,
 ) -> Any:
     r"""Connect to or start a DPF server with the DPF Composites plugin loaded.
 
@@ -82,6 +99,10 @@ def connect_to_or_start_server(
     ansys_path :
         Root path for the Ansys installation. For example, ``C:\\Program Files\\ANSYS Inc\\v232``.
         This parameter is ignored if either the port or IP address is set.
+    load_plugin :
+        Whether to load the DPF Composites plugin. Set it to ``False`` to connect
+        to a server which has the plugin loaded already, for example a server of
+        a :class:`.ServerPool`.
     **kwargs:
         Additional keyword arguments are passed to either `ansys.dpf.core.start_local_server`
         or `ansys.dpf.core.connect_to_server` to set a timeout, config and context.
@@ -132,5 +153,6 @@ def connect_to_or_start_server(
     # Note: server.ansys_path contains the computed Ansys path from
     # dpf.server.start_local_server. It is None if
     # a connection is made to an existing server.
-    load_composites_plugin(server, ansys_path=server.ansys_path)
+    if load_plugin:
+        load_composites_plugin(server, ansys_path=server.ansys_path)
     return server
@@ -0,0 +1,273 @@
+# Copyright (C) 2022 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Pool of local DPF servers with the DPF Composites plugin loaded."""
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass
+import queue
+import threading
+from typing import Any
+
+import ansys.dpf.core as dpf
+from ansys.dpf.core.server_factory import AvailableServerConfigs
+
+from ._connect_to_or_start_server import connect_to_or_start_server
+
+
+@dataclass
+class _PooledServer:
+    server: Any
+    number_of_uses: int = 0
+
+
+def _shutdown(server: Any) -> None:
+    try:
+        server.shutdown()
+    except Exception:  # pylint: disable=broad-except
+        # The server is discarded anyway, for example because it is not responding.
+        pass
+
+
+def _responds(server: Any, timeout: float) -> bool:
+    """Check whether the server answers a request within ``timeout`` seconds.
+
+    Properties such as ``server.version`` and ``server.info`` are cached on the
+    client after the first request, so they do not contact the server. The
+    request runs in a daemon thread which is abandoned if the server hangs.
+    """
+    responses: list[bool] = []
+
+    def request() -> None:
+        try:
+            dpf.make_tmp_dir_server(server)
+            responses.append(True)
+        except Exception:  # pylint: disable=broad-except
+            responses.append(False)
+
+    thread = threading.Thread(target=request, daemon=True)
+    thread.start()
+    thread.join(timeout)
+    return responses[:1] == [True]
+
+
+class ServerPool:
+    """Pool of local DPF servers with the DPF Composites plugin loaded.
+
+    The servers are started in parallel when the pool is created, so batch
+    jobs pay the startup and the loading of the plugin only once. Use
+    :meth:`server` to borrow a server for the duration of a ``with`` block.
+    Before a server is handed out, a health check sends a request to it and
+    verifies that it responds within ``health_check_timeout`` seconds.
+    Servers which fail the health check or which reached ``max_uses`` are shut
+    down and replaced by new ones.
+
+    The pool can be shared by the threads of a thread pool. Worker processes
+    of a process pool can connect to the servers with
+    ``connect_to_or_start_server(ip=ip, port=port, load_plugin=False)`` and
+    the addresses in :attr:`addresses`.
+
+    Parameters
+    ----------
+    size
+        Number of servers.
+    ansys_path
+        Root path of the Ansys installation. The latest installation is used if ``None``.
+    max_uses
+        Number of times a server is handed out before it is replaced by a new
+        one. Servers are never recycled if ``None``.
+    health_check
+        Whether to check that a server responds before it is handed out.
+    health_check_timeout
+        Time in seconds after which a server which does not respond to the
+        health check is considered unhealthy.
+    start_server
+        Function which starts a server with the plugin loaded. If ``None``,
+        :func:`.connect_to_or_start_server` starts gRPC servers which are not
+        set as global server. The keyword arguments are passed to this function.
+    **kwargs
+        Keyword arguments for ``start_server``.
+
+    Examples
+    --------
+    >>> with ServerPool(4) as pool:
+    ...     with pool.server() as server:
+    ...         composite_model = CompositeModel(composite_files, server)
+    """
+
+    def __init__(
+        self,
+        size: int,
+        ansys_path: str | None = None,
+        max_uses: int | None = None,
+        health_check: bool = True,
+        health_check_timeout: float = 10.0,
+        start_server: Callable[..., Any] | None = None,
+        **kwargs: Any,
+    ):
+        """Start the servers of the pool."""
+        if size < 1:
+            raise RuntimeError(f"The size of the server pool must be positive, got {size}.")
+        if max_uses is not None and max_uses < 1:
+            raise RuntimeError(f"The maximum number of uses must be positive, got {max_uses}.")
+        if health_check_timeout <= 0:
+            raise RuntimeError(
+                f"The health check timeout must be positive, got {health_check_timeout}."
+            )
+
+        if start_server is None:
+            start_server = connect_to_or_start_server
+            kwargs.setdefault("config", AvailableServerConfigs.GrpcServer)
+            kwargs.setdefault("as_global", False)
+            kwargs["ansys_path"] = ansys_path
+        self._start_server = start_server
+        self._kwargs = kwargs
+        self._size = size
+        self._max_uses = max_uses
+        self._health_check = health_check
+        self._health_check_timeout = health_check_timeout
+
+        self._lock = threading.Lock()
+        self._idle_servers: queue.Queue[_PooledServer] = queue.Queue()
+        self._servers: list[_PooledServer] = []
+        self._closed = False
+
+        try:
+            with ThreadPoolExecutor(max_workers=size) as executor:
+                new_servers = list(executor.map(lambda _: self._start(), range(size)))
+        except BaseException:
+            # Shut down the servers which were started before the error.
+            # The executor has finished all starts when it is left.
+            self._closed = True
+            for pooled_server in list(self._servers):
+                self._discard(pooled_server)
+            raise
+        for pooled_server in new_servers:
+            self._idle_servers.put(pooled_server)
+
+    def _start(self) -> _PooledServer:
+        pooled_server = _PooledServer(self._start_server(**self._kwargs))
+        with self._lock:
+            self._servers.append(pooled_server)
+        return pooled_server
+
+    def _replace(self, pooled_server: _PooledServer) -> _PooledServer:
+        """Start a new server and shut down the given one."""
+        new_server = self._start()
+        self._discard(pooled_server)
+        return new_server
+
+    def _discard(self, pooled_server: _PooledServer) -> None:
+        with self._lock:
+            self._servers.remove(pooled_server)
+        _shutdown(pooled_server.server)
+
+    def _is_healthy(self, pooled_server: _PooledServer) -> bool:
+        return _responds(pooled_server.server, self._health_check_timeout)
+
+    @property
+    def size(self) -> int:
+        """Number of servers."""
+        return self._size
+
+    @property
+    def servers(self) -> list[Any]:
+        """Servers of the pool, including the ones which are handed out."""
+        with self._lock:
+            return [pooled_server.server for pooled_server in self._servers]
+
+    @property
+    def addresses(self) -> list[tuple[str, int]]:
+        """IP addresses and ports of the servers.
+
+        Only servers which communicate through gRPC have an address.
+        """
+        return [
+            (server.ip, server.port)
+            for server in self.servers
+            if getattr(server, "ip", None) is not None
+        ]
+
+    @contextmanager
+    def server(self, timeout: float | None = None) -> Iterator[Any]:
+        """Borrow a server for the duration of a ``with`` block.
+
+        Waits until a server is available.
+
+        Parameters
+        ----------
+        timeout:
+            Maximum time in seconds to wait for a server. Waits indefinitely if ``None``.
+        """
+        if self._closed:
+            raise RuntimeError("The server pool is closed.")
+        try:
+            pooled_server = self._idle_servers.get(timeout=timeout)
+        except queue.Empty as exc:
+            raise TimeoutError(f"No server became available within {timeout} s.") from exc
+
+        if self._health_check and not self._is_healthy(pooled_server):
+            try:
+                pooled_server = self._replace(pooled_server)
+            except BaseException:
+                # Keep the size of the pool. The replacement is tried again
+                # when the server is handed out the next time.
+                self._idle_servers.put(pooled_server)
+                raise
+
+        try:
+            yield pooled_server.server
+        finally:
+            pooled_server.number_of_uses += 1
+            if self._closed:
+                self._discard(pooled_server)
+            elif self._max_uses is not None and pooled_server.number_of_uses >= self._max_uses:
+                try:
+                    pooled_server = self._replace(pooled_server)
+                except Exception:  # pylint: disable=broad-except
+                    # Keep using the old server until a new one can be started
+                    pass
+                self._idle_servers.put(pooled_server)
+            else:
+                self._idle_servers.put(pooled_server)
+
+    def close(self) -> None:
+        """Shut down all servers.
+
+        Servers which are handed out are shut down when they are returned.
+        """
+        self._closed = True
+        while True:
+            try:
+                pooled_server = self._idle_servers.get_nowait()
+            except queue.Empty:
+                return
+            self._discard(pooled_server)
+
+    def __enter__(self) -> "ServerPool":
+        """Enter the context of the pool."""
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        """Shut down all servers."""
+        self.close()
@@ -20,10 +20,19 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
+from collections.abc import Callable, Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+import hashlib
+import json
 import os
 import pathlib
-from typing import cast
+import tempfile
+import threading
+import time
+from typing import Any, TypeVar, cast
 import uuid
+import warnings
 
 import ansys.dpf.core as dpf
 from ansys.dpf.core.server_types import BaseServer
@@ -37,6 +46,205 @@ from ..data_sources import (
     get_d3plot_from_list_of_paths,
 )
 
+_HASH_BLOCK_SIZE = 1 << 20
+_DEFAULT_MAX_WORKERS = 4
+_RETRY_INITIAL_DELAY = 1.0
+_RETRY_MAX_DELAY = 30.0
+# Larger files are not downloaded again to verify their checksum
+_MAX_VERIFIED_FILE_SIZE = 1 << 30
+_S = TypeVar("_S")
+_T = TypeVar("_T")
+
+
+def _update_hash_with_file(file_hash: Any, path: _PATH) -> None:
+    with open(path, "rb") as file:
+        for block in iter(lambda: file.read(_HASH_BLOCK_SIZE), b""):
+            file_hash.update(block)
+
+
+def _get_file_hash(path: _PATH) -> str:
+    file_hash = hashlib.sha256()
+    _update_hash_with_file(file_hash, path)
+    return file_hash.hexdigest()
+
+
+@dataclass(frozen=True)
+class UploadProgress:
+    """Provides the progress of an upload of several files.
+
+    Files which are taken from an :class:`UploadCache` count as uploaded.
+    The progress is reported per file because DPF transfers a file in a
+    single request.
+
+    Parameters
+    ----------
+    total_files
+        Number of files to upload.
+    uploaded_files
+        Number of files which are uploaded.
+    total_bytes
+        Size of all files in bytes.
+    uploaded_bytes
+        Size of the uploaded files in bytes.
+    path_on_client
+        Client side path of the file which was uploaded last.
+    """
+
+    total_files: int
+    uploaded_files: int
+    total_bytes: int
+    uploaded_bytes: int
+    path_on_client: str
+
+
+class UploadCache:
+    """Cache of the files uploaded to DPF servers.
+
+    The entries are keyed by the identity of the server, the file name, and
+    the SHA-256 hash of the file content. A file which has been uploaded
+    before is therefore reused instead of transferred again, even if it is
+    located in another folder on the client. Use the same cache for all the
+    uploads of a batch job, for example for the design points of a study.
+
+    If a ``path`` is set, the entries are stored in this file after each
+    upload. A job which is interrupted, for example by a dropped connection,
+    can then be restarted with the same cache file and uploads only the files
+    which are missing. The server cannot append to a partially uploaded file,
+    so a file whose upload was interrupted is uploaded again completely.
+
+    The cache can be used by multiple threads. If several threads request
+    the same files at the same time, the files are uploaded only once and the
+    other threads wait for this upload. The server is identified by its
+    address, its process, and its temporary folder, so the entries of a
+    server which was replaced, for example by a :class:`.ServerPool`, or
+    restarted are not used for a new server on the same port. The cache does
+    not check whether an uploaded file has been deleted on the server in the
+    meantime. Use :meth:`clear` in this case.
+
+    Parameters
+    ----------
+    path
+        JSON file which stores the entries. The entries are kept in memory
+        only if ``None``.
+    """
+
+    def __init__(self, path: _PATH | None = None) -> None:
+        """Create a cache and load the entries of ``path`` if it exists."""
+        self._path = None if path is None else pathlib.Path(path)
+        self._paths_on_server: dict[tuple[str, tuple[tuple[str, str], ...]], list[str]] = {}
+        self._pending_uploads: dict[tuple[str, tuple[tuple[str, str], ...]], Future[list[str]]] = {}
+        self._lock = threading.Lock()
+        if self._path is not None and self._path.is_file():
+            with open(self._path, encoding="utf-8") as cache_file:
+                for entry in json.load(cache_file)["entries"]:
+                    key = (entry["server"], tuple((name, hash) for name, hash in entry["files"]))
+                    self._paths_on_server[key] = list(entry["paths_on_server"])
+
+    def _save(self) -> None:
+        """Write the entries to the cache file. Must be called with the lock held."""
+        if self._path is None:
+            return
+        entries = [
+            {"server": server_key, "files": list(file_keys), "paths_on_server": paths}
+            for (server_key, file_keys), paths in self._paths_on_server.items()
+        ]
+        # Replace the file atomically so that an interrupted job leaves a valid file
+        tmp_path = self._path.with_name(self._path.name + ".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as cache_file:
+            json.dump({"entries": entries}, cache_file)
+        os.replace(tmp_path, self._path)
+
+    @staticmethod
+    def _get_server_key(server: BaseServer) -> str:
+        ip = getattr(server, "ip", None)
+        if ip is not None:
+            # The process ID and the temporary folder distinguish a new server
+            # which reuses the port of a server which was shut down. The
+            # temporary folder is deleted when the server stops, and the
+            # uploaded files are located in it.
+            return (
+                f"{ip}:{getattr(server, 'port', '')}:{server.info['server_process_id']}:"
+                f"{dpf.make_tmp_dir_server(server)}"
+            )
+        return f"{type(server).__name__}:{id(server)}"
+
+    def _get_key(
+        self,
+        paths_on_client: Sequence[_PATH],
+        server: BaseServer,
+        file_hashes: Sequence[str] | None,
+    ) -> tuple[str, tuple[tuple[str, str], ...]]:
+        if file_hashes is None:
+            file_hashes = [_get_file_hash(path) for path in paths_on_client]
+        file_keys = tuple(
+            (pathlib.Path(path).name, file_hash)
+            for path, file_hash in zip(paths_on_client, file_hashes)
+        )
+        return self._get_server_key(server), file_keys
+
+    def _get_or_upload(
+        self,
+        paths_on_client: Sequence[_PATH],
+        server: BaseServer,
+        upload: Callable[[], list[str]],
+        file_hashes: Sequence[str] | None = None,
+    ) -> list[str]:
+        """Get the paths of uploaded files or upload them.
+
+        The hashes of the files are computed if ``file_hashes`` is ``None``.
+        """
+        key = self._get_key(paths_on_client, server, file_hashes)
+        with self._lock:
+            cached_paths = self._paths_on_server.get(key)
+            if cached_paths is not None:
+                return list(cached_paths)
+            pending_upload = self._pending_uploads.get(key)
+            if pending_upload is None:
+                pending_upload = Future()
+                self._pending_uploads[key] = pending_upload
+                is_uploading = True
+            else:
+                is_uploading = False
+
+        if not is_uploading:
+            # Another thread uploads the same files. Its error is raised if it fails.
+            return list(pending_upload.result())
+
+        try:
+            paths_on_server = upload()
+        except BaseException as exc:
+            with self._lock:
+                del self._pending_uploads[key]
+            pending_upload.set_exception(exc)
+            raise
+        with self._lock:
+            self._paths_on_server[key] = list(paths_on_server)
+            del self._pending_uploads[key]
+            self._save()
+        pending_upload.set_result(list(paths_on_server))
+        return paths_on_server
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._paths_on_server.clear()
+            self._save()
+
+    def __len__(self) -> int:
+        """Get the number of entries."""
+        return len(self._paths_on_server)
+
+
+def _map_concurrently(
+    function: Callable[[_S], _T], paths: Sequence[_S], max_workers: int
+) -> list[_T]:
+    if max_workers < 1:
+        raise RuntimeError(f"The number of workers must be positive, got {max_workers}.")
+    if max_workers == 1 or len(paths) <= 1:
+        return [function(path) for path in paths]
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(paths))) as executor:
+        return list(executor.map(function, paths))
+
 
 def _get_all_files_in_folder(directory: _PATH, key: str = "") -> list[_PATH]:
     if not os.path.isdir(directory):
@@ -73,7 +281,71 @@ def _get_path_on_server(path_on_client: _PATH, server: BaseServer) -> str:
     return _get_path_on_server_from_tmpdir(tmp_dir, path_on_client, server, str(uuid.uuid4()))
 
 
-def upload_file_to_unique_tmp_folder(path_on_client: _PATH, server: BaseServer) -> str:
+def _verify_checksum(path_on_server: str, server: BaseServer, expected_hash: str) -> None:
+    """Download an uploaded file and compare its hash with the hash of the client file."""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        # The server can use another path separator than the client
+        file_name = path_on_server.replace("\\", "/").rsplit("/", maxsplit=1)[-1]
+        downloaded_path = os.path.join(tmp_dir, file_name)
+        dpf.download_file(path_on_server, downloaded_path, server=server)
+        if _get_file_hash(downloaded_path) != expected_hash:
+            raise RuntimeError(
+                f"The checksum of the uploaded file {path_on_server} does not match."
+            )
+
+
+def _can_verify_checksum(path_on_client: _PATH) -> bool:
+    """Whether the file is small enough to be downloaded again for the verification."""
+    if os.path.getsize(path_on_client) <= _MAX_VERIFIED_FILE_SIZE:
+        return True
+    warnings.warn(
+        f"The checksum of the uploaded file {path_on_client} is not verified because "
+        f"the file is larger than {_MAX_VERIFIED_FILE_SIZE} bytes.",
+        stacklevel=3,
+    )
+    return False
+
+
+def _upload_file(
+    path_on_client: _PATH,
+    server: BaseServer,
+    max_retries: int = 0,
+    expected_hash: str | None = None,
+) -> str:
+    """Upload a file and verify its checksum if ``expected_hash`` is set.
+
+    The upload request of DPF has no offset, and the server cannot concatenate
+    files. A failed upload is therefore repeated for the complete file.
+    """
+    attempt = 0
+    while True:
+        try:
+            path_on_server = _get_path_on_server(path_on_client, server)
+            uploaded_path = cast(
+                str, dpf.upload_file(path_on_client, path_on_server, server=server)
+            )
+            if uploaded_path == "":
+                raise RuntimeError(
+                    f"Failed to upload file {path_on_client} to server. "
+                    f"Attempted to upload to {path_on_server}."
+                )
+            if expected_hash is not None:
+                _verify_checksum(uploaded_path, server, expected_hash)
+            return uploaded_path
+        except Exception:  # pylint: disable=broad-except
+            if attempt >= max_retries:
+                raise
+            time.sleep(min(_RETRY_INITIAL_DELAY * 2**attempt, _RETRY_MAX_DELAY))
+            attempt += 1
+
+
+def upload_file_to_unique_tmp_folder(
+    path_on_client: _PATH,
+    server: BaseServer,
+    upload_cache: UploadCache | None = None,
+    max_retries: int = 0,
+    verify_checksum: bool = False,
+) -> str:
     """Upload file to a unique temporary folder on the server.
 
     Parameters
@@ -82,19 +354,58 @@ def upload_file_to_unique_tmp_folder(path_on_client: _PATH, server: BaseServer)
         Client side path of the file which should be uploaded to the server.
     server:
         DPF server.
+    upload_cache:
+        Cache of uploaded files. If the file has been uploaded to the server
+        before, the path of the uploaded file is returned instead.
+    max_retries:
+        Number of times a failed upload is repeated, with an increasing delay.
+    verify_checksum:
+        Whether to download the uploaded file and compare its SHA-256 hash with
+        the hash of the client file. A mismatch counts as a failed upload.
+        Note that this doubles the transferred data. Files larger than 1 GiB
+        are not verified, and a warning is issued instead.
     """
-    path_on_server = _get_path_on_server(path_on_client, server)
-    uploaded_path = cast(str, dpf.upload_file(path_on_client, path_on_server, server=server))
-    if uploaded_path == "":
-        raise RuntimeError(
-            f"Failed to upload file {path_on_client} to server. "
-            f"Attempted to upload to {path_on_server}."
-        )
-    return uploaded_path
+    verify_checksum = verify_checksum and _can_verify_checksum(path_on_client)
+    if upload_cache is None:
+        expected_hash = _get_file_hash(path_on_client) if verify_checksum else None
+        return _upload_file(path_on_client, server, max_retries, expected_hash)
+
+    # The hash is computed once for the cache key and the verification
+    file_hash = _get_file_hash(path_on_client)
+
+    def upload() -> list[str]:
+        expected_hash = file_hash if verify_checksum else None
+        return [_upload_file(path_on_client, server, max_retries, expected_hash)]
+
+    return upload_cache._get_or_upload(  # pylint: disable=protected-access
+        [path_on_client], server, upload, [file_hash]
+    )[0]
+
+
+def _upload_files(
+    paths_on_client: Sequence[_PATH], server: BaseServer, max_workers: int
+) -> list[str]:
+    tmp_dir = dpf.make_tmp_dir_server(server)
+    my_uuid = str(uuid.uuid4())
+
+    def upload(file_path: _PATH) -> str:
+        path_on_server = _get_path_on_server_from_tmpdir(tmp_dir, file_path, server, my_uuid)
+        uploaded_path = cast(str, dpf.upload_file(file_path, path_on_server, server=server))
+        if uploaded_path == "":
+            raise RuntimeError(
+                f"Failed to upload file {file_path} to server. "
+                f"Attempted to upload to {path_on_server}."
+            )
+        return uploaded_path
+
+    return _map_concurrently(upload, paths_on_client, max_workers)
 
 
 def upload_files_to_unique_tmp_folder(
-    paths_on_client: list[_PATH], server: BaseServer
+    paths_on_client: list[_PATH],
+    server: BaseServer,
+    max_workers: int = _DEFAULT_MAX_WORKERS,
+    upload_cache: UploadCache | None = None,
 ) -> list[_PATH]:
     """Upload files to the same unique temporary folder on the server.
 
@@ -104,25 +415,72 @@ def upload_files_to_unique_tmp_folder(
         List of files which have to be uploaded to one tmp folder on the server.
     server:
         DPF server.
+    max_workers:
+        Maximum number of files which are uploaded concurrently.
+    upload_cache:
+        Cache of uploaded files. If the same set of files has been uploaded to
+        the server before, the paths of the uploaded files are returned instead.
     """
-    paths_on_server: list[_PATH] = []
-    tmp_dir = dpf.make_tmp_dir_server(server)
-    my_uuid = str(uuid.uuid4())
-    for file_path in paths_on_client:
-        file_path = pathlib.Path(file_path)
-        path_on_server = _get_path_on_server_from_tmpdir(tmp_dir, file_path, server, my_uuid)
-        uploaded_path = cast(str, dpf.upload_file(file_path, path_on_server, server=server))
-        if uploaded_path == "":
-            raise RuntimeError(
-                f"Failed to upload file {file_path} to server. "
-                f"Attempted to upload to {path_on_server}."
-            )
-        paths_on_server.append(uploaded_path)
-    return paths_on_server
+    if upload_cache is None:
+        return list(_upload_files(paths_on_client, server, max_workers))
+    return list(
+        upload_cache._get_or_upload(  # pylint: disable=protected-access
+            paths_on_client, server, lambda: _upload_files(paths_on_client, server, max_workers)
+        )
+    )
+
+
+def _upload_files_to_unique_tmp_folders(
+    paths_on_client: Sequence[_PATH],
+    server: BaseServer,
+    max_workers: int,
+    upload_cache: UploadCache | None,
+    progress: Callable[[UploadProgress], None] | None = None,
+    max_retries: int = 0,
+    verify_checksums: bool = False,
+) -> dict[str, str]:
+    """Upload files concurrently, each to its own temporary folder.
+
+    Returns the paths on the server by client path. Each path is uploaded once.
+    """
+    unique_paths = list(dict.fromkeys(str(path) for path in paths_on_client))
+    file_sizes = {path: os.path.getsize(path) for path in unique_paths}
+    progress_lock = threading.Lock()
+    uploaded = [0, 0]
+
+    def upload(path: str) -> str:
+        path_on_server = upload_file_to_unique_tmp_folder(
+            path, server, upload_cache, max_retries, verify_checksums
+        )
+        if progress is not None:
+            with progress_lock:
+                uploaded[0] += 1
+                uploaded[1] += file_sizes[path]
+                progress(
+                    UploadProgress(
+                        total_files=len(unique_paths),
+                        uploaded_files=uploaded[0],
+                        total_bytes=sum(file_sizes.values()),
+                        uploaded_bytes=uploaded[1],
+                        path_on_client=path,
+                    )
+                )
+        return path_on_server
+
+    # Start with the largest files so that they do not delay the end of the upload
+    paths_by_size = sorted(unique_paths, key=lambda path: -file_sizes[path])
+    paths_on_server = _map_concurrently(upload, paths_by_size, max_workers)
+    return dict(zip(paths_by_size, paths_on_server))
 
 
 def upload_short_fiber_composite_files_to_server(
-    data_files: ShortFiberCompositesFiles, server: BaseServer
+    data_files: ShortFiberCompositesFiles,
+    server: BaseServer,
+    max_workers: int = _DEFAULT_MAX_WORKERS,
+    upload_cache: UploadCache | None = None,
+    progress: Callable[[UploadProgress], None] | None = None,
+    max_retries: int = 0,
+    verify_checksums: bool = False,
 ) -> ShortFiberCompositesFiles:
     """Upload short fiber composites files to server.
 
@@ -130,25 +488,57 @@ def upload_short_fiber_composite_files_to_server(
     ----------
     data_files
     server
+    max_workers
+        Maximum number of files which are uploaded concurrently.
+    upload_cache
+        Cache of uploaded files. Files which have been uploaded to the server
+        before are reused.
+    progress
+        Function which is called after each uploaded file. It can be called
+        from several threads, but not concurrently.
+    max_retries
+        Number of times a failed upload of a file is repeated, with an
+        increasing delay.
+    verify_checksums
+        Whether to download each uploaded file and compare its SHA-256 hash
+        with the hash of the client file. This doubles the transferred data.
+        Files larger than 1 GiB are not verified, and a warning is issued
+        instead.
     """
     # If files are not local, it means they have already been
     # uploaded to the server
     if server.local_server or not data_files.files_are_local:
         return data_files
 
-    def upload(filename: _PATH) -> str:
-        return upload_file_to_unique_tmp_folder(filename, server=server)
+    paths_on_server = _upload_files_to_unique_tmp_folders(
+        [*data_files.rst, data_files.dsdat, data_files.engineering_data],
+        server,
+        max_workers,
+        upload_cache,
+        progress,
+        max_retries,
+        verify_checksums,
+    )
+
+    def get_path_on_server(filename: _PATH) -> str:
+        return paths_on_server[str(filename)]
 
     return ShortFiberCompositesFiles(
-        rst=[upload(filename) for filename in data_files.rst],
-        dsdat=upload(data_files.dsdat),
-        engineering_data=upload(data_files.engineering_data),
+        rst=[get_path_on_server(filename) for filename in data_files.rst],
+        dsdat=get_path_on_server(data_files.dsdat),
+        engineering_data=get_path_on_server(data_files.engineering_data),
         files_are_local=False,
     )
 
 
 def upload_continuous_fiber_composite_files_to_server(
-    data_files: ContinuousFiberCompositesFiles, server: BaseServer
+    data_files: ContinuousFiberCompositesFiles,
+    server: BaseServer,
+    max_workers: int = _DEFAULT_MAX_WORKERS,
+    upload_cache: UploadCache | None = None,
+    progress: Callable[[UploadProgress], None] | None = None,
+    max_retries: int = 0,
+    verify_checksums: bool = False,
 ) -> ContinuousFiberCompositesFiles:
     """Upload continuous fiber composites files to server.
 
@@ -160,22 +550,55 @@ def upload_continuous_fiber_composite_files_to_server(
         All input files such as result files, material file etc.
     server
         A running DPF server (in process or remote).
+    max_workers
+        Maximum number of files which are uploaded concurrently.
+    upload_cache
+        Cache of uploaded files. Files which have been uploaded to the server
+        before are reused, for example the same engineering data file of
+        several design points.
+    progress
+        Function which is called after each uploaded file. It can be called
+        from several threads, but not concurrently.
+    max_retries
+        Number of times a failed upload of a file is repeated, with an
+        increasing delay.
+    verify_checksums
+        Whether to download each uploaded file and compare its SHA-256 hash
+        with the hash of the client file. This doubles the transferred data.
+        Files larger than 1 GiB are not verified, and a warning is issued
+        instead.
     """
     # If files are not local, it means they have already been
     # uploaded to the server
     if server.local_server or not data_files.files_are_local:
         return data_files
 
-    def upload(filename: _PATH) -> _PATH:
-        return upload_file_to_unique_tmp_folder(filename, server=server)
+    single_files: list[_PATH] = [data_files.engineering_data]
+    for composite_files_by_scope in data_files.composite.values():
+        single_files.append(composite_files_by_scope.definition)
+        if composite_files_by_scope.mapping is not None:
+            single_files.append(composite_files_by_scope.mapping)
+    if data_files.solver_input_file:
+        single_files.append(data_files.solver_input_file)
+    if data_files.solver_type != SolverType.LSDYNA:
+        single_files.extend(data_files.result_files)
+
+    paths_on_server = _upload_files_to_unique_tmp_folders(
+        single_files, server, max_workers, upload_cache, progress, max_retries, verify_checksums
+    )
+
+    def get_path_on_server(filename: _PATH) -> _PATH:
+        return paths_on_server[str(filename)]
 
     all_composite_files = {}
     for key, composite_files_by_scope in data_files.composite.items():
         composite_definition_files = CompositeDefinitionFiles(
-            definition=upload(composite_files_by_scope.definition),
+            definition=get_path_on_server(composite_files_by_scope.definition),
         )
         if composite_files_by_scope.mapping is not None:
-            composite_definition_files.mapping = upload(composite_files_by_scope.mapping)
+            composite_definition_files.mapping = get_path_on_server(
+                composite_files_by_scope.mapping
+            )
         all_composite_files[key] = composite_definition_files
 
     rst_file_paths_on_server: list[_PATH] = []
@@ -190,18 +613,22 @@ def upload_continuous_fiber_composite_files_to_server(
         # The LSDyna reader automatically picks up the additional d3plot files and so only the first
         # one is passed to the DPF datasource.
         all_d3plot_paths_on_server = upload_files_to_unique_tmp_folder(
-            all_d3plot_files, server=server
+            all_d3plot_files, server=server, max_workers=max_workers, upload_cache=upload_cache
         )
         rst_file_paths_on_server = [get_d3plot_from_list_of_paths(all_d3plot_paths_on_server)]
     else:
-        rst_file_paths_on_server = [upload(filename) for filename in data_files.result_files]
+        rst_file_paths_on_server = [
+            get_path_on_server(filename) for filename in data_files.result_files
+        ]
 
     return ContinuousFiberCompositesFiles(
         result_files=rst_file_paths_on_server,
-        engineering_data=upload(data_files.engineering_data),
+        engineering_data=get_path_on_server(data_files.engineering_data),
         composite=all_composite_files,
         solver_input_file=(
-            upload(data_files.solver_input_file) if data_files.solver_input_file else None
+            get_path_on_server(data_files.solver_input_file)
+            if data_files.solver_input_file
+            else None
         ),
         files_are_local=False,
         solver_type=data_files.solver_type,
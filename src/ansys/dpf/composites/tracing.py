@@ -0,0 +1,274 @@
+# Copyright (C) 2022 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Timing of the stages of the operator pipelines."""
+
+from collections.abc import Callable, Iterator, Mapping
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+import threading
+import time
+from typing import Any
+
+__all__ = (
+    "Span",
+    "SpanCallback",
+    "StageTimings",
+    "TimingSummary",
+    "add_span_callback",
+    "record_timings",
+    "remove_span_callback",
+)
+
+
+@dataclass(frozen=True)
+class Span:
+    """Provides the timing of a stage of an operator pipeline.
+
+    Parameters
+    ----------
+    name
+        Name of the stage, for example ``"failure_chunk.evaluate"``.
+    start
+        Start time in seconds, as returned by :func:`time.perf_counter`.
+    duration
+        Wall time in seconds.
+    thread_id
+        Identifier of the thread which ran the stage.
+    attributes
+        Additional information about the stage. Chunk stages set ``chunk_index``.
+        Stages which process elements or transfer data to the client set
+        ``number_of_elements`` and ``bytes``.
+    """
+
+    name: str
+    start: float
+    duration: float
+    thread_id: int
+    attributes: Mapping[str, Any]
+
+
+#: Function which is called with each finished :class:`Span`.
+SpanCallback = Callable[[Span], None]
+
+_callbacks_lock = threading.Lock()
+# Replaced instead of modified, so spans can be emitted without the lock
+_callbacks: tuple[SpanCallback, ...] = ()
+# Summaries of the enclosing record_timings blocks. A context variable is used
+# so that a block does not record the spans of other threads. The worker threads
+# of the instrumented functions run in a copy of the context of their caller.
+_active_summaries: ContextVar[tuple["TimingSummary", ...]] = ContextVar(
+    "_active_summaries", default=()
+)
+
+
+def add_span_callback(callback: SpanCallback) -> None:
+    """Register a function which is called with each finished span.
+
+    The function is called in the thread which ran the stage, so it must be
+    thread-safe if the stages run in parallel. Use the callback to forward
+    the spans to a tracing framework such as OpenTelemetry.
+
+    Parameters
+    ----------
+    callback:
+        Function which is called with each finished span.
+    """
+    global _callbacks  # pylint: disable=global-statement
+    with _callbacks_lock:
+        _callbacks = (*_callbacks, callback)
+
+
+def remove_span_callback(callback: SpanCallback) -> None:
+    """Unregister a function registered with :func:`add_span_callback`.
+
+    Parameters
+    ----------
+    callback:
+        Registered function.
+    """
+    global _callbacks  # pylint: disable=global-statement
+    with _callbacks_lock:
+        if callback not in _callbacks:
+            raise RuntimeError("The span callback is not registered.")
+        callbacks = list(_callbacks)
+        callbacks.remove(callback)
+        _callbacks = tuple(callbacks)
+
+
+def _is_tracing() -> bool:
+    """Check whether a callback is registered or timings are recorded.
+
+    Use it to skip the computation of span attributes which are expensive.
+    """
+    return bool(_callbacks) or bool(_active_summaries.get())
+
+
+@contextmanager
+def _span(name: str, **attributes: Any) -> Iterator[dict[str, Any]]:
+    """Time the body of a ``with`` block and emit the span to the callbacks.
+
+    Yields the attributes of the span, so the body can add attributes which
+    are only known at the end of the stage, such as the number of bytes.
+    Does nothing if no callback is registered and no timings are recorded.
+    """
+    callbacks = _callbacks + _active_summaries.get()
+    if not callbacks:
+        yield attributes
+        return
+    start = time.perf_counter()
+    try:
+        yield attributes
+    finally:
+        span = Span(
+            name=name,
+            start=start,
+            duration=time.perf_counter() - start,
+            thread_id=threading.get_ident(),
+            attributes=dict(attributes),
+        )
+        for callback in callbacks:
+            callback(span)
+
+
+@dataclass(frozen=True)
+class StageTimings:
+    """Provides the accumulated timings of a stage.
+
+    Parameters
+    ----------
+    name
+        Name of the stage.
+    count
+        Number of spans of the stage.
+    total_time
+        Sum of the wall times in seconds.
+    max_time
+        Longest wall time in seconds.
+    number_of_elements
+        Sum of the number of elements.
+    bytes
+        Sum of the bytes transferred to the client.
+    """
+
+    name: str
+    count: int
+    total_time: float
+    max_time: float
+    number_of_elements: int
+    bytes: int
+
+    @property
+    def mean_time(self) -> float:
+        """Mean wall time in seconds."""
+        return self.total_time / self.count
+
+
+class TimingSummary:
+    """Span callback which accumulates the timings of each stage.
+
+    Use :func:`record_timings` to record the timings of a block of code.
+    The summary can be shared by multiple threads.
+    """
+
+    def __init__(self) -> None:
+        """Create an empty summary."""
+        self._lock = threading.Lock()
+        self._stages: dict[str, StageTimings] = {}
+
+    def __call__(self, span: Span) -> None:
+        """Add a span to the timings of its stage."""
+        number_of_elements = int(span.attributes.get("number_of_elements", 0))
+        transferred_bytes = int(span.attributes.get("bytes", 0))
+        with self._lock:
+            stage = self._stages.get(span.name)
+            if stage is None:
+                stage = StageTimings(span.name, 0, 0.0, 0.0, 0, 0)
+            self._stages[span.name] = StageTimings(
+                name=span.name,
+                count=stage.count + 1,
+                total_time=stage.total_time + span.duration,
+                max_time=max(stage.max_time, span.duration),
+                number_of_elements=stage.number_of_elements + number_of_elements,
+                bytes=stage.bytes + transferred_bytes,
+            )
+
+    @property
+    def stages(self) -> dict[str, StageTimings]:
+        """Timings by stage name in the order in which the stages finished first."""
+        with self._lock:
+            return dict(self._stages)
+
+    def clear(self) -> None:
+        """Remove all timings."""
+        with self._lock:
+            self._stages.clear()
+
+    def report(self) -> str:
+        """Get a table of the timings sorted by total time."""
+        stages = sorted(self.stages.values(), key=lambda stage: stage.total_time, reverse=True)
+        name_width = max([len("stage"), *[len(stage.name) for stage in stages]])
+        lines = [
+            f"{'stage':<{name_width}} {'count':>7} {'total [s]':>10} {'mean [s]':>10} "
+            f"{'max [s]':>10} {'elements':>10} {'MB':>10}"
+        ]
+        for stage in stages:
+            lines.append(
+                f"{stage.name:<{name_width}} {stage.count:>7} {stage.total_time:>10.4f} "
+                f"{stage.mean_time:>10.4f} {stage.max_time:>10.4f} "
+                f"{stage.number_of_elements:>10} {stage.bytes / 1e6:>10.3f}"
+            )
+        return "\n".join(lines)
+
+    def __str__(self) -> str:
+        """Get the report."""
+        return self.report()
+
+
+@contextmanager
+def record_timings() -> Iterator[TimingSummary]:
+    """Record the timings of the stages which run in a ``with`` block.
+
+    The stages of :meth:`.CompositeModel.evaluate_failure_criteria` and the
+    functions based on it, of :meth:`.CompositeModel.iterate_element_chunks`,
+    and of sampling points are instrumented. The DPF server reads the results and
+    evaluates the failure criteria in a single operator, so this time is reported
+    in the ``failure_chunk.evaluate`` stage.
+
+    Only the stages which run in the current thread, or in the background
+    threads of the instrumented functions called in the block, are recorded.
+    Blocks in other threads record their own timings. Use
+    :func:`add_span_callback` to receive the spans of all threads.
+
+    Examples
+    --------
+    >>> with record_timings() as timings:
+    ...     composite_model.evaluate_failure_criteria(combined_criterion)
+    >>> print(timings.report())
+    """
+    summary = TimingSummary()
+    token = _active_summaries.set((*_active_summaries.get(), summary))
+    try:
+        yield summary
+    finally:
+        _active_summaries.reset(token)
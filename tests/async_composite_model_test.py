@@ -0,0 +1,124 @@
+# Copyright (C) 2022 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import asyncio
+import threading
+
+import numpy as np
+import pytest
+
+from ansys.dpf.composites._async_helpers import _run_in_executor
+from ansys.dpf.composites.composite_model import CompositeModel
+from ansys.dpf.composites.constants import FailureOutput
+from ansys.dpf.composites.failure_criteria import CombinedFailureCriterion, MaxStressCriterion
+from ansys.dpf.composites.layup_info.material_properties import MaterialProperty
+
+from .helper import get_basic_shell_files
+
+
+def test_run_in_executor_sets_cancel_event_on_cancellation():
+    started = threading.Event()
+    received_events = []
+
+    def blocking_function(cancel_event):
+        received_events.append(cancel_event)
+        started.set()
+        # Stands in for a chunk loop which checks the event between chunks
+        cancel_event.wait(timeout=10)
+        return cancel_event.is_set()
+
+    async def cancel_while_running():
+        task = asyncio.create_task(_run_in_executor(blocking_function))
+        await asyncio.get_running_loop().run_in_executor(None, started.wait)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    asyncio.run(cancel_while_running())
+    assert received_events[0].is_set()
+
+
+def test_run_in_executor_returns_result():
+    async def run():
+        return await _run_in_executor(lambda cancel_event: threading.get_ident())
+
+    assert asyncio.run(run()) != threading.get_ident()
+
+
+def test_run_in_executor_serializes_calls_with_lock():
+    lock = threading.Lock()
+    running = []
+    overlaps = []
+    calls = []
+
+    def blocking_function(cancel_event):
+        running.append(threading.get_ident())
+        overlaps.append(len(running) > 1)
+        threading.Event().wait(timeout=0.01)
+        running.pop()
+        calls.append(cancel_event)
+
+    async def run_concurrently():
+        await asyncio.gather(*(_run_in_executor(blocking_function, lock) for _ in range(4)))
+
+        # A call which is cancelled while it waits for the lock is not run
+        with lock:
+            task = asyncio.create_task(_run_in_executor(blocking_function, lock))
+            await asyncio.sleep(0.01)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+    asyncio.run(run_concurrently())
+    assert len(calls) == 4
+    assert not any(overlaps)
+
+
+def test_async_composite_model(dpf_server):
+    composite_model = CompositeModel(get_basic_shell_files(), server=dpf_server)
+    combined_criterion = CombinedFailureCriterion(
+        "max stress", failure_criteria=[MaxStressCriterion()]
+    )
+    expected_irfs = composite_model.evaluate_failure_criteria(combined_criterion).get_field(
+        {"failure_label": FailureOutput.FAILURE_VALUE}
+    )
+
+    async def run_concurrently():
+        return await asyncio.gather(
+            composite_model.aevaluate_failure_criteria(combined_criterion),
+            composite_model.aevaluate_failure_criteria(combined_criterion, max_chunk_size=1),
+            composite_model.aget_sampling_point(combined_criterion, element_id=3),
+            composite_model.aget_constant_property_dict([MaterialProperty.Stress_Limits_Xt]),
+        )
+
+    output, chunked_output, sampling_point, property_dict = asyncio.run(run_concurrently())
+    for failure_output in [output, chunked_output]:
+        irfs = failure_output.get_field({"failure_label": FailureOutput.FAILURE_VALUE})
+        for element_id in expected_irfs.scoping.ids:
+            assert irfs.get_entity_data_by_id(element_id) == pytest.approx(
+                expected_irfs.get_entity_data_by_id(element_id)
+            )
+    assert sampling_point.is_uptodate
+    assert np.max(sampling_point.inverse_reserve_factor) > 0
+    assert property_dict == composite_model.get_constant_property_dict(
+        [MaterialProperty.Stress_Limits_Xt]
+    )
@@ -0,0 +1,151 @@
+# Copyright (C) 2022 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Recording of benchmark timings in a machine-readable format.
+
+The ``perf_benchmark`` fixture in ``conftest.py`` times a function and collects
+the results of the session. The benchmarks are marked with ``perf_benchmark``
+and are skipped unless ``--run-perf-benchmarks`` is given. Run them with::
+
+    pytest tests/benchmark_test.py --run-perf-benchmarks --perf-json=benchmarks.json
+
+and compare them to a previous run with
+``--perf-baseline=baseline.json --perf-tolerance=0.5``. A benchmark
+fails if its median is more than 50 % slower than in the baseline.
+
+The options and the fixture are named differently from the ones of
+pytest-benchmark, so both can be installed at the same time.
+"""
+
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass, field
+import datetime
+import json
+import os
+import pathlib
+import platform
+import statistics
+import sys
+import time
+from typing import Any
+
+import ansys.dpf.core as dpf
+
+PERF_BENCHMARK_MARKER = "perf_benchmark"
+RUN_PERF_BENCHMARKS_OPTION_KEY = "--run-perf-benchmarks"
+PERF_JSON_OPTION_KEY = "--perf-json"
+PERF_BASELINE_OPTION_KEY = "--perf-baseline"
+PERF_TOLERANCE_OPTION_KEY = "--perf-tolerance"
+DEFAULT_BENCHMARK_TOLERANCE = 0.5
+
+
+@dataclass(frozen=True)
+class BenchmarkResult:
+    name: str
+    parameters: Mapping[str, Any]
+    times: list[float]
+
+    @property
+    def median(self) -> float:
+        return statistics.median(self.times)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "name": self.name,
+            "parameters": dict(self.parameters),
+            "rounds": len(self.times),
+            "min": min(self.times),
+            "max": max(self.times),
+            "mean": statistics.fmean(self.times),
+            "median": self.median,
+            "stddev": statistics.stdev(self.times) if len(self.times) > 1 else 0.0,
+            "times": self.times,
+        }
+
+
+@dataclass
+class BenchmarkSession:
+    baseline: Mapping[str, float] = field(default_factory=dict)
+    tolerance: float = DEFAULT_BENCHMARK_TOLERANCE
+    results: list[BenchmarkResult] = field(default_factory=list)
+    server_version: str | None = None
+
+    def write_json(self, path: pathlib.Path) -> None:
+        data = {
+            "datetime": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+            "machine_info": {
+                "python": sys.version,
+                "platform": platform.platform(),
+                "cpu_count": os.cpu_count(),
+                "ansys_dpf_core": dpf.__version__,
+                "dpf_server": self.server_version,
+            },
+            "benchmarks": [result.to_dict() for result in self.results],
+        }
+        path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+
+
+def load_baseline(path: pathlib.Path) -> dict[str, float]:
+    """Get the median time by benchmark name of a previous run."""
+    data = json.loads(path.read_text(encoding="utf-8"))
+    return {benchmark["name"]: benchmark["median"] for benchmark in data["benchmarks"]}
+
+
+class Benchmark:
+    """Times a function and records the result in the benchmark session.
+
+    The name of a result is the ID of the test followed by the label, so
+    results of parametrized tests can be compared across runs.
+    """
+
+    def __init__(self, session: BenchmarkSession, test_id: str):
+        self._session = session
+        self._test_id = test_id
+
+    def __call__(
+        self,
+        label: str,
+        function: Callable[[], Any],
+        rounds: int = 3,
+        warmup_rounds: int = 1,
+        **parameters: Any,
+    ) -> Any:
+        for _ in range(warmup_rounds):
+            function()
+        times = []
+        for _ in range(rounds):
+            start = time.perf_counter()
+            result = function()
+            times.append(time.perf_counter() - start)
+
+        benchmark_result = BenchmarkResult(f"{self._test_id}::{label}", parameters, times)
+        self._session.results.append(benchmark_result)
+
+        baseline_median = self._session.baseline.get(benchmark_result.name)
+        if baseline_median is not None:
+            limit = baseline_median * (1.0 + self._session.tolerance)
+            assert benchmark_result.median <= limit, (
+                f"Benchmark {benchmark_result.name} regressed: median of "
+                f"{benchmark_result.median:.4f} s exceeds {limit:.4f} s "
+                f"(baseline {baseline_median:.4f} s)."
+            )
+        return result
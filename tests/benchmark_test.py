@@ -0,0 +1,232 @@
+# Copyright (C) 2022 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Benchmarks of the lay-up information and the failure evaluation.
+
+The benchmarks are skipped unless ``--run-perf-benchmarks`` is given. The
+element information and the index selection are benchmarked on synthetic
+models of increasing size to show how the runtime grows with the model size.
+The lay-up properties, the solid stacks and the failure evaluation need a
+lay-up provider or result files, so they run on the test models. See
+``benchmark.py`` for how to write and compare the results.
+"""
+
+import os
+import pathlib
+
+import pytest
+
+from ansys.dpf.composites._indexer import get_field_indexer
+from ansys.dpf.composites.composite_model import CompositeModel
+from ansys.dpf.composites.composite_scope import CompositeScope
+from ansys.dpf.composites.constants import Spot
+from ansys.dpf.composites.data_sources import (
+    CompositeDefinitionFiles,
+    ContinuousFiberCompositesFiles,
+    get_composite_files_from_workbench_result_folder,
+)
+from ansys.dpf.composites.failure_criteria import (
+    CombinedFailureCriterion,
+    MaxStrainCriterion,
+    MaxStressCriterion,
+)
+from ansys.dpf.composites.layup_info import LayupPropertiesProvider, SolidStackProvider
+from ansys.dpf.composites.select_indices import get_selected_indices
+from ansys.dpf.composites.server_helpers import version_older_than
+
+from .benchmark import Benchmark, BenchmarkSession, load_baseline
+from .helper import get_basic_shell_files
+from .synthetic_model import create_synthetic_layered_model
+
+TEST_DATA_ROOT_DIR = pathlib.Path(__file__).parent / "data"
+# Sizes of the synthetic models. Extend the list up to 10**7 for scale tests
+# on a machine with enough memory.
+SYNTHETIC_MODEL_SIZES = [10**4, 10**5]
+
+
+def get_solid_model_files() -> ContinuousFiberCompositesFiles:
+    solid_model_dir = TEST_DATA_ROOT_DIR / "solid_model"
+    return ContinuousFiberCompositesFiles(
+        result_files=os.path.join(solid_model_dir, "file.rst"),
+        composite={
+            "shell": CompositeDefinitionFiles(
+                definition=os.path.join(solid_model_dir, "ACPSolidModel_SolidModel.1.h5")
+            )
+        },
+        engineering_data=os.path.join(solid_model_dir, "material.engd"),
+    )
+
+
+def get_assembly_files() -> ContinuousFiberCompositesFiles:
+    return get_composite_files_from_workbench_result_folder(
+        TEST_DATA_ROOT_DIR / "workflow_example" / "assembly"
+    )
+
+
+MODELS = {
+    "shell": get_basic_shell_files,
+    "solid": get_solid_model_files,
+    "assembly": get_assembly_files,
+}
+
+
+def get_combined_criterion() -> CombinedFailureCriterion:
+    return CombinedFailureCriterion(
+        "max strain & max stress",
+        failure_criteria=[MaxStrainCriterion(), MaxStressCriterion()],
+    )
+
+
+@pytest.fixture(scope="module")
+def shell_model(dpf_server):
+    return CompositeModel(get_basic_shell_files(), server=dpf_server)
+
+
+@pytest.mark.perf_benchmark
+def test_benchmark_layup_properties(dpf_server, perf_benchmark, shell_model):
+    element_ids = shell_model.get_mesh().elements.scoping.ids
+    layup_properties_provider = perf_benchmark(
+        "create_provider",
+        lambda: LayupPropertiesProvider(
+            layup_provider=shell_model.get_layup_operator(), mesh=shell_model.get_mesh()
+        ),
+    )
+
+    def get_layup_properties():
+        for element_id in element_ids:
+            layup_properties_provider.get_layer_thicknesses(element_id)
+            layup_properties_provider.get_layer_angles(element_id)
+            layup_properties_provider.get_element_laminate_offset(element_id)
+            layup_properties_provider.get_analysis_plies(element_id)
+
+    perf_benchmark(
+        "get_layup_properties", get_layup_properties, number_of_elements=len(element_ids)
+    )
+
+
+@pytest.mark.perf_benchmark
+def test_benchmark_solid_stacks(dpf_server, perf_benchmark):
+    if version_older_than(dpf_server, "10.0"):
+        pytest.skip("Solid stack feature requires DPF server 10.0 or later.")
+    composite_model = CompositeModel(get_solid_model_files(), server=dpf_server)
+    element_ids = composite_model.get_mesh().elements.scoping.ids
+
+    def get_solid_stacks():
+        solid_stack_provider = SolidStackProvider(
+            composite_model.get_mesh(), composite_model.get_layup_operator()
+        )
+        return [solid_stack_provider.get_solid_stack(element_id) for element_id in element_ids]
+
+    solid_stacks = perf_benchmark(
+        "get_solid_stack", get_solid_stacks, number_of_elements=len(element_ids)
+    )
+    assert len(solid_stacks) == len(element_ids)
+
+
+@pytest.mark.perf_benchmark
+@pytest.mark.parametrize("number_of_elements", SYNTHETIC_MODEL_SIZES)
+def test_benchmark_synthetic_model(dpf_server, perf_benchmark, number_of_elements):
+    model = perf_benchmark(
+        "create_model",
+        lambda: create_synthetic_layered_model(number_of_elements, server=dpf_server),
+        rounds=1,
+        warmup_rounds=0,
+        number_of_elements=number_of_elements,
+    )
+    element_ids = model.element_ids.tolist()
+
+    def get_element_infos():
+        element_info_provider = model.get_element_info_provider(no_bounds_checks=True)
+        return [element_info_provider.get_element_info(element_id) for element_id in element_ids]
+
+    element_infos = perf_benchmark(
+        "get_element_info", get_element_infos, number_of_elements=number_of_elements
+    )
+
+    def get_top_stresses():
+        stress_indexer = get_field_indexer(model.stress)
+        return [
+            stress_indexer.by_id_as_array(element_info.id)[
+                get_selected_indices(element_info, spots=[Spot.TOP])
+            ]
+            for element_info in element_infos
+        ]
+
+    top_stresses = perf_benchmark(
+        "get_selected_indices", get_top_stresses, number_of_elements=number_of_elements
+    )
+    assert len(top_stresses) == number_of_elements
+
+
+@pytest.mark.perf_benchmark
+@pytest.mark.parametrize("number_of_sampling_points", [1, 5])
+def test_benchmark_sampling_points(
+    dpf_server, perf_benchmark, shell_model, number_of_sampling_points
+):
+    combined_criterion = get_combined_criterion()
+    element_ids = [
+        int(element_id)
+        for element_id in shell_model.get_mesh().elements.scoping.ids[:number_of_sampling_points]
+    ]
+
+    def evaluate_sampling_points():
+        return [
+            shell_model.get_sampling_point(combined_criterion, element_id).results
+            for element_id in element_ids
+        ]
+
+    results = perf_benchmark(
+        "sampling_point",
+        evaluate_sampling_points,
+        number_of_sampling_points=len(element_ids),
+    )
+    assert len(results) == len(element_ids)
+
+
+@pytest.mark.perf_benchmark
+@pytest.mark.parametrize("model_name", MODELS)
+def test_benchmark_evaluate_failure_criteria(dpf_server, perf_benchmark, model_name):
+    composite_model = CompositeModel(MODELS[model_name](), server=dpf_server)
+    combined_criterion = get_combined_criterion()
+    number_of_elements = len(composite_model.get_mesh().elements.scoping.ids)
+
+    failure_output = perf_benchmark(
+        "evaluate_failure_criteria",
+        lambda: composite_model.evaluate_failure_criteria(
+            combined_criterion, composite_scope=CompositeScope()
+        ),
+        number_of_elements=number_of_elements,
+    )
+    assert len(failure_output) > 0
+
+
+def test_benchmark_baseline(tmp_path):
+    session = BenchmarkSession()
+    Benchmark(session, "test")("label", lambda: 1, rounds=2, size=1)
+    session.write_json(tmp_path / "baseline.json")
+
+    baseline = load_baseline(tmp_path / "baseline.json")
+    assert list(baseline) == ["test::label"]
+
+    regression_check = Benchmark(BenchmarkSession(baseline={"test::label": 0.0}), "test")
+    with pytest.raises(AssertionError, match="regressed"):
+        regression_check("label", lambda: sum(range(1000)), rounds=1)
@@ -23,6 +23,7 @@
 import pathlib
 
 from ansys.dpf.core import unit_systems
+import numpy as np
 import pytest
 
 from ansys.dpf.composites.composite_model import CompositeModel, CompositeScope
@@ -47,7 +48,7 @@ from ansys.dpf.composites.layup_info.material_properties import MaterialMetadata
 from ansys.dpf.composites.result_definition import FailureMeasureEnum
 from ansys.dpf.composites.server_helpers import version_equal_or_later, version_older_than
 
-from .helper import Timer
+from .helper import Timer, get_basic_shell_files
 
 SEPARATOR = "::"
 
@@ -110,6 +111,12 @@ def test_basic_functionality_of_composite_model(dpf_server, data_files, distribu
     ]
     assert composite_model.get_analysis_plies(element_id) == analysis_ply_ids
 
+    layer_angles = composite_model.get_property_for_elements(LayerProperty.ANGLES, [element_id])
+    assert layer_angles.values == pytest.approx(expected_values[LayerProperty.ANGLES])
+    assert composite_model.get_number_of_layers([element_id]) == pytest.approx([6])
+    assert composite_model.get_laminate_thicknesses([element_id]) == pytest.approx([0.0061])
+    assert composite_model.get_element_laminate_offsets([element_id]) == pytest.approx([-0.00305])
+
     assert composite_model.core_model is not None
     assert composite_model.get_mesh() is not None
     assert composite_model.data_sources is not None
@@ -229,6 +236,33 @@ def test_model_with_multiple_timesteps(dpf_server):
             check_field_size(FailureOutput.MAX_SOLID_ELEMENT_ID)
 
 
+def test_analysis_ply_incidence(dpf_server):
+    pytest.importorskip("scipy")
+    if version_older_than(dpf_server, "7.0"):
+        pytest.xfail("The analysis ply incidence matrix requires DPF server 7.0 or later.")
+
+    composite_model = CompositeModel(get_basic_shell_files(), server=dpf_server)
+    incidence = composite_model.get_analysis_ply_incidence()
+
+    assert incidence is composite_model.get_analysis_ply_incidence()
+    assert sorted(incidence.analysis_ply_names) == sorted(
+        get_all_analysis_ply_names(composite_model.get_mesh())
+    )
+    assert incidence.matrix.shape == (4, 6)
+
+    assert sorted(incidence.get_element_ids(["P1L1__ud_patch ns1"])) == [1, 2]
+    assert sorted(incidence.get_element_ids(["P1L1__core", "P1L1__ud_patch ns1"])) == [1, 2, 3, 4]
+
+    element_ids, layer_indices = incidence.get_layer_indices("P1L1__core")
+    for element_id, layer_index in zip(element_ids, layer_indices):
+        assert composite_model.get_analysis_plies(element_id)[layer_index] == "P1L1__core"
+
+    # Number of layers per element is the number of non-zero entries per row
+    assert list(np.diff(incidence.matrix.tocsr().indptr)) == list(
+        composite_model.get_number_of_layers(incidence.element_ids)
+    )
+
+
 _MAX_RESERVE_FACTOR = 1000.0
 
 
@@ -44,6 +44,17 @@ from ansys.dpf.composites.server_helpers._connect_to_or_start_server import (
 from ansys.dpf.composites.server_helpers._load_plugin import load_composites_plugin
 from ansys.dpf.composites.server_helpers._versions import version_equal_or_later
 
+from .benchmark import (
+    DEFAULT_BENCHMARK_TOLERANCE,
+    PERF_BASELINE_OPTION_KEY,
+    PERF_BENCHMARK_MARKER,
+    PERF_JSON_OPTION_KEY,
+    PERF_TOLERANCE_OPTION_KEY,
+    RUN_PERF_BENCHMARKS_OPTION_KEY,
+    Benchmark,
+    BenchmarkSession,
+    load_baseline,
+)
 from .helper import get_dummy_data_files
 
 TEST_ROOT_DIR = pathlib.Path(__file__).parent
@@ -88,6 +99,78 @@ def pytest_addoption(parser: pytest.Parser) -> None:
         help="Tag of pydpf-composites container to start for the tests. Default is 'latest'.",
     )
 
+    parser.addoption(
+        RUN_PERF_BENCHMARKS_OPTION_KEY,
+        action="store_true",
+        default=False,
+        help=f"Run the benchmarks marked with '{PERF_BENCHMARK_MARKER}'. They are skipped "
+        "by default.",
+    )
+
+    parser.addoption(
+        PERF_JSON_OPTION_KEY,
+        action="store",
+        help="Path of a JSON file to which the benchmark results are written.",
+    )
+
+    parser.addoption(
+        PERF_BASELINE_OPTION_KEY,
+        action="store",
+        help="JSON file of a previous benchmark run. Benchmarks which are slower than "
+        "the baseline by more than the tolerance fail.",
+    )
+
+    parser.addoption(
+        PERF_TOLERANCE_OPTION_KEY,
+        action="store",
+        type=float,
+        default=DEFAULT_BENCHMARK_TOLERANCE,
+        help="Allowed relative slowdown of the median compared to the baseline. "
+        f"Default is {DEFAULT_BENCHMARK_TOLERANCE}.",
+    )
+
+
+BENCHMARK_SESSION_KEY = pytest.StashKey[BenchmarkSession]()
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    config.addinivalue_line(
+        "markers",
+        f"{PERF_BENCHMARK_MARKER}: benchmark which only runs with {RUN_PERF_BENCHMARKS_OPTION_KEY}",
+    )
+    baseline_path = config.getoption(PERF_BASELINE_OPTION_KEY)
+    config.stash[BENCHMARK_SESSION_KEY] = BenchmarkSession(
+        baseline=load_baseline(pathlib.Path(baseline_path)) if baseline_path else {},
+        tolerance=config.getoption(PERF_TOLERANCE_OPTION_KEY),
+    )
+
+
+def pytest_collection_modifyitems(config: pytest.Config, items: list[pytest.Item]) -> None:
+    if config.getoption(RUN_PERF_BENCHMARKS_OPTION_KEY):
+        return
+    skip_benchmark = pytest.mark.skip(
+        reason=f"Benchmarks only run with {RUN_PERF_BENCHMARKS_OPTION_KEY}."
+    )
+    for item in items:
+        if PERF_BENCHMARK_MARKER in item.keywords:
+            item.add_marker(skip_benchmark)
+
+
+def pytest_sessionfinish(session: pytest.Session) -> None:
+    json_path = session.config.getoption(PERF_JSON_OPTION_KEY)
+    benchmark_session = session.config.stash.get(BENCHMARK_SESSION_KEY, None)
+    if json_path and benchmark_session is not None:
+        benchmark_session.write_json(pathlib.Path(json_path))
+
+
+@pytest.fixture
+def perf_benchmark(request: pytest.FixtureRequest) -> Benchmark:
+    """Fixture which times functions and records the results of the session."""
+    benchmark_session = request.config.stash[BENCHMARK_SESSION_KEY]
+    if "dpf_server" in request.fixturenames:
+        benchmark_session.server_version = request.getfixturevalue("dpf_server").version
+    return Benchmark(benchmark_session, request.node.nodeid)
+
 
 ServerContext = namedtuple("ServerContext", ["port", "platform", "server"])
 
@@ -347,7 +430,6 @@ def distributed_rst(request, dpf_server):
 
 @pytest.fixture
 def data_files(distributed_rst):
-    # Using lightweight data for unit tests. Replace by get_ger_data_data_files
-    # for actual performance tests
-    # return get_ger_data_files()
+    # Using lightweight data for unit tests. See benchmark_test.py for
+    # performance tests with large synthetic models.
     return get_dummy_data_files(distributed=distributed_rst)
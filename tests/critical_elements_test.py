@@ -0,0 +1,88 @@
+# Copyright (C) 2022 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import numpy as np
+import pytest
+
+from ansys.dpf.composites.composite_model import CompositeModel
+from ansys.dpf.composites.constants import FailureOutput
+from ansys.dpf.composites.critical_elements import _get_top_k_indices
+from ansys.dpf.composites.failure_criteria import CombinedFailureCriterion, MaxStressCriterion
+from ansys.dpf.composites.result_definition import FailureMeasureEnum
+
+from .helper import get_basic_shell_files
+
+
+def test_get_top_k_indices():
+    values = np.array([0.5, 2.0, 1.0, 2.0, np.nan, 0.1])
+    element_ids = np.array([6, 5, 4, 3, 2, 1], dtype=np.int64)
+
+    # Ties are ordered by element ID, NaN is never critical
+    assert list(_get_top_k_indices(values, element_ids, 3, largest=True)) == [3, 1, 2]
+    assert list(_get_top_k_indices(values, element_ids, 2, largest=False)) == [5, 0]
+    assert list(_get_top_k_indices(values, element_ids, 10, largest=True)) == [3, 1, 2, 0, 5, 4]
+
+    rng = np.random.default_rng(1)
+    values = rng.random(1000)
+    element_ids = np.arange(1000, dtype=np.int64)
+    chunks = np.array_split(np.arange(1000), 7)
+    candidates = np.concatenate(
+        [chunk[_get_top_k_indices(values[chunk], element_ids[chunk], 5, True)] for chunk in chunks]
+    )
+    top = candidates[_get_top_k_indices(values[candidates], element_ids[candidates], 5, True)]
+    assert list(top) == list(np.argsort(-values)[:5])
+
+
+@pytest.mark.parametrize(
+    "measure", [FailureMeasureEnum.INVERSE_RESERVE_FACTOR, FailureMeasureEnum.RESERVE_FACTOR]
+)
+def test_get_most_critical(dpf_server, measure):
+    composite_model = CompositeModel(get_basic_shell_files(), server=dpf_server)
+    combined_criterion = CombinedFailureCriterion(
+        "max stress", failure_criteria=[MaxStressCriterion()]
+    )
+    failure_container = composite_model.evaluate_failure_criteria(
+        combined_criterion, measure=measure
+    )
+    value_field = failure_container.get_field({"failure_label": FailureOutput.FAILURE_VALUE})
+    mode_field = failure_container.get_field({"failure_label": FailureOutput.FAILURE_MODE})
+    sign = -1 if measure == FailureMeasureEnum.INVERSE_RESERVE_FACTOR else 1
+    expected_ids = np.array(value_field.scoping.ids)[
+        np.lexsort((value_field.scoping.ids, sign * value_field.data))
+    ][:3]
+
+    critical = composite_model.get_most_critical(
+        3, combined_criterion, measure=measure, max_chunk_size=1
+    )
+
+    assert len(critical) == 3
+    assert list(critical.element_ids) == list(expected_ids)
+    for index, element_id in enumerate(critical.element_ids):
+        assert critical.failure_values[index] == pytest.approx(
+            value_field.get_entity_data_by_id(element_id)[0]
+        )
+        assert critical.failure_modes[index] == int(mode_field.get_entity_data_by_id(element_id)[0])
+        analysis_plies = composite_model.get_analysis_plies(element_id)
+        assert critical.analysis_ply_names[index] in analysis_plies
+    assert critical.times == pytest.approx(
+        [composite_model.get_result_times_or_frequencies()[-1]] * 3
+    )
@@ -0,0 +1,99 @@
+# Copyright (C) 2022 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import pathlib
+import shutil
+
+import pytest
+
+from ansys.dpf.composites.design_point_study import (
+    find_design_points,
+    get_composite_input_hash,
+    run_design_point_study,
+)
+from ansys.dpf.composites.failure_criteria import CombinedFailureCriterion, MaxStressCriterion
+from ansys.dpf.composites.server_helpers import ServerPool
+
+TEST_DATA_DIR = pathlib.Path(__file__).parent / "data" / "workflow_example" / "shell"
+
+
+def _create_project(project_folder, number_of_design_points):
+    for index in range(number_of_design_points):
+        shutil.copytree(TEST_DATA_DIR, project_folder / f"dp{index}" / "SYS" / "MECH")
+
+
+def test_find_design_points(tmp_path):
+    _create_project(tmp_path, 11)
+    # Folders without results are ignored
+    (tmp_path / "dp11").mkdir()
+    (tmp_path / "user_files").mkdir()
+    with open(tmp_path / "dp1" / "SYS" / "MECH" / "MatML.xml", "a") as matml_file:
+        matml_file.write("\n")
+
+    design_points = find_design_points(tmp_path)
+
+    assert [design_point.name for design_point in design_points] == [
+        f"dp{index}" for index in range(11)
+    ]
+    assert design_points[0].input_hash == design_points[2].input_hash
+    assert design_points[0].input_hash != design_points[1].input_hash
+    assert design_points[0].input_hash == get_composite_input_hash(design_points[0].composite_files)
+
+    with pytest.raises(RuntimeError, match="No design point folders"):
+        find_design_points(tmp_path / "user_files")
+
+
+def test_run_design_point_study(dpf_server, tmp_path):
+    _create_project(tmp_path, 3)
+    design_points = find_design_points(tmp_path)
+    combined_criterion = CombinedFailureCriterion(
+        "max stress", failure_criteria=[MaxStressCriterion()]
+    )
+
+    results = run_design_point_study(design_points, combined_criterion, servers=[dpf_server])
+
+    assert len(results) == 3
+    assert list(results.columns["design_point"]) == ["dp0", "dp1", "dp2"]
+    # The design points are identical
+    assert len(set(results.columns["element_id"])) == 1
+    assert len(set(results.columns["failure_value"])) == 1
+    assert results.columns["failure_value"][0] > 0
+
+
+def test_run_design_point_study_with_server_pool(dpf_server, tmp_path):
+    _create_project(tmp_path, 2)
+    design_points = find_design_points(tmp_path)
+    combined_criterion = CombinedFailureCriterion(
+        "max stress", failure_criteria=[MaxStressCriterion()]
+    )
+
+    # The server is borrowed from the pool for each design point. The pool is
+    # not closed because this would shut down the server of the test session.
+    pool = ServerPool(1, start_server=lambda: dpf_server)
+    results = run_design_point_study(design_points, combined_criterion, server_pool=pool)
+    assert pool.servers == [dpf_server]
+
+    assert list(results.columns["design_point"]) == ["dp0", "dp1"]
+    with pytest.raises(RuntimeError, match="not both"):
+        run_design_point_study(
+            design_points, combined_criterion, servers=[dpf_server], server_pool=pool
+        )
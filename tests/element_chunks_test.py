@@ -0,0 +1,94 @@
+# Copyright (C) 2022 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import threading
+
+import numpy as np
+import pytest
+
+from ansys.dpf.composites.composite_model import CompositeModel
+from ansys.dpf.composites.constants import ResultType
+from ansys.dpf.composites.element_chunks import _prefetch
+
+from .helper import get_basic_shell_files
+
+
+def test_prefetch():
+    threads = set()
+    second_item_evaluated = threading.Event()
+
+    def items():
+        for index in range(3):
+            threads.add(threading.get_ident())
+            if index == 1:
+                second_item_evaluated.set()
+            yield index
+
+    prefetched_items = _prefetch(items())
+    assert next(prefetched_items) == 0
+    # The next item is evaluated in the background
+    assert second_item_evaluated.wait(timeout=10)
+    assert list(prefetched_items) == [1, 2]
+    assert len(threads) == 1
+    assert threading.get_ident() not in threads
+
+
+def test_prefetch_propagates_exceptions():
+    def items():
+        yield 0
+        raise ValueError("Failed to read chunk")
+
+    prefetched_items = _prefetch(items())
+    assert next(prefetched_items) == 0
+    with pytest.raises(ValueError, match="Failed to read chunk"):
+        next(prefetched_items)
+
+
+@pytest.mark.parametrize("prefetch", [True, False])
+def test_iterate_element_chunks(dpf_server, prefetch):
+    composite_model = CompositeModel(get_basic_shell_files(), server=dpf_server)
+    stresses = composite_model.get_result(ResultType.STRESS)[0]
+
+    chunks = list(composite_model.iterate_element_chunks(max_chunk_size=2, prefetch=prefetch))
+    assert len(chunks) == 2
+    assert [chunk.index for chunk in chunks] == [0, 1]
+    assert sorted(np.concatenate([chunk.element_ids for chunk in chunks])) == [1, 2, 3, 4]
+
+    for chunk in chunks:
+        assert chunk.stresses.shape == chunk.strains.shape
+        assert chunk.indptr[-1] == len(chunk.stresses)
+        for index, element_id in enumerate(chunk.element_ids):
+            element_info = chunk.element_info_columns.get_element_info(index)
+            assert element_info.id == element_id
+            assert chunk.stresses[chunk.indptr[index] : chunk.indptr[index + 1]] == pytest.approx(
+                stresses.get_entity_data_by_id(element_id)
+            )
+
+    chunks = list(
+        composite_model.iterate_element_chunks(
+            result_types=[ResultType.ELASTIC_STRAIN], element_ids=[2, 3]
+        )
+    )
+    assert len(chunks) == 1
+    assert sorted(chunks[0].element_ids) == [2, 3]
+    with pytest.raises(RuntimeError, match="does not contain the result stress"):
+        chunks[0].stresses
@@ -0,0 +1,123 @@
+# Copyright (C) 2022 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import numpy as np
+import pytest
+
+from ansys.dpf.composites.composite_model import CompositeModel
+from ansys.dpf.composites.constants import FailureOutput
+from ansys.dpf.composites.failure_criteria import CombinedFailureCriterion, MaxStressCriterion
+from ansys.dpf.composites.failure_export import (
+    ELEMENT_TABLE_NAME,
+    REFERENCE_SURFACE_TABLE_NAME,
+    ExportFormat,
+    FailureTableWriter,
+    get_export_format,
+)
+
+from .helper import get_basic_shell_files
+
+
+def _get_chunks():
+    return [
+        {
+            "element_id": np.array([1, 2], dtype=np.int64),
+            "time": np.array([1.0, 1.0]),
+            "failure_value": np.array([0.5, 1.5]),
+        },
+        {
+            "element_id": np.array([3], dtype=np.int64),
+            "time": np.array([1.0]),
+            "failure_value": np.array([2.5]),
+        },
+    ]
+
+
+def _read_table(path, file_format, table_name):
+    if file_format == ExportFormat.HDF5:
+        h5py = pytest.importorskip("h5py")
+        with h5py.File(path, "r") as file:
+            return {name: dataset[()] for name, dataset in file[table_name].items()}
+    if file_format == ExportFormat.PARQUET:
+        parquet = pytest.importorskip("pyarrow.parquet")
+        return parquet.read_table(path).to_pydict()
+    ipc = pytest.importorskip("pyarrow.ipc")
+    return ipc.open_file(path).read_all().to_pydict()
+
+
+def test_get_export_format():
+    assert get_export_format("result.parquet") == ExportFormat.PARQUET
+    assert get_export_format("result.Feather") == ExportFormat.ARROW
+    assert get_export_format("result.h5") == ExportFormat.HDF5
+    with pytest.raises(RuntimeError, match="Cannot determine the export format"):
+        get_export_format("result.csv")
+
+
+@pytest.mark.parametrize(
+    "file_name,module",
+    [("result.parquet", "pyarrow"), ("result.arrow", "pyarrow"), ("result.h5", "h5py")],
+)
+def test_failure_table_writer_appends_chunks(tmp_path, file_name, module):
+    pytest.importorskip(module)
+    path = tmp_path / file_name
+    with FailureTableWriter(path, metadata={"failure_measure": "inverse_reserve_factor"}) as writer:
+        for chunk in _get_chunks():
+            writer.write_columns(ELEMENT_TABLE_NAME, chunk)
+            writer.write_columns(REFERENCE_SURFACE_TABLE_NAME, chunk)
+
+    result = writer.result
+    assert result.number_of_rows == {ELEMENT_TABLE_NAME: 3, REFERENCE_SURFACE_TABLE_NAME: 3}
+    assert result.table_paths[ELEMENT_TABLE_NAME] == path
+    file_format = get_export_format(path)
+    for table_name, table_path in result.table_paths.items():
+        table = _read_table(table_path, file_format, table_name)
+        assert list(table["element_id"]) == [1, 2, 3]
+        assert list(table["failure_value"]) == pytest.approx([0.5, 1.5, 2.5])
+
+
+def test_export_failure_criteria(dpf_server, tmp_path):
+    pytest.importorskip("pyarrow")
+    composite_model = CompositeModel(get_basic_shell_files(), server=dpf_server)
+    combined_criterion = CombinedFailureCriterion(
+        "max stress", failure_criteria=[MaxStressCriterion()]
+    )
+    failure_container = composite_model.evaluate_failure_criteria(combined_criterion)
+
+    result = composite_model.export_failure_criteria(
+        tmp_path / "failure.parquet", combined_criterion, max_chunk_size=2
+    )
+    table = _read_table(
+        result.table_paths[ELEMENT_TABLE_NAME], ExportFormat.PARQUET, ELEMENT_TABLE_NAME
+    )
+
+    irf_field = failure_container.get_field({"failure_label": FailureOutput.FAILURE_VALUE})
+    mode_field = failure_container.get_field({"failure_label": FailureOutput.FAILURE_MODE})
+    assert sorted(table["element_id"]) == sorted(irf_field.scoping.ids)
+    assert table["time"] == pytest.approx(
+        [composite_model.get_result_times_or_frequencies()[-1]] * len(table["element_id"])
+    )
+    for element_id, value, mode in zip(
+        table["element_id"], table["failure_value"], table["failure_mode"]
+    ):
+        assert value == pytest.approx(irf_field.get_entity_data_by_id(element_id)[0])
+        assert mode == int(mode_field.get_entity_data_by_id(element_id)[0])
+    assert result.number_of_rows[ELEMENT_TABLE_NAME] == len(irf_field.scoping.ids)
@@ -0,0 +1,122 @@
+# Copyright (C) 2022 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import numpy as np
+import pytest
+
+from ansys.dpf.composites.composite_model import CompositeModel
+from ansys.dpf.composites.constants import FailureOutput
+from ansys.dpf.composites.failure_criteria import CombinedFailureCriterion, MaxStressCriterion
+from ansys.dpf.composites.failure_statistics import StreamingHistogram, _update_grouped_histograms
+
+from .helper import get_basic_shell_files
+
+
+def test_streaming_histogram():
+    rng = np.random.default_rng(3)
+    values = rng.random(10000) * 1.2
+    bin_edges = np.linspace(0.0, 1.0, 101)
+
+    histogram = StreamingHistogram(bin_edges)
+    for chunk in np.array_split(values, 13):
+        histogram.update(chunk)
+    histogram.update([np.nan])
+
+    counts, _ = np.histogram(values[values <= 1.0], bins=bin_edges)
+    np.testing.assert_array_equal(histogram.counts, counts)
+    assert histogram.overflow == np.count_nonzero(values > 1.0)
+    assert histogram.underflow == 0
+    assert histogram.count == len(values)
+    assert histogram.minimum == pytest.approx(np.min(values))
+    assert histogram.maximum == pytest.approx(np.max(values))
+    assert histogram.mean == pytest.approx(np.mean(values))
+    # The error of quantiles within the bins is bounded by the bin width
+    assert histogram.quantile(0.5) == pytest.approx(np.quantile(values, 0.5), abs=0.01)
+    assert histogram.quantile(0.0) == pytest.approx(np.min(values))
+    assert histogram.quantile(1.0) == pytest.approx(np.max(values))
+
+    other = StreamingHistogram(bin_edges)
+    other.update([-1.0, 0.5])
+    histogram.merge(other)
+    assert histogram.underflow == 1
+    assert histogram.minimum == -1.0
+    assert histogram.count == len(values) + 2
+
+    empty = StreamingHistogram(bin_edges)
+    assert empty.count == 0
+    assert np.isnan(empty.mean)
+    assert np.isnan(empty.quantile(0.5))
+
+    with pytest.raises(RuntimeError, match="strictly increasing"):
+        StreamingHistogram([1.0, 1.0])
+    with pytest.raises(RuntimeError, match="same bin edges"):
+        histogram.merge(StreamingHistogram([0.0, 2.0]))
+
+
+def test_update_grouped_histograms():
+    histograms = {}
+    bin_edges = np.array([0.0, 1.0, 2.0])
+    _update_grouped_histograms(
+        histograms,
+        np.array([2, 1, 2, 1]),
+        np.array([0.5, 1.5, 1.5, 2.5]),
+        bin_edges,
+        {1: "ply 1", 2: "ply 2"},
+    )
+    _update_grouped_histograms(
+        histograms, np.array([2]), np.array([0.25]), bin_edges, {1: "ply 1", 2: "ply 2"}
+    )
+    assert list(histograms["ply 1"].counts) == [0, 1]
+    assert histograms["ply 1"].overflow == 1
+    assert list(histograms["ply 2"].counts) == [2, 1]
+
+
+def test_get_failure_statistics(dpf_server):
+    composite_model = CompositeModel(get_basic_shell_files(), server=dpf_server)
+    combined_criterion = CombinedFailureCriterion(
+        "max stress", failure_criteria=[MaxStressCriterion()]
+    )
+    failure_container = composite_model.evaluate_failure_criteria(combined_criterion)
+    irf_field = failure_container.get_field({"failure_label": FailureOutput.FAILURE_VALUE})
+    mode_field = failure_container.get_field({"failure_label": FailureOutput.FAILURE_MODE})
+
+    statistics = composite_model.get_failure_statistics(combined_criterion, max_chunk_size=2)
+
+    assert statistics.elements.count == len(irf_field.scoping.ids)
+    assert statistics.elements.maximum == pytest.approx(np.max(irf_field.data))
+    assert statistics.elements.mean == pytest.approx(np.mean(irf_field.data))
+    modes, counts = np.unique(np.rint(mode_field.data).astype(int), return_counts=True)
+    assert statistics.failure_mode_counts == dict(zip(modes.tolist(), counts.tolist()))
+
+    all_analysis_plies = {
+        name
+        for element_id in irf_field.scoping.ids
+        for name in composite_model.get_analysis_plies(element_id) or []
+    }
+    assert set(statistics.analysis_plies) <= all_analysis_plies
+    # The maximum over all plies and materials is the maximum over all elements
+    assert max(
+        histogram.maximum for histogram in statistics.analysis_plies.values()
+    ) == pytest.approx(statistics.elements.maximum)
+    assert max(histogram.maximum for histogram in statistics.materials.values()) == pytest.approx(
+        statistics.elements.maximum
+    )
@@ -0,0 +1,139 @@
+# Copyright (C) 2022 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+import pathlib
+
+import ansys.dpf.core as dpf
+import numpy as np
+import pytest
+
+from ansys.dpf.composites.composite_model import CompositeModel
+from ansys.dpf.composites.constants import FAILURE_LABEL, FailureOutput
+from ansys.dpf.composites.data_sources import composite_files_from_workbench_harmonic_analysis
+from ansys.dpf.composites.failure_criteria import CombinedFailureCriterion, MaxStressCriterion
+from ansys.dpf.composites.harmonic_failure import (
+    _get_phase_factors,
+    _get_phases,
+    _refine_critical_phases,
+)
+
+HARMONIC_ROOT = pathlib.Path(__file__).parent / "data" / "workflow_example" / "harmonic"
+
+
+def test_get_phases():
+    assert list(_get_phases(4)) == [-180.0, -90.0, 0.0, 90.0]
+    with pytest.raises(RuntimeError, match="At least 3 phase angles"):
+        _get_phases(2)
+
+
+def test_get_phase_factors():
+    real = np.array([1.0, 2.0, -0.5])
+    imaginary = np.array([0.5, -1.0, 3.0])
+    phases = _get_phases(8)
+
+    values = _get_phase_factors(phases) @ np.stack([real, imaginary])
+
+    radians = np.deg2rad(phases)[:, np.newaxis]
+    np.testing.assert_allclose(values, real * np.cos(radians) - imaginary * np.sin(radians))
+
+
+def test_refine_critical_phases():
+    # The amplitude of a harmonic value is reached at the phase angle -atan2(imag, real)
+    real = np.array([1.0, -2.0, 0.3, 1.0])
+    imaginary = np.array([0.4, 0.5, -1.2, 0.0])
+    phases = _get_phases(36)
+    values = (_get_phase_factors(phases) @ np.stack([real, imaginary])).T
+
+    refined_phases = _refine_critical_phases(values, phases)
+
+    expected_phases = np.rad2deg(-np.arctan2(imaginary, real))
+    deviation = np.mod(refined_phases - expected_phases + 180.0, 360.0) - 180.0
+    assert np.all(np.abs(deviation) < 0.5)
+    assert np.all((refined_phases >= -180.0) & (refined_phases < 180.0))
+    # The refined phase is never farther than half a step from the sampled maximum
+    sampled_phases = phases[np.argmax(values, axis=1)]
+    step_deviation = np.mod(refined_phases - sampled_phases + 180.0, 360.0) - 180.0
+    assert np.all(np.abs(step_deviation) <= 5.0)
+
+
+def test_evaluate_harmonic_failure(dpf_server):
+    files = composite_files_from_workbench_harmonic_analysis(
+        result_folder_modal=HARMONIC_ROOT / "modal_analysis",
+        result_folder_harmonic=HARMONIC_ROOT / "harmonic_analysis",
+    )
+    composite_model = CompositeModel(files, server=dpf_server)
+    combined_criterion = CombinedFailureCriterion(
+        "max stress", failure_criteria=[MaxStressCriterion()]
+    )
+    frequencies = composite_model.get_result_times_or_frequencies()
+
+    sampled = composite_model.evaluate_harmonic_failure(
+        combined_criterion, number_of_phases=4, refine_phases=False, max_chunk_size=50
+    )
+    refined = composite_model.evaluate_harmonic_failure(
+        combined_criterion, number_of_phases=4, max_chunk_size=50
+    )
+
+    # Reference: one failure evaluation per phase angle with the sweeping phase operator
+    stress_operator = composite_model.core_model.results.stress.on_all_time_freqs()
+    stress_operator.inputs.bool_rotate_to_global(False)
+    strain_operator = composite_model.core_model.results.elastic_strain.on_all_time_freqs()
+    strain_operator.inputs.bool_rotate_to_global(False)
+    expected_values = np.zeros(len(sampled))
+    for phase in _get_phases(4):
+        failure_evaluator = dpf.Operator("composite::multiple_failure_criteria_operator")
+        failure_evaluator.inputs.configuration(combined_criterion.to_json())
+        failure_evaluator.inputs.materials_container(
+            composite_model.material_operators.material_provider
+        )
+        failure_evaluator.inputs.stresses_container(
+            dpf.operators.math.sweeping_phase_fc(
+                fields_container=stress_operator, angle=phase, unit_name="deg", abs_value=False
+            )
+        )
+        failure_evaluator.inputs.strains_container(
+            dpf.operators.math.sweeping_phase_fc(
+                fields_container=strain_operator, angle=phase, unit_name="deg", abs_value=False
+            )
+        )
+        failure_evaluator.inputs.mesh(composite_model.get_mesh())
+        minmax_per_element = dpf.Operator("composite::minmax_per_element_operator")
+        minmax_per_element.inputs.fields_container(failure_evaluator)
+        minmax_per_element.inputs.mesh(composite_model.get_mesh())
+        minmax_per_element.inputs.material_support(
+            composite_model.material_operators.material_support_provider.outputs
+        )
+        max_container = minmax_per_element.outputs.field_max()
+        for field in max_container.get_fields({FAILURE_LABEL: FailureOutput.FAILURE_VALUE.value}):
+            for index, element_id in enumerate(sampled.element_ids):
+                expected_values[index] = max(
+                    expected_values[index], field.get_entity_data_by_id(element_id)[0]
+                )
+
+    assert sampled.failure_values == pytest.approx(expected_values)
+    assert set(sampled.critical_phases) <= set(_get_phases(4))
+    assert set(sampled.critical_frequencies) <= set(frequencies)
+    assert list(refined.element_ids) == list(sampled.element_ids)
+    assert np.all(refined.failure_values >= sampled.failure_values)
+    assert np.all((refined.critical_phases >= -180.0) & (refined.critical_phases < 180.0))
+
+    with pytest.raises(RuntimeError, match="At least one frequency"):
+        composite_model.evaluate_harmonic_failure(combined_criterion, frequencies=[])
@@ -0,0 +1,73 @@
+# Copyright (C) 2022 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import subprocess
+import sys
+
+import pytest
+
+# Upper bound for the import of the package in a fresh interpreter. The lazy
+# import takes a few milliseconds. Importing all submodules eagerly takes
+# more than a second because it loads the DPF operators and Matplotlib.
+IMPORT_TIME_BUDGET = 0.5
+
+
+def _run_in_new_interpreter(code: str) -> str:
+    return subprocess.run(
+        [sys.executable, "-c", code], check=True, capture_output=True, text=True
+    ).stdout
+
+
+def test_import_time_budget():
+    import_time = float(
+        _run_in_new_interpreter(
+            "import time\n"
+            "start = time.perf_counter()\n"
+            "import ansys.dpf.composites\n"
+            "print(time.perf_counter() - start)\n"
+        )
+    )
+    assert import_time < IMPORT_TIME_BUDGET
+
+
+@pytest.mark.parametrize(
+    "module, lazy_modules",
+    [
+        ("ansys.dpf.composites", ["ansys.dpf.core", "matplotlib"]),
+        ("ansys.dpf.composites.composite_model", ["matplotlib"]),
+    ],
+)
+def test_lazy_imports(module, lazy_modules):
+    loaded_modules = _run_in_new_interpreter(
+        f"import sys\nimport {module}\nprint(' '.join(sys.modules))"
+    ).split()
+    for lazy_module in lazy_modules:
+        assert lazy_module not in loaded_modules
+
+
+def test_submodule_access():
+    import ansys.dpf.composites as composites
+
+    assert composites.sampling_point.__name__ == "ansys.dpf.composites.sampling_point"
+    assert set(composites.__all__) <= set(dir(composites))
+    with pytest.raises(AttributeError):
+        composites.no_such_module
@@ -0,0 +1,256 @@
+# Copyright (C) 2022 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import numpy as np
+import pytest
+
+from ansys.dpf.composites.constants import Spot
+from ansys.dpf.composites.layered_reduction import (
+    GroupingKey,
+    ReductionOperation,
+    reduce_layered_data,
+    reduce_layered_field,
+)
+from ansys.dpf.composites.layup_info import (
+    ElementInfoColumns,
+    LayeredElementData,
+    LayupPropertiesProvider,
+    get_element_info_columns,
+    get_element_info_provider,
+)
+from ansys.dpf.composites.select_indices import get_selected_indices
+
+from .helper import get_basic_shell_files, setup_operators
+
+
+def _get_layered_element_data(element_ids, values_per_element):
+    indptr = np.zeros(len(values_per_element) + 1, dtype=np.int64)
+    np.cumsum([len(values) for values in values_per_element], out=indptr[1:])
+    return LayeredElementData(
+        np.array(element_ids, dtype=np.int64),
+        indptr,
+        np.concatenate([np.array(values, dtype=np.int64) for values in values_per_element]),
+    )
+
+
+def _get_element_info_columns():
+    # Element 1: shell with 3 layers and 3 spots, element 2: solid with 2 layers and 2 spots,
+    # element 3: homogeneous solid, element 4: shell with 1 layer and 2 spots
+    element_ids = [1, 2, 3, 4]
+    return ElementInfoColumns(
+        element_ids=np.array(element_ids, dtype=np.int64),
+        is_supported=np.array([True, True, True, True]),
+        n_layers=np.array([3, 2, 1, 1], dtype=np.int64),
+        n_corner_nodes=np.array([4, 8, 8, 3], dtype=np.int64),
+        n_spots=np.array([3, 2, 0, 2], dtype=np.int64),
+        is_layered=np.array([True, True, False, True]),
+        element_type=np.array([181, 185, 185, 181], dtype=np.int64),
+        is_shell=np.array([True, False, False, True]),
+        number_of_nodes_per_spot_plane=np.array([4, 4, -1, 3], dtype=np.int64),
+        dpf_material_ids=_get_layered_element_data(element_ids, [[1, 2, 1], [2, 3], [4], [3]]),
+    )
+
+
+def _get_reference(data, indptr, columns, keys_per_layer, grouping_key, reduction):
+    """Reduce the data element by element with get_selected_indices."""
+    reduce = {
+        ReductionOperation.MAX: np.max,
+        ReductionOperation.MIN: np.min,
+        ReductionOperation.MEAN: np.mean,
+    }[reduction]
+    per_element_and_group = {}
+    per_group = {}
+    for index in range(len(columns)):
+        element_info = columns.get_element_info(index)
+        if not element_info.is_layered:
+            continue
+        element_data = data[indptr[index] : indptr[index + 1]]
+        if grouping_key == GroupingKey.SPOT:
+            spots = [Spot.BOTTOM, Spot.TOP]
+            if element_info.n_spots == 3:
+                spots.append(Spot.MIDDLE)
+            selections = {
+                int(spot): get_selected_indices(element_info, spots=[spot]) for spot in spots
+            }
+        else:
+            keys = keys_per_layer[index]
+            selections = {
+                int(key): get_selected_indices(
+                    element_info, layers=[layer for layer, k in enumerate(keys) if k == key]
+                )
+                for key in set(keys)
+            }
+        for key, indices in selections.items():
+            per_element_and_group[(element_info.id, key)] = reduce(element_data[indices])
+            per_group.setdefault(key, []).append(element_data[indices])
+    return per_element_and_group, {
+        key: reduce(np.concatenate(values)) for key, values in per_group.items()
+    }
+
+
+@pytest.mark.parametrize(
+    "grouping_key", [GroupingKey.LAYER, GroupingKey.MATERIAL, GroupingKey.SPOT]
+)
+@pytest.mark.parametrize(
+    "reduction", [ReductionOperation.MAX, ReductionOperation.MIN, ReductionOperation.MEAN]
+)
+def test_reduce_layered_data(grouping_key, reduction):
+    columns = _get_element_info_columns()
+    lengths = [36, 16, 8, 6]
+    indptr = np.zeros(len(lengths) + 1, dtype=np.int64)
+    np.cumsum(lengths, out=indptr[1:])
+    data = np.random.default_rng(42).random(indptr[-1])
+
+    result = reduce_layered_data(data, indptr, columns, grouping_key, reduction)
+
+    keys_per_layer = {
+        GroupingKey.LAYER: [[0, 1, 2], [0, 1], [0], [0]],
+        GroupingKey.MATERIAL: [[1, 2, 1], [2, 3], [4], [3]],
+        GroupingKey.SPOT: None,
+    }[grouping_key]
+    per_element_and_group, per_group = _get_reference(
+        data, indptr, columns, keys_per_layer, grouping_key, reduction
+    )
+
+    # The homogeneous element is ignored
+    assert list(result.element_ids) == [1, 2, 4]
+    assert dict(
+        zip(
+            zip(result.element_group_element_ids.tolist(), result.element_group_ids.tolist()),
+            result.element_group_values,
+        )
+    ) == pytest.approx(per_element_and_group)
+    assert dict(zip(result.group_ids.tolist(), result.group_values)) == pytest.approx(per_group)
+
+    element_reference = {
+        1: data[indptr[0] : indptr[1]],
+        2: data[indptr[1] : indptr[2]],
+        4: data[indptr[3] : indptr[4]],
+    }
+    if reduction == ReductionOperation.MAX:
+        assert result.element_values == pytest.approx(
+            [np.max(values) for values in element_reference.values()]
+        )
+
+
+def test_reduce_layered_data_argmax_and_selection():
+    columns = _get_element_info_columns()
+    indptr = np.array([0, 36, 52, 60, 66], dtype=np.int64)
+    data = np.zeros(66)
+    # Maximum of element 1 at layer 2, top spot, node 1
+    data[2 * 12 + 4 + 1] = 5.0
+    # Maximum of element 2 at layer 0, bottom spot, node 3
+    data[36 + 3] = 7.0
+    # Value of the homogeneous element is ignored
+    data[55] = 10.0
+
+    result = reduce_layered_data(data, indptr, columns, GroupingKey.SPOT, ReductionOperation.ARGMAX)
+    assert list(result.element_values) == [29, 3, 0]
+    assert list(result.group_ids) == [Spot.BOTTOM, Spot.MIDDLE, Spot.TOP]
+    assert list(result.group_values) == [2, 1, 1]
+    element_ids, indices = result.get_group_values(Spot.TOP)
+    assert list(element_ids) == [1, 2, 4]
+    assert list(indices) == [29, 4, 3]
+
+    result = reduce_layered_data(
+        data,
+        indptr,
+        columns,
+        GroupingKey.SPOT,
+        ReductionOperation.MAX,
+        selected_groups=[Spot.TOP],
+    )
+    assert list(result.group_ids) == [Spot.TOP]
+    assert list(result.element_values) == [5.0, 0.0, 0.0]
+
+    analysis_ply_indices = _get_layered_element_data([1, 2, 3, 4], [[4, 5, 6], [7, 8], [], [9]])
+    result = reduce_layered_data(
+        data,
+        indptr,
+        columns,
+        GroupingKey.ANALYSIS_PLY,
+        ReductionOperation.MAX,
+        analysis_ply_indices=analysis_ply_indices,
+        selected_groups=[6, 7],
+    )
+    assert list(result.element_group_element_ids) == [1, 2]
+    assert list(result.element_group_ids) == [6, 7]
+    assert list(result.element_group_values) == [5.0, 7.0]
+
+    with pytest.raises(RuntimeError, match="does not match the lay-up"):
+        reduce_layered_data(
+            data[:-1], indptr - np.array([0, 0, 0, 0, 1]), columns, GroupingKey.LAYER
+        )
+
+
+def test_reduce_layered_field(dpf_server):
+    files = get_basic_shell_files()
+    setup_result = setup_operators(dpf_server, files)
+    element_info_provider = get_element_info_provider(
+        setup_result.mesh, setup_result.streams_provider
+    )
+    layup_properties_provider = LayupPropertiesProvider(
+        setup_result.layup_provider, setup_result.mesh
+    )
+    field = setup_result.field
+    element_ids = field.scoping.ids
+
+    columns = get_element_info_columns(element_info_provider, element_ids)
+    for index, element_id in enumerate(element_ids):
+        expected = element_info_provider.get_element_info(element_id)
+        actual = columns.get_element_info(index)
+        assert actual.n_layers == expected.n_layers
+        assert actual.n_spots == expected.n_spots
+        assert actual.number_of_nodes_per_spot_plane == expected.number_of_nodes_per_spot_plane
+        assert list(actual.dpf_material_ids) == list(expected.dpf_material_ids)
+
+    result = reduce_layered_field(
+        field,
+        element_info_provider,
+        GroupingKey.MATERIAL,
+        ReductionOperation.MAX,
+        component=1,
+    )
+    for element_id, material_id, value in zip(
+        result.element_group_element_ids, result.element_group_ids, result.element_group_values
+    ):
+        element_info = element_info_provider.get_element_info(element_id)
+        layers = [
+            layer
+            for layer, dpf_material_id in enumerate(element_info.dpf_material_ids)
+            if dpf_material_id == material_id
+        ]
+        indices = get_selected_indices(element_info, layers=layers)
+        assert value == pytest.approx(np.max(field.get_entity_data_by_id(element_id)[indices, 1]))
+
+    result = reduce_layered_field(
+        field,
+        element_info_provider,
+        GroupingKey.ANALYSIS_PLY,
+        ReductionOperation.MAX,
+        layup_properties_provider=layup_properties_provider,
+    )
+    # Ply P1L1__ud_patch ns1 is the second layer of elements 1 and 2
+    ply_index = layup_properties_provider.get_analysis_ply_indices_for_elements([1]).values[1]
+    element_ids, values = result.get_group_values(ply_index)
+    assert list(element_ids) == [1, 2]
+    assert values[0] == pytest.approx(np.max(field.get_entity_data_by_id(1)[12:24, 0]))
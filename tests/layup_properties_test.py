@@ -21,8 +21,10 @@
 # SOFTWARE.
 
 from ansys.dpf.core import Operator
+import numpy as np
 import pytest
 
+from ansys.dpf.composites._indexer import _get_indices_by_ids
 from ansys.dpf.composites.data_sources import get_composites_data_sources
 from ansys.dpf.composites.layup_info import LayupPropertiesProvider, add_layup_info_to_mesh
 from ansys.dpf.composites.layup_info.material_operators import get_material_operators
@@ -32,6 +34,15 @@ from ansys.dpf.composites.unit_system import get_unit_system
 from .helper import get_basic_shell_files
 
 
+def test_get_indices_by_ids():
+    indices = np.array([-1, 0, -1, 1], dtype=np.int64)
+    entity_ids = np.array([3, 1, 7, 2], dtype=np.int64)
+
+    # IDs above the maximum ID are missing with and without bounds check
+    for bounds_check in (True, False):
+        assert list(_get_indices_by_ids(indices, entity_ids, bounds_check)) == [1, 0, -1, -1]
+
+
 def test_layup_properties(dpf_server):
     files = get_basic_shell_files()
     files = upload_continuous_fiber_composite_files_to_server(files, dpf_server)
@@ -120,3 +131,60 @@ def test_layup_properties(dpf_server):
     assert plies_by_element[1] == six_layers
     assert plies_by_element[2] == five_layers
     assert plies_by_element[3] == five_layers
+
+
+def test_layup_properties_for_multiple_elements(dpf_server):
+    files = get_basic_shell_files()
+    files = upload_continuous_fiber_composite_files_to_server(files, dpf_server)
+
+    composite_data_sources = get_composites_data_sources(files)
+    mesh_provider = Operator("MeshProvider")
+    mesh_provider.inputs.data_sources(composite_data_sources.result_files)
+    mesh = mesh_provider.outputs.mesh()
+
+    unit_system = get_unit_system(composite_data_sources.result_files)
+    material_operators = get_material_operators(
+        composite_data_sources.result_files,
+        composite_data_sources.engineering_data,
+        unit_system=unit_system,
+    )
+    layup_provider = add_layup_info_to_mesh(
+        composite_data_sources,
+        mesh=mesh,
+        material_operators=material_operators,
+        unit_system=unit_system,
+    )
+
+    properties_provider = LayupPropertiesProvider(layup_provider, mesh=mesh)
+    element_ids = mesh.elements.scoping.ids
+
+    angles = properties_provider.get_layer_angles_for_elements()
+    assert sorted(angles.element_ids) == sorted(element_ids)
+    for index, element_id in enumerate(angles.element_ids):
+        assert angles.get_values_by_index(index) == pytest.approx(
+            properties_provider.get_layer_angles(element_id)
+        )
+
+    thicknesses = properties_provider.get_layer_thicknesses_for_elements(element_ids)
+    assert list(thicknesses.number_of_layers) == [6, 6, 5, 5]
+    assert list(properties_provider.get_number_of_layers(element_ids)) == [6, 6, 5, 5]
+    assert properties_provider.get_laminate_thicknesses(element_ids) == pytest.approx(
+        [0.0061, 0.0061, 0.0059, 0.0059]
+    )
+    assert properties_provider.get_element_laminate_offsets(element_ids) == pytest.approx(
+        [-0.00305, -0.00305, -0.00295, -0.00295]
+    )
+
+    shear_angles = properties_provider.get_layer_shear_angles_for_elements(element_ids)
+    assert shear_angles.values == pytest.approx(22 * [0])
+
+    ply_indices = properties_provider.get_analysis_ply_indices_for_elements(element_ids)
+    for index, element_id in enumerate(element_ids):
+        assert list(ply_indices.get_values_by_index(index)) == list(
+            properties_provider._analysis_ply_indexer.by_id_as_array(element_id)
+        )
+
+    # Elements which do not exist have no layers
+    assert list(properties_provider.get_number_of_layers([1, 1000])) == [6, 0]
+    offsets = properties_provider.get_element_laminate_offsets([1000])
+    assert np.isnan(offsets[0])
@@ -0,0 +1,116 @@
+# Copyright (C) 2022 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+import numpy as np
+import pytest
+
+from ansys.dpf.composites.composite_model import CompositeModel
+from ansys.dpf.composites.composite_scope import CompositeScope
+from ansys.dpf.composites.constants import FailureOutput
+from ansys.dpf.composites.failure_criteria import CombinedFailureCriterion, MaxStressCriterion
+from ansys.dpf.composites.load_combinations import _combine_load_steps, _validate_combination_matrix
+
+from .helper import get_basic_shell_files
+
+
+def test_validate_combination_matrix():
+    matrix = _validate_combination_matrix([[1.0, 0.5], [0.0, 1.5]], 2)
+    assert matrix.shape == (2, 2)
+    assert matrix.dtype == np.double
+
+    with pytest.raises(RuntimeError, match="2 columns, but 3 load steps"):
+        _validate_combination_matrix([[1.0, 0.5]], 3)
+    with pytest.raises(RuntimeError, match="non-empty 2D array"):
+        _validate_combination_matrix([1.0, 0.5], 2)
+    with pytest.raises(RuntimeError, match="non-empty 2D array"):
+        _validate_combination_matrix(np.zeros((0, 2)), 2)
+    with pytest.raises(RuntimeError, match="finite"):
+        _validate_combination_matrix([[1.0, np.nan]], 2)
+
+
+def test_combine_load_steps():
+    rng = np.random.default_rng(0)
+    data_by_load_step = rng.standard_normal((3, 10, 6))
+    matrix = np.array([[1.0, 0.0, 0.0], [1.35, 1.5, 0.0], [1.0, -1.0, 2.0]])
+
+    combined = _combine_load_steps(data_by_load_step, matrix)
+
+    assert combined.shape == (3, 10, 6)
+    for combination_index, factors in enumerate(matrix):
+        expected = sum(factor * data for factor, data in zip(factors, data_by_load_step))
+        np.testing.assert_allclose(combined[combination_index], expected)
+
+
+def test_evaluate_load_combinations(dpf_server):
+    composite_model = CompositeModel(get_basic_shell_files(), server=dpf_server)
+    combined_criterion = CombinedFailureCriterion(
+        "max stress", failure_criteria=[MaxStressCriterion()]
+    )
+    failure_container = composite_model.evaluate_failure_criteria(combined_criterion)
+    value_field = failure_container.get_field({"failure_label": FailureOutput.FAILURE_VALUE})
+    mode_field = failure_container.get_field({"failure_label": FailureOutput.FAILURE_MODE})
+    last_time = composite_model.get_result_times_or_frequencies()[-1]
+
+    # The max stress criterion is linear in the stresses
+    envelope = composite_model.evaluate_load_combinations(
+        [[1.0], [2.0], [0.5]], combined_criterion, load_steps=[last_time], max_chunk_size=2
+    )
+
+    assert sorted(envelope.element_ids) == sorted(value_field.scoping.ids)
+    assert np.all(envelope.critical_combinations == 1)
+    for index, element_id in enumerate(envelope.element_ids):
+        assert envelope.failure_values[index] == pytest.approx(
+            2.0 * value_field.get_entity_data_by_id(element_id)[0]
+        )
+        assert envelope.failure_modes[index] == int(mode_field.get_entity_data_by_id(element_id)[0])
+    assert envelope.combination_failure_values == pytest.approx(
+        np.array([1.0, 2.0, 0.5]) * np.max(value_field.data)
+    )
+
+    # Batches of combinations give the same envelope as a single batch
+    batched_envelope = composite_model.evaluate_load_combinations(
+        [[1.0], [2.0], [0.5]],
+        combined_criterion,
+        load_steps=[last_time],
+        max_chunk_size=2,
+        max_combinations_per_batch=2,
+    )
+    np.testing.assert_array_equal(batched_envelope.element_ids, envelope.element_ids)
+    np.testing.assert_allclose(batched_envelope.failure_values, envelope.failure_values)
+    np.testing.assert_array_equal(
+        batched_envelope.critical_combinations, envelope.critical_combinations
+    )
+    np.testing.assert_allclose(
+        batched_envelope.combination_failure_values, envelope.combination_failure_values
+    )
+
+    with pytest.raises(RuntimeError, match="per batch must be positive"):
+        composite_model.evaluate_load_combinations(
+            [[1.0]], combined_criterion, load_steps=[last_time], max_combinations_per_batch=0
+        )
+    with pytest.raises(RuntimeError, match="columns"):
+        composite_model.evaluate_load_combinations(
+            [[1.0, 1.0]], combined_criterion, load_steps=[last_time]
+        )
+    with pytest.raises(RuntimeError, match="elements and named selections"):
+        composite_model.evaluate_load_combinations(
+            [[1.0]], combined_criterion, CompositeScope(plies=["P1L1__ud_patch ns1"])
+        )
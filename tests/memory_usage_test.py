@@ -0,0 +1,121 @@
+# Copyright (C) 2022 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+from dataclasses import dataclass
+
+import numpy as np
+import pytest
+
+from ansys.dpf.composites import _composite_model_impl
+from ansys.dpf.composites.composite_model import CompositeModel
+from ansys.dpf.composites.constants import ResultType
+from ansys.dpf.composites.memory_usage import (
+    MemoryReport,
+    ModelCache,
+    _estimate_dict_nbytes,
+    _get_nbytes,
+)
+
+from .helper import get_basic_shell_files
+
+
+@dataclass(frozen=True)
+class _Entry:
+    values: np.ndarray
+
+
+def test_nbytes_counts_arrays_once():
+    array = np.zeros(1000)
+    single = _get_nbytes(_Entry(array))
+    assert single > array.nbytes
+    # The same array referenced twice is counted once
+    assert _get_nbytes([_Entry(array), _Entry(array)]) < 2 * array.nbytes
+    # A view is counted with its base array
+    assert _get_nbytes(array[:10]) > array.nbytes
+    assert _get_nbytes(None) == 0
+
+
+def test_estimate_dict_nbytes():
+    small = {index: np.zeros(10) for index in range(50)}
+    assert _estimate_dict_nbytes(small) == _get_nbytes(small)
+
+    large = {index: np.zeros(10) for index in range(10000)}
+    assert _estimate_dict_nbytes(large) == pytest.approx(_get_nbytes(large), rel=0.05)
+
+
+def test_memory_report():
+    report = MemoryReport(
+        cache_bytes={ModelCache.ELEMENT_INFO: 2_000_000, ModelCache.RESULT: 0},
+        indexer_bytes={"layup_properties_provider": 1_000_000},
+    )
+    assert report.total_bytes == 3_000_000
+    lines = str(report).splitlines()
+    assert lines[0].split() == ["element_info", "2.000", "MB"]
+    assert lines[-1].split() == ["total", "3.000", "MB"]
+
+
+def test_composite_model_memory_budget(dpf_server):
+    composite_model = CompositeModel(get_basic_shell_files(), server=dpf_server)
+    element_ids = composite_model.get_mesh().elements.scoping.ids
+    composite_model.get_element_info_columns(element_ids)
+    composite_model.get_analysis_ply_incidence()
+
+    report = composite_model.memory_report()
+    assert report.cache_bytes[ModelCache.ELEMENT_INFO] > 0
+    assert report.cache_bytes[ModelCache.ANALYSIS_PLY_INCIDENCE] > 0
+    assert report.indexer_bytes["layup_properties_provider"] > 0
+
+    composite_model.clear_caches([ModelCache.ANALYSIS_PLY_INCIDENCE])
+    report = composite_model.memory_report()
+    assert report.cache_bytes[ModelCache.ANALYSIS_PLY_INCIDENCE] == 0
+    assert report.cache_bytes[ModelCache.ELEMENT_INFO] > 0
+
+    # A budget below the size of the indexers releases all caches
+    composite_model.enable_result_cache()
+    composite_model.get_result(ResultType.STRESS)
+    composite_model.set_memory_budget(0)
+    assert composite_model.memory_budget == 0
+    assert sum(composite_model.memory_report().cache_bytes.values()) <= _get_nbytes(
+        composite_model._implementation.result_cache
+    )
+    assert len(composite_model._implementation.result_cache) == 0
+
+    with pytest.raises(RuntimeError, match="must not be negative"):
+        composite_model.set_memory_budget(-1)
+
+
+def test_memory_budget_measures_changed_caches(dpf_server, monkeypatch):
+    composite_model = CompositeModel(get_basic_shell_files(), server=dpf_server)
+    implementation = composite_model._implementation
+    composite_model.set_memory_budget(10**12)
+    measured_objects = []
+
+    def get_nbytes(obj, visited=None):
+        measured_objects.append(obj)
+        return _get_nbytes(obj, visited)
+
+    monkeypatch.setattr(_composite_model_impl, "_get_nbytes", get_nbytes)
+    analysis_ply_incidence = composite_model.get_analysis_ply_incidence()
+
+    # The lookup structures were measured when the budget was set
+    assert measured_objects == [analysis_ply_incidence]
+    assert implementation._indexer_nbytes is not None
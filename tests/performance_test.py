@@ -46,9 +46,8 @@ from .helper import ContinuousFiberCompositesFiles, Timer, setup_operators
 
 
 def get_data_files():
-    # Using lightweight data for unit tests. Replace by get_ger_data_data_files
-    # for actual performance tests
-    # return get_ger_data_files()
+    # Using lightweight data for unit tests. See benchmark_test.py for
+    # performance tests with large synthetic models.
     return get_dummy_data_files()
 
 
@@ -65,26 +64,6 @@ def get_dummy_data_files():
     )
 
 
-def get_ger_data_files():
-    ger_path = (
-        pathlib.Path("D:\\")
-        / "ANSYSDev"
-        / "additional_model_data"
-        / "ger89"
-        / "ger89_files"
-        / "dp0"
-    )
-
-    rst_path = ger_path / "SYS-1" / "MECH" / "file.rst"
-    h5_path = ger_path / "ACP-Pre" / "ACP" / "ACPCompositeDefinitions.h5"
-    material_path = ger_path / "SYS-1" / "MECH" / "MatML.xml"
-    return ContinuousFiberCompositesFiles(
-        result_files=rst_path,
-        composite={"shell": CompositeDefinitionFiles(definition=h5_path)},
-        engineering_data=material_path,
-    )
-
-
 def get_generated_test_data(server, n_components=6):
     n_entities = 10000
     n_layers_times_nodes_times_integration_points = 10 * 4 * 3
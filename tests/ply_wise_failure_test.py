@@ -0,0 +1,158 @@
+# Copyright (C) 2022 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import numpy as np
+import pytest
+
+from ansys.dpf.composites.composite_model import CompositeModel
+from ansys.dpf.composites.composite_scope import CompositeScope
+from ansys.dpf.composites.constants import FailureOutput
+from ansys.dpf.composites.failure_criteria import CombinedFailureCriterion, MaxStressCriterion
+from ansys.dpf.composites.ply_wise_failure import PlyWiseFailureResults
+
+from .helper import get_basic_shell_files
+
+
+def test_ply_wise_failure_results():
+    results = PlyWiseFailureResults(
+        analysis_ply_names=["ply a", "ply b"],
+        analysis_ply_indices=np.array([3, 5], dtype=np.int64),
+        indptr=np.array([0, 2, 5], dtype=np.int64),
+        element_ids=np.array([1, 2, 1, 2, 3], dtype=np.int64),
+        failure_values=np.array([0.5, 0.2, 0.3, 0.9, 0.1]),
+        failure_modes=np.array([1, 2, 3, 4, 5], dtype=np.int64),
+        time=1.0,
+    )
+    element_ids, values, modes = results.get_ply_results("ply b")
+    assert list(element_ids) == [1, 2, 3]
+    assert list(values) == [0.3, 0.9, 0.1]
+    assert list(modes) == [3, 4, 5]
+
+    element_ids, max_values = results.get_max_per_element()
+    assert list(element_ids) == [1, 2, 3]
+    assert list(max_values) == [0.5, 0.9, 0.1]
+
+    with pytest.raises(RuntimeError, match="Analysis ply ply c is not available"):
+        results.get_ply_results("ply c")
+
+    selected = results.select_plies(["ply b"])
+    assert selected.analysis_ply_names == ["ply b"]
+    assert list(selected.analysis_ply_indices) == [5]
+    assert list(selected.indptr) == [0, 3]
+    assert list(selected.get_ply_results("ply b")[1]) == [0.3, 0.9, 0.1]
+
+    critical_plies = results.get_critical_plies()
+    assert list(critical_plies.element_ids) == [1, 2, 3]
+    assert list(critical_plies.failure_values) == [0.5, 0.9, 0.1]
+    assert list(critical_plies.failure_modes) == [1, 4, 5]
+    assert list(critical_plies.analysis_ply_names) == ["ply a", "ply b", "ply b"]
+
+    critical_plies = results.select_plies(["ply a"]).get_critical_plies()
+    assert list(critical_plies.element_ids) == [1, 2]
+    assert list(critical_plies.analysis_ply_names) == ["ply a", "ply a"]
+
+
+def test_evaluate_ply_wise_failure_criteria(dpf_server):
+    composite_model = CompositeModel(get_basic_shell_files(), server=dpf_server)
+    combined_criterion = CombinedFailureCriterion(
+        "max stress", failure_criteria=[MaxStressCriterion()]
+    )
+
+    results = composite_model.evaluate_ply_wise_failure_criteria(
+        combined_criterion, max_chunk_size=2
+    )
+
+    assert len(results.analysis_ply_names) > 1
+    for ply_name in results.analysis_ply_names:
+        element_ids, values, modes = results.get_ply_results(ply_name)
+        assert list(element_ids) == sorted(element_ids)
+        failure_container = composite_model.evaluate_failure_criteria(
+            combined_criterion,
+            composite_scope=CompositeScope(plies=[ply_name]),
+            write_data_for_full_element_scope=False,
+        )
+        irf_field = failure_container.get_field({"failure_label": FailureOutput.FAILURE_VALUE})
+        mode_field = failure_container.get_field({"failure_label": FailureOutput.FAILURE_MODE})
+        assert sorted(irf_field.scoping.ids) == list(element_ids)
+        for element_id, value, mode in zip(element_ids, values, modes):
+            assert value == pytest.approx(irf_field.get_entity_data_by_id(element_id)[0])
+            assert mode == int(mode_field.get_entity_data_by_id(element_id)[0])
+
+    ply_field = results.get_ply_field(results.analysis_ply_names[0], server=dpf_server)
+    assert list(ply_field.scoping.ids) == list(
+        results.get_ply_results(results.analysis_ply_names[0])[0]
+    )
+
+
+def test_ply_wise_failure_cache(dpf_server):
+    composite_model = CompositeModel(get_basic_shell_files(), server=dpf_server)
+    combined_criterion = CombinedFailureCriterion(
+        "max stress", failure_criteria=[MaxStressCriterion()]
+    )
+
+    all_plies = composite_model.evaluate_ply_wise_failure_criteria(combined_criterion)
+    ply_names = list(all_plies.analysis_ply_names[:2])
+    selected = composite_model.evaluate_ply_wise_failure_criteria(
+        combined_criterion, CompositeScope(plies=ply_names)
+    )
+    assert selected.analysis_ply_names == ply_names
+
+    critical_plies = selected.get_critical_plies()
+    failure_container = composite_model.evaluate_failure_criteria(
+        combined_criterion,
+        composite_scope=CompositeScope(plies=ply_names),
+        write_data_for_full_element_scope=False,
+    )
+    irf_field = failure_container.get_field({"failure_label": FailureOutput.FAILURE_VALUE})
+    assert sorted(irf_field.scoping.ids) == list(critical_plies.element_ids)
+    for element_id, value in zip(critical_plies.element_ids, critical_plies.failure_values):
+        assert value == pytest.approx(irf_field.get_entity_data_by_id(element_id)[0])
+
+    composite_model.clear_ply_wise_failure_cache()
+    reevaluated = composite_model.evaluate_ply_wise_failure_criteria(
+        combined_criterion, CompositeScope(plies=ply_names)
+    )
+    assert np.array_equal(reevaluated.failure_values, selected.failure_values)
+
+
+def test_ply_wise_failure_empty_scope(dpf_server):
+    composite_model = CompositeModel(get_basic_shell_files(), server=dpf_server)
+    combined_criterion = CombinedFailureCriterion(
+        "max stress", failure_criteria=[MaxStressCriterion()]
+    )
+
+    with pytest.raises(RuntimeError, match="No elements are selected|No output is generated"):
+        composite_model.evaluate_ply_wise_failure_criteria(
+            combined_criterion, CompositeScope(elements=[999999])
+        )
+
+
+def test_ply_wise_failure_unknown_ply(dpf_server):
+    composite_model = CompositeModel(get_basic_shell_files(), server=dpf_server)
+    combined_criterion = CombinedFailureCriterion(
+        "max stress", failure_criteria=[MaxStressCriterion()]
+    )
+
+    with pytest.raises(RuntimeError, match="Analysis ply unknown ply is not available"):
+        composite_model.evaluate_ply_wise_failure_criteria(
+            combined_criterion, CompositeScope(plies=["unknown ply"])
+        )
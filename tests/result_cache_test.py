@@ -0,0 +1,113 @@
+# Copyright (C) 2022 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import numpy as np
+import pytest
+
+from ansys.dpf.composites.composite_model import CompositeModel
+from ansys.dpf.composites.constants import ResultType
+from ansys.dpf.composites.result_cache import ResultCache, ResultCacheStatistics
+
+from .helper import get_basic_shell_files
+
+
+def test_result_cache_lru_and_statistics():
+    cache = ResultCache(max_size=2)
+    stress_1 = (ResultType.STRESS, 1, None)
+    stress_2 = (ResultType.STRESS, 2, None)
+    strain_1 = (ResultType.ELASTIC_STRAIN, 1, (1, 2))
+
+    assert cache.get(stress_1) is None
+    cache.put(stress_1, "stress 1")
+    cache.put(stress_2, "stress 2")
+    assert cache.get(stress_1) == "stress 1"
+
+    # stress_2 is the least recently used entry
+    cache.put(strain_1, "strain 1")
+    assert cache.get(stress_2) is None
+    assert cache.get(strain_1) == "strain 1"
+    assert cache.statistics == ResultCacheStatistics(
+        hits=2, misses=2, evictions=1, size=2, max_size=2
+    )
+
+    assert cache.invalidate(time_id=2) == 0
+    assert cache.invalidate(result_type=ResultType.ELASTIC_STRAIN) == 1
+    assert cache.get(stress_1) == "stress 1"
+    assert cache.invalidate() == 1
+    assert len(cache) == 0
+
+    shared_value = ["stresses"]
+    cache.put(stress_1, shared_value)
+    cache.put(stress_2, ["stresses"])
+    assert cache.remove(shared_value) == 1
+    assert cache.get(stress_1) is None
+    assert cache.get(stress_2) == ["stresses"]
+    cache.invalidate()
+
+    cache.clear()
+    assert cache.statistics == ResultCacheStatistics(
+        hits=0, misses=0, evictions=0, size=0, max_size=2
+    )
+
+    with pytest.raises(RuntimeError, match="must be positive"):
+        ResultCache(max_size=0)
+
+
+def test_composite_model_result_cache(dpf_server):
+    composite_model = CompositeModel(get_basic_shell_files(), server=dpf_server)
+    assert composite_model.result_cache_statistics is None
+
+    composite_model.enable_result_cache(max_size=2)
+    stresses = composite_model.get_result(ResultType.STRESS)
+    assert composite_model.get_result(ResultType.STRESS) is stresses
+    strains = composite_model.get_result(ResultType.ELASTIC_STRAIN, element_ids=[1, 2])
+    assert sorted(strains[0].scoping.ids) == [1, 2]
+    assert composite_model.result_cache_statistics == ResultCacheStatistics(
+        hits=1, misses=2, evictions=0, size=2, max_size=2
+    )
+
+    time = composite_model.get_result_times_or_frequencies()[-1]
+    assert composite_model.invalidate_result_cache(ResultType.STRESS, time) == 1
+    assert composite_model.get_result(ResultType.STRESS) is not stresses
+
+    with pytest.raises(RuntimeError, match="is not in the result file"):
+        composite_model.get_result(ResultType.STRESS, time=time + 100.0)
+
+    composite_model.disable_result_cache()
+    assert composite_model.result_cache_statistics is None
+
+
+def test_result_cache_with_interlaminar_normal_stresses(dpf_server):
+    composite_model = CompositeModel(get_basic_shell_files(), server=dpf_server)
+    composite_model.enable_result_cache()
+    stresses = composite_model.get_result(ResultType.STRESS)
+    strains = composite_model.get_result(ResultType.ELASTIC_STRAIN)
+    original_stresses = stresses[0].data.copy()
+
+    # The stresses are modified in place and are not returned by the next hit
+    composite_model.add_interlaminar_normal_stresses(stresses, strains)
+    assert not np.array_equal(stresses[0].data, original_stresses)
+    reread_stresses = composite_model.get_result(ResultType.STRESS)
+    assert reread_stresses is not stresses
+    assert np.array_equal(reread_stresses[0].data, original_stresses)
+    assert composite_model.get_result(ResultType.STRESS) is reread_stresses
+    assert composite_model.get_result(ResultType.ELASTIC_STRAIN) is strains
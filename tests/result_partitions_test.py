@@ -0,0 +1,111 @@
+# Copyright (C) 2022 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import threading
+import time
+
+import numpy as np
+import pytest
+
+from ansys.dpf.composites.composite_model import CompositeModel
+from ansys.dpf.composites.constants import ResultType
+from ansys.dpf.composites.result_partitions import (
+    ResultPartition,
+    _map_in_parallel,
+    get_partition_chunks,
+)
+
+from .helper import get_dummy_data_files
+
+
+def _get_partition(index, element_ids):
+    # The data sources are not needed to split the element scope
+    return ResultPartition(
+        index=index, data_sources=None, element_ids=np.array(element_ids, dtype=np.int64)
+    )
+
+
+def test_get_partition_chunks():
+    partitions = [_get_partition(0, [1, 2, 5, 6, 7]), _get_partition(1, [3, 4, 8])]
+
+    chunks = get_partition_chunks(partitions, np.array([8, 7, 1, 3, 6, 5]), max_chunk_size=2)
+
+    assert [(partition.index, list(ids)) for partition, ids in chunks] == [
+        (0, [1, 5]),
+        (0, [6, 7]),
+        (1, [3, 8]),
+    ]
+
+    with pytest.raises(RuntimeError, match="not part of any partition"):
+        get_partition_chunks(partitions, np.array([1, 9]), max_chunk_size=2)
+    with pytest.raises(RuntimeError, match="must be positive"):
+        get_partition_chunks(partitions, np.array([1]), max_chunk_size=0)
+
+
+def test_map_in_parallel_keeps_order_and_bounds_work():
+    lock = threading.Lock()
+    running = [0, 0]
+
+    def square(value):
+        with lock:
+            running[0] += 1
+            running[1] = max(running[1], running[0])
+        time.sleep(0.01)
+        with lock:
+            running[0] -= 1
+        return value * value
+
+    assert list(_map_in_parallel(square, range(20), max_workers=3)) == [
+        value * value for value in range(20)
+    ]
+    assert running[1] <= 3
+
+
+def test_distributed_element_chunks(dpf_server):
+    composite_model = CompositeModel(get_dummy_data_files(distributed=True), server=dpf_server)
+    partitions = composite_model.result_partitions
+    assert len(partitions) == 2
+    all_element_ids = np.sort(composite_model.get_mesh().elements.scoping.ids)
+    assert np.array_equal(
+        np.unique(np.concatenate([partition.element_ids for partition in partitions])),
+        all_element_ids,
+    )
+
+    # The element info is available for the elements of all partitions
+    for element_id in all_element_ids:
+        assert composite_model.get_element_info(int(element_id)) is not None
+
+    reference_model = CompositeModel(get_dummy_data_files(), server=dpf_server)
+    assert len(reference_model.result_partitions) == 0
+    reference_stresses = reference_model.get_result(ResultType.STRESS)[0]
+
+    chunks = list(composite_model.iterate_element_chunks([ResultType.STRESS], max_chunk_size=2))
+    assert [chunk.index for chunk in chunks] == list(range(len(chunks)))
+    chunk_element_ids = np.concatenate([chunk.element_ids for chunk in chunks])
+    assert np.array_equal(np.sort(chunk_element_ids), all_element_ids)
+    for chunk in chunks:
+        assert any(np.all(np.isin(chunk.element_ids, p.element_ids)) for p in partitions)
+        for index, element_id in enumerate(chunk.element_ids):
+            np.testing.assert_allclose(
+                chunk.stresses[chunk.indptr[index] : chunk.indptr[index + 1]].reshape(-1),
+                np.ravel(reference_stresses.get_entity_data_by_id(element_id)),
+            )
@@ -0,0 +1,169 @@
+# Copyright (C) 2022 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import numpy as np
+import pytest
+
+from ansys.dpf.composites.composite_model import CompositeModel
+from ansys.dpf.composites.constants import ResultType, Spot
+from ansys.dpf.composites.layup_info import ElementInfoColumns, LayeredElementData
+from ansys.dpf.composites.result_store import ResultStore, ResultStoreWriter
+from ansys.dpf.composites.select_indices import get_selected_indices
+
+from .helper import get_basic_shell_files
+
+
+def _get_layered_element_data(element_ids, values_per_element):
+    indptr = np.zeros(len(values_per_element) + 1, dtype=np.int64)
+    np.cumsum([len(values) for values in values_per_element], out=indptr[1:])
+    return LayeredElementData(
+        np.array(element_ids, dtype=np.int64),
+        indptr,
+        np.concatenate([np.array(values, dtype=np.int64) for values in values_per_element]),
+    )
+
+
+def _get_element_info_columns(element_ids, n_layers, n_spots, nodes, material_ids):
+    n_elements = len(element_ids)
+    return ElementInfoColumns(
+        element_ids=np.array(element_ids, dtype=np.int64),
+        is_supported=np.ones(n_elements, dtype=bool),
+        n_layers=np.array(n_layers, dtype=np.int64),
+        n_corner_nodes=np.array(nodes, dtype=np.int64),
+        n_spots=np.array(n_spots, dtype=np.int64),
+        is_layered=np.array(n_spots) > 0,
+        element_type=np.full(n_elements, 181, dtype=np.int64),
+        is_shell=np.ones(n_elements, dtype=bool),
+        number_of_nodes_per_spot_plane=np.where(np.array(n_spots) > 0, nodes, -1),
+        dpf_material_ids=_get_layered_element_data(element_ids, material_ids),
+    )
+
+
+def _write_store(path):
+    # Chunk 1: element 10 with 3 layers and 3 spots, homogeneous element 5
+    # Chunk 2: element 7 with 2 layers and 2 spots
+    chunks = [
+        (
+            _get_element_info_columns([10, 5], [3, 1], [3, 0], [4, 4], [[1, 2, 1], [3]]),
+            _get_layered_element_data([10, 5], [[0, 1, 2], []]),
+        ),
+        (
+            _get_element_info_columns([7], [2], [2], [3], [[2, 3]]),
+            _get_layered_element_data([7], [[1, 2]]),
+        ),
+    ]
+    rng = np.random.default_rng(0)
+    data = {}
+    with ResultStoreWriter(
+        path,
+        number_of_components={"stress": 2},
+        analysis_ply_names={0: "ply 0", 1: "ply 1", 2: "ply 2"},
+        material_names={"epoxy": 1, "carbon": 2, "core": 3},
+        metadata={"time": 1.0},
+    ) as writer:
+        for columns, ply_indices in chunks:
+            lengths = [
+                max(columns.n_spots[i], 1) * columns.n_layers[i] * columns.n_corner_nodes[i]
+                for i in range(len(columns))
+            ]
+            indptr = np.zeros(len(lengths) + 1, dtype=np.int64)
+            np.cumsum(lengths, out=indptr[1:])
+            values = rng.random((indptr[-1], 2))
+            for i, element_id in enumerate(columns.element_ids):
+                data[int(element_id)] = values[indptr[i] : indptr[i + 1]]
+            writer.append(columns, indptr, {"stress": values}, ply_indices)
+    return data
+
+
+def test_result_store_roundtrip_and_selection(tmp_path):
+    data = _write_store(tmp_path / "store")
+    store = ResultStore(tmp_path / "store")
+
+    assert list(store.element_ids) == [10, 5, 7]
+    assert store.result_names == ["stress"]
+    assert store.metadata == {"time": 1.0}
+    assert store.material_names == {"epoxy": 1, "carbon": 2, "core": 3}
+    for element_id, values in data.items():
+        np.testing.assert_array_equal(store.get_element_data("stress", element_id), values)
+    assert list(store.get_element_info(7).dpf_material_ids) == [2, 3]
+
+    # All values of all elements
+    selection = store.select("stress")
+    assert list(selection.element_ids) == [10, 5, 7]
+    np.testing.assert_array_equal(selection.values, np.concatenate(list(data.values())))
+
+    # Layers, spots and nodes behave like get_selected_indices
+    selection = store.select("stress", layers=[1], spots=[Spot.TOP, Spot.MIDDLE], nodes=[0, 2])
+    assert list(selection.element_ids) == [10, 7]
+    for index, element_id in enumerate(selection.element_ids):
+        element_info = store.get_element_info(element_id)
+        spots = [Spot.TOP, Spot.MIDDLE] if element_info.n_spots == 3 else [Spot.TOP]
+        expected = np.sort(
+            get_selected_indices(element_info, layers=[1], spots=spots, nodes=[0, 2])
+        )
+        rows = slice(selection.indptr[index], selection.indptr[index + 1])
+        np.testing.assert_array_equal(selection.elementary_indices[rows], expected)
+        np.testing.assert_array_equal(selection.values[rows], data[element_id][expected])
+
+    # Analysis plies and materials use the index tables
+    selection = store.select("stress", analysis_ply_names=["ply 2"])
+    assert list(selection.element_ids) == [10, 7]
+    element_info = store.get_element_info(7)
+    np.testing.assert_array_equal(
+        selection.values[selection.indptr[1] :],
+        data[7][get_selected_indices(element_info, layers=[1])],
+    )
+    selection = store.select("stress", element_ids=[7, 10], dpf_material_ids=[1])
+    assert list(selection.element_ids) == [10]
+    assert len(selection.values) == 2 * 3 * 4
+
+    with pytest.raises(RuntimeError, match="Element 4 is not in the result store"):
+        store.select("stress", element_ids=[4])
+    # The sorted element index is written by the writer and memory-mapped
+    assert list(store._sorted_element_ids) == [5, 7, 10]
+    assert isinstance(store._element_order, np.memmap)
+    with pytest.raises(RuntimeError, match="does not contain the result strain"):
+        store.select("strain")
+    with pytest.raises(RuntimeError, match="not a complete result store"):
+        ResultStore(tmp_path / "missing")
+
+
+def test_write_result_store(dpf_server, tmp_path):
+    composite_model = CompositeModel(get_basic_shell_files(), server=dpf_server)
+    store = composite_model.write_result_store(
+        tmp_path / "store", result_types=[ResultType.STRESS], max_chunk_size=2
+    )
+    stress_field = composite_model.get_result(ResultType.STRESS)[0]
+    assert sorted(store.element_ids) == sorted(stress_field.scoping.ids)
+    for element_id in stress_field.scoping.ids:
+        np.testing.assert_allclose(
+            store.get_element_data("stress", element_id),
+            stress_field.get_entity_data_by_id(element_id),
+        )
+
+    ply_name = "P1L1__ud_patch ns1"
+    selection = ResultStore(tmp_path / "store").select("stress", analysis_ply_names=[ply_name])
+    assert list(selection.element_ids) == [1, 2]
+    np.testing.assert_allclose(
+        selection.values[: selection.indptr[1]],
+        stress_field.get_entity_data_by_id(1)[12:24],
+    )
@@ -0,0 +1,182 @@
+# Copyright (C) 2022 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+from concurrent.futures import ThreadPoolExecutor
+import itertools
+import threading
+import time
+
+import pytest
+
+from ansys.dpf.composites.server_helpers import ServerPool, _server_pool
+from ansys.dpf.composites.server_helpers._connect_to_or_start_server import _try_until_timeout
+
+
+class _Server:
+    """Server replacement which records its state."""
+
+    _ids = itertools.count()
+
+    def __init__(self):
+        self.id = next(self._ids)
+        self.is_up = True
+        self.is_hung = False
+        self.is_shut_down = False
+
+    @property
+    def version(self):
+        # Like the DPF servers, the version is cached on the client and
+        # does not contact the server
+        return "10.0"
+
+    def make_tmp_dir(self):
+        while self.is_hung:
+            time.sleep(0.01)
+        if not self.is_up:
+            raise RuntimeError("The server is not responding.")
+        return f"/tmp/{self.id}"
+
+    def shutdown(self):
+        self.is_shut_down = True
+        self.is_hung = False
+
+
+@pytest.fixture(autouse=True)
+def fake_requests(monkeypatch):
+    """Send the requests of the health check to the fake servers."""
+    monkeypatch.setattr(
+        _server_pool.dpf, "make_tmp_dir_server", lambda server: server.make_tmp_dir()
+    )
+
+
+def test_server_pool_hands_out_servers():
+    with ServerPool(2, start_server=_Server) as pool:
+        assert pool.size == 2
+        servers = pool.servers
+        assert len(servers) == 2
+
+        with pool.server() as first_server:
+            with pool.server() as second_server:
+                assert first_server is not second_server
+                with pytest.raises(TimeoutError):
+                    with pool.server(timeout=0.01):
+                        pass
+        assert set(pool.servers) == set(servers)
+
+    assert all(server.is_shut_down for server in servers)
+    with pytest.raises(RuntimeError, match="closed"):
+        with pool.server():
+            pass
+
+
+def test_server_pool_health_check_and_recycling():
+    with ServerPool(1, start_server=_Server, max_uses=2) as pool:
+        with pool.server() as server:
+            server.is_up = False
+        with pool.server() as replacement:
+            assert replacement is not server
+            assert server.is_shut_down
+        assert pool.servers == [replacement]
+
+        # The replacement is recycled after it was handed out twice
+        with pool.server() as same_server:
+            assert same_server is replacement
+        with pool.server() as recycled:
+            assert recycled is not replacement
+            assert replacement.is_shut_down
+
+
+def test_server_pool_health_check_contacts_server():
+    with ServerPool(2, start_server=_Server, health_check_timeout=0.1) as pool:
+        with pool.server() as dead_server:
+            # The cached version does not reveal that the connection is dead
+            dead_server.is_up = False
+            assert dead_server.version is not None
+        with pool.server() as hung_server:
+            hung_server.is_hung = True
+
+        with pool.server() as first_server:
+            with pool.server() as second_server:
+                assert {first_server, second_server}.isdisjoint({dead_server, hung_server})
+        assert dead_server.is_shut_down
+        assert hung_server.is_shut_down
+
+    with pytest.raises(RuntimeError, match="timeout must be positive"):
+        ServerPool(1, start_server=_Server, health_check_timeout=0)
+
+
+def test_server_pool_shuts_down_started_servers_on_error():
+    started_servers = []
+    lock = threading.Lock()
+
+    def start_server():
+        with lock:
+            if len(started_servers) == 2:
+                raise RuntimeError("The server cannot be started.")
+            server = _Server()
+            started_servers.append(server)
+        return server
+
+    with pytest.raises(RuntimeError, match="cannot be started"):
+        ServerPool(3, start_server=start_server)
+    assert len(started_servers) == 2
+    assert all(server.is_shut_down for server in started_servers)
+
+
+def test_server_pool_from_threads():
+    lock = threading.Lock()
+    servers_in_use = set()
+
+    def use_server(pool):
+        with pool.server() as server:
+            with lock:
+                assert server.id not in servers_in_use
+                servers_in_use.add(server.id)
+            time.sleep(0.001)
+            with lock:
+                servers_in_use.remove(server.id)
+
+    with ServerPool(3, start_server=_Server) as pool:
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(lambda _: use_server(pool), range(50)))
+        assert len(pool.servers) == 3
+
+
+def test_try_until_timeout_backs_off():
+    attempts = []
+
+    def succeed_on_fourth_attempt():
+        attempts.append(time.monotonic())
+        if len(attempts) < 4:
+            raise RuntimeError("Not ready")
+        return "ready"
+
+    assert _try_until_timeout(succeed_on_fourth_attempt, "", initial_delay=0.01) == "ready"
+    delays = [end - start for start, end in zip(attempts, attempts[1:])]
+    assert delays[2] > delays[0]
+
+    with pytest.raises(TimeoutError, match="never ready"):
+        _try_until_timeout(_fail, "never ready", timeout=0.05)
+
+
+def _fail():
+    raise RuntimeError("Not ready")
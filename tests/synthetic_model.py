@@ -0,0 +1,285 @@
+# Copyright (C) 2022 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Generator of synthetic layered shell models for scale tests.
+
+The models consist of a regular grid of 4-node layered shell elements
+(SHELL181 with ``keyopt_8=1``, so results are available at the bottom and top
+of each layer). All fields are created from NumPy arrays in a single call per
+field, so models with millions of elements can be generated in seconds.
+
+The memory of the stress and strain fields is
+``number_of_elements * number_of_layers * 2 spots * 4 nodes * 6 components * 8 bytes``
+each, which is about 15 GB for 10^7 elements with 4 layers.
+"""
+
+from dataclasses import dataclass
+import math
+
+import ansys.dpf.core as dpf
+from ansys.dpf.core import Field, MeshedRegion, PropertyField
+from ansys.dpf.core.server_types import BaseServer
+import numpy as np
+from numpy.typing import NDArray
+
+from ansys.dpf.composites.layup_info import ElementInfoProvider
+from ansys.dpf.composites.layup_info._layup_info import _get_analysis_ply_prefix
+
+SHELL_181 = 181
+NUMBER_OF_NODES = 4
+NUMBER_OF_SPOTS = 2
+NUMBER_OF_COMPONENTS = 6
+
+
+@dataclass(frozen=True)
+class SyntheticLayeredModel:
+    """Synthetic layered shell model and its elemental nodal results.
+
+    The mesh contains the ``element_layer_indices``, ``element_layered_material_ids``,
+    ``layer_to_analysis_ply``, ``AnalysisPly::<name>``, ``apdl_element_type``,
+    ``keyopt_3`` and ``keyopt_8`` property fields. The keyopts are stored
+    in the mesh because there is no result file from which they can be read.
+    """
+
+    mesh: MeshedRegion
+    element_ids: NDArray[np.int64]
+    number_of_layers: int
+    analysis_ply_names: list[str]
+    keyopt_8: PropertyField
+    keyopt_3: PropertyField
+    stress: Field
+    strain: Field
+
+    def get_element_info_provider(self, no_bounds_checks: bool = False) -> ElementInfoProvider:
+        return ElementInfoProvider(
+            self.mesh,
+            layer_indices=self.mesh.property_field("element_layer_indices"),
+            element_types_mapdl=self.mesh.property_field("apdl_element_type"),
+            element_types_dpf=self.mesh.elements.element_types_field,
+            keyopt_8_values=self.keyopt_8,
+            keyopt_3_values=self.keyopt_3,
+            material_ids=self.mesh.property_field("element_layered_material_ids"),
+            no_bounds_checks=no_bounds_checks,
+        )
+
+
+def _create_property_field(
+    ids: NDArray[np.int64],
+    data: NDArray[np.int64],
+    location: str,
+    server: BaseServer | None,
+    data_pointer: NDArray[np.int64] | None = None,
+    number_of_components: int = 1,
+) -> PropertyField:
+    property_field = dpf.PropertyField(
+        nentities=len(ids),
+        nature=dpf.natures.scalar if number_of_components == 1 else dpf.natures.vector,
+        location=location,
+        server=server,
+    )
+    property_field.scoping = dpf.Scoping(ids=ids, location=location, server=server)
+    property_field.data = np.ascontiguousarray(data, dtype=np.int32).reshape(-1)
+    if data_pointer is not None:
+        property_field._data_pointer = data_pointer.astype(np.int32)
+    return property_field
+
+
+def _create_result_field(
+    element_ids: NDArray[np.int64],
+    values_per_element: int,
+    scale: float,
+    rng: np.random.Generator,
+    server: BaseServer | None,
+) -> Field:
+    field = dpf.Field(
+        nentities=len(element_ids),
+        nature=dpf.natures.symmatrix,
+        location=dpf.locations.elemental_nodal,
+        server=server,
+    )
+    field.scoping = dpf.Scoping(ids=element_ids, location=dpf.locations.elemental, server=server)
+    field.data = scale * rng.standard_normal(
+        (len(element_ids) * values_per_element, NUMBER_OF_COMPONENTS)
+    )
+    # The data pointer counts scalar values, not entities
+    field._data_pointer = (
+        np.arange(len(element_ids), dtype=np.int32) * values_per_element * NUMBER_OF_COMPONENTS
+    )
+    return field
+
+
+def create_synthetic_layered_model(
+    number_of_elements: int,
+    number_of_layers: int = 4,
+    number_of_zones: int = 4,
+    number_of_materials: int = 2,
+    server: BaseServer | None = None,
+    seed: int = 0,
+) -> SyntheticLayeredModel:
+    """Create a synthetic layered shell model.
+
+    The elements are split into ``number_of_zones`` consecutive zones. Each zone
+    has its own stack of ``number_of_layers`` analysis plies, so the model has
+    ``number_of_zones * number_of_layers`` analysis plies named
+    ``zone_<zone>_ply_<layer>``. The dpf material of a layer cycles through
+    ``1`` to ``number_of_materials``. The stresses and strains are random
+    with a fixed seed.
+    """
+    if number_of_elements < 1 or number_of_layers < 1 or number_of_zones < 1:
+        raise RuntimeError("The number of elements, layers and zones must be positive.")
+    number_of_zones = min(number_of_zones, number_of_elements)
+    rng = np.random.default_rng(seed)
+
+    # Regular grid of quads
+    elements_per_row = math.ceil(math.sqrt(number_of_elements))
+    number_of_rows = math.ceil(number_of_elements / elements_per_row)
+    nodes_per_row = elements_per_row + 1
+    number_of_nodes = nodes_per_row * (number_of_rows + 1)
+    node_ids = np.arange(1, number_of_nodes + 1, dtype=np.int64)
+    element_ids = np.arange(1, number_of_elements + 1, dtype=np.int64)
+    element_indices = element_ids - 1
+
+    mesh = dpf.MeshedRegion(
+        num_nodes=number_of_nodes, num_elements=number_of_elements, server=server
+    )
+    coordinates = dpf.Field(
+        nentities=number_of_nodes,
+        nature=dpf.natures.vector,
+        location=dpf.locations.nodal,
+        server=server,
+    )
+    coordinates.scoping = dpf.Scoping(ids=node_ids, location=dpf.locations.nodal, server=server)
+    node_indices = node_ids - 1
+    coordinates.data = np.column_stack(
+        [
+            node_indices % nodes_per_row,
+            node_indices // nodes_per_row,
+            np.zeros(number_of_nodes),
+        ]
+    ).astype(np.double)
+    mesh.set_coordinates_field(coordinates)
+
+    first_nodes = (element_indices // elements_per_row) * nodes_per_row + (
+        element_indices % elements_per_row
+    )
+    connectivity = np.column_stack(
+        [first_nodes, first_nodes + 1, first_nodes + nodes_per_row + 1, first_nodes + nodes_per_row]
+    )
+    mesh.elements.connectivities_field = _create_property_field(
+        element_ids,
+        connectivity,
+        dpf.locations.elemental,
+        server,
+        data_pointer=element_indices * NUMBER_OF_NODES,
+    )
+    mesh.elements.element_types_field = _create_property_field(
+        element_ids,
+        np.full(number_of_elements, dpf.element_types.Quad4.value, dtype=np.int64),
+        dpf.locations.elemental,
+        server,
+    )
+    mesh.elements.materials_field = _create_property_field(
+        element_ids, np.ones(number_of_elements, dtype=np.int64), dpf.locations.elemental, server
+    )
+    mesh.set_property_field(
+        "apdl_element_type",
+        _create_property_field(
+            element_ids,
+            np.full(number_of_elements, SHELL_181, dtype=np.int64),
+            dpf.locations.elemental,
+            server,
+        ),
+    )
+    keyopt_8 = _create_property_field(
+        element_ids, np.ones(number_of_elements, dtype=np.int64), dpf.locations.elemental, server
+    )
+    keyopt_3 = _create_property_field(
+        element_ids, np.zeros(number_of_elements, dtype=np.int64), dpf.locations.elemental, server
+    )
+    mesh.set_property_field("keyopt_8", keyopt_8)
+    mesh.set_property_field("keyopt_3", keyopt_3)
+
+    # Lay-up: the first entry of the layer indices of an element is the number of layers
+    layers = np.arange(number_of_layers, dtype=np.int64)
+    layer_indices = np.column_stack(
+        [np.full(number_of_elements, number_of_layers), np.tile(layers, (number_of_elements, 1))]
+    )
+    mesh.set_property_field(
+        "element_layer_indices",
+        _create_property_field(
+            element_ids,
+            layer_indices,
+            dpf.locations.elemental,
+            server,
+            data_pointer=element_indices * (number_of_layers + 1),
+        ),
+    )
+    mesh.set_property_field(
+        "element_layered_material_ids",
+        _create_property_field(
+            element_ids,
+            np.tile(layers % number_of_materials + 1, number_of_elements),
+            dpf.locations.elemental,
+            server,
+            data_pointer=element_indices * number_of_layers,
+        ),
+    )
+    zones = element_indices * number_of_zones // number_of_elements
+    mesh.set_property_field(
+        "layer_to_analysis_ply",
+        _create_property_field(
+            element_ids,
+            zones[:, np.newaxis] * number_of_layers + layers,
+            dpf.locations.elemental,
+            server,
+            data_pointer=element_indices * number_of_layers,
+        ),
+    )
+
+    analysis_ply_names = []
+    analysis_ply_prefix = _get_analysis_ply_prefix(mesh._server)
+    for zone in range(number_of_zones):
+        zone_element_ids = element_ids[zones == zone]
+        for layer in range(number_of_layers):
+            name = f"zone_{zone}_ply_{layer}"
+            analysis_ply_names.append(name)
+            mesh.set_property_field(
+                analysis_ply_prefix + name,
+                _create_property_field(
+                    zone_element_ids,
+                    np.full(len(zone_element_ids), layer),
+                    dpf.locations.elemental,
+                    server,
+                ),
+            )
+
+    values_per_element = number_of_layers * NUMBER_OF_SPOTS * NUMBER_OF_NODES
+    return SyntheticLayeredModel(
+        mesh=mesh,
+        element_ids=element_ids,
+        number_of_layers=number_of_layers,
+        analysis_ply_names=analysis_ply_names,
+        keyopt_8=keyopt_8,
+        keyopt_3=keyopt_3,
+        stress=_create_result_field(element_ids, values_per_element, 1e8, rng, server),
+        strain=_create_result_field(element_ids, values_per_element, 1e-3, rng, server),
+    )
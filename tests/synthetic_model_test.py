@@ -0,0 +1,74 @@
+# Copyright (C) 2022 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import numpy as np
+
+from ansys.dpf.composites._indexer import get_field_indexer
+from ansys.dpf.composites.constants import Spot
+from ansys.dpf.composites.layup_info import (
+    AnalysisPlyInfoProvider,
+    get_analysis_ply_index_to_name_map,
+)
+from ansys.dpf.composites.select_indices import get_selected_indices
+
+from .synthetic_model import create_synthetic_layered_model
+
+
+def test_synthetic_layered_model(dpf_server):
+    model = create_synthetic_layered_model(
+        number_of_elements=10, number_of_layers=3, number_of_zones=2, server=dpf_server
+    )
+
+    assert model.mesh.elements.n_elements == 10
+    assert model.mesh.nodes.n_nodes == 20
+    assert model.analysis_ply_names == [
+        f"zone_{zone}_ply_{layer}" for zone in range(2) for layer in range(3)
+    ]
+
+    element_info_provider = model.get_element_info_provider()
+    stress_indexer = get_field_indexer(model.stress)
+    for element_id in model.element_ids:
+        element_info = element_info_provider.get_element_info(element_id)
+        assert element_info.is_layered
+        assert element_info.n_layers == 3
+        assert element_info.n_spots == 2
+        assert element_info.number_of_nodes_per_spot_plane == 4
+        assert list(element_info.dpf_material_ids) == [1, 2, 1]
+
+        element_stresses = stress_indexer.by_id_as_array(element_id)
+        assert element_stresses.shape == (3 * 2 * 4, 6)
+        top_of_last_layer = get_selected_indices(element_info, layers=[2], spots=[Spot.TOP])
+        assert element_stresses[top_of_last_layer].shape == (4, 6)
+
+    assert get_analysis_ply_index_to_name_map(model.mesh) == dict(
+        enumerate(model.analysis_ply_names)
+    )
+    analysis_ply_info_provider = AnalysisPlyInfoProvider(model.mesh, "zone_1_ply_2")
+    assert list(analysis_ply_info_provider.ply_element_ids()) == [6, 7, 8, 9, 10]
+    assert analysis_ply_info_provider.get_layer_index_by_element_id(6) == 2
+
+
+def test_synthetic_results_are_reproducible(dpf_server):
+    first = create_synthetic_layered_model(100, seed=1, server=dpf_server)
+    second = create_synthetic_layered_model(100, seed=1, server=dpf_server)
+    assert np.array_equal(first.stress.data, second.stress.data)
+    assert np.array_equal(first.strain.data, second.strain.data)
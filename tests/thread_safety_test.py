@@ -0,0 +1,110 @@
+# Copyright (C) 2022 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+from concurrent.futures import ThreadPoolExecutor
+import dataclasses
+
+import numpy as np
+import pytest
+
+from ansys.dpf.composites.composite_model import CompositeModel
+from ansys.dpf.composites.constants import FailureOutput, ResultType
+from ansys.dpf.composites.failure_criteria import CombinedFailureCriterion, MaxStressCriterion
+from ansys.dpf.composites.memory_usage import ModelCache
+from ansys.dpf.composites.result_cache import ResultCache
+
+from .helper import get_basic_shell_files
+
+
+def test_result_cache_concurrent_access():
+    cache = ResultCache(max_size=4)
+    number_of_lookups = 1000
+
+    def use_cache(thread_index):
+        for index in range(number_of_lookups):
+            key = (ResultType.STRESS, index % 7, (thread_index,))
+            if cache.get(key) is None:
+                cache.put(key, index)
+            if index % 100 == 0:
+                cache.invalidate(time_id=index % 7)
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(use_cache, range(8)))
+
+    statistics = cache.statistics
+    assert statistics.hits + statistics.misses == 8 * number_of_lookups
+    assert statistics.size == len(cache) <= 4
+
+
+def test_failure_evaluation_with_model_per_thread(dpf_server):
+    # The operators of a model are not locked, so each thread uses its own model
+    combined_criterion = CombinedFailureCriterion(
+        "max stress", failure_criteria=[MaxStressCriterion()]
+    )
+
+    def get_irfs_and_sampling_point(max_chunk_size):
+        composite_model = CompositeModel(get_basic_shell_files(), server=dpf_server)
+        irf_field = composite_model.evaluate_failure_criteria(
+            combined_criterion, max_chunk_size=max_chunk_size
+        ).get_field({"failure_label": FailureOutput.FAILURE_VALUE})
+        irfs = {
+            element_id: irf_field.get_entity_data_by_id(element_id)
+            for element_id in irf_field.scoping.ids
+        }
+        sampling_point = composite_model.get_sampling_point(combined_criterion, element_id=3)
+        return irfs, sampling_point.results
+
+    expected_irfs, expected_sampling_point_results = get_irfs_and_sampling_point(50000)
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = list(executor.map(get_irfs_and_sampling_point, [50000, 1, 2, 3]))
+
+    for irfs, sampling_point_results in results:
+        assert irfs.keys() == expected_irfs.keys()
+        for element_id, values in irfs.items():
+            assert values == pytest.approx(expected_irfs[element_id])
+        assert sampling_point_results == expected_sampling_point_results
+
+
+def test_concurrent_element_info_lookups(dpf_server):
+    # The element information is looked up on the client and can be shared
+    composite_model = CompositeModel(get_basic_shell_files(), server=dpf_server)
+    element_ids = list(composite_model.get_all_layered_element_ids())
+
+    def get_element_infos(_):
+        return [
+            _as_tuple(composite_model.get_element_info(element_id)) for element_id in element_ids
+        ]
+
+    expected_element_infos = get_element_infos(None)
+    composite_model.clear_caches([ModelCache.ELEMENT_INFO])
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = list(executor.map(get_element_infos, range(8)))
+
+    assert all(element_infos == expected_element_infos for element_infos in results)
+
+
+def _as_tuple(element_info):
+    return tuple(
+        value.tolist() if isinstance(value, np.ndarray) else value
+        for value in dataclasses.astuple(element_info)
+    )
@@ -0,0 +1,176 @@
+# Copyright (C) 2022 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import asyncio
+import threading
+
+import pytest
+
+from ansys.dpf.composites._async_helpers import _run_in_executor
+from ansys.dpf.composites.composite_model import CompositeModel
+from ansys.dpf.composites.constants import ResultType
+from ansys.dpf.composites.element_chunks import _prefetch
+from ansys.dpf.composites.failure_criteria import CombinedFailureCriterion, MaxStressCriterion
+from ansys.dpf.composites.result_partitions import _map_in_parallel
+from ansys.dpf.composites.tracing import (
+    Span,
+    TimingSummary,
+    _is_tracing,
+    _span,
+    add_span_callback,
+    record_timings,
+    remove_span_callback,
+)
+
+from .helper import get_basic_shell_files
+
+
+def test_span_callbacks():
+    spans = []
+    with _span("not_traced"):
+        pass
+    assert not _is_tracing()
+
+    add_span_callback(spans.append)
+    try:
+        assert _is_tracing()
+        with _span("chunk", chunk_index=3) as attributes:
+            attributes["bytes"] = 16
+    finally:
+        remove_span_callback(spans.append)
+
+    assert len(spans) == 1
+    assert spans[0].name == "chunk"
+    assert spans[0].attributes == {"chunk_index": 3, "bytes": 16}
+    assert spans[0].duration >= 0.0
+    with pytest.raises(RuntimeError, match="not registered"):
+        remove_span_callback(spans.append)
+
+
+def test_span_is_emitted_on_exception():
+    with record_timings() as timings:
+        with pytest.raises(ValueError):
+            with _span("failing_stage"):
+                raise ValueError("Failed")
+    assert timings.stages["failing_stage"].count == 1
+    assert not _is_tracing()
+
+
+def test_record_timings_of_current_thread():
+    other_thread_started = threading.Event()
+    stop_other_thread = threading.Event()
+
+    def run_stages_in_other_thread():
+        other_thread_started.set()
+        while not stop_other_thread.is_set():
+            with _span("other_thread"):
+                pass
+
+    other_thread = threading.Thread(target=run_stages_in_other_thread)
+    with record_timings() as timings:
+        other_thread.start()
+        other_thread_started.wait(timeout=10)
+        with _span("current_thread"):
+            pass
+        # Stages of the background threads of the instrumented functions are recorded
+        assert list(_map_in_parallel(_run_stage, ["parallel_worker"], max_workers=2)) == [
+            "parallel_worker"
+        ]
+        assert list(_prefetch(_run_stages(["prefetch_worker"]))) == ["prefetch_worker"]
+        stop_other_thread.set()
+        other_thread.join()
+
+    assert set(timings.stages) == {"current_thread", "parallel_worker", "prefetch_worker"}
+    assert not _is_tracing()
+
+
+def test_record_timings_of_async_calls():
+    async def run_stage_in_executor():
+        with record_timings() as timings:
+            assert await _run_in_executor(lambda _: _run_stage("executor")) == "executor"
+        return timings
+
+    timings = asyncio.run(run_stage_in_executor())
+    assert set(timings.stages) == {"executor"}
+    assert not _is_tracing()
+
+
+def _run_stage(name):
+    with _span(name):
+        return name
+
+
+def _run_stages(names):
+    for name in names:
+        yield _run_stage(name)
+
+
+def test_timing_summary():
+    summary = TimingSummary()
+    summary(Span("read", 0.0, 1.0, 1, {"number_of_elements": 10, "bytes": 2_000_000}))
+    summary(Span("read", 1.0, 3.0, 1, {"number_of_elements": 5, "bytes": 1_000_000}))
+    summary(Span("evaluate", 4.0, 0.5, 1, {}))
+
+    read = summary.stages["read"]
+    assert read.count == 2
+    assert read.total_time == pytest.approx(4.0)
+    assert read.mean_time == pytest.approx(2.0)
+    assert read.max_time == pytest.approx(3.0)
+    assert read.number_of_elements == 15
+    assert read.bytes == 3_000_000
+
+    report_lines = summary.report().splitlines()
+    assert report_lines[0].split() == [
+        "stage",
+        "count",
+        "total",
+        "[s]",
+        "mean",
+        "[s]",
+        "max",
+        "[s]",
+        "elements",
+        "MB",
+    ]
+    # Sorted by total time
+    assert report_lines[1].split()[:2] == ["read", "2"]
+    assert report_lines[2].split()[:2] == ["evaluate", "1"]
+
+    summary.clear()
+    assert summary.stages == {}
+
+
+def test_failure_evaluation_timings(dpf_server):
+    composite_model = CompositeModel(get_basic_shell_files(), server=dpf_server)
+    combined_criterion = CombinedFailureCriterion("max stress", [MaxStressCriterion()])
+
+    with record_timings() as timings:
+        composite_model.evaluate_failure_criteria(combined_criterion, max_chunk_size=2)
+        list(composite_model.iterate_element_chunks([ResultType.STRESS], max_chunk_size=2))
+
+    stages = timings.stages
+    number_of_elements = len(composite_model.get_mesh().elements.scoping.ids)
+    assert stages["evaluate_failure_criteria"].count == 1
+    assert stages["failure_chunk.evaluate"].count == stages["failure_chunk.min_max_reduction"].count
+    assert stages["failure_chunk.min_max_reduction"].number_of_elements > 0
+    assert stages["element_chunk.element_info"].number_of_elements == number_of_elements
+    assert stages["element_chunk.transfer"].bytes > 0
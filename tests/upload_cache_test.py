@@ -0,0 +1,272 @@
+# Copyright (C) 2022 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+from concurrent.futures import ThreadPoolExecutor
+import shutil
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+from ansys.dpf.composites.server_helpers import (
+    UploadCache,
+    _upload_files_to_server,
+    upload_file_to_unique_tmp_folder,
+)
+from ansys.dpf.composites.server_helpers._upload_files_to_server import (
+    _map_concurrently,
+    _upload_files_to_unique_tmp_folders,
+)
+
+from .helper import get_basic_shell_files
+
+
+def _server(port, process_id=1, tmp_dir="/tmp/dataProcessingTemp1"):
+    return SimpleNamespace(
+        ip="127.0.0.1",
+        port=port,
+        os="posix",
+        info={"server_process_id": process_id},
+        tmp_dir=tmp_dir,
+    )
+
+
+@pytest.fixture
+def fake_servers(monkeypatch):
+    """Let the fake servers of ``_server`` provide their temporary folder."""
+    monkeypatch.setattr(
+        _upload_files_to_server.dpf, "make_tmp_dir_server", lambda server: server.tmp_dir
+    )
+
+
+def _write(path, content):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content)
+    return path
+
+
+def test_upload_cache_keys(tmp_path, fake_servers):
+    upload_cache = UploadCache()
+    server = _server(50052)
+    other_server = _server(50053)
+    uploads = []
+
+    def get_or_upload(path, target_server):
+        def upload():
+            uploads.append(path)
+            return [f"/server/{len(uploads)}/{path.name}"]
+
+        return upload_cache._get_or_upload([path], target_server, upload)[0]
+
+    matml = _write(tmp_path / "dp0" / "MatML.xml", "materials")
+    same_matml = _write(tmp_path / "dp1" / "MatML.xml", "materials")
+    changed_matml = _write(tmp_path / "dp2" / "MatML.xml", "other materials")
+    renamed_matml = _write(tmp_path / "dp3" / "Materials.xml", "materials")
+
+    first_path = get_or_upload(matml, server)
+    assert get_or_upload(same_matml, server) == first_path
+    assert get_or_upload(changed_matml, server) != first_path
+    assert get_or_upload(renamed_matml, server) != first_path
+    assert get_or_upload(matml, other_server) != first_path
+    assert len(uploads) == 4
+    assert len(upload_cache) == 4
+
+    # A new server which reuses the port of a replaced one
+    assert get_or_upload(matml, _server(50052, process_id=2)) != first_path
+    assert len(uploads) == 5
+
+    upload_cache.clear()
+    get_or_upload(matml, server)
+    assert len(uploads) == 6
+
+
+def test_upload_cache_concurrent_requests(tmp_path, fake_servers):
+    upload_cache = UploadCache()
+    server = _server(50052)
+    path = _write(tmp_path / "file.rst", "results")
+    upload_started = threading.Event()
+    finish_upload = threading.Event()
+    uploads = []
+
+    def upload():
+        uploads.append(path)
+        upload_started.set()
+        finish_upload.wait(timeout=10)
+        return ["/server/1/file.rst"]
+
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        first_request = executor.submit(upload_cache._get_or_upload, [path], server, upload)
+        upload_started.wait(timeout=10)
+        other_requests = [
+            executor.submit(upload_cache._get_or_upload, [path], server, upload) for _ in range(2)
+        ]
+        finish_upload.set()
+        paths_on_server = [request.result() for request in [first_request, *other_requests]]
+
+    assert len(uploads) == 1
+    assert paths_on_server == [["/server/1/file.rst"]] * 3
+
+
+def test_upload_cache_failed_upload(tmp_path, fake_servers):
+    upload_cache = UploadCache()
+    server = _server(50052)
+    path = _write(tmp_path / "file.rst", "results")
+
+    def upload():
+        raise ConnectionError("Connection dropped")
+
+    with pytest.raises(ConnectionError):
+        upload_cache._get_or_upload([path], server, upload)
+    # The failed upload is not cached
+    assert upload_cache._get_or_upload([path], server, lambda: ["/server/1/file.rst"]) == [
+        "/server/1/file.rst"
+    ]
+
+
+def test_map_concurrently_keeps_order():
+    assert _map_concurrently(lambda value: value * 2, list(range(10)), max_workers=4) == [
+        value * 2 for value in range(10)
+    ]
+    with pytest.raises(RuntimeError, match="must be positive"):
+        _map_concurrently(lambda value: value, [1, 2], max_workers=0)
+
+
+def test_upload_file_with_cache(dpf_server):
+    if dpf_server.local_server:
+        pytest.skip("Files are not uploaded to a local server.")
+    upload_cache = UploadCache()
+    path = get_basic_shell_files().engineering_data
+
+    path_on_server = upload_file_to_unique_tmp_folder(path, dpf_server, upload_cache)
+
+    assert upload_file_to_unique_tmp_folder(path, dpf_server, upload_cache) == path_on_server
+    assert upload_file_to_unique_tmp_folder(path, dpf_server) != path_on_server
+
+
+def test_upload_cache_file(tmp_path, fake_servers):
+    cache_path = tmp_path / "upload_cache.json"
+    server = _server(50052)
+    rst_path = _write(tmp_path / "file.rst", "results")
+
+    upload_cache = UploadCache(cache_path)
+    upload_cache._get_or_upload([rst_path], server, lambda: ["/server/1/file.rst"])
+
+    # A restarted job reuses the upload of the interrupted one
+    restarted_cache = UploadCache(cache_path)
+    assert len(restarted_cache) == 1
+    assert restarted_cache._get_or_upload([rst_path], server, _fail_upload) == [
+        "/server/1/file.rst"
+    ]
+
+    # The entries of a restarted server are not used, even if its process ID is the same
+    restarted_server = _server(50052, tmp_dir="/tmp/dataProcessingTemp2")
+    assert restarted_cache._get_or_upload(
+        [rst_path], restarted_server, lambda: ["/server/2/file.rst"]
+    ) == ["/server/2/file.rst"]
+
+
+def test_upload_progress(tmp_path, fake_servers):
+    server = _server(50052)
+    upload_cache = UploadCache()
+    paths = [_write(tmp_path / f"file{index}.rst", "x" * (index + 1)) for index in range(3)]
+    for path in paths:
+        upload_cache._get_or_upload([path], server, lambda path=path: [f"/server/{path.name}"])
+    reports = []
+
+    paths_on_server = _upload_files_to_unique_tmp_folders(
+        paths + [paths[0]], server, 2, upload_cache, progress=reports.append
+    )
+
+    assert paths_on_server == {str(path): f"/server/{path.name}" for path in paths}
+    assert [report.uploaded_files for report in reports] == [1, 2, 3]
+    assert reports[-1].uploaded_bytes == reports[-1].total_bytes == 6
+
+
+def test_upload_retries(tmp_path, monkeypatch):
+    server = SimpleNamespace(os="posix")
+    path = _write(tmp_path / "file.rst", "results")
+    attempts = []
+
+    def upload_file(path_on_client, path_on_server, server):
+        attempts.append(path_on_server)
+        if len(attempts) < 3:
+            raise ConnectionError("Connection dropped")
+        return path_on_server
+
+    monkeypatch.setattr(_upload_files_to_server, "_RETRY_INITIAL_DELAY", 0.0)
+    monkeypatch.setattr(_upload_files_to_server.dpf, "make_tmp_dir_server", lambda _: "/tmp")
+    monkeypatch.setattr(_upload_files_to_server.dpf, "upload_file", upload_file)
+
+    assert upload_file_to_unique_tmp_folder(path, server, max_retries=2) == attempts[-1]
+    assert len(attempts) == 3
+
+    attempts.clear()
+    with pytest.raises(ConnectionError):
+        upload_file_to_unique_tmp_folder(path, server, max_retries=1)
+    assert len(attempts) == 2
+
+
+def _fail_upload():
+    raise AssertionError("The file must not be uploaded again.")
+
+
+def test_upload_hashes_file_once(tmp_path, monkeypatch, fake_servers):
+    server = _server(50052)
+    path = _write(tmp_path / "file.rst", "results")
+    hashed_paths = []
+    get_file_hash = _upload_files_to_server._get_file_hash
+
+    def get_file_hash_and_count(path):
+        hashed_paths.append(str(path))
+        return get_file_hash(path)
+
+    def download_file(path_on_server, path_on_client, server):
+        shutil.copy(path, path_on_client)
+
+    monkeypatch.setattr(_upload_files_to_server, "_get_file_hash", get_file_hash_and_count)
+    monkeypatch.setattr(
+        _upload_files_to_server.dpf, "upload_file", lambda _, target, server: target
+    )
+    monkeypatch.setattr(_upload_files_to_server.dpf, "download_file", download_file)
+
+    upload_file_to_unique_tmp_folder(path, server, UploadCache(), verify_checksum=True)
+
+    # The client file is hashed for the cache and the verification, the download once
+    assert hashed_paths.count(str(path)) == 1
+    assert len(hashed_paths) == 2
+
+
+def test_upload_skips_checksum_of_large_files(tmp_path, monkeypatch, fake_servers):
+    server = _server(50052)
+    path = _write(tmp_path / "file.rst", "results")
+    monkeypatch.setattr(_upload_files_to_server, "_MAX_VERIFIED_FILE_SIZE", 1)
+    monkeypatch.setattr(
+        _upload_files_to_server.dpf, "upload_file", lambda _, target, server: target
+    )
+    monkeypatch.setattr(_upload_files_to_server.dpf, "download_file", _fail_download)
+
+    with pytest.warns(UserWarning, match="is not verified"):
+        upload_file_to_unique_tmp_folder(path, server, verify_checksum=True)
+
+
+def _fail_download(*args, **kwargs):
+    raise AssertionError("The file must not be downloaded.")